@@ -10,12 +10,29 @@ from .pool import (
     get_connection_pool,
     get_connection,
     close_pool,
+    PoolTimeoutError,
+    PoolQueueFullError,
+    PRIORITY_NORMAL,
+    PRIORITY_HIGH,
+)
+from .async_pool import (
+    AsyncDatabasePool,
+    get_async_pool,
+    get_async_connection,
+    close_async_pool,
+)
+from .batching import AsyncBatchLoader
+from .metadata_cache import (
+    MetadataCache,
+    get_metadata_cache,
+    close_metadata_cache,
 )
 from .operations import (
     save_audio_metadata,
     save_audio_metadata_batch,
     get_audio_metadata_by_id,
     get_audio_metadata_by_ids,
+    get_existing_track_ids,
     get_all_audio_metadata,
     search_audio_tracks,
     search_audio_tracks_advanced,
@@ -24,6 +41,7 @@ from .operations import (
     mark_as_failed,
     mark_as_completed,
     mark_as_processing,
+    delete_audio_tracks,
 )
 
 __all__ = [
@@ -31,10 +49,23 @@ __all__ = [
     "get_connection_pool",
     "get_connection",
     "close_pool",
+    "PoolTimeoutError",
+    "PoolQueueFullError",
+    "PRIORITY_NORMAL",
+    "PRIORITY_HIGH",
+    "AsyncDatabasePool",
+    "get_async_pool",
+    "get_async_connection",
+    "close_async_pool",
+    "AsyncBatchLoader",
+    "MetadataCache",
+    "get_metadata_cache",
+    "close_metadata_cache",
     "save_audio_metadata",
     "save_audio_metadata_batch",
     "get_audio_metadata_by_id",
     "get_audio_metadata_by_ids",
+    "get_existing_track_ids",
     "get_all_audio_metadata",
     "search_audio_tracks",
     "search_audio_tracks_advanced",
@@ -43,5 +74,6 @@ __all__ = [
     "mark_as_failed",
     "mark_as_completed",
     "mark_as_processing",
+    "delete_audio_tracks",
 ]
 
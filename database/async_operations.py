@@ -0,0 +1,395 @@
+"""
+Async database operations for the MCP tools and resource handlers.
+
+Coroutine counterparts of the read operations in database.operations, with
+the same names, arguments, results and exceptions. Queries run on
+AsyncDatabasePool (psycopg 3) and reuse the SQL built in
+database.operations. When the async pool is unavailable (psycopg 3 not
+installed, or db_async_enabled is off), the psycopg2 implementation runs in
+a worker thread so the event loop is still never blocked.
+"""
+
+import asyncio
+import logging
+import uuid
+from typing import Optional, Dict, Any, List
+
+from . import operations
+from .async_pool import get_async_connection, is_async_pool_enabled, HAS_PSYCOPG
+from .batching import AsyncBatchLoader
+from .metadata_cache import cache_key, get_metadata_cache
+from .operations import (
+    GET_METADATA_BY_ID_QUERY,
+    GET_METADATA_BY_IDS_QUERY,
+    FUZZY_SIMILARITY_THRESHOLD,
+    SET_SIMILARITY_THRESHOLD_QUERY,
+    build_advanced_search_queries,
+    advanced_search_response,
+    build_fuzzy_search_query,
+    build_suggest_query,
+)
+from src.exceptions import (
+    ValidationError,
+    DatabaseOperationError,
+)
+
+if HAS_PSYCOPG:
+    from psycopg import DatabaseError
+else:
+    DatabaseError = Exception
+
+# Try to import config, fallback to defaults
+try:
+    from config import config as app_config
+    HAS_APP_CONFIG = True
+except ImportError:
+    HAS_APP_CONFIG = False
+
+logger = logging.getLogger(__name__)
+
+_metadata_loader: Optional[AsyncBatchLoader] = None
+
+
+async def get_audio_metadata_by_id(track_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Retrieve audio metadata by track ID without blocking the event loop.
+
+    Cache misses issued concurrently (e.g. one resource read per track of
+    a search page) are coalesced by get_metadata_loader() into a single
+    WHERE id = ANY(...) query; a lookup that has no company within the
+    batch window runs the single-row query.
+
+    Args:
+        track_id: UUID string of the track to retrieve
+
+    Returns:
+        Dictionary with track metadata if found, None otherwise
+        (see database.operations.get_audio_metadata_by_id)
+
+    Raises:
+        ValidationError: If track_id format is invalid
+        DatabaseOperationError: If database query fails
+
+    Example:
+        >>> track = await get_audio_metadata_by_id('123e4567-e89b-12d3-a456-426614174000')
+    """
+    if not is_async_pool_enabled():
+        return await asyncio.to_thread(operations.get_audio_metadata_by_id, track_id)
+
+    try:
+        uuid.UUID(track_id)
+    except ValueError:
+        raise ValidationError(f"Invalid track_id format: {track_id}")
+
+    cached = get_metadata_cache().get(track_id)
+    if cached is not None:
+        return cached
+
+    if not _lookup_batching_enabled():
+        return await _fetch_metadata_by_id(track_id)
+
+    result = await get_metadata_loader().load(cache_key(track_id))
+    # Rows are shared by every caller of the batch
+    return dict(result) if result is not None else None
+
+
+async def get_audio_metadata_by_ids(track_ids: List[str]) -> List[Dict[str, Any]]:
+    """
+    Retrieve multiple audio metadata records without blocking the event loop.
+
+    Args:
+        track_ids: List of UUID strings to retrieve
+
+    Returns:
+        List of track metadata dictionaries for found tracks (order not guaranteed)
+
+    Raises:
+        ValidationError: If any track_id format is invalid
+        DatabaseOperationError: If database query fails
+
+    Example:
+        >>> tracks = await get_audio_metadata_by_ids(ids)
+    """
+    if not is_async_pool_enabled():
+        return await asyncio.to_thread(operations.get_audio_metadata_by_ids, track_ids)
+
+    if not track_ids:
+        return []
+
+    for track_id in track_ids:
+        try:
+            uuid.UUID(track_id)
+        except ValueError:
+            raise ValidationError(f"Invalid track_id format in batch: {track_id}")
+
+    cached, missing_ids = get_metadata_cache().get_many(track_ids)
+    if not missing_ids:
+        return cached
+
+    results = await _fetch_metadata_by_ids(missing_ids)
+    logger.debug(
+        f"Retrieved {len(results)} tracks out of {len(missing_ids)} queried "
+        f"({len(cached)} cached, {len(track_ids)} requested)"
+    )
+    return cached + results
+
+
+async def _fetch_metadata_by_id(track_id: str) -> Optional[Dict[str, Any]]:
+    """Query one track on the async pool and cache the row."""
+    cache = get_metadata_cache()
+    generation = cache.generation
+
+    try:
+        async with get_async_connection() as conn:
+            cur = await conn.execute(GET_METADATA_BY_ID_QUERY, (track_id,))
+            result = await cur.fetchone()
+
+            if result:
+                logger.debug(f"Retrieved metadata for track: {track_id}")
+                cache.put(result, generation)
+            else:
+                logger.debug(f"Track not found: {track_id}")
+            return result
+
+    except DatabaseError as e:
+        logger.error(f"Database error retrieving metadata for {track_id}: {e}")
+        raise DatabaseOperationError(
+            f"Failed to retrieve metadata: database error - {str(e)}"
+        )
+
+
+async def _fetch_metadata_by_ids(track_ids: List[str]) -> List[Dict[str, Any]]:
+    """Query several tracks on the async pool and cache the rows."""
+    cache = get_metadata_cache()
+    generation = cache.generation
+
+    try:
+        async with get_async_connection() as conn:
+            cur = await conn.execute(GET_METADATA_BY_IDS_QUERY, (track_ids,))
+            results = await cur.fetchall()
+            cache.put_many(results, generation)
+            return results
+
+    except DatabaseError as e:
+        logger.error(f"Database error retrieving batch metadata: {e}")
+        raise DatabaseOperationError(
+            f"Failed to retrieve batch metadata: database error - {str(e)}"
+        )
+
+
+async def _load_metadata_batch(track_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Batch function of the metadata loader.
+
+    Args:
+        track_ids: Distinct, normalized track UUIDs
+
+    Returns:
+        Dictionary mapping track UUID to its row, for the tracks found
+    """
+    if len(track_ids) == 1:
+        result = await _fetch_metadata_by_id(track_ids[0])
+        return {track_ids[0]: result} if result else {}
+
+    results = await _fetch_metadata_by_ids(track_ids)
+    logger.debug(f"Batched {len(track_ids)} concurrent track lookups, {len(results)} found")
+    return {cache_key(row["id"]): row for row in results}
+
+
+def _lookup_batching_enabled() -> bool:
+    """Whether concurrent single-track lookups are coalesced."""
+    return app_config.db_lookup_batching if HAS_APP_CONFIG else True
+
+
+def get_metadata_loader() -> AsyncBatchLoader:
+    """
+    Get the global loader that batches get_audio_metadata_by_id misses.
+
+    Returns:
+        AsyncBatchLoader: Loader keyed by normalized track UUID
+    """
+    global _metadata_loader
+    if _metadata_loader is None:
+        _metadata_loader = AsyncBatchLoader(_load_metadata_batch)
+    return _metadata_loader
+
+
+async def search_audio_tracks_advanced(
+    query: str,
+    limit: int = 20,
+    offset: int = 0,
+    status_filter: Optional[str] = None,
+    year_min: Optional[int] = None,
+    year_max: Optional[int] = None,
+    format_filter: Optional[str] = None,
+    min_rank: float = 0.0,
+    rank_normalization: int = 1,
+    include_total: bool = True,
+    cursor: Optional[str] = None,
+    genres: Optional[List[str]] = None,
+    formats: Optional[List[str]] = None,
+    duration_min: Optional[float] = None,
+    duration_max: Optional[float] = None,
+    artist_filter: Optional[str] = None,
+    album_filter: Optional[str] = None,
+    sort_by: str = 'relevance',
+    sort_order: str = 'desc',
+    facets: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Advanced full-text search without blocking the event loop.
+
+    Args:
+        See database.operations.search_audio_tracks_advanced
+
+    Returns:
+        Dictionary with tracks, total_matches, filters and pagination info
+
+    Raises:
+        ValidationError: If parameters are invalid
+        DatabaseOperationError: If search fails
+
+    Example:
+        >>> result = await search_audio_tracks_advanced("rock", status_filter="COMPLETED")
+    """
+    arguments = dict(
+        query=query,
+        limit=limit,
+        offset=offset,
+        status_filter=status_filter,
+        year_min=year_min,
+        year_max=year_max,
+        format_filter=format_filter,
+        min_rank=min_rank,
+        rank_normalization=rank_normalization,
+        include_total=include_total,
+        cursor=cursor,
+        genres=genres,
+        formats=formats,
+        duration_min=duration_min,
+        duration_max=duration_max,
+        artist_filter=artist_filter,
+        album_filter=album_filter,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        facets=facets,
+    )
+
+    if not is_async_pool_enabled():
+        return await asyncio.to_thread(operations.search_audio_tracks_advanced, **arguments)
+
+    search = build_advanced_search_queries(**arguments)
+
+    try:
+        async with get_async_connection() as conn:
+            cur = await conn.execute(search.search_query, search.search_params)
+            rows = await cur.fetchall()
+
+            total_matches = None
+            if search.needs_count(rows):
+                cur = await conn.execute(search.count_query, search.count_params)
+                total_matches = (await cur.fetchone())['total']
+
+            facet_rows = None
+            if search.facets:
+                cur = await conn.execute(search.facet_query, search.facet_params)
+                facet_rows = await cur.fetchall()
+
+            return advanced_search_response(search, rows, total_matches, facet_rows)
+
+    except DatabaseError as e:
+        if "syntax error" in str(e).lower():
+            raise ValidationError(f"Invalid search query syntax: {query}")
+
+        logger.error(f"Database error during advanced search: {e}")
+        raise DatabaseOperationError(
+            f"Advanced search operation failed: database error - {str(e)}"
+        )
+
+
+async def fuzzy_search_audio_tracks(
+    query: str,
+    limit: int = 20,
+    similarity_threshold: float = FUZZY_SIMILARITY_THRESHOLD,
+    **filters
+) -> List[Dict[str, Any]]:
+    """
+    Typo-tolerant trigram search without blocking the event loop.
+
+    Args:
+        See database.operations.fuzzy_search_audio_tracks
+
+    Returns:
+        List of track dictionaries, most similar first
+
+    Raises:
+        ValidationError: If parameters are invalid
+        DatabaseOperationError: If search fails
+
+    Example:
+        >>> tracks = await fuzzy_search_audio_tracks("beatels", status_filter="COMPLETED")
+    """
+    if not is_async_pool_enabled():
+        return await asyncio.to_thread(
+            operations.fuzzy_search_audio_tracks, query, limit, similarity_threshold, **filters
+        )
+
+    sql, params = build_fuzzy_search_query(query, limit, similarity_threshold, **filters)
+
+    try:
+        async with get_async_connection() as conn:
+            # The threshold is transaction-local; autocommit needs an explicit block
+            async with conn.transaction():
+                await conn.execute(SET_SIMILARITY_THRESHOLD_QUERY, (str(similarity_threshold),))
+                cur = await conn.execute(sql, params)
+                results = await cur.fetchall()
+
+            logger.debug(f"Fuzzy search for '{query}' returned {len(results)} results")
+            return results
+
+    except DatabaseError as e:
+        logger.error(f"Database error during fuzzy search: {e}")
+        raise DatabaseOperationError(
+            f"Fuzzy search operation failed: database error - {str(e)}"
+        )
+
+
+async def suggest_completions(
+    prefix: str,
+    limit: int = 10,
+    fields: Optional[List[str]] = None,
+    status_filter: Optional[str] = 'COMPLETED'
+) -> List[Dict[str, Any]]:
+    """
+    Complete a typed prefix without blocking the event loop.
+
+    Args:
+        See database.operations.suggest_completions
+
+    Returns:
+        List of {'field': ..., 'value': ...} dictionaries, shortest first
+
+    Raises:
+        ValidationError: If parameters are invalid
+        DatabaseOperationError: If the query fails
+
+    Example:
+        >>> suggestions = await suggest_completions("beat", limit=5)
+    """
+    if not is_async_pool_enabled():
+        return await asyncio.to_thread(
+            operations.suggest_completions, prefix, limit, fields, status_filter
+        )
+
+    sql, params = build_suggest_query(prefix, limit, fields, status_filter)
+
+    try:
+        async with get_async_connection() as conn:
+            cur = await conn.execute(sql, params)
+            return await cur.fetchall()
+
+    except DatabaseError as e:
+        logger.error(f"Database error during suggestion lookup: {e}")
+        raise DatabaseOperationError(
+            f"Suggestion lookup failed: database error - {str(e)}"
+        )
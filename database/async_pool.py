@@ -0,0 +1,381 @@
+"""
+Async connection pooling for PostgreSQL.
+
+The MCP tools and resource handlers are coroutines, so running psycopg2
+queries from them blocks the event loop for the whole round trip.
+AsyncDatabasePool keeps psycopg 3 AsyncConnections next to the psycopg2
+DatabasePool so async handlers await their queries instead. Checkouts go
+through the same "database" circuit breaker as DatabasePool.
+
+Connections run in autocommit mode: the async path serves single-statement
+reads, which then need no BEGIN/ROLLBACK round trips. Writers can still
+open an explicit transaction with ``async with conn.transaction()``.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, Deque
+
+try:
+    import psycopg
+    from psycopg.rows import dict_row
+    from psycopg.types.string import TextLoader
+    HAS_PSYCOPG = True
+except ImportError:
+    HAS_PSYCOPG = False
+
+from src.circuit_breaker import get_circuit_breaker
+from .pool import build_database_url_from_env
+
+# Try to import config, fallback to environment
+try:
+    from config import config as app_config
+    HAS_APP_CONFIG = True
+except ImportError:
+    HAS_APP_CONFIG = False
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDatabasePool:
+    """
+    Asyncio connection pool built on psycopg 3.
+
+    At most max_connections connections are checked out at once; further
+    callers wait (FIFO) on a semaphore instead of failing. Idle connections
+    are reused most-recently-returned first and dropped once closed.
+    Rows are returned as dictionaries with UUIDs as strings, matching the
+    RealDictCursor results of the psycopg2 pool.
+    """
+
+    def __init__(
+        self,
+        min_connections: int = 0,
+        max_connections: int = 10,
+        database_url: Optional[str] = None,
+        connect_timeout: int = 10,
+        **connection_kwargs
+    ):
+        """
+        Initialize the async pool.
+
+        Args:
+            min_connections: Connections opened by initialize()
+            max_connections: Maximum concurrent checkouts
+            database_url: PostgreSQL connection URL (defaults to config)
+            connect_timeout: Seconds to wait when opening a connection
+            **connection_kwargs: Additional psycopg connection parameters
+
+        Raises:
+            ImportError: If psycopg 3 is not installed
+            ValueError: If no database URL is available
+        """
+        if not HAS_PSYCOPG:
+            raise ImportError("AsyncDatabasePool requires psycopg 3 (pip install 'psycopg[binary]')")
+
+        self.min_connections = min_connections
+        self.max_connections = max_connections
+        self.connect_timeout = connect_timeout
+        self._connection_kwargs = connection_kwargs
+
+        if database_url:
+            self.database_url = database_url
+        elif HAS_APP_CONFIG and app_config.database_url:
+            self.database_url = app_config.database_url
+        else:
+            self.database_url = build_database_url_from_env()
+
+        if not self.database_url:
+            raise ValueError(
+                "Database URL must be provided via parameter, config, or environment variables"
+            )
+
+        self._idle: Deque["psycopg.AsyncConnection"] = deque()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._open_connections = 0
+
+        self._stats = {
+            "connections_created": 0,
+            "connections_closed": 0,
+            "connections_failed": 0,
+            "checkouts": 0,
+            "waits": 0,
+            "total_wait_seconds": 0.0,
+            "last_health_check": None,
+        }
+
+        logger.info(
+            f"Initialized async database pool: min={min_connections}, max={max_connections}"
+        )
+
+    async def initialize(self) -> None:
+        """
+        Open the minimum number of connections and test connectivity.
+
+        Must be called from the event loop that will use the pool.
+        """
+        if self._semaphore is not None:
+            logger.warning("Async pool already initialized")
+            return
+
+        self._semaphore = asyncio.Semaphore(self.max_connections)
+
+        try:
+            for _ in range(self.min_connections):
+                self._idle.append(await self._connect())
+
+            async with self.get_connection() as conn:
+                cur = await conn.execute("SELECT 1 AS ok")
+                row = await cur.fetchone()
+                if row["ok"] != 1:
+                    raise psycopg.DatabaseError("Health check failed")
+
+            logger.info("Async database connection pool initialized successfully")
+
+        except Exception as e:
+            logger.error(f"Failed to initialize async connection pool: {e}")
+            await self.close()
+            raise
+
+    async def close(self) -> None:
+        """Close all idle connections and reset the pool."""
+        while self._idle:
+            await self._discard(self._idle.pop())
+        self._semaphore = None
+        logger.info("Async database connection pool closed")
+
+    async def _connect(self) -> "psycopg.AsyncConnection":
+        """Open a new connection configured like the psycopg2 pool's cursors."""
+        try:
+            conn = await psycopg.AsyncConnection.connect(
+                self.database_url,
+                autocommit=True,
+                row_factory=dict_row,
+                connect_timeout=self.connect_timeout,
+                **self._connection_kwargs
+            )
+        except Exception:
+            self._stats["connections_failed"] += 1
+            raise
+
+        # psycopg2 returns UUID columns as str; keep results interchangeable
+        conn.adapters.register_loader("uuid", TextLoader)
+
+        # psycopg prepares a query after prepare_threshold executions; prepare
+        # the hot reads on first use, like database.prepared does for psycopg2
+        if HAS_APP_CONFIG:
+            conn.prepare_threshold = 0 if app_config.db_prepared_statements else None
+            conn.prepared_max = app_config.db_max_prepared_statements
+
+        self._open_connections += 1
+        self._stats["connections_created"] += 1
+        return conn
+
+    async def _discard(self, conn: "psycopg.AsyncConnection") -> None:
+        """Close a connection and drop it from the pool's accounting."""
+        try:
+            if not conn.closed:
+                await conn.close()
+        except Exception as e:
+            logger.warning(f"Error closing connection: {e}")
+        self._open_connections -= 1
+        self._stats["connections_closed"] += 1
+
+    async def _checkout(self, validate: bool = False) -> "psycopg.AsyncConnection":
+        """
+        Take the most recently used open connection, or open a new one.
+
+        Args:
+            validate: Ping idle connections before reuse (dropping those that
+                fail), so the checkout is a real round trip to the server
+        """
+        while self._idle:
+            conn = self._idle.pop()
+            if not conn.closed and (not validate or await self._ping(conn)):
+                return conn
+            await self._discard(conn)
+        return await self._connect()
+
+    async def _ping(self, conn: "psycopg.AsyncConnection") -> bool:
+        """Check that an idle connection still reaches the server."""
+        try:
+            await conn.execute("SELECT 1")
+            return True
+        except psycopg.Error as e:
+            logger.debug(f"Idle connection failed validation: {e}")
+            return False
+
+    async def _checkin(self, conn: "psycopg.AsyncConnection") -> None:
+        """Return a connection to the idle list, closing it if unusable."""
+        if conn.closed or self._semaphore is None:
+            await self._discard(conn)
+            return
+
+        if conn.info.transaction_status != psycopg.pq.TransactionStatus.IDLE:
+            try:
+                await conn.rollback()
+            except Exception as e:
+                logger.warning(f"Rollback on checkin failed, closing connection: {e}")
+                await self._discard(conn)
+                return
+
+        self._idle.append(conn)
+
+    @asynccontextmanager
+    async def get_connection(self):
+        """
+        Check out a connection for the duration of the block.
+
+        Yields:
+            psycopg AsyncConnection (autocommit, dict rows)
+
+        Raises:
+            CircuitOpenError: If the database circuit is open
+
+        Example:
+            async with pool.get_connection() as conn:
+                cur = await conn.execute("SELECT * FROM audio_tracks WHERE id = %s", (track_id,))
+                row = await cur.fetchone()
+        """
+        if self._semaphore is None:
+            await self.initialize()
+
+        breaker = get_circuit_breaker("database")
+
+        semaphore = self._semaphore
+        if semaphore.locked():
+            self._stats["waits"] += 1
+        started = time.monotonic()
+
+        async with semaphore:
+            self._stats["total_wait_seconds"] += time.monotonic() - started
+
+            # Waiting for a slot is local and must not hold a half-open probe
+            probe = breaker.before_call()
+            self._stats["checkouts"] += 1
+            conn = None
+
+            try:
+                # A probe validates its connection: the circuit only closes
+                # after a round trip to the server, not on an idle handout
+                conn = await self._checkout(validate=probe)
+                if probe:
+                    breaker.record_success()
+
+                yield conn
+            except psycopg.OperationalError:
+                # Failed connects and connections lost mid-query count against the database
+                breaker.record_failure()
+                raise
+            else:
+                breaker.record_success()
+            finally:
+                # Cancelled or failed without an outcome
+                if probe:
+                    breaker.release_probe()
+                if conn is not None:
+                    await self._checkin(conn)
+
+    async def health_check(self) -> Dict[str, Any]:
+        """
+        Perform a health check on the async pool.
+
+        Returns:
+            Dictionary with health status and statistics
+        """
+        status = {
+            "healthy": False,
+            "error": None,
+            "stats": self.get_stats(),
+            "timestamp": time.time(),
+        }
+
+        try:
+            async with self.get_connection() as conn:
+                cur = await conn.execute("SELECT version() AS version")
+                status["database_version"] = (await cur.fetchone())["version"]
+                status["healthy"] = True
+            self._stats["last_health_check"] = status["timestamp"]
+        except Exception as e:
+            status["error"] = str(e)
+            logger.error(f"Async health check failed: {e}")
+
+        return status
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get async pool statistics."""
+        stats = self._stats.copy()
+        stats["open_connections"] = self._open_connections
+        stats["idle_connections"] = len(self._idle)
+        stats["max_connections"] = self.max_connections
+        return stats
+
+
+# Global async pool instance
+_async_pool: Optional[AsyncDatabasePool] = None
+_async_pool_lock: Optional[asyncio.Lock] = None
+
+
+def is_async_pool_enabled() -> bool:
+    """Whether async handlers should use AsyncDatabasePool (psycopg 3 installed and enabled)."""
+    enabled = app_config.db_async_enabled if HAS_APP_CONFIG else True
+    return HAS_PSYCOPG and enabled
+
+
+async def get_async_pool() -> AsyncDatabasePool:
+    """
+    Get or create the global async pool, initializing it on first use.
+
+    Returns:
+        AsyncDatabasePool instance
+    """
+    global _async_pool, _async_pool_lock
+
+    if _async_pool is not None:
+        return _async_pool
+
+    if _async_pool_lock is None:
+        _async_pool_lock = asyncio.Lock()
+
+    async with _async_pool_lock:
+        if _async_pool is None:
+            max_conn = app_config.db_async_max_connections if HAS_APP_CONFIG else 10
+            pool = AsyncDatabasePool(max_connections=max_conn)
+            await pool.initialize()
+            _async_pool = pool
+
+    return _async_pool
+
+
+@asynccontextmanager
+async def get_async_connection():
+    """
+    Convenience function to check out a connection from the global async pool.
+
+    Yields:
+        psycopg AsyncConnection
+
+    Example:
+        from database.async_pool import get_async_connection
+
+        async with get_async_connection() as conn:
+            cur = await conn.execute("SELECT COUNT(*) AS total FROM audio_tracks")
+            total = (await cur.fetchone())["total"]
+    """
+    pool = await get_async_pool()
+    async with pool.get_connection() as conn:
+        yield conn
+
+
+async def close_async_pool() -> None:
+    """Close the global async pool."""
+    global _async_pool, _async_pool_lock
+
+    if _async_pool is not None:
+        await _async_pool.close()
+        _async_pool = None
+        logger.info("Global async connection pool closed")
+    _async_pool_lock = None
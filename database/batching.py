@@ -0,0 +1,170 @@
+"""
+Request coalescing for concurrent lookups by key.
+
+A client rendering a page of search results fires one metadata or
+thumbnail read per track at once, and each would run its own
+single-row query. AsyncBatchLoader (the "dataloader" pattern) collects
+the keys requested within a short window and resolves them with one
+batch call, e.g. a single WHERE id = ANY(...) query. Concurrent requests
+for the same key share one result.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Set
+
+# Try to import config, fallback to defaults
+try:
+    from config import config as app_config
+    HAS_APP_CONFIG = True
+except ImportError:
+    HAS_APP_CONFIG = False
+
+logger = logging.getLogger(__name__)
+
+BatchFunction = Callable[[List[Hashable]], Awaitable[Dict[Hashable, Any]]]
+
+
+class AsyncBatchLoader:
+    """
+    Coalesce concurrent load(key) calls into batched calls of batch_fn.
+
+    The first key of a batch schedules a flush after window_seconds (0
+    flushes on the next event loop iteration); a batch reaching
+    max_batch_size is flushed at once. batch_fn receives the distinct keys
+    and returns a dict of the values it found; missing keys resolve to
+    None. An exception from batch_fn is raised to every caller in the batch.
+
+    Pending state belongs to the running event loop and is reset when the
+    loader is first used from a different loop.
+
+    Attributes:
+        window_seconds: How long a batch collects keys
+        max_batch_size: Keys per batch call
+    """
+
+    def __init__(
+        self,
+        batch_fn: BatchFunction,
+        window_seconds: Optional[float] = None,
+        max_batch_size: Optional[int] = None,
+    ):
+        """
+        Initialize the loader.
+
+        Args:
+            batch_fn: Coroutine function resolving a list of keys to {key: value}
+            window_seconds: Collection window (defaults to config
+                db_lookup_batch_window_ms; 0 = next loop iteration)
+            max_batch_size: Maximum keys per batch (defaults to config)
+        """
+        if window_seconds is None:
+            window_seconds = app_config.db_lookup_batch_window_ms / 1000.0 if HAS_APP_CONFIG else 0.002
+        if max_batch_size is None:
+            max_batch_size = app_config.db_lookup_batch_max_size if HAS_APP_CONFIG else 100
+
+        self.batch_fn = batch_fn
+        self.window_seconds = window_seconds
+        self.max_batch_size = max(1, max_batch_size)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self.loads = 0
+        self.batches = 0
+        self.coalesced = 0
+
+    async def load(self, key: Hashable) -> Any:
+        """
+        Resolve one key as part of the current batch.
+
+        Args:
+            key: Key to look up (normalize it first; equal keys are merged)
+
+        Returns:
+            The value batch_fn returned for the key, or None
+
+        Raises:
+            Exception: Whatever batch_fn raised for this key's batch
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._pending = {}
+            self._flush_handle = None
+
+        self.loads += 1
+        future = self._pending.get(key)
+        if future is not None:
+            self.coalesced += 1
+        else:
+            future = loop.create_future()
+            # Results of callers that were cancelled are never retrieved
+            future.add_done_callback(_consume_exception)
+            self._pending[key] = future
+
+            if len(self._pending) >= self.max_batch_size:
+                self._flush()
+            elif self._flush_handle is None:
+                if self.window_seconds > 0:
+                    self._flush_handle = loop.call_later(self.window_seconds, self._flush)
+                else:
+                    self._flush_handle = loop.call_soon(self._flush)
+
+        # Shielded: one caller's cancellation must not cancel the shared result
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        """Dispatch the pending keys as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+
+        self.batches += 1
+        task = self._loop.create_task(self._dispatch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: Dict[Hashable, asyncio.Future]) -> None:
+        """Run batch_fn and resolve every future of the batch."""
+        try:
+            results = await self.batch_fn(list(batch))
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(results.get(key))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get batching statistics.
+
+        Returns:
+            Dictionary with load, batch and coalescing counts
+        """
+        return {
+            "loads": self.loads,
+            "batches": self.batches,
+            "coalesced": self.coalesced,
+            "average_batch_size": (self.loads - self.coalesced) / self.batches if self.batches else 0.0,
+            "window_seconds": self.window_seconds,
+            "max_batch_size": self.max_batch_size,
+        }
+
+
+def _consume_exception(future: asyncio.Future) -> None:
+    """Mark a future's exception as retrieved."""
+    if not future.cancelled():
+        future.exception()
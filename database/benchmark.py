@@ -0,0 +1,289 @@
+"""
+Throughput benchmark for database lookups under concurrent load.
+
+Runs N concurrent workers on one event loop, the way the MCP server serves
+tool calls, and reports requests per second and latency percentiles for:
+
+- blocking: the psycopg2 operations called directly from coroutines
+  (the handlers' behaviour before the async path; every query stalls
+  the loop)
+- async: database.async_operations on AsyncDatabasePool
+
+A second benchmark measures sequential per-query latency of the psycopg2
+metadata lookup and full-text search with server-side prepared statements
+off and on (see database.prepared). It can first seed synthetic tracks so
+the table is large enough for planning cost to show (100K+ rows).
+
+Both run with the in-process metadata cache bypassed (see
+database.metadata_cache.bypass_metadata_cache): the sampled ids fit in the
+cache, so after warm-up every lookup would otherwise be a dictionary hit.
+
+Usage:
+    python -m database.cli benchmark --concurrency 50 --requests 2000
+    python -m database.cli benchmark --prepared --seed 100000 --requests 5000
+"""
+
+import asyncio
+import logging
+import statistics
+import time
+from typing import Dict, Any, List, Callable, Awaitable
+
+from . import operations, async_operations
+from .metadata_cache import bypass_metadata_cache
+from .pool import get_connection
+from .prepared import get_statement_registry
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_MODES = ("blocking", "async")
+PREPARED_QUERIES = ("lookup", "search")
+
+BENCHMARK_TITLE_PREFIX = "Benchmark Track"
+
+
+def sample_track_ids(count: int = 1000) -> List[str]:
+    """
+    Fetch existing track ids to look up during the benchmark.
+
+    Args:
+        count: Maximum number of ids
+
+    Returns:
+        List of UUID strings
+    """
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT id::text FROM audio_tracks LIMIT %s", (count,))
+            return [row[0] for row in cur.fetchall()]
+
+
+def seed_benchmark_tracks(count: int) -> int:
+    """
+    Insert synthetic COMPLETED tracks until the table has at least count rows.
+
+    Rows are generated server-side in one statement; titles start with
+    BENCHMARK_TITLE_PREFIX so they are easy to find and remove.
+
+    Args:
+        count: Target number of rows in audio_tracks
+
+    Returns:
+        Number of rows inserted
+    """
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT COUNT(*) FROM audio_tracks")
+            missing = count - cur.fetchone()[0]
+            if missing <= 0:
+                return 0
+
+            cur.execute(
+                """
+                INSERT INTO audio_tracks (
+                    status, title, artist, album, genre, year,
+                    duration_seconds, format, audio_gcs_path
+                )
+                SELECT
+                    'COMPLETED',
+                    %s || ' ' || g,
+                    'Artist ' || (g %% 5000),
+                    'Album ' || (g %% 20000),
+                    (ARRAY['Rock', 'Jazz', 'Pop', 'Folk', 'Blues'])[1 + g %% 5],
+                    1950 + g %% 75,
+                    120 + g %% 300,
+                    'MP3',
+                    'gs://benchmark/audio/' || g || '.mp3'
+                FROM generate_series(1, %s) AS g
+                """,
+                (BENCHMARK_TITLE_PREFIX, missing),
+            )
+            cur.execute("ANALYZE audio_tracks")
+        conn.commit()
+
+    logger.info(f"Seeded {missing} benchmark tracks")
+    return missing
+
+
+def _lookup_for_mode(mode: str) -> Callable[[str], Awaitable[Any]]:
+    """Return a coroutine function performing one lookup in the given mode."""
+    if mode == "blocking":
+        async def lookup(track_id: str):
+            return operations.get_audio_metadata_by_id(track_id)
+        return lookup
+    if mode == "async":
+        return async_operations.get_audio_metadata_by_id
+    raise ValueError(f"Unknown benchmark mode: {mode}. Valid modes: {BENCHMARK_MODES}")
+
+
+async def run_lookup_benchmark(
+    mode: str,
+    track_ids: List[str],
+    concurrency: int = 50,
+    requests: int = 2000,
+) -> Dict[str, Any]:
+    """
+    Run get_audio_metadata_by_id lookups from concurrent workers.
+
+    Args:
+        mode: "blocking" or "async"
+        track_ids: Ids to look up (cycled)
+        concurrency: Number of concurrent workers
+        requests: Total lookups across all workers
+
+    Returns:
+        Dictionary with mode, requests, duration, throughput and latency percentiles (ms)
+    """
+    if not track_ids:
+        raise ValueError("Benchmark needs at least one track id")
+
+    lookup = _lookup_for_mode(mode)
+    latencies: List[float] = []
+    counter = iter(range(requests))
+
+    async def worker():
+        for i in counter:
+            started = time.perf_counter()
+            await lookup(track_ids[i % len(track_ids)])
+            latencies.append(time.perf_counter() - started)
+
+    with bypass_metadata_cache():
+        # Warm up connections so pool creation is not measured
+        await asyncio.gather(*(lookup(track_ids[0]) for _ in range(concurrency)))
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        duration = time.perf_counter() - started
+
+    latencies.sort()
+    ms = [value * 1000 for value in latencies]
+    return {
+        "mode": mode,
+        "requests": len(latencies),
+        "concurrency": concurrency,
+        "duration_seconds": round(duration, 3),
+        "requests_per_second": round(len(latencies) / duration, 1),
+        "p50_ms": round(statistics.median(ms), 2),
+        "p95_ms": round(ms[int(len(ms) * 0.95) - 1], 2),
+        "max_ms": round(ms[-1], 2),
+    }
+
+
+def benchmark_lookups(
+    modes: List[str] = BENCHMARK_MODES,
+    concurrency: int = 50,
+    requests: int = 2000,
+) -> List[Dict[str, Any]]:
+    """
+    Benchmark metadata lookups in each mode against the configured database.
+
+    Args:
+        modes: Modes to run, in order
+        concurrency: Number of concurrent workers
+        requests: Total lookups per mode
+
+    Returns:
+        List of result dictionaries (see run_lookup_benchmark)
+    """
+    track_ids = sample_track_ids()
+    logger.info(f"Benchmarking {requests} lookups over {len(track_ids)} tracks, concurrency={concurrency}")
+
+    async def run_all():
+        results = []
+        for mode in modes:
+            results.append(await run_lookup_benchmark(mode, track_ids, concurrency, requests))
+        from .async_pool import close_async_pool
+        await close_async_pool()
+        return results
+
+    return asyncio.run(run_all())
+
+
+def _latency_summary(latencies: List[float]) -> Dict[str, Any]:
+    """Per-query latency percentiles in milliseconds."""
+    ms = sorted(value * 1000 for value in latencies)
+    return {
+        "requests": len(ms),
+        "mean_ms": round(statistics.fmean(ms), 3),
+        "p50_ms": round(statistics.median(ms), 3),
+        "p95_ms": round(ms[int(len(ms) * 0.95) - 1], 3),
+    }
+
+
+def run_prepared_benchmark(
+    query: str,
+    prepared: bool,
+    track_ids: List[str],
+    requests: int = 2000,
+) -> Dict[str, Any]:
+    """
+    Time sequential psycopg2 queries with prepared statements off or on.
+
+    Args:
+        query: "lookup" (get_audio_metadata_by_id) or "search" (search_audio_tracks_advanced)
+        prepared: Whether to run through server-side prepared statements
+        track_ids: Ids to look up (cycled)
+        requests: Number of queries
+
+    Returns:
+        Dictionary with query, prepared flag and latency summary (ms)
+    """
+    if query == "lookup":
+        if not track_ids:
+            raise ValueError("Benchmark needs at least one track id")
+        run = lambda i: operations.get_audio_metadata_by_id(track_ids[i % len(track_ids)])
+    elif query == "search":
+        terms = ["rock", "jazz", "album", "artist", "track"]
+        run = lambda i: operations.search_audio_tracks_advanced(
+            terms[i % len(terms)], limit=20, status_filter="COMPLETED"
+        )
+    else:
+        raise ValueError(f"Unknown benchmark query: {query}. Valid queries: {PREPARED_QUERIES}")
+
+    registry = get_statement_registry()
+    previous = registry.enabled
+    registry.enabled = prepared
+    try:
+        with bypass_metadata_cache():
+            # Warm up so connection setup and the PREPARE itself are not measured
+            for i in range(min(20, requests)):
+                run(i)
+
+            latencies: List[float] = []
+            for i in range(requests):
+                started = time.perf_counter()
+                run(i)
+                latencies.append(time.perf_counter() - started)
+    finally:
+        registry.enabled = previous
+
+    result = {"query": query, "prepared": prepared}
+    result.update(_latency_summary(latencies))
+    return result
+
+
+def benchmark_prepared_statements(
+    requests: int = 2000,
+    seed_rows: int = 0,
+) -> List[Dict[str, Any]]:
+    """
+    Compare per-query latency with and without prepared statements.
+
+    Args:
+        requests: Queries per (query, prepared) combination
+        seed_rows: If set, first seed the table up to this many rows
+
+    Returns:
+        List of result dictionaries (see run_prepared_benchmark)
+    """
+    if seed_rows:
+        seed_benchmark_tracks(seed_rows)
+
+    track_ids = sample_track_ids()
+    logger.info(f"Benchmarking prepared statements: {requests} queries each over {len(track_ids)} tracks")
+
+    results = []
+    for query in PREPARED_QUERIES:
+        for prepared in (False, True):
+            results.append(run_prepared_benchmark(query, prepared, track_ids, requests))
+    return results
@@ -7,12 +7,17 @@ Provides commands for database operations including:
 - Connection testing
 - Health checks
 - Data operations
+- Storage reconciliation (orphaned blobs)
+- Lookup throughput benchmark
 
 Usage:
     python -m database.cli migrate up
     python -m database.cli migrate status
     python -m database.cli health
     python -m database.cli test-connection
+    python -m database.cli reconcile-storage [--apply]
+    python -m database.cli benchmark [--concurrency 50] [--requests 2000]
+    python -m database.cli benchmark --prepared [--seed 100000]
 """
 
 import argparse
@@ -128,6 +133,17 @@ def stats_command(args):
         print(f"Connections Closed: {stats['connections_closed']}")
         print(f"Connections Failed: {stats['connections_failed']}")
         print(f"Queries Executed: {stats['queries_executed']}")
+        print(f"Validation Skipped (recently used): {stats['validation_skipped']}")
+        print(f"Validation Pings (idle): {stats['validation_pings']}")
+        print(f"Validation Failures: {stats['validation_failures']}")
+        print(f"Connections Evicted: {stats['connections_evicted']}")
+        print(f"Keepalive Pings: {stats['keepalive_pings']}")
+        print(f"Queue Depth: {stats['queue_depth']} (max {stats['max_queue_depth']})")
+        print(f"Checkout Timeouts: {stats['checkout_timeouts']}")
+        print(f"Checkouts Rejected (queue full): {stats['checkouts_rejected']}")
+        print("Checkout Wait Histogram:")
+        for bucket, count in stats['wait_histogram'].items():
+            print(f"  {bucket:>9}: {count}")
         
         if stats['last_health_check']:
             from datetime import datetime
@@ -182,6 +198,94 @@ def create_sample_data_command(args):
         return 1
 
 
+def reconcile_storage_command(args):
+    """Find (and optionally delete) blobs with no audio_tracks row."""
+    try:
+        from src.storage.reconcile import reconcile_storage
+        
+        report = reconcile_storage(
+            dry_run=not args.apply,
+            prefix=args.prefix,
+            batch_size=args.batch_size,
+            max_deletes_per_second=args.max_deletes_per_second,
+            min_age_seconds=args.min_age_hours * 3600,
+        )
+        
+        print("\n=== Storage Reconciliation ===")
+        print(f"Mode: {'dry run' if report.dry_run else 'apply'}")
+        print(f"Blobs Scanned: {report.scanned_blobs}")
+        print(f"Track IDs Checked: {report.checked_ids}")
+        print(f"Orphaned IDs: {report.orphan_ids}")
+        print(f"Orphaned Blobs: {report.orphan_blobs}")
+        print(f"Skipped (too recent): {report.skipped_recent_ids}")
+        print(f"Unrecognized Blobs: {report.unrecognized_blobs}")
+        if not report.dry_run:
+            print(f"Deleted Blobs: {report.deleted_blobs}")
+            print(f"Failed Deletes: {report.failed_blobs}")
+        print(f"Duration: {report.duration_seconds:.1f}s")
+        
+        for name in report.sample_orphans:
+            print(f"  orphan: {name}")
+        
+        return 1 if report.failed_blobs else 0
+        
+    except Exception as e:
+        logger.error(f"Storage reconciliation failed: {e}")
+        return 1
+
+
+def benchmark_command(args):
+    """Measure concurrent metadata lookup throughput per access path."""
+    if args.prepared:
+        return benchmark_prepared_command(args)
+    
+    try:
+        from database.benchmark import benchmark_lookups
+        
+        results = benchmark_lookups(
+            modes=args.modes,
+            concurrency=args.concurrency,
+            requests=args.requests,
+        )
+        
+        print("\n=== Lookup Benchmark ===")
+        print(f"{'Mode':<10} {'Req/s':>10} {'p50 ms':>10} {'p95 ms':>10} {'max ms':>10}")
+        for result in results:
+            print(
+                f"{result['mode']:<10} {result['requests_per_second']:>10} "
+                f"{result['p50_ms']:>10} {result['p95_ms']:>10} {result['max_ms']:>10}"
+            )
+        return 0
+        
+    except Exception as e:
+        logger.error(f"Benchmark failed: {e}")
+        return 1
+
+
+def benchmark_prepared_command(args):
+    """Measure per-query latency with prepared statements off and on."""
+    try:
+        from database.benchmark import benchmark_prepared_statements
+        
+        results = benchmark_prepared_statements(
+            requests=args.requests,
+            seed_rows=args.seed,
+        )
+        
+        print("\n=== Prepared Statement Benchmark ===")
+        print(f"{'Query':<8} {'Prepared':<10} {'mean ms':>10} {'p50 ms':>10} {'p95 ms':>10}")
+        for result in results:
+            print(
+                f"{result['query']:<8} {str(result['prepared']):<10} {result['mean_ms']:>10} "
+                f"{result['p50_ms']:>10} {result['p95_ms']:>10}"
+            )
+        return 0
+        
+    except Exception as e:
+        logger.error(f"Prepared statement benchmark failed: {e}")
+        return 1
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Database CLI for Loist Music Library",
@@ -229,6 +333,78 @@ def main():
     )
     sample_parser.set_defaults(func=create_sample_data_command)
     
+    # Reconcile storage command
+    reconcile_parser = subparsers.add_parser(
+        'reconcile-storage',
+        help='Find and delete blobs that have no audio_tracks row (dry run by default)'
+    )
+    reconcile_parser.add_argument(
+        '--apply',
+        action='store_true',
+        help='Delete orphaned blobs (default: report only)'
+    )
+    reconcile_parser.add_argument(
+        '--prefix',
+        default='audio/',
+        help='Bucket prefix holding per-track directories (default: audio/)'
+    )
+    reconcile_parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=500,
+        help='Track IDs checked against the database per query (default: 500)'
+    )
+    reconcile_parser.add_argument(
+        '--max-deletes-per-second',
+        type=float,
+        default=50.0,
+        help='Upper bound on the delete rate (default: 50)'
+    )
+    reconcile_parser.add_argument(
+        '--min-age-hours',
+        type=float,
+        default=1.0,
+        help='Skip tracks with blobs younger than this, e.g. uploads still in progress (default: 1)'
+    )
+    reconcile_parser.set_defaults(func=reconcile_storage_command)
+    
+    # Benchmark command
+    benchmark_parser = subparsers.add_parser(
+        'benchmark',
+        help='Measure concurrent metadata lookup throughput (blocking vs async)'
+    )
+    benchmark_parser.add_argument(
+        '--modes',
+        nargs='+',
+        choices=['blocking', 'async'],
+        default=['blocking', 'async'],
+        help='Access paths to measure (default: blocking async)'
+    )
+    benchmark_parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=50,
+        help='Concurrent workers on the event loop (default: 50)'
+    )
+    benchmark_parser.add_argument(
+        '--requests',
+        type=int,
+        default=2000,
+        help='Total lookups per mode (default: 2000)'
+    )
+    benchmark_parser.add_argument(
+        '--prepared',
+        action='store_true',
+        help='Compare sequential query latency with prepared statements off and on'
+    )
+    benchmark_parser.add_argument(
+        '--seed',
+        type=int,
+        default=0,
+        help='With --prepared, first add synthetic tracks up to this many rows (e.g. 100000)'
+    )
+    benchmark_parser.set_defaults(func=benchmark_command)
+    
     # Parse arguments
     args = parser.parse_args()
     
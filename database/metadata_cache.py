@@ -0,0 +1,532 @@
+"""
+Read-through cache for track metadata lookups.
+
+get_audio_metadata_by_id/_by_ids back every embed page, oEmbed call and
+resource read, and the same hot tracks are requested over and over. Each
+lookup is a pool checkout, possibly a validation ping, and a query, so the
+rows are kept in a bounded in-process LRU with a TTL.
+
+Coherence across replicas comes from PostgreSQL LISTEN/NOTIFY: triggers on
+audio_tracks (migrations 007 and 008) send the id of every inserted,
+updated or deleted track on the audio_tracks_changed channel, and a
+MetadataChangeListener thread in each replica drops those entries. Entries
+are only served while the listener is connected (or when listening is
+disabled in configuration), because without it a replica would not hear
+about other replicas' writes. Writes made through database.operations
+also invalidate locally right away.
+
+The same change feed drives the library generation: a counter bumped on
+every change, which caches of derived results (search pages) store with
+their entries and compare on lookup.
+"""
+
+import logging
+import select
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import psycopg2
+from psycopg2 import extensions
+
+from .pool import build_database_url_from_env
+
+# Try to import config, fallback to defaults
+try:
+    from config import config as app_config
+    HAS_APP_CONFIG = True
+except ImportError:
+    HAS_APP_CONFIG = False
+
+logger = logging.getLogger(__name__)
+
+# NOTIFY channel written by the audio_tracks triggers (migrations 007, 008); "*" invalidates everything
+CHANGE_CHANNEL = "audio_tracks_changed"
+INVALIDATE_ALL = "*"
+
+
+def cache_key(track_id: Any) -> str:
+    """Normalize a track id (str or UUID, any case) to its canonical string."""
+    return str(uuid.UUID(str(track_id)))
+
+
+class MetadataCache:
+    """
+    Bounded LRU + TTL cache of audio_tracks rows keyed by track id.
+
+    Readers take a generation token before querying and pass it to put();
+    if any invalidation happened in between, the row may predate it and is
+    not stored. This keeps a slow read from re-caching a row that a
+    concurrent write (or NOTIFY) has just invalidated.
+
+    Attributes:
+        max_entries: Maximum cached rows before LRU eviction
+        ttl_seconds: Maximum age of a cached row
+        require_listener: Only serve entries while a change listener is connected
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        ttl_seconds: float = 300.0,
+        require_listener: bool = True,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: LRU capacity (0 disables caching)
+            ttl_seconds: Seconds a row may be served after it was read
+            require_listener: Bypass the cache unless a MetadataChangeListener
+                is connected (set False for a single replica, where local
+                invalidation on writes is enough)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.require_listener = require_listener
+        self._entries: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._listening = False
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def coherent(self) -> bool:
+        """Whether this process currently hears about every audio_tracks change."""
+        return self._listening or not self.require_listener
+
+    @property
+    def active(self) -> bool:
+        """Whether entries may currently be served and stored."""
+        return self.max_entries > 0 and self.coherent
+
+    @property
+    def generation(self) -> int:
+        """Token for put(); take it before running the query."""
+        return self._generation
+
+    def set_listening(self, listening: bool) -> None:
+        """
+        Record whether the change listener is connected.
+
+        Both transitions clear the cache: notifications may have been
+        missed while disconnected, and entries read before LISTEN started
+        were never covered by it.
+        """
+        with self._lock:
+            self._listening = listening
+            self._clear_locked()
+
+    def get(self, track_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return a copy of the cached row, or None on a miss.
+
+        Args:
+            track_id: Track UUID
+
+        Returns:
+            Track metadata dictionary, or None if not cached
+        """
+        if not self.active:
+            return None
+
+        key = cache_key(track_id)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(entry[0])
+
+    def get_many(self, track_ids: Iterable[str]) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Look up several tracks at once.
+
+        Args:
+            track_ids: Track UUIDs
+
+        Returns:
+            Tuple of (cached rows, ids that must be queried)
+        """
+        if not self.active:
+            return [], list(track_ids)
+
+        found = []
+        missing = []
+        for track_id in track_ids:
+            row = self.get(track_id)
+            if row is None:
+                missing.append(track_id)
+            else:
+                found.append(row)
+        return found, missing
+
+    def put(self, row: Dict[str, Any], generation: int) -> bool:
+        """
+        Store a row read from the database.
+
+        Args:
+            row: Track metadata dictionary (must contain "id")
+            generation: Value of `generation` taken before the query ran
+
+        Returns:
+            True if stored, False if skipped (cache inactive, or an
+            invalidation happened since the token was taken)
+        """
+        if not self.active:
+            return False
+
+        key = cache_key(row["id"])
+        with self._lock:
+            if generation != self._generation:
+                return False
+
+            self._entries[key] = (dict(row), time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return True
+
+    def put_many(self, rows: Iterable[Dict[str, Any]], generation: int) -> None:
+        """Store several rows read under the same generation token."""
+        for row in rows:
+            self.put(row, generation)
+
+    def invalidate(self, track_id: Any) -> None:
+        """
+        Drop one track, e.g. after it was updated or deleted.
+
+        Args:
+            track_id: Track UUID, or INVALIDATE_ALL to clear the cache
+        """
+        if track_id == INVALIDATE_ALL:
+            self.clear()
+            return
+
+        try:
+            key = cache_key(track_id)
+        except ValueError:
+            logger.warning(f"Ignoring metadata invalidation for invalid id: {track_id}")
+            return
+
+        with self._lock:
+            self._generation += 1
+            self.invalidations += 1
+            self._entries.pop(key, None)
+
+    def invalidate_many(self, track_ids: Iterable[Any]) -> None:
+        """Drop several tracks."""
+        for track_id in track_ids:
+            self.invalidate(track_id)
+
+    def _clear_locked(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self.invalidations += 1
+            self._clear_locked()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with size, hit/miss counts and listener state
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "listening": self._listening,
+                "active": self.active,
+            }
+
+
+class MetadataChangeListener:
+    """
+    Background LISTEN on audio_tracks_changed that invalidates a MetadataCache.
+
+    Uses its own autocommit connection (LISTEN needs a session that is not
+    returned to a pool). On any connection error the cache is marked
+    not-listening, which also clears it, and the listener reconnects with
+    exponential backoff.
+    """
+
+    def __init__(
+        self,
+        cache: MetadataCache,
+        database_url: str,
+        poll_timeout: float = 5.0,
+        heartbeat_seconds: float = 30.0,
+        max_backoff_seconds: float = 30.0,
+        connect: Callable[[str], Any] = psycopg2.connect,
+    ):
+        """
+        Initialize the listener.
+
+        Args:
+            cache: Cache to invalidate
+            database_url: PostgreSQL URL for the dedicated connection
+            poll_timeout: Seconds each wait for notifications blocks
+            heartbeat_seconds: Idle time after which the connection is pinged
+                so a dead socket is noticed
+            max_backoff_seconds: Cap of the reconnect delay
+            connect: Connection factory (psycopg2.connect)
+        """
+        self.cache = cache
+        self.database_url = database_url
+        self.poll_timeout = poll_timeout
+        self.heartbeat_seconds = heartbeat_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self._connect = connect
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.notifications = 0
+
+    def start(self) -> None:
+        """Start the listener thread."""
+        if self._thread is not None:
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="db-metadata-listener", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the listener thread and stop serving cached entries."""
+        if self._thread is None:
+            return
+
+        self._stop.set()
+        self._thread.join(timeout=self.poll_timeout + 5)
+        self._thread = None
+        self._set_listening(False)
+
+    def handle_notification(self, payload: str) -> None:
+        """Apply one audio_tracks_changed payload (a track id or "*")."""
+        self.notifications += 1
+        self.cache.invalidate(payload)
+        bump_library_generation()
+
+    def _set_listening(self, listening: bool) -> None:
+        # Changes may have been missed around (re)connects
+        self.cache.set_listening(listening)
+        bump_library_generation()
+
+    def _listen_once(self) -> None:
+        """Connect, LISTEN and dispatch notifications until an error or stop."""
+        conn = self._connect(self.database_url)
+        try:
+            conn.set_isolation_level(extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+            with conn.cursor() as cur:
+                cur.execute(f"LISTEN {CHANGE_CHANNEL}")
+
+            self._set_listening(True)
+            logger.info(f"Listening for track changes on {CHANGE_CHANNEL}")
+
+            last_activity = time.monotonic()
+            while not self._stop.is_set():
+                readable, _, _ = select.select([conn], [], [], self.poll_timeout)
+                if readable:
+                    conn.poll()
+                    while conn.notifies:
+                        self.handle_notification(conn.notifies.pop(0).payload)
+                    last_activity = time.monotonic()
+                elif time.monotonic() - last_activity >= self.heartbeat_seconds:
+                    with conn.cursor() as cur:
+                        cur.execute("SELECT 1")
+                    last_activity = time.monotonic()
+        finally:
+            self._set_listening(False)
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def _run(self) -> None:
+        """Keep a LISTEN session open until stopped, reconnecting on errors."""
+        backoff = 1.0
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                self._listen_once()
+            except Exception as e:
+                logger.warning(f"Metadata change listener disconnected: {e}")
+
+            # A session that stayed up for a while resets the backoff
+            if time.monotonic() - started > self.max_backoff_seconds:
+                backoff = 1.0
+            if self._stop.wait(backoff):
+                break
+            backoff = min(backoff * 2, self.max_backoff_seconds)
+
+
+# Library generation: bumped on every audio_tracks change this process hears of
+_library_generation = 0
+_generation_lock = threading.Lock()
+
+
+def get_library_generation() -> int:
+    """
+    Get the current library generation.
+
+    Caches of derived results store the generation read before computing
+    an entry and only serve it while the generation is unchanged.
+
+    Returns:
+        Generation counter
+    """
+    return _library_generation
+
+
+def bump_library_generation() -> int:
+    """
+    Record that audio_tracks changed (insert, update, delete or a missed feed).
+
+    Returns:
+        The new generation
+    """
+    global _library_generation
+    with _generation_lock:
+        _library_generation += 1
+        return _library_generation
+
+
+def library_changes_tracked() -> bool:
+    """
+    Whether every audio_tracks change reaches this process.
+
+    True while the change listener is connected, or always when
+    db_metadata_cache_listen is off (single replica: local writes are the
+    only writes). Derived-result caches should not serve entries otherwise.
+
+    Returns:
+        True if the library generation can be trusted
+    """
+    return get_metadata_cache().coherent
+
+
+# Global cache and listener
+_metadata_cache: Optional[MetadataCache] = None
+_listener: Optional[MetadataChangeListener] = None
+_init_lock = threading.Lock()
+
+
+def _resolve_database_url() -> Optional[str]:
+    """Database URL the pool would use (config, then DB_* environment)."""
+    if HAS_APP_CONFIG and app_config.database_url:
+        return app_config.database_url
+    return build_database_url_from_env()
+
+
+def get_metadata_cache() -> MetadataCache:
+    """
+    Get the global MetadataCache instance.
+
+    Creates the cache on first access from configuration and, when
+    db_metadata_cache_listen is on and a database is configured, starts
+    the change listener that makes it active. The listener also runs with
+    row caching disabled if search_cache_enabled is on, since search
+    results are only cached while library changes are tracked.
+
+    Returns:
+        MetadataCache: Global cache instance
+    """
+    global _metadata_cache, _listener
+    if _metadata_cache is not None:
+        return _metadata_cache
+
+    with _init_lock:
+        if _metadata_cache is None:
+            if HAS_APP_CONFIG:
+                enabled = app_config.db_metadata_cache_enabled
+                listen = app_config.db_metadata_cache_listen
+                search_cache = app_config.search_cache_enabled
+                cache = MetadataCache(
+                    max_entries=app_config.db_metadata_cache_max_entries if enabled else 0,
+                    ttl_seconds=app_config.db_metadata_cache_ttl_seconds,
+                    require_listener=listen,
+                )
+            else:
+                listen = True
+                search_cache = False
+                cache = MetadataCache()
+
+            # The search cache relies on library_changes_tracked(), so it
+            # needs the listener even when row caching is disabled
+            needs_listener = listen and (cache.max_entries > 0 or search_cache)
+            database_url = _resolve_database_url() if needs_listener else None
+            if database_url:
+                _listener = MetadataChangeListener(cache, database_url)
+                _listener.start()
+            elif needs_listener:
+                logger.warning(
+                    "No database URL for the metadata change listener; "
+                    "metadata and search caches stay bypassed"
+                )
+
+            _metadata_cache = cache
+
+    return _metadata_cache
+
+
+@contextmanager
+def bypass_metadata_cache():
+    """
+    Serve every metadata lookup from the database for the duration of the block.
+
+    Swaps in a disabled cache (which also reports library changes as
+    untracked, so derived-result caches step aside too) and restores the
+    global cache afterwards. Used by the benchmarks, which would otherwise
+    measure in-process dictionary hits.
+
+    Example:
+        >>> with bypass_metadata_cache():
+        ...     get_audio_metadata_by_id(track_id)  # always queries
+    """
+    global _metadata_cache
+
+    with _init_lock:
+        previous = _metadata_cache
+        _metadata_cache = MetadataCache(max_entries=0)
+    try:
+        yield
+    finally:
+        with _init_lock:
+            _metadata_cache = previous
+
+
+def close_metadata_cache() -> None:
+    """Stop the change listener and discard the global cache."""
+    global _metadata_cache, _listener
+
+    with _init_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+        _metadata_cache = None
@@ -0,0 +1,25 @@
+-- migration_002_keyset_pagination_indexes.sql
+-- Indexes backing keyset (cursor) pagination of track listings
+--
+-- get_all_audio_metadata pages with seek predicates such as
+--   WHERE (created_at, id) < ($1, $2) ORDER BY created_at DESC, id DESC
+-- Each index below matches one supported sort order (with id as the
+-- tie-breaker), so a deep page is an index range scan of `limit` rows
+-- instead of reading and discarding every earlier row.
+--
+-- The single-column created_at/updated_at indexes from 001 are prefixes
+-- of the new composite indexes and are dropped.
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_audio_tracks_created_at_id ON audio_tracks(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_audio_tracks_updated_at_id ON audio_tracks(updated_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_audio_tracks_title_id ON audio_tracks(title, id);
+
+-- Listing restricted to one status (e.g. the COMPLETED library view)
+CREATE INDEX IF NOT EXISTS idx_audio_tracks_status_created_at_id ON audio_tracks(status, created_at DESC, id DESC);
+
+DROP INDEX IF EXISTS idx_audio_tracks_created_at;
+DROP INDEX IF EXISTS idx_audio_tracks_updated_at;
+
+COMMIT;
@@ -0,0 +1,26 @@
+-- migration_003_search_filter_indexes.sql
+-- Indexes for the structured filters of search_library
+--
+-- search_audio_tracks_advanced turns every SearchFilters field into a
+-- predicate next to the full-text match:
+--   LOWER(genre) = ANY($n)            -> idx_audio_tracks_genre_lower
+--   UPPER(format) = ANY($n)           -> idx_audio_tracks_status_format
+--   duration_seconds BETWEEN ...      -> idx_audio_tracks_status_duration
+--   year BETWEEN ...                  -> idx_audio_tracks_status_year
+--   artist / album ILIKE '%...%'      -> trigram GIN indexes from 001
+-- The planner can combine these with the search_vector GIN index in a
+-- bitmap AND when a filter is more selective than the text match.
+--
+-- Filters are always applied together with status = 'COMPLETED', so the
+-- range indexes lead with status. They are not partial indexes: the
+-- status value arrives as a parameter of a prepared statement, which a
+-- generic plan cannot match against a partial index predicate.
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_audio_tracks_genre_lower ON audio_tracks(LOWER(genre));
+CREATE INDEX IF NOT EXISTS idx_audio_tracks_status_format ON audio_tracks(status, UPPER(format));
+CREATE INDEX IF NOT EXISTS idx_audio_tracks_status_duration ON audio_tracks(status, duration_seconds);
+CREATE INDEX IF NOT EXISTS idx_audio_tracks_status_year ON audio_tracks(status, year);
+
+COMMIT;
@@ -0,0 +1,18 @@
+-- migration_004_search_sort_indexes.sql
+-- Indexes for ordering search results by a column
+--
+-- search_library with sortBy other than relevance orders by
+--   <column> ASC|DESC, id ASC|DESC
+-- using PostgreSQL's default NULL placement, so a (column, id) btree
+-- index returns rows already in order (forwards or backwards). For broad
+-- full-text matches the planner can then walk the index, test each row
+-- against the tsquery and stop after LIMIT rows instead of sorting the
+-- whole match set. title and created_at are covered by migration 002.
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_audio_tracks_artist_id ON audio_tracks(artist, id);
+CREATE INDEX IF NOT EXISTS idx_audio_tracks_year_id ON audio_tracks(year, id);
+CREATE INDEX IF NOT EXISTS idx_audio_tracks_duration_id ON audio_tracks(duration_seconds, id);
+
+COMMIT;
@@ -0,0 +1,23 @@
+-- migration_005_fuzzy_search_index.sql
+-- Indexed expression for typo-tolerant (trigram) search
+--
+-- Fuzzy search used to filter with
+--   similarity(COALESCE(artist, '') || ' ' || title, $1) > $2
+-- which no index can answer, so every query scanned the whole table.
+-- fuzzy_search_audio_tracks now matches with the pg_trgm operator
+--   fuzzy_text % $1
+-- (cut-off taken from pg_trgm.similarity_threshold), which the trigram GIN
+-- index below serves.
+--
+-- Adding a stored generated column rewrites audio_tracks; run this during
+-- a maintenance window on large libraries.
+
+BEGIN;
+
+ALTER TABLE audio_tracks
+    ADD COLUMN IF NOT EXISTS fuzzy_text TEXT
+    GENERATED ALWAYS AS (COALESCE(artist, '') || ' ' || title) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_audio_tracks_fuzzy_text ON audio_tracks USING GIN(fuzzy_text gin_trgm_ops);
+
+COMMIT;
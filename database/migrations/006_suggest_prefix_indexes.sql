@@ -0,0 +1,18 @@
+-- migration_006_suggest_prefix_indexes.sql
+-- Prefix indexes for the suggest (autocomplete) tool
+--
+-- suggest_completions looks up, per field,
+--   WHERE status = $1 AND LOWER(artist) COLLATE "C" LIKE 'beat%'
+--   ORDER BY LOWER(artist) COLLATE "C" LIMIT $n
+-- Under the C collation a left-anchored LIKE becomes an index range (the
+-- same as text_pattern_ops), and unlike a text_pattern_ops index this one
+-- also returns rows in the ORDER BY order, so the scan stops after the
+-- first distinct values instead of reading every track with the prefix.
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_audio_tracks_suggest_artist ON audio_tracks(status, (LOWER(artist) COLLATE "C"));
+CREATE INDEX IF NOT EXISTS idx_audio_tracks_suggest_title ON audio_tracks(status, (LOWER(title) COLLATE "C"));
+CREATE INDEX IF NOT EXISTS idx_audio_tracks_suggest_album ON audio_tracks(status, (LOWER(album) COLLATE "C"));
+
+COMMIT;
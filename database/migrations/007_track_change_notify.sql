@@ -0,0 +1,37 @@
+-- migration_007_track_change_notify.sql
+-- Change notifications for the metadata read-through cache
+--
+-- Every replica caches audio_tracks rows in memory (database.metadata_cache)
+-- and LISTENs on audio_tracks_changed. These triggers send the id of each
+-- updated or deleted track (TRUNCATE sends "*"), so every replica drops
+-- its copy when the transaction commits. Notifications are delivered only
+-- on commit, and identical payloads within one transaction are merged.
+-- Inserts need no notification: missing tracks are never cached.
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION notify_audio_track_change()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        PERFORM pg_notify('audio_tracks_changed', '*');
+    ELSE
+        PERFORM pg_notify('audio_tracks_changed', OLD.id::text);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_notify_audio_tracks_change ON audio_tracks;
+CREATE TRIGGER trg_notify_audio_tracks_change
+    AFTER UPDATE OR DELETE ON audio_tracks
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_audio_track_change();
+
+DROP TRIGGER IF EXISTS trg_notify_audio_tracks_truncate ON audio_tracks;
+CREATE TRIGGER trg_notify_audio_tracks_truncate
+    AFTER TRUNCATE ON audio_tracks
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION notify_audio_track_change();
+
+COMMIT;
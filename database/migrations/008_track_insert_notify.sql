@@ -0,0 +1,32 @@
+-- migration_008_track_insert_notify.sql
+-- Notify audio_tracks inserts as well as updates and deletes
+--
+-- Cached search_library pages (src.tools.query_tools) are expired through
+-- the library generation, which each replica bumps for every
+-- audio_tracks_changed notification. A new track changes search results
+-- even though no cached metadata row refers to it, so inserts are
+-- notified too; for the metadata cache the new id is simply not cached.
+
+BEGIN;
+
+CREATE OR REPLACE FUNCTION notify_audio_track_change()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'TRUNCATE' THEN
+        PERFORM pg_notify('audio_tracks_changed', '*');
+    ELSIF TG_OP = 'INSERT' THEN
+        PERFORM pg_notify('audio_tracks_changed', NEW.id::text);
+    ELSE
+        PERFORM pg_notify('audio_tracks_changed', OLD.id::text);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_notify_audio_tracks_change ON audio_tracks;
+CREATE TRIGGER trg_notify_audio_tracks_change
+    AFTER INSERT OR UPDATE OR DELETE ON audio_tracks
+    FOR EACH ROW
+    EXECUTE FUNCTION notify_audio_track_change();
+
+COMMIT;
@@ -7,12 +7,16 @@ transaction management, and comprehensive error handling.
 
 import logging
 import uuid
-from typing import Optional, Dict, Any, List
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List, Set, Tuple
 from datetime import datetime
 import psycopg2.extras
 from psycopg2 import DatabaseError, IntegrityError
 
 from .pool import get_connection
+from .prepared import execute_prepared
+from .metadata_cache import get_metadata_cache, bump_library_generation
+from .pagination import cursor_scope, encode_cursor, decode_cursor
 from src.exceptions import (
     StorageError,
     ValidationError,
@@ -23,6 +27,17 @@ from src.exceptions import (
 logger = logging.getLogger(__name__)
 
 
+def _tracks_changed(track_ids: List[str]) -> None:
+    """
+    Drop changed tracks from the metadata cache and expire cached searches.
+    
+    Called after commit; other replicas learn of the change from the
+    audio_tracks NOTIFY triggers (migrations 007 and 008).
+    """
+    get_metadata_cache().invalidate_many(track_ids)
+    bump_library_generation()
+
+
 # ============================================================================
 # Save Metadata Operations
 # ============================================================================
@@ -179,6 +194,7 @@ def save_audio_metadata(
                 
                 # Commit transaction
                 conn.commit()
+                _tracks_changed([track_id])
                 
                 logger.info(f"Successfully saved audio metadata for track: {track_id}")
                 
@@ -307,12 +323,27 @@ def save_audio_metadata_batch(
 # Retrieve Metadata Operations
 # ============================================================================
 
+# Columns returned by metadata lookups
+TRACK_METADATA_COLUMNS = """
+    id, status, artist, title, album, genre, year,
+    duration_seconds, channels, sample_rate, bitrate,
+    format, file_size_bytes, audio_gcs_path, thumbnail_gcs_path,
+    created_at, updated_at, error_message, retry_count, last_processed_at
+"""
+
+# Shared by the sync functions below and database.async_operations
+GET_METADATA_BY_ID_QUERY = f"SELECT {TRACK_METADATA_COLUMNS} FROM audio_tracks WHERE id = %s"
+GET_METADATA_BY_IDS_QUERY = f"SELECT {TRACK_METADATA_COLUMNS} FROM audio_tracks WHERE id = ANY(%s::uuid[])"
+
+
 def get_audio_metadata_by_id(track_id: str) -> Optional[Dict[str, Any]]:
     """
     Retrieve audio metadata by track ID.
     
     Efficiently queries the database using the primary key index.
-    Returns None if track is not found (graceful handling).
+    Returns None if track is not found (graceful handling). Found rows are
+    served from the metadata read-through cache when possible (see
+    database.metadata_cache).
     
     Args:
         track_id: UUID string of the track to retrieve
@@ -345,26 +376,24 @@ def get_audio_metadata_by_id(track_id: str) -> Optional[Dict[str, Any]]:
     except ValueError:
         raise ValidationError(f"Invalid track_id format: {track_id}")
     
+    cache = get_metadata_cache()
+    cached = cache.get(track_id)
+    if cached is not None:
+        return cached
+    generation = cache.generation
+    
     try:
         with get_connection() as conn:
             with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
                 # Parameterized query for security
-                query = """
-                    SELECT 
-                        id, status, artist, title, album, genre, year,
-                        duration_seconds, channels, sample_rate, bitrate,
-                        format, file_size_bytes, audio_gcs_path, thumbnail_gcs_path,
-                        created_at, updated_at, error_message, retry_count, last_processed_at
-                    FROM audio_tracks
-                    WHERE id = %s
-                """
-                
-                cur.execute(query, (track_id,))
+                execute_prepared(cur, GET_METADATA_BY_ID_QUERY, (track_id,))
                 result = cur.fetchone()
                 
                 if result:
                     logger.debug(f"Retrieved metadata for track: {track_id}")
-                    return dict(result)
+                    result = dict(result)
+                    cache.put(result, generation)
+                    return result
                 else:
                     logger.debug(f"Track not found: {track_id}")
                     return None
@@ -387,7 +416,8 @@ def get_audio_metadata_by_ids(track_ids: List[str]) -> List[Dict[str, Any]]:
     Retrieve multiple audio metadata records by track IDs.
     
     Efficiently queries multiple tracks in a single database operation.
-    Skips invalid UUIDs and returns only found tracks.
+    Skips invalid UUIDs and returns only found tracks. Cached tracks are
+    not queried again.
     
     Args:
         track_ids: List of UUID strings to retrieve
@@ -422,26 +452,26 @@ def get_audio_metadata_by_ids(track_ids: List[str]) -> List[Dict[str, Any]]:
     if not valid_ids:
         return []
     
+    cache = get_metadata_cache()
+    cached, missing_ids = cache.get_many(valid_ids)
+    if not missing_ids:
+        return cached
+    generation = cache.generation
+    
     try:
         with get_connection() as conn:
             with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
                 # Use ANY operator for efficient batch query
-                query = """
-                    SELECT 
-                        id, status, artist, title, album, genre, year,
-                        duration_seconds, channels, sample_rate, bitrate,
-                        format, file_size_bytes, audio_gcs_path, thumbnail_gcs_path,
-                        created_at, updated_at, error_message, retry_count, last_processed_at
-                    FROM audio_tracks
-                    WHERE id = ANY(%s)
-                """
+                execute_prepared(cur, GET_METADATA_BY_IDS_QUERY, (missing_ids,))
+                results = [dict(row) for row in cur.fetchall()]
                 
-                cur.execute(query, (valid_ids,))
-                results = cur.fetchall()
-                
-                logger.debug(f"Retrieved {len(results)} tracks out of {len(valid_ids)} requested")
+                logger.debug(
+                    f"Retrieved {len(results)} tracks out of {len(missing_ids)} queried "
+                    f"({len(cached)} cached, {len(valid_ids)} requested)"
+                )
                 
-                return [dict(row) for row in results]
+                cache.put_many(results, generation)
+                return cached + results
     
     except DatabaseError as e:
         logger.error(f"Database error retrieving batch metadata: {e}")
@@ -456,17 +486,78 @@ def get_audio_metadata_by_ids(track_ids: List[str]) -> List[Dict[str, Any]]:
         )
 
 
+def get_existing_track_ids(track_ids: List[str]) -> Set[str]:
+    """
+    Return which of the given track IDs exist in audio_tracks.
+    
+    Used by storage reconciliation to diff bucket contents against the
+    database one batch at a time. Invalid UUIDs are treated as missing.
+    
+    Args:
+        track_ids: UUID strings to check
+    
+    Returns:
+        Set of the IDs (as given) that have a row in audio_tracks
+    
+    Raises:
+        DatabaseOperationError: If database query fails
+    
+    Example:
+        >>> existing = get_existing_track_ids(ids_from_bucket)
+        >>> orphans = set(ids_from_bucket) - existing
+    """
+    normalized = {}
+    for track_id in track_ids:
+        try:
+            normalized[str(uuid.UUID(track_id))] = track_id
+        except ValueError:
+            continue
+    
+    if not normalized:
+        return set()
+    
+    try:
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT id::text FROM audio_tracks WHERE id = ANY(%s::uuid[])",
+                    (list(normalized),),
+                )
+                return {normalized[row[0]] for row in cur.fetchall()}
+    
+    except DatabaseError as e:
+        logger.error(f"Database error checking track ids: {e}")
+        raise DatabaseOperationError(
+            f"Failed to check track ids: database error - {str(e)}"
+        )
+
+
+# order_by columns that support cursors (NOT NULL, indexed with id; see
+# migration 002) and the SQL type their cursor values are cast to
+LISTING_KEYSET_COLUMNS = {
+    'created_at': 'timestamptz',
+    'updated_at': 'timestamptz',
+    'title': 'text',
+}
+
+
 def get_all_audio_metadata(
     limit: int = 100,
     offset: int = 0,
     status_filter: Optional[str] = None,
     order_by: str = 'created_at',
-    order_direction: str = 'DESC'
+    order_direction: str = 'DESC',
+    cursor: Optional[str] = None,
+    include_total: Optional[bool] = None
 ) -> Dict[str, Any]:
     """
     Retrieve paginated list of audio metadata records.
     
     Supports filtering, ordering, and pagination for efficient data retrieval.
+    Rows are ordered by order_by with id as tie-breaker. For deep pages pass
+    the previous page's next_cursor instead of an offset: the query then
+    seeks past the last row via the (order_by, id) index rather than
+    scanning and discarding every earlier row.
     
     Args:
         limit: Maximum number of records to return (default: 100, max: 1000)
@@ -474,14 +565,22 @@ def get_all_audio_metadata(
         status_filter: Optional status to filter by ('PENDING', 'PROCESSING', 'COMPLETED', 'FAILED')
         order_by: Field to order by (default: 'created_at')
         order_direction: Sort direction 'ASC' or 'DESC' (default: 'DESC')
+        cursor: next_cursor of the previous page (only for order_by in
+            LISTING_KEYSET_COLUMNS; mutually exclusive with offset)
+        include_total: Whether to run the COUNT(*) query (default: only
+            without a cursor, since clients read the total from the first
+            page; has_more is exact either way)
     
     Returns:
         Dictionary containing:
             - tracks: List of track metadata dictionaries
-            - total_count: Total number of tracks matching filter
+            - total_count: Total number of tracks matching filter (None if
+              the count was skipped)
             - limit: Limit used
             - offset: Offset used
             - has_more: Boolean indicating if more records exist
+            - next_cursor: Cursor for the next page (None on the last page
+              or when order_by does not support cursors)
     
     Raises:
         ValidationError: If parameters are invalid
@@ -512,6 +611,23 @@ def get_all_audio_metadata(
     if order_direction not in ['ASC', 'DESC']:
         raise ValidationError("order_direction must be 'ASC' or 'DESC'")
     
+    if cursor and offset:
+        raise ValidationError("Use either cursor or offset, not both")
+    
+    if cursor and order_by not in LISTING_KEYSET_COLUMNS:
+        raise ValidationError(
+            f"Cursor pagination is not supported for order_by={order_by}. "
+            f"Supported: {list(LISTING_KEYSET_COLUMNS)}"
+        )
+    
+    if include_total is None:
+        include_total = not cursor
+    
+    scope = cursor_scope("list", status_filter, order_by, order_direction)
+    
+    # Decoded up front: a malformed cursor is the client's error, not a database failure
+    seek = decode_cursor(cursor, scope, 2) if cursor else None
+    
     try:
         with get_connection() as conn:
             with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
@@ -527,41 +643,66 @@ def get_all_audio_metadata(
                 
                 count_query = "SELECT COUNT(*) FROM audio_tracks"
                 
-                where_clause = ""
+                conditions = []
                 params = []
                 
                 if status_filter:
-                    where_clause = " WHERE status = %s"
-                    params = [status_filter]
+                    conditions.append("status = %s")
+                    params.append(status_filter)
+                
+                where_clause = (" WHERE " + " AND ".join(conditions)) if conditions else ""
                 
                 # Use psycopg2.sql for safe column name injection
                 from psycopg2 import sql
                 
                 # Get total count
-                count_query_full = count_query + where_clause
-                cur.execute(count_query_full, params)
-                total_count = cur.fetchone()['count']
+                total_count = None
+                if include_total:
+                    count_query_full = count_query + where_clause
+                    cur.execute(count_query_full, params)
+                    total_count = cur.fetchone()['count']
+                
+                # Seek past the previous page's last row
+                page_params = list(params)
+                if seek:
+                    last_value, last_id = seek
+                    conditions.append(
+                        f"({order_by}, id) {'<' if order_direction == 'DESC' else '>'} "
+                        f"(%s::{LISTING_KEYSET_COLUMNS[order_by]}, %s::uuid)"
+                    )
+                    page_params.extend([last_value, last_id])
+                    where_clause = " WHERE " + " AND ".join(conditions)
                 
-                # Get paginated results
-                query_full = sql.SQL(base_query + where_clause + " ORDER BY {} {} LIMIT %s OFFSET %s").format(
+                # Get paginated results (one extra row tells whether more exist)
+                query_full = sql.SQL(base_query + where_clause + " ORDER BY {} {}, id {} LIMIT %s OFFSET %s").format(
                     sql.Identifier(order_by),
+                    sql.SQL(order_direction),
                     sql.SQL(order_direction)
                 )
                 
-                cur.execute(query_full, params + [limit, offset])
-                results = cur.fetchall()
+                cur.execute(query_full, page_params + [limit + 1, offset])
+                results = [dict(row) for row in cur.fetchall()]
+                
+                tracks = results[:limit]
+                has_more = len(results) > limit
+                
+                next_cursor = None
+                if has_more and order_by in LISTING_KEYSET_COLUMNS:
+                    last = tracks[-1]
+                    next_cursor = encode_cursor(scope, [last[order_by], last['id']])
                 
                 logger.debug(
-                    f"Retrieved {len(results)} tracks (offset={offset}, limit={limit}, "
-                    f"total={total_count}, status={status_filter})"
+                    f"Retrieved {len(tracks)} tracks (offset={offset}, cursor={bool(cursor)}, "
+                    f"limit={limit}, total={total_count}, status={status_filter})"
                 )
                 
                 return {
-                    'tracks': [dict(row) for row in results],
+                    'tracks': tracks,
                     'total_count': total_count,
                     'limit': limit,
                     'offset': offset,
-                    'has_more': (offset + limit) < total_count
+                    'has_more': has_more,
+                    'next_cursor': next_cursor
                 }
     
     except DatabaseError as e:
@@ -695,6 +836,564 @@ def search_audio_tracks(
         )
 
 
+@dataclass
+class AdvancedSearch:
+    """Validated arguments and SQL for search_audio_tracks_advanced."""
+    query: str
+    limit: int
+    offset: int
+    filters: Dict[str, Any]
+    include_total: bool
+    count_query: str
+    count_params: List[Any]
+    search_query: str
+    search_params: List[Any]
+    cursor: Optional[str] = None
+    cursor_scope: str = ""
+    sort_keys: Tuple[str, ...] = ("rank", "created_at", "id")
+    total_in_page: bool = True
+    facets: Tuple[str, ...] = ()
+    facet_query: str = ""
+    facet_params: List[Any] = field(default_factory=list)
+
+    def needs_count(self, rows: List[Dict[str, Any]]) -> bool:
+        """
+        Whether the count query must run after the page query.
+
+        Relevance-ordered pages return the total with every row, so the
+        count is only needed when the page is past the end. Column-ordered
+        pages never carry it (see build_advanced_search_queries).
+        """
+        if not self.include_total:
+            return False
+        if not self.total_in_page:
+            return True
+        return not rows and (self.offset > 0 or self.cursor is not None)
+
+
+def _contains_pattern(value: str) -> str:
+    """ILIKE pattern matching value anywhere, with LIKE wildcards in value escaped."""
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+# Search sort fields: column, SQL type of its cursor value, and whether it
+# is nullable. Column sorts are backed by (column, id) btree indexes
+# (migrations 002 and 004).
+SEARCH_SORT_COLUMNS = {
+    'title': ('title', 'text', False),
+    'artist': ('artist', 'text', True),
+    'year': ('year', 'integer', True),
+    'duration': ('duration_seconds', 'numeric', True),
+    'created_at': ('created_at', 'timestamptz', False),
+}
+SEARCH_SORT_FIELDS = ['relevance'] + list(SEARCH_SORT_COLUMNS)
+
+
+def _search_order(
+    sort_by: str,
+    sort_order: str,
+    last: Optional[List[Any]]
+) -> Tuple[Tuple[str, ...], str, str, List[Any]]:
+    """
+    Build the ORDER BY and keyset seek predicate for a search sort.
+
+    Relevance sorts by (rank, created_at, id) descending. Column sorts use
+    (column, id) in the requested direction with PostgreSQL's default NULL
+    placement (NULLs sort as the largest value), which is the order a
+    (column, id) btree index returns when scanned either way, so a LIMIT
+    can stop early instead of sorting every match.
+
+    Args:
+        sort_by: One of SEARCH_SORT_FIELDS
+        sort_order: 'asc' or 'desc'
+        last: Cursor values of the previous page's last row, if any
+
+    Returns:
+        Tuple of (cursor keys, ORDER BY clause, seek condition or "", seek params)
+    """
+    if sort_by == 'relevance':
+        keys = ("rank", "created_at", "id")
+        order = "rank DESC, created_at DESC, id DESC"
+        if last is None:
+            return keys, order, "", []
+        return keys, order, "(rank, created_at, id) < (%s::real, %s::timestamptz, %s::uuid)", list(last)
+
+    column, sql_type, nullable = SEARCH_SORT_COLUMNS[sort_by]
+    keys = (column, "id")
+    direction = "DESC" if sort_order == 'desc' else "ASC"
+    op = "<" if direction == "DESC" else ">"
+    order = f"{column} {direction}, id {direction}"
+
+    if last is None:
+        return keys, order, "", []
+
+    value, last_id = last
+    if not nullable:
+        return keys, order, f"({column}, id) {op} (%s::{sql_type}, %s::uuid)", [value, last_id]
+
+    # NULLs come after all values ascending and before them descending
+    if value is None:
+        seek = f"({column} IS NULL AND id {op} %s::uuid)"
+        if direction == "DESC":
+            seek = f"({seek} OR {column} IS NOT NULL)"
+        return keys, order, seek, [last_id]
+
+    seek = f"({column} {op} %s::{sql_type} OR ({column} = %s::{sql_type} AND id {op} %s::uuid)"
+    if direction == "ASC":
+        seek += f" OR {column} IS NULL"
+    return keys, order, seek + ")", [value, value, last_id]
+
+
+# Search facets: expression computed per matching row (columns of the
+# ranked match set) that the facet groups by
+SEARCH_FACET_EXPRESSIONS = {
+    'genre': "genre",
+    'decade': "(year / 10) * 10",
+    'format': "UPPER(format)",
+    'duration': """CASE
+                WHEN duration_seconds IS NULL THEN NULL
+                WHEN duration_seconds < 120 THEN 0
+                WHEN duration_seconds < 240 THEN 120
+                WHEN duration_seconds < 360 THEN 240
+                WHEN duration_seconds < 600 THEN 360
+                ELSE 600
+            END""",
+}
+SEARCH_FACET_FIELDS = list(SEARCH_FACET_EXPRESSIONS)
+
+# Lower bounds (seconds) of the duration facet buckets, matching the CASE above
+DURATION_FACET_BOUNDS = [0, 120, 240, 360, 600]
+
+
+def _build_facet_query(ranked_query: str, facets: Tuple[str, ...]) -> str:
+    """
+    Build the query counting search matches per facet value.
+    
+    Every requested facet is one grouping set of a single GROUP BY, so the
+    match set is read once however many facets are asked for. GROUPING()
+    tells which facet a row belongs to (a NULL value in its own set is a
+    track without that field).
+    
+    Args:
+        ranked_query: The search's ranked match query (before paging)
+        facets: Facet names from SEARCH_FACET_FIELDS
+    
+    Returns:
+        SQL returning (facet, value, count) rows; takes the ranked query's parameters
+    """
+    columns = ",\n                ".join(
+        f"{SEARCH_FACET_EXPRESSIONS[name]} AS facet_{name}" for name in facets
+    )
+    facet_case = " ".join(f"WHEN GROUPING(facet_{name}) = 0 THEN '{name}'" for name in facets)
+    value_case = " ".join(
+        f"WHEN GROUPING(facet_{name}) = 0 THEN facet_{name}::text" for name in facets
+    )
+    grouping_sets = ", ".join(f"(facet_{name})" for name in facets)
+    
+    return f"""
+        SELECT
+            CASE {facet_case} END AS facet,
+            CASE {value_case} END AS value,
+            COUNT(*) AS count
+        FROM (
+            SELECT
+                {columns}
+            FROM ({ranked_query}) matches
+        ) facet_rows
+        GROUP BY GROUPING SETS ({grouping_sets})
+        ORDER BY facet, count DESC, value
+    """
+
+
+def facet_counts(
+    facets: Tuple[str, ...],
+    rows: List[Dict[str, Any]]
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Turn facet query rows into per-facet value counts.
+    
+    Range facets (decade, duration) carry the bucket's inclusive min/max so
+    a caller can narrow the search with the matching year/duration filter.
+    Tracks without a value for a facet are not counted in it.
+    
+    Args:
+        facets: Requested facet names
+        rows: Rows of the facet query, as dictionaries
+    
+    Returns:
+        Dict mapping each facet to a list of {value, count[, min, max]},
+        most frequent first
+    
+    Example:
+        >>> facet_counts(('decade',), [{'facet': 'decade', 'value': '1970', 'count': 12}])
+        {'decade': [{'value': '1970s', 'count': 12, 'min': 1970, 'max': 1979}]}
+    """
+    counts = {name: [] for name in facets}
+    
+    for row in rows:
+        name, value = row['facet'], row['value']
+        if name not in counts or value is None:
+            continue
+        
+        bucket = {'value': value, 'count': int(row['count'])}
+        if name == 'decade':
+            start = int(value)
+            bucket.update(value=f"{start}s", min=start, max=start + 9)
+        elif name == 'duration':
+            start = int(value)
+            index = DURATION_FACET_BOUNDS.index(start)
+            if index + 1 < len(DURATION_FACET_BOUNDS):
+                end = DURATION_FACET_BOUNDS[index + 1]
+                bucket.update(value=f"{start}-{end}s", min=start, max=end)
+            else:
+                bucket.update(value=f"{start}s+", min=start, max=None)
+        
+        counts[name].append(bucket)
+    
+    return counts
+
+
+def build_search_filter_conditions(
+    status_filter: Optional[str] = None,
+    year_min: Optional[int] = None,
+    year_max: Optional[int] = None,
+    format_filter: Optional[str] = None,
+    genres: Optional[List[str]] = None,
+    formats: Optional[List[str]] = None,
+    duration_min: Optional[float] = None,
+    duration_max: Optional[float] = None,
+    artist_filter: Optional[str] = None,
+    album_filter: Optional[str] = None
+) -> Tuple[List[str], List[Any], Dict[str, Any]]:
+    """
+    Validate the structured search filters and build their SQL predicates.
+    
+    Shared by the full-text and fuzzy searches so both apply the same
+    filters. Predicates reference audio_tracks as "t".
+    
+    Args:
+        See search_audio_tracks_advanced
+    
+    Returns:
+        Tuple of (WHERE conditions, their parameters, normalized filters dict)
+    
+    Raises:
+        ValidationError: If a filter is invalid
+    """
+    # Validate additional filters
+    valid_statuses = ['PENDING', 'PROCESSING', 'COMPLETED', 'FAILED']
+    if status_filter and status_filter not in valid_statuses:
+        raise ValidationError(f"Invalid status filter. Must be one of: {valid_statuses}")
+    
+    if year_min is not None and (year_min < 1800 or year_min > 2100):
+        raise ValidationError("year_min must be between 1800 and 2100")
+    
+    if year_max is not None and (year_max < 1800 or year_max > 2100):
+        raise ValidationError("year_max must be between 1800 and 2100")
+    
+    if year_min and year_max and year_min > year_max:
+        raise ValidationError("year_min cannot be greater than year_max")
+    
+    if duration_min is not None and duration_min < 0:
+        raise ValidationError("duration_min must be non-negative")
+    
+    if duration_min is not None and duration_max is not None and duration_min > duration_max:
+        raise ValidationError("duration_min cannot be greater than duration_max")
+    
+    # Single format_filter and the formats list combine into one IN list;
+    # sorted so equivalent filters produce the same SQL parameters and cursor scope
+    format_values = {f.upper() for f in (formats or [])}
+    if format_filter:
+        format_values.add(format_filter.upper())
+    format_values = sorted(format_values)
+    
+    genre_values = sorted({g.strip().lower() for g in (genres or []) if g and g.strip()})
+    
+    conditions = []
+    params = []
+    
+    # Add optional filters
+    if status_filter:
+        conditions.append("t.status = %s")
+        params.append(status_filter)
+    
+    if year_min is not None:
+        conditions.append("t.year >= %s")
+        params.append(year_min)
+    
+    if year_max is not None:
+        conditions.append("t.year <= %s")
+        params.append(year_max)
+    
+    if format_values:
+        conditions.append("UPPER(t.format) = ANY(%s::text[])")
+        params.append(format_values)
+    
+    if genre_values:
+        conditions.append("LOWER(t.genre) = ANY(%s::text[])")
+        params.append(genre_values)
+    
+    if duration_min is not None:
+        conditions.append("t.duration_seconds >= %s")
+        params.append(duration_min)
+    
+    if duration_max is not None:
+        conditions.append("t.duration_seconds <= %s")
+        params.append(duration_max)
+    
+    # Substring matches use the pg_trgm GIN indexes on artist and album
+    if artist_filter:
+        conditions.append("t.artist ILIKE %s")
+        params.append(_contains_pattern(artist_filter))
+    
+    if album_filter:
+        conditions.append("t.album ILIKE %s")
+        params.append(_contains_pattern(album_filter))
+    
+    filters = {
+        'status': status_filter,
+        'year_min': year_min,
+        'year_max': year_max,
+        'format': format_filter,
+        'formats': format_values or None,
+        'genres': genre_values or None,
+        'duration_min': duration_min,
+        'duration_max': duration_max,
+        'artist': artist_filter,
+        'album': album_filter,
+    }
+    
+    return conditions, params, filters
+
+
+def build_advanced_search_queries(
+    query: str,
+    limit: int = 20,
+    offset: int = 0,
+    status_filter: Optional[str] = None,
+    year_min: Optional[int] = None,
+    year_max: Optional[int] = None,
+    format_filter: Optional[str] = None,
+    min_rank: float = 0.0,
+    rank_normalization: int = 1,
+    include_total: bool = True,
+    cursor: Optional[str] = None,
+    genres: Optional[List[str]] = None,
+    formats: Optional[List[str]] = None,
+    duration_min: Optional[float] = None,
+    duration_max: Optional[float] = None,
+    artist_filter: Optional[str] = None,
+    album_filter: Optional[str] = None,
+    sort_by: str = 'relevance',
+    sort_order: str = 'desc',
+    facets: Optional[List[str]] = None
+) -> AdvancedSearch:
+    """
+    Validate advanced search arguments and build its count and page queries.
+    
+    Shared by search_audio_tracks_advanced and its async counterpart in
+    database.async_operations, so both run identical SQL. The page query
+    parses the tsquery and ranks each match once, and returns the total
+    match count as a window column; the count query is only a fallback
+    for pages past the end (see AdvancedSearch.needs_count). With a
+    cursor the page seeks past the previous page's last row instead of
+    skipping offset rows. Requested facets get one grouped query over
+    the whole match set.
+    
+    Args:
+        See search_audio_tracks_advanced
+    
+    Returns:
+        AdvancedSearch with the count and search queries and their parameters
+    
+    Raises:
+        ValidationError: If parameters are invalid
+    """
+    # Reuse basic validation
+    if not query or not query.strip():
+        raise ValidationError("Search query cannot be empty")
+    
+    if limit < 1 or limit > 100:
+        raise ValidationError("Limit must be between 1 and 100")
+    
+    if offset < 0:
+        raise ValidationError("Offset must be non-negative")
+    
+    if cursor and offset:
+        raise ValidationError("Use either cursor or offset, not both")
+    
+    if min_rank < 0.0 or min_rank > 1.0:
+        raise ValidationError("min_rank must be between 0.0 and 1.0")
+    
+    if sort_by not in SEARCH_SORT_FIELDS:
+        raise ValidationError(f"Invalid sort_by. Must be one of: {SEARCH_SORT_FIELDS}")
+    
+    if sort_order not in ('asc', 'desc'):
+        raise ValidationError("sort_order must be 'asc' or 'desc'")
+    
+    facet_names = tuple(dict.fromkeys(facets or []))
+    invalid_facets = [name for name in facet_names if name not in SEARCH_FACET_EXPRESSIONS]
+    if invalid_facets:
+        raise ValidationError(f"Invalid facets {invalid_facets}. Must be any of: {SEARCH_FACET_FIELDS}")
+    
+    valid_normalizations = [0, 1, 2, 4, 8, 16, 32]
+    if rank_normalization not in valid_normalizations:
+        raise ValidationError(
+            f"Invalid rank_normalization. Must be one of: {valid_normalizations}"
+        )
+    
+    # Prepare tsquery
+    query_sanitized = query.strip()
+    if not any(op in query_sanitized for op in ['&', '|', '!', '<->']):
+        words = query_sanitized.split()
+        tsquery_string = ' & '.join(words)
+    else:
+        tsquery_string = query_sanitized
+    
+    filter_conditions, filter_params, filters = build_search_filter_conditions(
+        status_filter=status_filter,
+        year_min=year_min,
+        year_max=year_max,
+        format_filter=format_filter,
+        genres=genres,
+        formats=formats,
+        duration_min=duration_min,
+        duration_max=duration_max,
+        artist_filter=artist_filter,
+        album_filter=album_filter,
+    )
+    
+    # Build dynamic WHERE clause (the tsquery is parsed once, in the q CTE)
+    where_conditions = ["t.search_vector @@ q.tsq"] + filter_conditions
+    params = [tsquery_string] + filter_params
+    
+    where_clause = " AND ".join(where_conditions)
+    
+    # Each matching row is ranked once; the rank filter applies to that value
+    ranked_query = f"""
+        WITH q AS (SELECT to_tsquery('english', %s) AS tsq)
+        SELECT * FROM (
+            SELECT
+                t.id, t.status, t.artist, t.title, t.album, t.genre, t.year,
+                t.duration_seconds, t.channels, t.sample_rate, t.bitrate,
+                t.format, t.file_size_bytes, t.audio_gcs_path, t.thumbnail_gcs_path,
+                t.created_at, t.updated_at,
+                ts_rank(t.search_vector, q.tsq, {rank_normalization}) AS rank
+            FROM audio_tracks t, q
+            WHERE {where_clause}
+        ) ranked
+        WHERE rank >= %s
+    """
+    params.append(min_rank)
+    
+    count_query = f"SELECT COUNT(*) AS total FROM ({ranked_query}) matches"
+    count_params = list(params)
+    facet_query = _build_facet_query(ranked_query, facet_names) if facet_names else ""
+    
+    filters['min_rank'] = min_rank
+    filters['rank_normalization'] = rank_normalization
+    scope = cursor_scope("search", tsquery_string, filters, sort_by, sort_order)
+    
+    last = decode_cursor(cursor, scope, 3 if sort_by == 'relevance' else 2) if cursor else None
+    sort_keys, order_clause, seek_condition, seek_params = _search_order(sort_by, sort_order, last)
+    params.extend(seek_params)
+    
+    # Sorting by rank already visits every match, so the window count adds
+    # no extra scan; it is taken before the cursor seek so it stays the
+    # total over all pages. Column sorts leave it out: a window over all
+    # matches would stop the index scan from ending at LIMIT, so their
+    # total comes from the count query. One extra row tells whether more exist.
+    total_in_page = sort_by == 'relevance'
+    total_column = ", COUNT(*) OVER () AS total" if include_total and total_in_page else ""
+    seek_clause = f"WHERE {seek_condition}" if seek_condition else ""
+    
+    search_query = f"""
+        SELECT * FROM (
+            SELECT matches.*{total_column}
+            FROM ({ranked_query}) matches
+        ) page
+        {seek_clause}
+        ORDER BY {order_clause}
+        LIMIT %s OFFSET %s
+    """
+    
+    return AdvancedSearch(
+        query=query,
+        limit=limit,
+        offset=offset,
+        filters=filters,
+        include_total=include_total,
+        count_query=count_query,
+        count_params=count_params,
+        search_query=search_query,
+        search_params=params + [limit + 1, offset],
+        cursor=cursor,
+        cursor_scope=scope,
+        sort_keys=sort_keys,
+        total_in_page=total_in_page,
+        facets=facet_names,
+        facet_query=facet_query,
+        facet_params=list(count_params) if facet_names else [],
+    )
+
+
+def advanced_search_response(
+    search: AdvancedSearch,
+    rows: List[Dict[str, Any]],
+    total_matches: Optional[int] = None,
+    facet_rows: Optional[List[Dict[str, Any]]] = None
+) -> Dict[str, Any]:
+    """
+    Build the search_audio_tracks_advanced result dictionary.
+    
+    Args:
+        search: The executed AdvancedSearch
+        rows: Page query rows as dictionaries
+        total_matches: Value of the count query, if it ran
+        facet_rows: Rows of the facet query, if facets were requested
+    
+    Returns:
+        Search result dictionary (see search_audio_tracks_advanced)
+    """
+    tracks = rows[:search.limit]
+    has_more = len(rows) > search.limit
+    
+    if search.include_total:
+        if rows and search.total_in_page:
+            total_matches = rows[0]['total']
+        elif total_matches is None:
+            total_matches = 0
+        for track in tracks:
+            track.pop('total', None)
+    else:
+        total_matches = None
+    
+    next_cursor = None
+    if has_more:
+        last = tracks[-1]
+        next_cursor = encode_cursor(search.cursor_scope, [last[key] for key in search.sort_keys])
+    
+    filters = search.filters
+    logger.info(
+        f"Advanced search for '{search.query}' returned {len(tracks)}/{total_matches} results "
+        f"(filters: status={filters['status']}, year={filters['year_min']}-{filters['year_max']}, "
+        f"format={filters['format']}, normalization={filters['rank_normalization']})"
+    )
+    
+    return {
+        'tracks': tracks,
+        'total_matches': total_matches,
+        'query': search.query,
+        'filters': filters,
+        'limit': search.limit,
+        'offset': search.offset,
+        'has_more': has_more,
+        'next_cursor': next_cursor,
+        'facets': facet_counts(search.facets, facet_rows or []) if search.facets else None
+    }
+
+
 def search_audio_tracks_advanced(
     query: str,
     limit: int = 20,
@@ -704,7 +1403,18 @@ def search_audio_tracks_advanced(
     year_max: Optional[int] = None,
     format_filter: Optional[str] = None,
     min_rank: float = 0.0,
-    rank_normalization: int = 1
+    rank_normalization: int = 1,
+    include_total: bool = True,
+    cursor: Optional[str] = None,
+    genres: Optional[List[str]] = None,
+    formats: Optional[List[str]] = None,
+    duration_min: Optional[float] = None,
+    duration_max: Optional[float] = None,
+    artist_filter: Optional[str] = None,
+    album_filter: Optional[str] = None,
+    sort_by: str = 'relevance',
+    sort_order: str = 'desc',
+    facets: Optional[List[str]] = None
 ) -> Dict[str, Any]:
     """
     Advanced full-text search with additional filters and ranking options.
@@ -729,14 +1439,33 @@ def search_audio_tracks_advanced(
             - 8: Divides by unique word count
             - 16: Divides by 1 + log(unique word count)
             - 32: Divides by rank + 1
+        include_total: Whether to return the total match count (False
+            skips counting; has_more is still exact)
+        cursor: next_cursor of the previous page (keyset pagination;
+            mutually exclusive with offset)
+        genres: Genres to match (case-insensitive, any of)
+        formats: Audio formats to match (any of; combined with format_filter)
+        duration_min: Minimum duration in seconds (inclusive)
+        duration_max: Maximum duration in seconds (inclusive)
+        artist_filter: Case-insensitive substring of the artist
+        album_filter: Case-insensitive substring of the album
+        sort_by: 'relevance' (default) or a column in SEARCH_SORT_COLUMNS
+            ('title', 'artist', 'year', 'duration', 'created_at')
+        sort_order: 'asc' or 'desc' for column sorts (relevance is always
+            best match first)
+        facets: Facets to count over all matches, any of
+            SEARCH_FACET_FIELDS ('genre', 'decade', 'format', 'duration')
     
     Returns:
         Dictionary containing:
             - tracks: List of matching tracks with relevance scores
-            - total_matches: Approximate total matching tracks
+            - total_matches: Total matching tracks (None if include_total is False)
             - query: Original query string
             - filters: Applied filters
             - limit/offset: Pagination info
+            - has_more: Whether another page exists
+            - next_cursor: Cursor for the next page (None on the last page)
+            - facets: Per-facet value counts (None if no facets requested)
     
     Raises:
         ValidationError: If parameters are invalid
@@ -755,143 +1484,326 @@ def search_audio_tracks_advanced(
         >>> for track in result['tracks']:
         ...     print(f"{track['year']}: {track['title']} ({track['rank']:.3f})")
     """
-    # Reuse basic validation
+    search = build_advanced_search_queries(
+        query=query,
+        limit=limit,
+        offset=offset,
+        status_filter=status_filter,
+        year_min=year_min,
+        year_max=year_max,
+        format_filter=format_filter,
+        min_rank=min_rank,
+        rank_normalization=rank_normalization,
+        include_total=include_total,
+        cursor=cursor,
+        genres=genres,
+        formats=formats,
+        duration_min=duration_min,
+        duration_max=duration_max,
+        artist_filter=artist_filter,
+        album_filter=album_filter,
+        sort_by=sort_by,
+        sort_order=sort_order,
+        facets=facets,
+    )
+    
+    try:
+        with get_connection() as conn:
+            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+                # Ranked page, with the total match count on every row
+                execute_prepared(cur, search.search_query, search.search_params)
+                rows = [dict(row) for row in cur.fetchall()]
+                
+                total_matches = None
+                if search.needs_count(rows):
+                    execute_prepared(cur, search.count_query, search.count_params)
+                    total_matches = cur.fetchone()['total']
+                
+                facet_rows = None
+                if search.facets:
+                    execute_prepared(cur, search.facet_query, search.facet_params)
+                    facet_rows = [dict(row) for row in cur.fetchall()]
+                
+                return advanced_search_response(search, rows, total_matches, facet_rows)
+    
+    except DatabaseError as e:
+        if "syntax error" in str(e).lower():
+            raise ValidationError(f"Invalid search query syntax: {query}")
+        
+        logger.error(f"Database error during advanced search: {e}")
+        raise DatabaseOperationError(
+            f"Advanced search operation failed: database error - {str(e)}"
+        )
+    
+    except Exception as e:
+        logger.error(f"Unexpected error during advanced search: {e}")
+        raise DatabaseOperationError(
+            f"Advanced search operation failed: {str(e)}"
+        )
+
+
+# ============================================================================
+# Fuzzy Search Operations
+# ============================================================================
+
+FUZZY_SIMILARITY_THRESHOLD = 0.3
+
+# Threshold for the pg_trgm % operator, local to the current transaction
+SET_SIMILARITY_THRESHOLD_QUERY = "SELECT set_config('pg_trgm.similarity_threshold', %s, true)"
+
+
+def build_fuzzy_search_query(
+    query: str,
+    limit: int = 20,
+    similarity_threshold: float = FUZZY_SIMILARITY_THRESHOLD,
+    **filters
+) -> Tuple[str, List[Any]]:
+    """
+    Validate fuzzy search arguments and build its query.
+    
+    Matches with the pg_trgm % operator on the fuzzy_text column
+    ("artist title", migration 005), which its trigram GIN index answers.
+    The operator's cut-off is pg_trgm.similarity_threshold, so run
+    SET_SIMILARITY_THRESHOLD_QUERY in the same transaction first; the
+    threshold is also applied inline, so it holds even if that setting
+    is lost.
+    
+    Args:
+        query: Search text (typos allowed)
+        limit: Maximum results (1-100)
+        similarity_threshold: Minimum trigram similarity (0.0-1.0)
+        **filters: Filter arguments of search_audio_tracks_advanced
+            (status_filter, year_min, genres, artist_filter, ...)
+    
+    Returns:
+        Tuple of (SQL, parameters)
+    
+    Raises:
+        ValidationError: If parameters are invalid
+    """
     if not query or not query.strip():
         raise ValidationError("Search query cannot be empty")
     
     if limit < 1 or limit > 100:
         raise ValidationError("Limit must be between 1 and 100")
     
-    if offset < 0:
-        raise ValidationError("Offset must be non-negative")
+    if similarity_threshold < 0.0 or similarity_threshold > 1.0:
+        raise ValidationError("similarity_threshold must be between 0.0 and 1.0")
     
-    if min_rank < 0.0 or min_rank > 1.0:
-        raise ValidationError("min_rank must be between 0.0 and 1.0")
+    filter_conditions, filter_params, _ = build_search_filter_conditions(**filters)
     
-    # Validate additional filters
-    valid_statuses = ['PENDING', 'PROCESSING', 'COMPLETED', 'FAILED']
-    if status_filter and status_filter not in valid_statuses:
-        raise ValidationError(f"Invalid status filter. Must be one of: {valid_statuses}")
+    text = query.strip()
+    where_clause = " AND ".join(
+        ["t.fuzzy_text %% %s", "similarity(t.fuzzy_text, %s) >= %s"] + filter_conditions
+    )
     
-    if year_min is not None and (year_min < 1800 or year_min > 2100):
-        raise ValidationError("year_min must be between 1800 and 2100")
+    sql = f"""
+        SELECT
+            t.id, t.status, t.artist, t.title, t.album, t.genre, t.year,
+            t.duration_seconds, t.channels, t.sample_rate, t.bitrate,
+            t.format, t.file_size_bytes, t.audio_gcs_path, t.thumbnail_gcs_path,
+            t.created_at, t.updated_at,
+            similarity(t.fuzzy_text, %s) AS rank
+        FROM audio_tracks t
+        WHERE {where_clause}
+        ORDER BY rank DESC, t.created_at DESC, t.id DESC
+        LIMIT %s
+    """
     
-    if year_max is not None and (year_max < 1800 or year_max > 2100):
-        raise ValidationError("year_max must be between 1800 and 2100")
+    return sql, [text, text, text, similarity_threshold] + filter_params + [limit]
+
+
+def fuzzy_search_audio_tracks(
+    query: str,
+    limit: int = 20,
+    similarity_threshold: float = FUZZY_SIMILARITY_THRESHOLD,
+    **filters
+) -> List[Dict[str, Any]]:
+    """
+    Typo-tolerant search on artist and title using trigram similarity.
     
-    if year_min and year_max and year_min > year_max:
-        raise ValidationError("year_min cannot be greater than year_max")
+    Used as the fallback when full-text search finds nothing (e.g. a
+    misspelled artist). Results carry the similarity as "rank", so they
+    have the same shape as search_audio_tracks_advanced tracks.
     
-    valid_normalizations = [0, 1, 2, 4, 8, 16, 32]
-    if rank_normalization not in valid_normalizations:
-        raise ValidationError(
-            f"Invalid rank_normalization. Must be one of: {valid_normalizations}"
-        )
+    Args:
+        query: Search text
+        limit: Maximum results (1-100, default: 20)
+        similarity_threshold: Minimum trigram similarity (default: 0.3)
+        **filters: Filter arguments of search_audio_tracks_advanced
     
-    # Prepare tsquery
-    query_sanitized = query.strip()
-    if not any(op in query_sanitized for op in ['&', '|', '!', '<->']):
-        words = query_sanitized.split()
-        tsquery_string = ' & '.join(words)
-    else:
-        tsquery_string = query_sanitized
+    Returns:
+        List of track dictionaries, most similar first
+    
+    Raises:
+        ValidationError: If parameters are invalid
+        DatabaseOperationError: If search fails
+    
+    Example:
+        >>> tracks = fuzzy_search_audio_tracks("beatels hey jdue", status_filter="COMPLETED")
+    """
+    sql, params = build_fuzzy_search_query(query, limit, similarity_threshold, **filters)
     
     try:
         with get_connection() as conn:
             with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
-                # Build dynamic WHERE clause
-                where_conditions = ["search_vector @@ to_tsquery('english', %s)"]
-                params = [tsquery_string]
-                
-                # Add rank filter
-                where_conditions.append(f"ts_rank(search_vector, to_tsquery('english', %s), {rank_normalization}) >= %s")
-                params.extend([tsquery_string, min_rank])
-                
-                # Add optional filters
-                if status_filter:
-                    where_conditions.append("status = %s")
-                    params.append(status_filter)
-                
-                if year_min is not None:
-                    where_conditions.append("year >= %s")
-                    params.append(year_min)
-                
-                if year_max is not None:
-                    where_conditions.append("year <= %s")
-                    params.append(year_max)
-                
-                if format_filter:
-                    where_conditions.append("UPPER(format) = UPPER(%s)")
-                    params.append(format_filter)
-                
-                where_clause = " AND ".join(where_conditions)
-                
-                # Count total matches
-                count_query = f"""
-                    SELECT COUNT(*) as total
-                    FROM audio_tracks
-                    WHERE {where_clause}
-                """
-                
-                cur.execute(count_query, params)
-                total_matches = cur.fetchone()['total']
-                
-                # Get ranked results
-                search_query = f"""
-                    SELECT 
-                        id, status, artist, title, album, genre, year,
-                        duration_seconds, channels, sample_rate, bitrate,
-                        format, file_size_bytes, audio_gcs_path, thumbnail_gcs_path,
-                        created_at, updated_at,
-                        ts_rank(search_vector, to_tsquery('english', %s), {rank_normalization}) as rank
-                    FROM audio_tracks
-                    WHERE {where_clause}
-                    ORDER BY rank DESC, created_at DESC
-                    LIMIT %s OFFSET %s
-                """
-                
-                # Add tsquery param for rank calculation in SELECT, plus limit/offset
-                search_params = [tsquery_string] + params + [limit, offset]
-                
-                cur.execute(search_query, search_params)
-                results = cur.fetchall()
+                cur.execute(SET_SIMILARITY_THRESHOLD_QUERY, (str(similarity_threshold),))
+                execute_prepared(cur, sql, params)
+                results = [dict(row) for row in cur.fetchall()]
                 
-                logger.info(
-                    f"Advanced search for '{query}' returned {len(results)}/{total_matches} results "
-                    f"(filters: status={status_filter}, year={year_min}-{year_max}, "
-                    f"format={format_filter}, normalization={rank_normalization})"
-                )
+                logger.info(f"Fuzzy search for '{query}' returned {len(results)} results")
+                return results
+    
+    except DatabaseError as e:
+        logger.error(f"Database error during fuzzy search: {e}")
+        raise DatabaseOperationError(
+            f"Fuzzy search operation failed: database error - {str(e)}"
+        )
+    
+    except Exception as e:
+        logger.error(f"Unexpected error during fuzzy search: {e}")
+        raise DatabaseOperationError(
+            f"Fuzzy search operation failed: {str(e)}"
+        )
+
+
+# ============================================================================
+# Suggestion (Autocomplete) Operations
+# ============================================================================
+
+# Fields that can be completed. Each has a (status, LOWER(column) COLLATE "C")
+# btree index (migration 006): under the C collation a LIKE 'prefix%' is an
+# index range, and the index also returns values in ORDER BY order, so a
+# completion reads about `limit` index entries however many tracks match.
+SUGGEST_FIELDS = ['artist', 'title', 'album']
+SUGGEST_MAX_LIMIT = 20
+
+
+def _prefix_pattern(prefix: str) -> str:
+    """LIKE pattern matching values that start with prefix (wildcards escaped)."""
+    escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}%"
+
+
+def build_suggest_query(
+    prefix: str,
+    limit: int = 10,
+    fields: Optional[List[str]] = None,
+    status_filter: Optional[str] = 'COMPLETED'
+) -> Tuple[str, List[Any]]:
+    """
+    Validate suggestion arguments and build the completion query.
+    
+    Each field contributes its first `limit` distinct values (case-
+    insensitive) starting with the prefix, in index order; the union is
+    ordered shortest first so the closest completions lead.
+    
+    Args:
+        prefix: Typed prefix (matched case-insensitively against the start
+            of the whole value)
+        limit: Maximum suggestions (1-20)
+        fields: Fields to complete, any of SUGGEST_FIELDS (default: all)
+        status_filter: Only suggest from tracks with this status
+    
+    Returns:
+        Tuple of (SQL, parameters)
+    
+    Raises:
+        ValidationError: If parameters are invalid
+    """
+    prefix = (prefix or "").strip().lower()
+    if not prefix:
+        raise ValidationError("Prefix cannot be empty")
+    
+    if len(prefix) > 100:
+        raise ValidationError("Prefix must be at most 100 characters")
+    
+    if limit < 1 or limit > SUGGEST_MAX_LIMIT:
+        raise ValidationError(f"Limit must be between 1 and {SUGGEST_MAX_LIMIT}")
+    
+    fields = list(dict.fromkeys(fields or SUGGEST_FIELDS))
+    invalid_fields = [name for name in fields if name not in SUGGEST_FIELDS]
+    if invalid_fields:
+        raise ValidationError(f"Invalid fields {invalid_fields}. Must be any of: {SUGGEST_FIELDS}")
+    
+    status_condition = "status = %s AND " if status_filter else ""
+    
+    parts = []
+    params = []
+    for name in fields:
+        key = f'LOWER({name}) COLLATE "C"'
+        parts.append(f"""
+            (SELECT DISTINCT ON ({key}) '{name}' AS field, {name} AS value
+             FROM audio_tracks
+             WHERE {status_condition}{key} LIKE %s
+             ORDER BY {key}
+             LIMIT %s)""")
+        if status_filter:
+            params.append(status_filter)
+        params.extend([_prefix_pattern(prefix), limit])
+    
+    sql = f"""
+        SELECT field, value FROM ({" UNION ALL".join(parts)}
+        ) suggestions
+        ORDER BY LENGTH(value), LOWER(value), field
+        LIMIT %s
+    """
+    params.append(limit)
+    
+    return sql, params
+
+
+def suggest_completions(
+    prefix: str,
+    limit: int = 10,
+    fields: Optional[List[str]] = None,
+    status_filter: Optional[str] = 'COMPLETED'
+) -> List[Dict[str, Any]]:
+    """
+    Complete a typed prefix from artist, title and album values.
+    
+    Intended for typeahead: every keystroke is a few short index range
+    scans instead of a ranked full-text search.
+    
+    Args:
+        prefix: Typed prefix
+        limit: Maximum suggestions (1-20, default: 10)
+        fields: Fields to complete (default: artist, title, album)
+        status_filter: Only suggest from tracks with this status
+            (default: 'COMPLETED'; None for all tracks)
+    
+    Returns:
+        List of {'field': ..., 'value': ...} dictionaries, shortest first
+    
+    Raises:
+        ValidationError: If parameters are invalid
+        DatabaseOperationError: If the query fails
+    
+    Example:
+        >>> suggest_completions("beat")
+        [{'field': 'artist', 'value': 'The Beatles'}, ...]
+    """
+    sql, params = build_suggest_query(prefix, limit, fields, status_filter)
+    
+    try:
+        with get_connection() as conn:
+            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+                execute_prepared(cur, sql, params)
+                results = [dict(row) for row in cur.fetchall()]
                 
-                return {
-                    'tracks': [dict(row) for row in results],
-                    'total_matches': total_matches,
-                    'query': query,
-                    'filters': {
-                        'status': status_filter,
-                        'year_min': year_min,
-                        'year_max': year_max,
-                        'format': format_filter,
-                        'min_rank': min_rank,
-                        'rank_normalization': rank_normalization,
-                    },
-                    'limit': limit,
-                    'offset': offset,
-                    'has_more': (offset + len(results)) < total_matches
-                }
+                logger.debug(f"Suggestions for '{prefix}': {len(results)}")
+                return results
     
     except DatabaseError as e:
-        if "syntax error" in str(e).lower():
-            raise ValidationError(f"Invalid search query syntax: {query}")
-        
-        logger.error(f"Database error during advanced search: {e}")
+        logger.error(f"Database error during suggestion lookup: {e}")
         raise DatabaseOperationError(
-            f"Advanced search operation failed: database error - {str(e)}"
+            f"Suggestion lookup failed: database error - {str(e)}"
         )
     
     except Exception as e:
-        logger.error(f"Unexpected error during advanced search: {e}")
+        logger.error(f"Unexpected error during suggestion lookup: {e}")
         raise DatabaseOperationError(
-            f"Advanced search operation failed: {str(e)}"
+            f"Suggestion lookup failed: {str(e)}"
         )
 
 
@@ -1007,6 +1919,7 @@ def update_processing_status(
                 
                 # Commit transaction
                 conn.commit()
+                _tracks_changed([track_id])
                 
                 logger.info(
                     f"Updated status for track {track_id}: {status} "
@@ -1245,6 +2158,7 @@ def create_processing_record(track_id: str, status: str = 'PROCESSING') -> Dict[
                 
                 # Commit transaction
                 conn.commit()
+                _tracks_changed([track_id])
                 
                 logger.info(f"Created/updated processing record for track: {track_id}")
                 return dict(result)
@@ -1281,6 +2195,77 @@ def mark_as_processing(track_id: str) -> Dict[str, Any]:
     )
 
 
+# ============================================================================
+# Delete Operations
+# ============================================================================
+
+# Track ids per DELETE statement, keeping parameter arrays and locks bounded
+DELETE_BATCH_SIZE = 1000
+
+
+def delete_audio_tracks(track_ids: List[str]) -> List[Dict[str, Any]]:
+    """
+    Delete audio tracks by ID and return the storage paths they referenced.
+    
+    Each batch of DELETE_BATCH_SIZE ids is removed with a single
+    DELETE ... WHERE id = ANY(...) RETURNING statement; all batches commit
+    in one transaction. Invalid UUIDs and ids without a row are skipped.
+    
+    Args:
+        track_ids: UUID strings of the tracks to delete
+    
+    Returns:
+        List of dictionaries (id, audio_gcs_path, thumbnail_gcs_path) for
+        the rows that were deleted
+    
+    Raises:
+        DatabaseOperationError: If a delete statement fails
+    
+    Example:
+        >>> deleted = delete_audio_tracks(['123e4567-e89b-12d3-a456-426614174000'])
+        >>> paths = [row['audio_gcs_path'] for row in deleted]
+    """
+    valid_ids = []
+    for track_id in dict.fromkeys(track_ids):
+        try:
+            valid_ids.append(str(uuid.UUID(track_id)))
+        except ValueError:
+            logger.warning(f"Skipping invalid track_id in delete: {track_id}")
+    
+    if not valid_ids:
+        return []
+    
+    deleted: List[Dict[str, Any]] = []
+    
+    try:
+        with get_connection() as conn:
+            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+                for start in range(0, len(valid_ids), DELETE_BATCH_SIZE):
+                    batch = valid_ids[start:start + DELETE_BATCH_SIZE]
+                    cur.execute(
+                        """
+                        DELETE FROM audio_tracks
+                        WHERE id = ANY(%s::uuid[])
+                        RETURNING id::text AS id, audio_gcs_path, thumbnail_gcs_path
+                        """,
+                        (batch,),
+                    )
+                    deleted.extend(dict(row) for row in cur.fetchall())
+                conn.commit()
+        
+        # Other replicas are told by the NOTIFY trigger (migration 007)
+        _tracks_changed([row['id'] for row in deleted])
+        
+        logger.info(f"Deleted {len(deleted)} of {len(valid_ids)} requested tracks")
+        return deleted
+    
+    except DatabaseError as e:
+        logger.error(f"Database error deleting tracks: {e}")
+        raise DatabaseOperationError(
+            f"Failed to delete tracks: database error - {str(e)}"
+        )
+
+
 # ============================================================================
 # Error and Transaction Management
 # ============================================================================
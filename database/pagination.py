@@ -0,0 +1,114 @@
+"""
+Opaque cursor tokens for keyset pagination.
+
+LIMIT/OFFSET makes PostgreSQL produce and discard every row before the
+requested page, so deep pages get slower the further a client pages.
+Keyset pagination instead remembers the sort key of the last row returned
+and seeks past it with a row comparison, e.g.
+
+    WHERE (created_at, id) < (%s, %s) ORDER BY created_at DESC, id DESC
+
+which an index on (created_at DESC, id DESC) answers directly.
+
+Tokens are URL-safe base64 JSON holding the last row's sort key values and
+a scope: a digest of the query, filters and ordering they were issued for,
+so a cursor cannot be replayed against a different search or sort order.
+"""
+
+import base64
+import binascii
+import hashlib
+import json
+from datetime import date, datetime
+from typing import Any, List, Sequence
+
+from src.exceptions import ValidationError
+
+CURSOR_VERSION = 1
+
+
+def cursor_scope(kind: str, *parts: Any) -> str:
+    """
+    Build the scope a cursor is valid for.
+
+    Args:
+        kind: Paginated operation, e.g. "search" or "list"
+        *parts: Everything that defines the result order (query, filters, sort)
+
+    Returns:
+        Scope string, e.g. "search:1b2c3d4e5f60"
+    """
+    digest = hashlib.sha1(
+        json.dumps(parts, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()[:12]
+    return f"{kind}:{digest}"
+
+
+def _json_value(value: Any) -> Any:
+    """Convert sort key values (datetimes, UUIDs) to JSON-safe values."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def encode_cursor(scope: str, values: Sequence[Any]) -> str:
+    """
+    Encode the sort key of the last row of a page as a cursor token.
+
+    Args:
+        scope: Scope from cursor_scope()
+        values: Sort key values of the last row, in ORDER BY order
+
+    Returns:
+        Opaque cursor token
+
+    Example:
+        >>> token = encode_cursor(scope, [row['created_at'], row['id']])
+    """
+    payload = {
+        "v": CURSOR_VERSION,
+        "s": scope,
+        "k": [_json_value(value) for value in values],
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str, scope: str, size: int) -> List[Any]:
+    """
+    Decode a cursor token issued by encode_cursor.
+
+    Args:
+        token: Cursor token from a previous page
+        scope: Scope the current request would issue cursors for
+        size: Number of sort key values expected
+
+    Returns:
+        Sort key values of the last row of the previous page
+
+    Raises:
+        ValidationError: If the token is malformed or was issued for a
+            different query, filter set or ordering
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw)
+    except (binascii.Error, ValueError, TypeError):
+        raise ValidationError("Invalid pagination cursor")
+
+    if not isinstance(payload, dict) or payload.get("v") != CURSOR_VERSION:
+        raise ValidationError("Invalid pagination cursor")
+
+    if payload.get("s") != scope:
+        raise ValidationError(
+            "Pagination cursor does not match this query; "
+            "request the first page again without a cursor"
+        )
+
+    values = payload.get("k")
+    if not isinstance(values, list) or len(values) != size:
+        raise ValidationError("Invalid pagination cursor")
+
+    return values
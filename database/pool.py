@@ -2,16 +2,33 @@
 Database connection pooling for PostgreSQL.
 
 Provides thread-safe connection pooling with automatic connection
-management, health checks, and retry logic.
+management, health checks, and retry logic. Connection checkouts go
+through the shared "database" circuit breaker and retry budget, so
+callers fail fast while Cloud SQL is unreachable.
+
+Checkouts only ping connections that have sat idle longer than
+validation_idle_seconds; recently used connections are handed out as-is
+and evicted if a query fails with a connection error. A background
+keepalive thread pings stale idle connections so checkouts stay on the
+fast path.
+
+When every connection is in use, callers queue FIFO in CheckoutQueue for
+up to the checkout timeout instead of failing. A few connections can be
+reserved for high-priority callers such as health checks.
 """
 
+import bisect
 import logging
+import threading
 import time
+from collections import deque
 from contextlib import contextmanager
 from typing import Optional, Dict, Any
-from psycopg2 import pool, extensions, OperationalError, DatabaseError
+from psycopg2 import pool, extensions, OperationalError, InterfaceError, DatabaseError
 import psycopg2.extras
 
+from src.circuit_breaker import get_circuit_breaker, get_retry_budget
+
 # Try to import config, fallback to environment
 try:
     from config import config as app_config
@@ -23,6 +40,188 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+def build_database_url_from_env() -> Optional[str]:
+    """
+    Build a database URL from DB_* environment variables.
+    
+    Returns:
+        PostgreSQL URL (Cloud SQL socket or direct host), or None if the
+        variables are incomplete
+    """
+    import os
+    
+    db_host = os.getenv("DB_HOST")
+    db_port = os.getenv("DB_PORT", "5432")
+    db_name = os.getenv("DB_NAME")
+    db_user = os.getenv("DB_USER")
+    db_password = os.getenv("DB_PASSWORD")
+    db_connection_name = os.getenv("DB_CONNECTION_NAME")
+    
+    if db_connection_name and db_connection_name.strip() and db_name and db_user and db_password:
+        # Cloud SQL Proxy connection
+        return f"postgresql://{db_user}:{db_password}@/{db_name}?host=/cloudsql/{db_connection_name}"
+    elif db_host and db_name and db_user and db_password:
+        # Direct connection
+        return f"postgresql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
+    
+    return None
+
+
+# Checkout priorities; high-priority callers may use reserved connections
+PRIORITY_NORMAL = "normal"
+PRIORITY_HIGH = "high"
+
+# Upper bounds (ms) of the checkout wait histogram buckets
+WAIT_HISTOGRAM_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class PoolTimeoutError(pool.PoolError):
+    """Raised when no connection becomes available within the checkout timeout."""
+
+
+class PoolQueueFullError(pool.PoolError):
+    """Raised when the checkout wait queue is at capacity."""
+
+
+class CheckoutQueue:
+    """
+    FIFO admission control for pool checkouts.
+    
+    Admits at most capacity concurrent checkouts. Normal-priority callers
+    are limited to capacity - reserved, so reserved slots stay free for
+    high-priority callers. Waiters are served in arrival order among those
+    whose priority allows them a free slot.
+    """
+    
+    def __init__(self, capacity: int, reserved: int = 0, max_waiters: int = 0):
+        """
+        Initialize the queue.
+        
+        Args:
+            capacity: Maximum concurrent checkouts (the pool's max connections)
+            reserved: Slots usable only by PRIORITY_HIGH callers
+            max_waiters: Maximum queued callers (0 = unbounded)
+        """
+        self.capacity = capacity
+        self.reserved = max(0, min(reserved, capacity - 1))
+        self.max_waiters = max_waiters
+        self.in_use = 0
+        self._waiters: deque = deque()
+        self._cond = threading.Condition()
+        
+        self.max_queue_depth = 0
+        self.timeouts = 0
+        self.rejected = 0
+        self.total_wait_seconds = 0.0
+        self._histogram = [0] * (len(WAIT_HISTOGRAM_BUCKETS_MS) + 1)
+    
+    def _limit(self, priority: str) -> int:
+        """Slots available to a priority."""
+        return self.capacity if priority == PRIORITY_HIGH else self.capacity - self.reserved
+    
+    def _is_next(self, ticket: list) -> bool:
+        """Whether a waiter may take a slot now. Caller holds the lock."""
+        if self.in_use >= self._limit(ticket[0]):
+            return False
+        # FIFO: anyone ahead that could also take a slot goes first
+        for ahead in self._waiters:
+            if ahead is ticket:
+                return True
+            if self.in_use < self._limit(ahead[0]):
+                return False
+        return True
+    
+    def _record_wait(self, seconds: float) -> None:
+        """Add a wait to the histogram. Caller holds the lock."""
+        self.total_wait_seconds += seconds
+        self._histogram[bisect.bisect_left(WAIT_HISTOGRAM_BUCKETS_MS, seconds * 1000)] += 1
+    
+    def acquire(self, priority: str = PRIORITY_NORMAL, timeout: Optional[float] = None) -> float:
+        """
+        Wait for a checkout slot.
+        
+        Args:
+            priority: PRIORITY_NORMAL or PRIORITY_HIGH
+            timeout: Maximum seconds to wait (None = wait indefinitely)
+        
+        Returns:
+            Seconds spent waiting
+        
+        Raises:
+            PoolQueueFullError: If max_waiters callers are already queued
+            PoolTimeoutError: If no slot frees up within the timeout
+        """
+        started = time.monotonic()
+        
+        with self._cond:
+            # Fast path: nobody queued and a slot is free
+            if not self._waiters and self.in_use < self._limit(priority):
+                self.in_use += 1
+                self._record_wait(0.0)
+                return 0.0
+            
+            if self.max_waiters and len(self._waiters) >= self.max_waiters:
+                self.rejected += 1
+                raise PoolQueueFullError(
+                    f"Connection wait queue full ({len(self._waiters)} waiters)"
+                )
+            
+            ticket = [priority]
+            self._waiters.append(ticket)
+            self.max_queue_depth = max(self.max_queue_depth, len(self._waiters))
+            deadline = None if timeout is None else started + timeout
+            
+            try:
+                while not self._is_next(ticket):
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        self.timeouts += 1
+                        raise PoolTimeoutError(
+                            f"No database connection available within {timeout}s "
+                            f"({self.in_use}/{self.capacity} in use, {len(self._waiters)} waiting)"
+                        )
+                    self._cond.wait(remaining)
+            finally:
+                self._waiters.remove(ticket)
+                # Our departure may unblock the waiter behind us
+                self._cond.notify_all()
+            
+            self.in_use += 1
+            waited = time.monotonic() - started
+            self._record_wait(waited)
+            return waited
+    
+    def try_acquire(self, priority: str = PRIORITY_NORMAL) -> bool:
+        """Take a slot only if one is free and nobody is queued."""
+        with self._cond:
+            if self._waiters or self.in_use >= self._limit(priority):
+                return False
+            self.in_use += 1
+            return True
+    
+    def release(self) -> None:
+        """Give a slot back and wake waiters."""
+        with self._cond:
+            self.in_use = max(0, self.in_use - 1)
+            self._cond.notify_all()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth, timeouts and the checkout wait histogram."""
+        with self._cond:
+            labels = [f"<={bound}ms" for bound in WAIT_HISTOGRAM_BUCKETS_MS] + [
+                f">{WAIT_HISTOGRAM_BUCKETS_MS[-1]}ms"
+            ]
+            return {
+                "in_use": self.in_use,
+                "queue_depth": len(self._waiters),
+                "max_queue_depth": self.max_queue_depth,
+                "checkout_timeouts": self.timeouts,
+                "checkouts_rejected": self.rejected,
+                "total_wait_seconds": round(self.total_wait_seconds, 6),
+                "wait_histogram": dict(zip(labels, self._histogram)),
+            }
+
+
 class DatabasePool:
     """
     Thread-safe database connection pool manager.
@@ -36,6 +235,11 @@ class DatabasePool:
         min_connections: int = 2,
         max_connections: int = 10,
         database_url: Optional[str] = None,
+        validation_idle_seconds: Optional[float] = None,
+        keepalive_interval_seconds: Optional[float] = None,
+        checkout_timeout: Optional[float] = None,
+        max_waiters: Optional[int] = None,
+        reserved_connections: Optional[int] = None,
         **connection_kwargs
     ):
         """
@@ -45,6 +249,15 @@ class DatabasePool:
             min_connections: Minimum number of connections to maintain
             max_connections: Maximum number of connections allowed
             database_url: PostgreSQL connection URL (defaults to config)
+            validation_idle_seconds: Idle time after which a checkout pings the
+                connection first (defaults to config; 0 pings on every checkout)
+            keepalive_interval_seconds: Interval of the background keepalive
+                thread (defaults to config; 0 disables it)
+            checkout_timeout: Seconds a checkout waits for a free connection
+                (defaults to config)
+            max_waiters: Maximum queued checkouts (defaults to config; 0 = unbounded)
+            reserved_connections: Connections only high-priority checkouts
+                may use (defaults to config)
             **connection_kwargs: Additional psycopg2 connection parameters
         """
         self.min_connections = min_connections
@@ -52,6 +265,27 @@ class DatabasePool:
         self._pool: Optional[pool.ThreadedConnectionPool] = None
         self._connection_kwargs = connection_kwargs
         
+        if validation_idle_seconds is None:
+            validation_idle_seconds = app_config.db_validation_idle_seconds if HAS_APP_CONFIG else 30.0
+        if keepalive_interval_seconds is None:
+            keepalive_interval_seconds = app_config.db_keepalive_interval_seconds if HAS_APP_CONFIG else 60.0
+        self.validation_idle_seconds = validation_idle_seconds
+        self.keepalive_interval_seconds = keepalive_interval_seconds
+        
+        if checkout_timeout is None:
+            checkout_timeout = app_config.db_checkout_timeout_seconds if HAS_APP_CONFIG else 5.0
+        if max_waiters is None:
+            max_waiters = app_config.db_max_waiters if HAS_APP_CONFIG else 100
+        if reserved_connections is None:
+            reserved_connections = app_config.db_reserved_connections if HAS_APP_CONFIG else 1
+        self.checkout_timeout = checkout_timeout
+        self._queue = CheckoutQueue(max_connections, reserved_connections, max_waiters)
+        
+        # Last time each pooled connection was returned or pinged, keyed by id(conn)
+        self._last_used: Dict[int, float] = {}
+        self._keepalive_stop = threading.Event()
+        self._keepalive_thread: Optional[threading.Thread] = None
+        
         # Get database URL from config or parameter
         if database_url:
             self.database_url = database_url
@@ -73,6 +307,11 @@ class DatabasePool:
             "connections_failed": 0,
             "queries_executed": 0,
             "last_health_check": None,
+            "validation_skipped": 0,
+            "validation_pings": 0,
+            "validation_failures": 0,
+            "connections_evicted": 0,
+            "keepalive_pings": 0,
         }
         
         logger.info(
@@ -81,23 +320,7 @@ class DatabasePool:
     
     def _build_url_from_env(self) -> Optional[str]:
         """Build database URL from environment variables."""
-        import os
-        
-        db_host = os.getenv("DB_HOST")
-        db_port = os.getenv("DB_PORT", "5432")
-        db_name = os.getenv("DB_NAME")
-        db_user = os.getenv("DB_USER")
-        db_password = os.getenv("DB_PASSWORD")
-        db_connection_name = os.getenv("DB_CONNECTION_NAME")
-        
-        if db_connection_name and db_connection_name.strip() and db_name and db_user and db_password:
-            # Cloud SQL Proxy connection
-            return f"postgresql://{db_user}:{db_password}@/{db_name}?host=/cloudsql/{db_connection_name}"
-        elif db_host and db_name and db_user and db_password:
-            # Direct connection
-            return f"postgresql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
-        
-        return None
+        return build_database_url_from_env()
     
     def initialize(self) -> None:
         """
@@ -127,6 +350,7 @@ class DatabasePool:
                     if result[0] != 1:
                         raise DatabaseError("Health check failed")
             
+            self._start_keepalive()
             logger.info("Database connection pool initialized successfully")
             
         except Exception as e:
@@ -139,6 +363,8 @@ class DatabasePool:
         if self._pool is None:
             return
         
+        self._stop_keepalive()
+        
         try:
             self._pool.closeall()
             logger.info("Database connection pool closed")
@@ -147,19 +373,36 @@ class DatabasePool:
             logger.error(f"Error closing connection pool: {e}")
         finally:
             self._pool = None
+            self._last_used.clear()
     
     @contextmanager
-    def get_connection(self, retry: bool = True, max_retries: int = 3):
+    def get_connection(
+        self,
+        retry: bool = True,
+        max_retries: int = 3,
+        priority: str = PRIORITY_NORMAL,
+        timeout: Optional[float] = None,
+    ):
         """
         Get a connection from the pool with automatic cleanup.
         
+        When all connections are in use the caller queues (FIFO) until one
+        is returned or the checkout timeout elapses.
+        
         Args:
             retry: Whether to retry on connection failures
             max_retries: Maximum number of retry attempts
+            priority: PRIORITY_NORMAL, or PRIORITY_HIGH to also use reserved connections
+            timeout: Seconds to wait for a free connection (defaults to checkout_timeout)
         
         Yields:
             Database connection
         
+        Raises:
+            CircuitOpenError: If the database circuit is open
+            PoolTimeoutError: If no connection frees up within the timeout
+            PoolQueueFullError: If too many callers are already waiting
+        
         Example:
             with pool.get_connection() as conn:
                 with conn.cursor() as cur:
@@ -168,56 +411,147 @@ class DatabasePool:
         if self._pool is None:
             self.initialize()
         
+        breaker = get_circuit_breaker("database")
+        budget = get_retry_budget("database")
+        
+        # Queue for a slot first; pool waits are local, say nothing about
+        # database health and must not hold a half-open probe slot
+        self._queue.acquire(priority, self.checkout_timeout if timeout is None else timeout)
+        try:
+            probe = breaker.before_call()
+        except BaseException:
+            self._queue.release()
+            raise
+        
         conn = None
         attempts = 0
         
-        while attempts < max_retries:
-            try:
-                conn = self._pool.getconn()
-                
-                # Validate connection
-                if not self._validate_connection(conn):
-                    self._pool.putconn(conn, close=True)
-                    conn = None
+        try:
+            while True:
+                try:
+                    conn = self._pool.getconn()
+                except Exception as e:
                     attempts += 1
+                    logger.warning(f"Connection attempt {attempts} failed: {e}")
+                    
+                    if attempts >= max_retries:
+                        self._stats["connections_failed"] += 1
+                        raise
+                    
                     if not retry:
-                        raise OperationalError("Connection validation failed")
+                        raise
+                    
+                    if not budget.try_acquire():
+                        logger.error("Database retry budget exhausted; not retrying")
+                        self._stats["connections_failed"] += 1
+                        raise
+                    
+                    # Brief backoff
+                    time.sleep(0.1 * attempts)
                     continue
                 
-                # Connection is valid
-                break
+                # Validate connection (pings only after idle time; a
+                # half-open probe always pings so recovery is real)
+                if self._checkout_valid(conn, force_ping=probe):
+                    break
                 
-            except Exception as e:
+                # Raised outside the handler above so the attempt and the
+                # retry budget are counted once
+                self._release(conn, close=True)
+                conn = None
                 attempts += 1
-                logger.warning(f"Connection attempt {attempts} failed: {e}")
+                logger.warning(f"Connection attempt {attempts} failed validation")
                 
-                if attempts >= max_retries:
+                if attempts >= max_retries or not retry:
                     self._stats["connections_failed"] += 1
-                    raise
+                    raise OperationalError("Connection validation failed")
                 
-                if not retry:
-                    raise
-                
-                # Brief backoff
-                time.sleep(0.1 * attempts)
+                if not budget.try_acquire():
+                    self._stats["connections_failed"] += 1
+                    raise OperationalError("Connection validation failed; retry budget exhausted")
+        except OperationalError:
+            self._queue.release()
+            breaker.record_failure()
+            raise
+        except BaseException:
+            # Pool errors (e.g. exhaustion) are local and say nothing about
+            # database health; the probe slot is given back below
+            self._queue.release()
+            raise
+        else:
+            breaker.record_success()
+        finally:
+            if probe:
+                breaker.release_probe()
         
+        broken = False
         try:
             yield conn
         except Exception as e:
+            # A connection lost mid-query counts against the database
+            if isinstance(e, OperationalError):
+                breaker.record_failure()
+            
+            # Connection errors evict the connection instead of returning it
+            broken = isinstance(e, (OperationalError, InterfaceError))
+            
             # Rollback on error
-            if conn and not conn.closed:
+            if conn and not conn.closed and not broken:
                 try:
                     conn.rollback()
                 except Exception:
-                    pass
+                    broken = True
             raise
         finally:
             # Return connection to pool
             if conn and self._pool:
-                try:
-                    self._pool.putconn(conn)
-                except Exception as e:
-                    logger.error(f"Error returning connection to pool: {e}")
+                if broken or conn.closed:
+                    self._stats["connections_evicted"] += 1
+                self._release(conn, close=broken or bool(conn.closed))
+            self._queue.release()
+    
+    def _release(self, conn, close: bool = False) -> None:
+        """Return a connection to the pool, recording when it was last used."""
+        if close:
+            self._last_used.pop(id(conn), None)
+        else:
+            self._last_used[id(conn)] = time.monotonic()
+        
+        try:
+            self._pool.putconn(conn, close=close)
+        except Exception as e:
+            logger.error(f"Error returning connection to pool: {e}")
+    
+    def _checkout_valid(self, conn, force_ping: bool = False) -> bool:
+        """
+        Decide whether a checked-out connection can be used.
+        
+        Closed connections are rejected without a round trip. Connections
+        used within validation_idle_seconds are trusted; older or unseen
+        ones are pinged with _validate_connection.
+        
+        Args:
+            conn: Connection just taken from the pool
+            force_ping: Ping even a recently used connection
+        
+        Returns:
+            True if the connection can be handed out
+        """
+        if conn is None or conn.closed:
+            self._stats["validation_failures"] += 1
+            return False
+        
+        last_used = self._last_used.get(id(conn))
+        if not force_ping and last_used is not None and time.monotonic() - last_used < self.validation_idle_seconds:
+            self._stats["validation_skipped"] += 1
+            return True
+        
+        self._stats["validation_pings"] += 1
+        if self._validate_connection(conn):
+            return True
+        
+        self._stats["validation_failures"] += 1
+        return False
     
     def _validate_connection(self, conn) -> bool:
         """
@@ -242,6 +576,81 @@ class DatabasePool:
             logger.warning(f"Connection validation failed: {e}")
             return False
     
+    def keepalive(self) -> int:
+        """
+        Ping idle connections that have been unused for validation_idle_seconds.
+        
+        Pinged connections get a fresh last-used time, so the next checkout
+        skips validation; dead ones are closed.
+        
+        Returns:
+            Number of connections pinged
+        """
+        if self._pool is None:
+            return 0
+        
+        # psycopg2 keeps idle connections in the pool's internal list
+        idle_count = len(getattr(self._pool, "_pool", []))
+        held = []
+        for _ in range(idle_count):
+            # Only borrow slots nobody is waiting for
+            if not self._queue.try_acquire():
+                break
+            try:
+                held.append(self._pool.getconn())
+            except pool.PoolError:
+                self._queue.release()
+                break
+        
+        pinged = 0
+        now = time.monotonic()
+        for conn in held:
+            last_used = self._last_used.get(id(conn))
+            if last_used is not None and now - last_used < self.validation_idle_seconds:
+                self._release(conn)
+                continue
+            
+            pinged += 1
+            self._stats["keepalive_pings"] += 1
+            if self._validate_connection(conn):
+                self._release(conn)
+            else:
+                self._stats["connections_evicted"] += 1
+                self._release(conn, close=True)
+        
+        for _ in held:
+            self._queue.release()
+        
+        return pinged
+    
+    def _keepalive_loop(self) -> None:
+        """Run keepalive() every keepalive_interval_seconds until stopped."""
+        while not self._keepalive_stop.wait(self.keepalive_interval_seconds):
+            try:
+                self.keepalive()
+            except Exception as e:
+                logger.warning(f"Connection keepalive failed: {e}")
+    
+    def _start_keepalive(self) -> None:
+        """Start the background keepalive thread if enabled."""
+        if self.keepalive_interval_seconds <= 0 or self._keepalive_thread is not None:
+            return
+        
+        self._keepalive_stop.clear()
+        self._keepalive_thread = threading.Thread(
+            target=self._keepalive_loop, name="db-pool-keepalive", daemon=True
+        )
+        self._keepalive_thread.start()
+    
+    def _stop_keepalive(self) -> None:
+        """Stop the background keepalive thread."""
+        if self._keepalive_thread is None:
+            return
+        
+        self._keepalive_stop.set()
+        self._keepalive_thread.join(timeout=5)
+        self._keepalive_thread = None
+    
     def health_check(self) -> Dict[str, Any]:
         """
         Perform a health check on the connection pool.
@@ -257,7 +666,8 @@ class DatabasePool:
         }
         
         try:
-            with self.get_connection(retry=False) as conn:
+            # High priority: health checks may use reserved connections
+            with self.get_connection(retry=False, priority=PRIORITY_HIGH) as conn:
                 with conn.cursor() as cur:
                     # Test query
                     cur.execute("SELECT version()")
@@ -311,8 +721,10 @@ class DatabasePool:
                 return result
     
     def get_stats(self) -> Dict[str, Any]:
-        """Get connection pool statistics."""
-        return self._stats.copy()
+        """Get connection pool statistics, including checkout queue depth and wait histogram."""
+        stats = self._stats.copy()
+        stats.update(self._queue.get_stats())
+        return stats
 
 
 # Global pool instance
@@ -359,13 +771,20 @@ def get_connection_pool(
 
 
 @contextmanager
-def get_connection(retry: bool = True, max_retries: int = 3):
+def get_connection(
+    retry: bool = True,
+    max_retries: int = 3,
+    priority: str = PRIORITY_NORMAL,
+    timeout: Optional[float] = None,
+):
     """
     Convenience function to get a database connection.
     
     Args:
         retry: Whether to retry on connection failures
         max_retries: Maximum number of retry attempts
+        priority: PRIORITY_NORMAL, or PRIORITY_HIGH to also use reserved connections
+        timeout: Seconds to wait for a free connection (defaults to the pool's)
     
     Yields:
         Database connection
@@ -379,7 +798,9 @@ def get_connection(retry: bool = True, max_retries: int = 3):
                 tracks = cur.fetchall()
     """
     pool = get_connection_pool()
-    with pool.get_connection(retry=retry, max_retries=max_retries) as conn:
+    with pool.get_connection(
+        retry=retry, max_retries=max_retries, priority=priority, timeout=timeout
+    ) as conn:
         yield conn
 
 
@@ -0,0 +1,314 @@
+"""
+Server-side prepared statements for hot read queries.
+
+psycopg2 sends every query as text, so PostgreSQL parses and plans the
+metadata lookups and search queries again on each call. The
+PreparedStatementRegistry prepares each query once per pooled connection
+(PREPARE) and afterwards runs it by name (EXECUTE), skipping the parse and
+plan work on repeat calls.
+
+Prepared statements live in the database session, so the registry tracks
+them per connection object. A connection replaced by the pool starts with
+no statements, and a statement the server no longer knows (session reset
+by a proxy, DISCARD ALL) is prepared again and the query retried once.
+
+Only use execute_prepared for read-only statements run at the start of a
+transaction: recovering from a lost statement rolls the transaction back.
+"""
+
+import hashlib
+import logging
+import re
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Sequence, Tuple
+
+from psycopg2 import errors, extensions
+
+# Try to import config, fallback to defaults
+try:
+    from config import config as app_config
+    HAS_APP_CONFIG = True
+except ImportError:
+    HAS_APP_CONFIG = False
+
+logger = logging.getLogger(__name__)
+
+STATEMENT_NAME_PREFIX = "loist_"
+
+# Savepoint guarding a prepared execute inside an open transaction
+RESYNC_SAVEPOINT = "loist_prepared_resync"
+
+_PLACEHOLDER = re.compile(r"%(%|s)")
+
+
+def statement_name(query: str) -> str:
+    """
+    Derive a stable prepared statement name from the query text.
+
+    Args:
+        query: SQL with psycopg2 %s placeholders
+
+    Returns:
+        Statement name, e.g. "loist_3f2a9c0d81b7"
+    """
+    return STATEMENT_NAME_PREFIX + hashlib.sha1(query.encode("utf-8")).hexdigest()[:12]
+
+
+def to_server_placeholders(query: str) -> Tuple[str, int]:
+    """
+    Rewrite psycopg2 placeholders as PostgreSQL positional parameters.
+
+    Args:
+        query: SQL with %s placeholders (and %% for a literal %)
+
+    Returns:
+        Tuple of (SQL with $1..$n placeholders, parameter count)
+
+    Raises:
+        ValueError: If the query uses named %(name)s placeholders
+
+    Example:
+        >>> to_server_placeholders("SELECT * FROM t WHERE a = %s AND b LIKE 'x%%'")
+        ("SELECT * FROM t WHERE a = $1 AND b LIKE 'x%'", 1)
+    """
+    if "%(" in query.replace("%%", ""):
+        raise ValueError("Prepared statements do not support named placeholders")
+
+    count = 0
+
+    def replace(match):
+        nonlocal count
+        if match.group(1) == "%":
+            return "%"
+        count += 1
+        return f"${count}"
+
+    return _PLACEHOLDER.sub(replace, query), count
+
+
+def _array_literal(values: Sequence[Any]) -> str:
+    """
+    Render a list as a PostgreSQL array literal string.
+
+    psycopg2 sends lists as ARRAY[...] of text, which EXECUTE will not
+    coerce to e.g. uuid[]; an untyped '{...}' literal takes the type the
+    statement was prepared with.
+    """
+    items = []
+    for value in values:
+        if value is None:
+            items.append("NULL")
+        else:
+            text = str(value).replace("\\", "\\\\").replace('"', '\\"')
+            items.append(f'"{text}"')
+    return "{" + ",".join(items) + "}"
+
+
+class PreparedStatementRegistry:
+    """
+    Tracks which queries are prepared on which connection.
+
+    Each connection keeps at most max_statements prepared statements; the
+    least recently used one is deallocated to make room for a new query.
+    Entries are dropped automatically when the connection object is
+    garbage collected, so replaced connections never inherit statements.
+    """
+
+    def __init__(self, enabled: bool = True, max_statements: int = 100):
+        """
+        Initialize the registry.
+
+        Args:
+            enabled: Whether execute() prepares queries (False runs them as plain text)
+            max_statements: Prepared statements kept per connection
+        """
+        self.enabled = enabled
+        self.max_statements = max(1, max_statements)
+        self._prepared: "weakref.WeakKeyDictionary[Any, OrderedDict]" = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+        self._stats = {
+            "prepares": 0,
+            "executes": 0,
+            "reprepares": 0,
+            "deallocations": 0,
+            "unprepared_executes": 0,
+        }
+
+    def _statements(self, conn) -> OrderedDict:
+        """Return the name -> query map of statements prepared on conn."""
+        with self._lock:
+            statements = self._prepared.get(conn)
+            if statements is None:
+                statements = OrderedDict()
+                self._prepared[conn] = statements
+            return statements
+
+    def forget(self, conn) -> None:
+        """Drop everything known about conn (e.g. after its session was reset)."""
+        with self._lock:
+            self._prepared.pop(conn, None)
+
+    def is_prepared(self, conn, query: str) -> bool:
+        """Whether query is currently prepared on conn."""
+        with self._lock:
+            statements = self._prepared.get(conn)
+            return bool(statements) and statement_name(query) in statements
+
+    def _prepare(self, cur, name: str, query: str) -> None:
+        """PREPARE query on the cursor's connection, evicting the LRU statement if full."""
+        statements = self._statements(cur.connection)
+
+        while len(statements) >= self.max_statements:
+            evicted, _ = statements.popitem(last=False)
+            cur.execute(f"DEALLOCATE {evicted}")
+            self._stats["deallocations"] += 1
+
+        server_query, _ = to_server_placeholders(query)
+        cur.execute(f"PREPARE {name} AS {server_query}")
+        statements[name] = query
+        self._stats["prepares"] += 1
+        logger.debug(f"Prepared statement {name} on connection {id(cur.connection)}")
+
+    def _execute_by_name(self, cur, name: str, params: Sequence[Any]) -> None:
+        """EXECUTE a prepared statement with the given parameters."""
+        if not params:
+            cur.execute(f"EXECUTE {name}")
+            return
+
+        values = [
+            _array_literal(value) if isinstance(value, (list, tuple)) else value
+            for value in params
+        ]
+        placeholders = ", ".join(["%s"] * len(values))
+        cur.execute(f"EXECUTE {name} ({placeholders})", values)
+
+    def execute(self, cur, query: str, params: Optional[Sequence[Any]] = None) -> None:
+        """
+        Run a read query on cur, preparing it on first use per connection.
+
+        Args:
+            cur: psycopg2 cursor (its connection owns the prepared statement)
+            query: SQL with %s placeholders
+            params: Query parameters
+
+        Raises:
+            psycopg2.DatabaseError: If the query fails
+        """
+        params = list(params or [])
+
+        if not self.enabled:
+            cur.execute(query, params)
+            self._stats["unprepared_executes"] += 1
+            return
+
+        try:
+            name = statement_name(query)
+            _, expected = to_server_placeholders(query)
+        except ValueError:
+            cur.execute(query, params)
+            self._stats["unprepared_executes"] += 1
+            return
+
+        if expected != len(params):
+            raise ValueError(f"Query expects {expected} parameters, got {len(params)}")
+
+        conn = cur.connection
+        statements = self._statements(conn)
+
+        # Inside an open transaction, a resync must not throw away the caller's
+        # earlier statements or transaction-local settings (SET LOCAL, set_config)
+        savepoint = conn.get_transaction_status() == extensions.TRANSACTION_STATUS_INTRANS
+        if savepoint:
+            cur.execute(f"SAVEPOINT {RESYNC_SAVEPOINT}")
+
+        try:
+            if name not in statements:
+                self._prepare(cur, name, query)
+            else:
+                statements.move_to_end(name)
+            self._execute_by_name(cur, name, params)
+
+        except (errors.InvalidSqlStatementName, errors.DuplicatePreparedStatement) as e:
+            # The session no longer matches the registry (reset, or prepared
+            # outside it): resynchronize and retry once.
+            logger.warning(f"Prepared statement {name} out of sync on connection {id(conn)}: {e}")
+            if savepoint:
+                cur.execute(f"ROLLBACK TO SAVEPOINT {RESYNC_SAVEPOINT}")
+            else:
+                conn.rollback()
+            self.forget(conn)
+            self._stats["reprepares"] += 1
+
+            if isinstance(e, errors.DuplicatePreparedStatement):
+                cur.execute(f"DEALLOCATE {name}")
+            self._prepare(cur, name, query)
+            self._execute_by_name(cur, name, params)
+
+        if savepoint:
+            # On a separate cursor: cur still holds the caller's results
+            with conn.cursor() as release_cur:
+                release_cur.execute(f"RELEASE SAVEPOINT {RESYNC_SAVEPOINT}")
+
+        self._stats["executes"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get prepared statement statistics."""
+        stats = self._stats.copy()
+        with self._lock:
+            stats["connections"] = len(self._prepared)
+            stats["prepared_statements"] = sum(len(s) for s in self._prepared.values())
+        stats["enabled"] = self.enabled
+        stats["max_statements"] = self.max_statements
+        return stats
+
+
+# Global registry instance
+_registry: Optional[PreparedStatementRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_statement_registry() -> PreparedStatementRegistry:
+    """
+    Get or create the global prepared statement registry.
+
+    Returns:
+        PreparedStatementRegistry configured from db_prepared_statements
+        and db_max_prepared_statements
+    """
+    global _registry
+
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                if HAS_APP_CONFIG:
+                    _registry = PreparedStatementRegistry(
+                        enabled=app_config.db_prepared_statements,
+                        max_statements=app_config.db_max_prepared_statements,
+                    )
+                else:
+                    _registry = PreparedStatementRegistry()
+
+    return _registry
+
+
+def execute_prepared(cur, query: str, params: Optional[Sequence[Any]] = None) -> None:
+    """
+    Convenience function to run a read query through the global registry.
+
+    Args:
+        cur: psycopg2 cursor
+        query: SQL with %s placeholders
+        params: Query parameters
+
+    Example:
+        from database.prepared import execute_prepared
+
+        with get_connection() as conn:
+            with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+                execute_prepared(cur, GET_METADATA_BY_ID_QUERY, (track_id,))
+                row = cur.fetchone()
+    """
+    get_statement_registry().execute(cur, query, params)
@@ -180,19 +180,25 @@ class AudioTrackDB:
         Returns:
             List of track records with similarity scores
         """
+        # The % operator (unlike a similarity() > x comparison) can use the
+        # trigram index on fuzzy_text; its cut-off is the session setting
         query = """
             SELECT *,
-                   similarity(COALESCE(artist, '') || ' ' || title, %s) as sim_score
+                   similarity(fuzzy_text, %s) as sim_score
             FROM audio_tracks
-            WHERE similarity(COALESCE(artist, '') || ' ' || title, %s) > %s
+            WHERE fuzzy_text %% %s
             ORDER BY sim_score DESC
             LIMIT %s
         """
         
-        params = (search_term, search_term, similarity_threshold, limit)
+        params = (search_term, search_term, limit)
         
         with get_connection() as conn:
             with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+                cur.execute(
+                    "SELECT set_config('pg_trgm.similarity_threshold', %s, true)",
+                    (str(similarity_threshold),)
+                )
                 cur.execute(query, params)
                 results = cur.fetchall()
                 return [dict(row) for row in results]
@@ -0,0 +1,386 @@
+"""
+Retry budgets and circuit breakers for external dependencies.
+
+When GCS or Cloud SQL is degraded, independent per-call retries multiply
+the load on the struggling dependency and tie up workers in backoff sleeps.
+This module provides two shared, per-dependency guards:
+
+- RetryBudget: token bucket that caps how many retries all callers of a
+  dependency may perform; once empty, failures are surfaced immediately
+- CircuitBreaker: closed/open/half-open state machine that rejects calls
+  outright while a dependency is failing, then lets a probe through after
+  a recovery timeout
+
+Guards are looked up by dependency name ("gcs", "database") so every caller
+in the process shares the same state, and get_resilience_status() exposes
+it for health checks.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from src.exceptions import ExternalServiceError
+
+try:
+    from src.config import config as app_config
+    HAS_APP_CONFIG = True
+except ImportError:
+    HAS_APP_CONFIG = False
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Circuit states
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(ExternalServiceError):
+    """
+    Raised when a call is rejected because a dependency's circuit is open.
+
+    Examples:
+    - GCS has returned repeated 503s and the recovery timeout has not elapsed
+    - Cloud SQL connections keep failing and a half-open probe is in flight
+    """
+
+    def __init__(self, dependency: str, retry_after: float):
+        self.dependency = dependency
+        self.retry_after = retry_after
+        super().__init__(
+            f"Circuit open for {dependency}; failing fast (retry after {retry_after:.1f}s)",
+            details={"dependency": dependency, "retry_after_seconds": round(retry_after, 1)},
+        )
+
+
+class RetryBudget:
+    """
+    Token bucket limiting retries across all callers of a dependency.
+
+    Each retry spends one token. Tokens refill continuously up to capacity,
+    so a healthy dependency never runs dry while a sustained outage quickly
+    drains the bucket and stops retry storms.
+    """
+
+    def __init__(self, capacity: float = 10.0, refill_per_second: float = 1.0):
+        """
+        Initialize the retry budget.
+
+        Args:
+            capacity: Maximum number of banked retry tokens
+            refill_per_second: Tokens added per second
+        """
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+        self.retries_allowed = 0
+        self.retries_denied = 0
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last refill. Caller holds the lock."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.refill_per_second)
+        self._last_refill = now
+
+    def try_acquire(self) -> bool:
+        """
+        Spend one token for a retry.
+
+        Returns:
+            True if the retry may proceed, False if the budget is exhausted
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                self.retries_allowed += 1
+                return True
+            self.retries_denied += 1
+            return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get budget statistics."""
+        with self._lock:
+            self._refill()
+            return {
+                "tokens": round(self._tokens, 2),
+                "capacity": self.capacity,
+                "retries_allowed": self.retries_allowed,
+                "retries_denied": self.retries_denied,
+            }
+
+
+class CircuitBreaker:
+    """
+    Per-dependency circuit breaker.
+
+    - closed: calls pass through; consecutive failures are counted
+    - open: calls are rejected with CircuitOpenError until recovery_timeout elapses
+    - half_open: a limited number of probe calls pass; one success closes the
+      circuit, one failure reopens it
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+    ):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            name: Dependency name used in logs and errors
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds to stay open before allowing a probe
+            half_open_max_calls: Concurrent probe calls allowed while half-open
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+
+        self._state = STATE_CLOSED
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._half_open_calls = 0
+        self._lock = threading.Lock()
+
+        self.total_failures = 0
+        self.rejected_calls = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> str:
+        """Current state, moving open -> half_open once the recovery timeout has elapsed."""
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def _maybe_half_open(self) -> None:
+        """Transition open -> half_open when due. Caller holds the lock."""
+        if self._state == STATE_OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+            self._state = STATE_HALF_OPEN
+            self._half_open_calls = 0
+            logger.info(f"Circuit for {self.name} half-open; allowing probe calls")
+
+    def _open(self) -> None:
+        """Open the circuit. Caller holds the lock."""
+        self._state = STATE_OPEN
+        self._opened_at = time.monotonic()
+        self.times_opened += 1
+        logger.warning(
+            f"Circuit for {self.name} opened after {self._consecutive_failures} consecutive failures; "
+            f"failing fast for {self.recovery_timeout}s"
+        )
+
+    def before_call(self) -> bool:
+        """
+        Check whether a call may proceed.
+
+        A call admitted while half-open holds a probe slot until it reports
+        record_success() or record_failure(). A caller that ends without an
+        outcome (cancelled, or failed before reaching the dependency) must
+        hand the slot back with release_probe().
+
+        Returns:
+            True if the call took a half-open probe slot
+
+        Raises:
+            CircuitOpenError: If the circuit is open or the half-open probe slots are taken
+        """
+        with self._lock:
+            self._maybe_half_open()
+
+            if self._state == STATE_OPEN:
+                self.rejected_calls += 1
+                retry_after = self.recovery_timeout - (time.monotonic() - self._opened_at)
+                raise CircuitOpenError(self.name, max(0.0, retry_after))
+
+            if self._state == STATE_HALF_OPEN:
+                if self._half_open_calls >= self.half_open_max_calls:
+                    self.rejected_calls += 1
+                    raise CircuitOpenError(self.name, 0.0)
+                self._half_open_calls += 1
+                return True
+
+            return False
+
+    def release_probe(self) -> None:
+        """
+        Give back a half-open probe slot without an outcome.
+
+        No-op once the probe has reported, since reporting leaves the
+        half-open state.
+        """
+        with self._lock:
+            if self._state == STATE_HALF_OPEN and self._half_open_calls > 0:
+                self._half_open_calls -= 1
+
+    def record_success(self) -> None:
+        """Record a call that reached the dependency and got an answer."""
+        with self._lock:
+            if self._state == STATE_HALF_OPEN:
+                logger.info(f"Circuit for {self.name} closed; dependency recovered")
+            self._state = STATE_CLOSED
+            self._consecutive_failures = 0
+            self._opened_at = None
+            self._half_open_calls = 0
+
+    def record_failure(self) -> None:
+        """Record a transient dependency failure (timeout, 5xx, connection error)."""
+        with self._lock:
+            self._consecutive_failures += 1
+            self.total_failures += 1
+
+            if self._state == STATE_HALF_OPEN:
+                self._open()
+            elif self._state == STATE_CLOSED and self._consecutive_failures >= self.failure_threshold:
+                self._open()
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Get breaker state for health reporting.
+
+        Returns:
+            dict: State, failure counters and seconds until the next probe
+        """
+        with self._lock:
+            self._maybe_half_open()
+            retry_after = None
+            if self._state == STATE_OPEN:
+                retry_after = round(max(0.0, self.recovery_timeout - (time.monotonic() - self._opened_at)), 1)
+
+            return {
+                "state": self._state,
+                "consecutive_failures": self._consecutive_failures,
+                "failure_threshold": self.failure_threshold,
+                "total_failures": self.total_failures,
+                "rejected_calls": self.rejected_calls,
+                "times_opened": self.times_opened,
+                "retry_after_seconds": retry_after,
+            }
+
+
+# Global registries, keyed by dependency name
+_breakers: Dict[str, CircuitBreaker] = {}
+_budgets: Dict[str, RetryBudget] = {}
+_registry_lock = threading.Lock()
+
+
+def get_circuit_breaker(dependency: str) -> CircuitBreaker:
+    """
+    Get the shared circuit breaker for a dependency, creating it on first use.
+
+    Args:
+        dependency: Dependency name (e.g. "gcs", "database")
+
+    Returns:
+        CircuitBreaker instance shared by the whole process
+    """
+    with _registry_lock:
+        if dependency not in _breakers:
+            if HAS_APP_CONFIG:
+                _breakers[dependency] = CircuitBreaker(
+                    dependency,
+                    failure_threshold=app_config.circuit_breaker_failure_threshold,
+                    recovery_timeout=app_config.circuit_breaker_recovery_seconds,
+                )
+            else:
+                _breakers[dependency] = CircuitBreaker(dependency)
+        return _breakers[dependency]
+
+
+def get_retry_budget(dependency: str) -> RetryBudget:
+    """
+    Get the shared retry budget for a dependency, creating it on first use.
+
+    Args:
+        dependency: Dependency name (e.g. "gcs", "database")
+
+    Returns:
+        RetryBudget instance shared by the whole process
+    """
+    with _registry_lock:
+        if dependency not in _budgets:
+            if HAS_APP_CONFIG:
+                _budgets[dependency] = RetryBudget(
+                    capacity=app_config.retry_budget_capacity,
+                    refill_per_second=app_config.retry_budget_refill_per_second,
+                )
+            else:
+                _budgets[dependency] = RetryBudget()
+        return _budgets[dependency]
+
+
+def call_with_breaker(
+    dependency: str,
+    operation: Callable[[], T],
+    failure_exceptions: tuple = (Exception,),
+) -> T:
+    """
+    Run an operation guarded by a dependency's circuit breaker (no retries).
+
+    Args:
+        dependency: Dependency name
+        operation: Callable to execute (takes no arguments)
+        failure_exceptions: Exceptions that count as dependency failures;
+            anything else is treated as an answer from a healthy dependency
+
+    Returns:
+        Result of the operation
+
+    Raises:
+        CircuitOpenError: If the circuit is open
+    """
+    breaker = get_circuit_breaker(dependency)
+    probe = breaker.before_call()
+
+    try:
+        result = operation()
+    except failure_exceptions:
+        breaker.record_failure()
+        raise
+    except Exception:
+        breaker.record_success()
+        raise
+    else:
+        breaker.record_success()
+        return result
+    finally:
+        # Interrupted (KeyboardInterrupt, cancellation) without an outcome
+        if probe:
+            breaker.release_probe()
+
+
+def get_resilience_status() -> Dict[str, Dict[str, Any]]:
+    """
+    Get breaker and retry budget state for every known dependency.
+
+    Returns:
+        dict: {dependency: {"circuit": {...}, "retry_budget": {...}}}
+    """
+    with _registry_lock:
+        names = sorted(set(_breakers) | set(_budgets))
+
+    return {
+        name: {
+            "circuit": get_circuit_breaker(name).get_state(),
+            "retry_budget": get_retry_budget(name).get_stats(),
+        }
+        for name in names
+    }
+
+
+def reset_resilience_state() -> None:
+    """Drop all breakers and budgets (used by tests and after reconfiguration)."""
+    with _registry_lock:
+        _breakers.clear()
+        _budgets.clear()
@@ -53,8 +53,11 @@ class ServerConfig(BaseSettings):
     max_workers: int = 4
     request_timeout: int = 30
     
-    # Storage (for future implementation)
-    storage_path: str = "./storage"
+    # Storage backend
+    storage_backend: Literal["gcs", "local"] = "gcs"  # "local" serves files from storage_path
+    storage_path: str = "./storage"  # Root directory of the local storage backend
+    local_storage_signing_key: str | None = None  # HMAC key for local signed URLs (random per process if unset)
+    local_storage_base_url: str | None = None  # Public base URL for local signed URLs (defaults to http://localhost:{server_port})
     max_file_size: int = 104857600  # 100MB
     
     # Google Cloud Storage Configuration
@@ -62,8 +65,19 @@ class ServerConfig(BaseSettings):
     gcs_project_id: str | None = None
     gcs_region: str = "us-central1"
     gcs_signed_url_expiration: int = 900  # 15 minutes in seconds
+    gcs_signed_url_window_seconds: int = 900  # Align signed URL expiry to 15-minute buckets (0 disables)
     gcs_service_account_email: str | None = None
     google_application_credentials: str | None = None  # Path to service account key
+    gcs_upload_chunk_size_mb: int = 8  # Resumable upload chunk size (rounded up to 256 KiB)
+    gcs_upload_max_resume_attempts: int = 5  # Resume attempts per interrupted upload session
+    gcs_composite_upload_threshold_mb: int = 150  # Parallel composite upload at/above this size (0 disables)
+    gcs_composite_upload_parts: int = 8  # Concurrent parts per composite upload (max 32)
+    
+    # Signed URL Cache Configuration
+    signed_url_cache_max_entries: int = 1000  # Local LRU size per instance
+    signed_url_cache_backend: Literal["none", "memory", "redis"] = "none"  # Shared second tier
+    redis_url: str | None = None  # e.g. redis://10.0.0.3:6379/0
+    signed_url_cache_snapshot_path: str | None = None  # Local path or gs://bucket/key, restored on startup
     
     # Database Configuration
     db_host: str | None = None
@@ -75,6 +89,35 @@ class ServerConfig(BaseSettings):
     db_min_connections: int = 2
     db_max_connections: int = 10
     db_command_timeout: int = 30
+    db_async_enabled: bool = True  # Async tools use the psycopg 3 pool; False runs psycopg2 in worker threads
+    db_async_max_connections: int = 10  # Async pool size (separate from the psycopg2 pool)
+    db_validation_idle_seconds: float = 30.0  # Ping a pooled connection on checkout only after this much idle time
+    db_keepalive_interval_seconds: float = 60.0  # Background ping of stale idle connections (0 disables)
+    db_checkout_timeout_seconds: float = 5.0  # Max wait for a connection when the pool is exhausted
+    db_max_waiters: int = 100  # Callers allowed to queue for a connection (0 = unbounded)
+    db_reserved_connections: int = 1  # Connections only high-priority callers (health checks) may use
+    db_prepared_statements: bool = True  # Prepare hot read queries once per pooled connection
+    db_max_prepared_statements: int = 100  # Prepared statements kept per connection (LRU)
+    db_metadata_cache_enabled: bool = True  # Cache get_audio_metadata_by_id(s) rows in memory
+    db_metadata_cache_max_entries: int = 10000  # Cached track rows per instance (LRU)
+    db_metadata_cache_ttl_seconds: float = 300.0  # Maximum age of a cached track row
+    db_metadata_cache_listen: bool = True  # LISTEN for audio_tracks changes; cache is bypassed while not listening (False: single replica, TTL-bounded staleness)
+    db_lookup_batching: bool = True  # Coalesce concurrent single-track async lookups into one WHERE id = ANY query
+    db_lookup_batch_window_ms: float = 2.0  # How long a batch collects track IDs (0 = next event loop iteration)
+    db_lookup_batch_max_size: int = 100  # Track IDs per batched query
+    
+    # Resilience (retry budget and circuit breaker per dependency)
+    circuit_breaker_failure_threshold: int = 5  # Consecutive failures before failing fast
+    circuit_breaker_recovery_seconds: float = 30.0  # Time open before a probe call is allowed
+    retry_budget_capacity: int = 10  # Retry tokens shared by all callers of a dependency
+    retry_budget_refill_per_second: float = 1.0  # Retry tokens regained per second
+    
+    # Search Configuration
+    search_fuzzy_fallback: bool = True  # Retry zero-hit searches with trigram (typo-tolerant) matching
+    search_fuzzy_threshold: float = 0.3  # Minimum trigram similarity for fuzzy matches
+    search_cache_enabled: bool = True  # Cache search_library responses until the library changes
+    search_cache_max_entries: int = 1000  # Cached search responses per instance (LRU)
+    search_cache_ttl_seconds: float = 60.0  # Maximum age of a cached search response
     
     # CORS Configuration
     enable_cors: bool = True
@@ -8,14 +8,18 @@ Provides secure downloading of audio files from URLs with:
 - Timeout handling
 - Redirect support
 - Custom headers
+- CRC32C/MD5 checksums computed while streaming
 """
 
+import base64
+import hashlib
 import logging
 import tempfile
 from pathlib import Path
 from typing import Optional, Dict, Any, Callable
 from urllib.parse import urlparse
 
+import google_crc32c
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -53,6 +57,7 @@ class HTTPDownloader:
     - Redirect support
     - Custom headers
     - Progress tracking
+    - Incremental CRC32C/MD5 checksums (see last_checksums)
     """
     
     def __init__(
@@ -82,6 +87,9 @@ class HTTPDownloader:
         self.follow_redirects = follow_redirects
         self.user_agent = user_agent or "Loist-MCP-Server/0.1.0"
         
+        # Base64 checksums of the most recent completed download
+        self.last_checksums: Optional[Dict[str, str]] = None
+        
         # Create session with retry logic
         self.session = self._create_session()
         
@@ -185,15 +193,21 @@ class HTTPDownloader:
         destination: Optional[Path | str] = None,
         headers: Optional[Dict[str, str]] = None,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        checksums: Optional[Dict[str, str]] = None,
     ) -> Path:
         """
         Download file from URL.
         
+        CRC32C and MD5 digests are computed over each chunk as it is written,
+        so the file never has to be re-read to obtain upload checksums.
+        
         Args:
             url: URL to download from
             destination: Destination path (uses temp file if None)
             headers: Optional custom headers
             progress_callback: Optional callback(bytes_downloaded, total_bytes)
+            checksums: Optional dict that receives base64 "crc32c" and "md5_hash"
+                values in the format GCS uses for object hashes
         
         Returns:
             Path to downloaded file
@@ -256,10 +270,14 @@ class HTTPDownloader:
                 
                 # Download in chunks
                 bytes_downloaded = 0
+                crc32c = google_crc32c.Checksum()
+                md5 = hashlib.md5()
                 with open(dest_path, 'wb') as f:
                     for chunk in response.iter_content(chunk_size=self.chunk_size):
                         if chunk:  # Filter out keep-alive chunks
                             f.write(chunk)
+                            crc32c.update(chunk)
+                            md5.update(chunk)
                             bytes_downloaded += len(chunk)
                             
                             # Check size during download
@@ -273,8 +291,16 @@ class HTTPDownloader:
                             if progress_callback:
                                 progress_callback(bytes_downloaded, total_size)
                 
+                self.last_checksums = {
+                    "crc32c": base64.b64encode(crc32c.digest()).decode("ascii"),
+                    "md5_hash": base64.b64encode(md5.digest()).decode("ascii"),
+                }
+                if checksums is not None:
+                    checksums.update(self.last_checksums)
+                
                 logger.info(
-                    f"Download complete: {bytes_downloaded / 1024 / 1024:.2f}MB saved to {dest_path}"
+                    f"Download complete: {bytes_downloaded / 1024 / 1024:.2f}MB saved to {dest_path} "
+                    f"(crc32c={self.last_checksums['crc32c']})"
                 )
                 return dest_path
                 
@@ -343,6 +369,7 @@ def download_from_url(
     timeout_seconds: int = 60,
     headers: Optional[Dict[str, str]] = None,
     progress_callback: Optional[Callable[[int, int], None]] = None,
+    checksums: Optional[Dict[str, str]] = None,
 ) -> Path:
     """
     Download a file from a URL.
@@ -356,6 +383,8 @@ def download_from_url(
         timeout_seconds: Download timeout in seconds
         headers: Optional custom headers
         progress_callback: Optional progress callback function
+        checksums: Optional dict that receives base64 "crc32c" and "md5_hash"
+            of the downloaded bytes
     
     Returns:
         Path to downloaded file
@@ -373,6 +402,10 @@ def download_from_url(
         ...     max_size_mb=50
         ... )
         >>> print(f"Downloaded to: {file_path}")
+        
+        >>> checksums = {}
+        >>> file_path = download_from_url("https://example.com/audio.mp3", checksums=checksums)
+        >>> upload_audio_file(file_path, "audio/track.mp3", **checksums)
     """
     with HTTPDownloader(
         max_size_mb=max_size_mb,
@@ -382,6 +415,7 @@ def download_from_url(
             url=url,
             destination=destination,
             headers=headers,
-            progress_callback=progress_callback
+            progress_callback=progress_callback,
+            checksums=checksums,
         )
 
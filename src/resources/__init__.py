@@ -17,10 +17,20 @@ from .audio_stream import get_audio_stream_resource
 from .metadata import get_metadata_resource
 from .thumbnail import get_thumbnail_resource
 from .cache import SignedURLCache
+from .cache_backends import (
+    SharedCacheBackend,
+    InMemoryCacheBackend,
+    RedisCacheBackend,
+    create_shared_backend,
+)
 
 __all__ = [
     "get_audio_stream_resource",
     "get_metadata_resource",
     "get_thumbnail_resource",
     "SignedURLCache",
+    "SharedCacheBackend",
+    "InMemoryCacheBackend",
+    "RedisCacheBackend",
+    "create_shared_backend",
 ]
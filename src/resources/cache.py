@@ -2,7 +2,11 @@
 Signed URL caching for MCP resources.
 
 Implements in-memory caching for GCS signed URLs to reduce
-redundant signature operations and improve performance.
+redundant signature operations and improve performance. A bounded
+local LRU can sit in front of an optional shared backend (see
+cache_backends) so replicas reuse each other's signed URLs, and
+still-valid entries can be snapshotted to local disk or GCS so new
+instances start warm.
 
 Follows best practices from research:
 - Short TTL for security
@@ -11,16 +15,53 @@ Follows best practices from research:
 - Thread-safe operations
 """
 
+import asyncio
+import json
+import os
 import time
 import logging
-from typing import Optional, Dict
+from collections import OrderedDict
+from typing import Any, Optional, Dict, Tuple
 from threading import Lock
 from datetime import timedelta
 
-from src.storage import generate_signed_url
+from src.storage import agenerate_signed_url, generate_signed_url, create_gcs_client
+from .cache_backends import INVALIDATE_ALL, SharedCacheBackend, create_shared_backend
+
+try:
+    from src.config import config as app_config
+    HAS_APP_CONFIG = True
+except ImportError:
+    HAS_APP_CONFIG = False
 
 logger = logging.getLogger(__name__)
 
+SNAPSHOT_VERSION = 1
+
+
+def parse_gcs_path(gcs_path: str) -> Tuple[str, str]:
+    """
+    Split a gs:// URI into bucket and blob name.
+    
+    Args:
+        gcs_path: Full GCS path (gs://bucket/path/to/file)
+    
+    Returns:
+        Tuple of (bucket_name, blob_name)
+    
+    Raises:
+        ValueError: If the path is not a gs:// URI with a blob name
+    """
+    if not gcs_path.startswith("gs://"):
+        raise ValueError(f"Invalid GCS path: {gcs_path}")
+    
+    parts = gcs_path[5:].split("/", 1)
+    
+    if len(parts) != 2 or not parts[1]:
+        raise ValueError(f"Invalid GCS path format: {gcs_path}")
+    
+    return parts[0], parts[1]
+
 
 class SignedURLCache:
     """
@@ -31,26 +72,90 @@ class SignedURLCache:
     
     Attributes:
         default_ttl: Default cache TTL in seconds (90% of URL expiration)
-        cache: Dictionary storing cached URLs
+        cache: Local LRU of cached URLs (least recently used first)
         expiry: Dictionary storing expiration timestamps
         lock: Thread lock for safe concurrent access
+        window_seconds: Signing window size; entries roll over at window boundaries
+        max_entries: Maximum local entries before LRU eviction (None = unbounded)
+        shared_backend: Optional second-tier cache shared across replicas
     """
     
-    def __init__(self, default_ttl: int = 810):  # 13.5 minutes (90% of 15 min)
+    def __init__(
+        self,
+        default_ttl: int = 810,  # 13.5 minutes (90% of 15 min)
+        window_seconds: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        shared_backend: Optional[SharedCacheBackend] = None,
+    ):
         """
         Initialize the cache.
         
         Args:
             default_ttl: Default cache TTL in seconds (default: 810s = 13.5 min)
+            window_seconds: Signed URL expiry window in seconds (defaults to config
+                gcs_signed_url_window_seconds; 0 disables window alignment)
+            max_entries: Local LRU capacity (None = unbounded)
+            shared_backend: Second-tier cache consulted on local misses and
+                notified on invalidation
         """
+        if window_seconds is None:
+            window_seconds = app_config.gcs_signed_url_window_seconds if HAS_APP_CONFIG else 0
+        
         self.default_ttl = default_ttl
-        self.cache: Dict[str, str] = {}
+        self.window_seconds = window_seconds
+        self.max_entries = max_entries
+        self.shared_backend = shared_backend
+        self.cache: "OrderedDict[str, str]" = OrderedDict()
         self.expiry: Dict[str, float] = {}
         self.lock = Lock()
         self.hits = 0
         self.misses = 0
+        self.shared_hits = 0
+        self.evictions = 0
+        
+        if shared_backend is not None:
+            shared_backend.subscribe(self._on_remote_invalidation)
+        
+        logger.info(
+            f"Signed URL cache initialized with TTL={default_ttl}s, "
+            f"max_entries={max_entries}, shared_backend={type(shared_backend).__name__ if shared_backend else None}"
+        )
+    
+    def _store_local(self, gcs_path: str, signed_url: str, expires_at: float):
+        """Insert into the local LRU, evicting the least recently used entries. Caller holds the lock."""
+        self.cache[gcs_path] = signed_url
+        self.cache.move_to_end(gcs_path)
+        self.expiry[gcs_path] = expires_at
         
-        logger.info(f"Signed URL cache initialized with TTL={default_ttl}s")
+        if self.max_entries is not None:
+            while len(self.cache) > self.max_entries:
+                evicted, _ = self.cache.popitem(last=False)
+                self.expiry.pop(evicted, None)
+                self.evictions += 1
+    
+    def _get_shared(self, gcs_path: str, current_time: float) -> Optional[tuple]:
+        """Look up the shared tier, treating backend errors as a miss."""
+        try:
+            entry = self.shared_backend.get(gcs_path)
+        except Exception as e:
+            logger.warning(f"Shared cache lookup failed for {gcs_path}: {e}")
+            return None
+        
+        if entry is None or entry[1] <= current_time:
+            return None
+        return entry
+    
+    def _on_remote_invalidation(self, gcs_path: str):
+        """Drop the local copy of an entry invalidated by any replica."""
+        with self.lock:
+            if gcs_path == INVALIDATE_ALL:
+                self.cache.clear()
+                self.expiry.clear()
+                logger.info("Dropped local signed URLs after missed shared invalidations")
+                return
+            if self.cache.pop(gcs_path, None) is not None:
+                self.expiry.pop(gcs_path, None)
+                logger.debug(f"Dropped {gcs_path} after shared invalidation")
     
     def get(
         self,
@@ -73,74 +178,193 @@ class SignedURLCache:
             >>> print(url)
             "https://storage.googleapis.com/bucket/audio.mp3?X-Goog-..."
         """
-        with self.lock:
-            current_time = time.time()
+        current_time = time.time()
+        
+        cached = self._get_local(gcs_path, current_time)
+        if cached is None and self.shared_backend is not None:
+            cached = self._get_from_shared(gcs_path, current_time)
+        if cached is not None:
+            return cached
+        
+        self._count_miss(gcs_path)
+        
+        # Parse GCS path
+        bucket_name, blob_name = parse_gcs_path(gcs_path)
+        
+        # Generate signed URL
+        try:
+            signed_url = generate_signed_url(
+                bucket_name=bucket_name,
+                blob_name=blob_name,
+                expiration_minutes=url_expiration_minutes,
+                window_seconds=self.window_seconds,
+            )
+        except Exception as e:
+            logger.error(f"Failed to generate signed URL for {gcs_path}: {e}")
+            raise
+        
+        self._remember(gcs_path, signed_url, self._expires_at(current_time, url_expiration_minutes))
+        return signed_url
+    
+    async def aget(
+        self,
+        gcs_path: str,
+        url_expiration_minutes: int = 15
+    ) -> str:
+        """
+        Async variant of get for use on the event loop.
+        
+        Local hits are served inline. Shared tier round trips run in a worker
+        thread, and misses are signed with agenerate_signed_url, so the blob
+        existence check goes through the async GCS client.
+        
+        Args:
+            gcs_path: Full GCS path (gs://bucket/path/to/file)
+            url_expiration_minutes: Signed URL expiration time in minutes
             
-            # Check if URL is in cache and not expired
+        Returns:
+            str: Signed URL (cached or freshly generated)
+        """
+        current_time = time.time()
+        
+        cached = self._get_local(gcs_path, current_time)
+        if cached is None and self.shared_backend is not None:
+            cached = await asyncio.to_thread(self._get_from_shared, gcs_path, current_time)
+        if cached is not None:
+            return cached
+        
+        self._count_miss(gcs_path)
+        
+        bucket_name, blob_name = parse_gcs_path(gcs_path)
+        
+        try:
+            signed_url = await agenerate_signed_url(
+                bucket_name=bucket_name,
+                blob_name=blob_name,
+                expiration_minutes=url_expiration_minutes,
+                window_seconds=self.window_seconds,
+            )
+        except Exception as e:
+            logger.error(f"Failed to generate signed URL for {gcs_path}: {e}")
+            raise
+        
+        expires_at = self._expires_at(current_time, url_expiration_minutes)
+        if self.shared_backend is not None:
+            await asyncio.to_thread(self._remember, gcs_path, signed_url, expires_at)
+        else:
+            self._remember(gcs_path, signed_url, expires_at)
+        return signed_url
+    
+    def _get_local(self, gcs_path: str, current_time: float) -> Optional[str]:
+        """Return the URL from the local LRU if it is still valid, counting a hit."""
+        with self.lock:
             if gcs_path in self.cache and self.expiry.get(gcs_path, 0) > current_time:
                 self.hits += 1
+                self.cache.move_to_end(gcs_path)
                 logger.debug(f"Cache HIT for {gcs_path} (hits={self.hits}, misses={self.misses})")
                 return self.cache[gcs_path]
-            
-            # Cache miss - generate new signed URL
+        return None
+    
+    def _get_from_shared(self, gcs_path: str, current_time: float) -> Optional[str]:
+        """
+        Look up the shared tier after a local miss, copying a hit into the LRU.
+        
+        The round trip runs without the lock, so other lookups do not wait
+        behind the shared tier's latency.
+        """
+        entry = self._get_shared(gcs_path, current_time)
+        if entry is None:
+            return None
+        
+        signed_url, expires_at = entry
+        with self.lock:
+            self.hits += 1
+            self.shared_hits += 1
+            self._store_local(gcs_path, signed_url, expires_at)
+        logger.debug(f"Shared cache HIT for {gcs_path}")
+        return signed_url
+    
+    def _count_miss(self, gcs_path: str):
+        """Record a lookup that has to sign a new URL."""
+        with self.lock:
             self.misses += 1
             logger.debug(f"Cache MISS for {gcs_path} (hits={self.hits}, misses={self.misses})")
-            
-            # Parse GCS path
-            if not gcs_path.startswith("gs://"):
-                raise ValueError(f"Invalid GCS path: {gcs_path}")
-            
-            # Extract bucket and blob name
-            path_without_prefix = gcs_path[5:]  # Remove "gs://"
-            parts = path_without_prefix.split("/", 1)
-            
-            if len(parts) != 2:
-                raise ValueError(f"Invalid GCS path format: {gcs_path}")
-            
-            bucket_name, blob_name = parts
-            
-            # Generate signed URL
+    
+    def _expires_at(self, current_time: float, url_expiration_minutes: int) -> float:
+        """When a URL signed now stops being served from the cache."""
+        # 90% of URL expiration for safety
+        cache_ttl = url_expiration_minutes * 60 * 0.9
+        
+        # With aligned signing, drop the entry when the window rolls over so
+        # this process hands out the same URL as every other replica
+        if self.window_seconds > 0:
+            window_end = (int(current_time // self.window_seconds) + 1) * self.window_seconds
+            cache_ttl = min(cache_ttl, window_end - current_time)
+        
+        return current_time + cache_ttl
+    
+    def _remember(self, gcs_path: str, signed_url: str, expires_at: float):
+        """Store a freshly signed URL locally, then in the shared tier (outside the lock)."""
+        with self.lock:
+            self._store_local(gcs_path, signed_url, expires_at)
+        
+        if self.shared_backend is not None:
             try:
-                signed_url = generate_signed_url(
-                    bucket_name=bucket_name,
-                    blob_name=blob_name,
-                    expiration_minutes=url_expiration_minutes
-                )
+                self.shared_backend.set(gcs_path, signed_url, expires_at)
             except Exception as e:
-                logger.error(f"Failed to generate signed URL for {gcs_path}: {e}")
-                raise
-            
-            # Calculate cache expiration (90% of URL expiration for safety)
-            cache_ttl = url_expiration_minutes * 60 * 0.9
-            
-            # Store in cache
-            self.cache[gcs_path] = signed_url
-            self.expiry[gcs_path] = current_time + cache_ttl
-            
-            logger.info(f"Generated and cached signed URL for {gcs_path} (expires in {cache_ttl}s)")
-            
-            return signed_url
+                logger.warning(f"Shared cache write failed for {gcs_path}: {e}")
+        
+        logger.info(
+            f"Generated and cached signed URL for {gcs_path} "
+            f"(expires in {expires_at - time.time():.0f}s)"
+        )
     
     def invalidate(self, gcs_path: str) -> bool:
         """
         Invalidate a cached URL.
         
+        Removes the entry locally and, when a shared backend is configured,
+        from the shared tier, then broadcasts the invalidation so other
+        replicas drop their local copies.
+        
         Args:
             gcs_path: GCS path to invalidate
             
         Returns:
-            bool: True if entry was removed, False if not in cache
+            bool: True if entry was removed locally, False if not in cache
         """
         with self.lock:
+            removed = False
             if gcs_path in self.cache:
                 del self.cache[gcs_path]
                 del self.expiry[gcs_path]
                 logger.debug(f"Invalidated cache for {gcs_path}")
-                return True
-            return False
-    
+                removed = True
+        
+        # Outside the lock: in-process backends deliver the broadcast synchronously
+        if self.shared_backend is not None:
+            try:
+                self.shared_backend.delete(gcs_path)
+                self.shared_backend.publish_invalidation(gcs_path)
+            except Exception as e:
+                logger.warning(f"Shared cache invalidation failed for {gcs_path}: {e}")
+        
+        return removed
+
+    def invalidate_many(self, gcs_paths) -> int:
+        """
+        Invalidate several cached URLs, e.g. after deleting tracks.
+
+        Args:
+            gcs_paths: GCS paths to invalidate
+
+        Returns:
+            int: Number of entries removed locally
+        """
+        return sum(1 for gcs_path in gcs_paths if self.invalidate(gcs_path))
+
     def clear(self):
-        """Clear all cached URLs."""
+        """Clear all locally cached URLs (the shared tier is left untouched)."""
         with self.lock:
             count = len(self.cache)
             self.cache.clear()
@@ -167,6 +391,154 @@ class SignedURLCache:
             if expired_keys:
                 logger.info(f"Cleaned up {len(expired_keys)} expired cache entries")
     
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Capture still-valid entries and hit statistics.
+        
+        Returns:
+            dict: JSON-serializable snapshot (see restore)
+        """
+        with self.lock:
+            current_time = time.time()
+            entries = [
+                {"gcs_path": key, "url": url, "expires_at": self.expiry[key]}
+                for key, url in self.cache.items()
+                if self.expiry.get(key, 0) > current_time
+            ]
+            
+            return {
+                "version": SNAPSHOT_VERSION,
+                "saved_at": current_time,
+                "window_seconds": self.window_seconds,
+                "stats": {
+                    "hits": self.hits,
+                    "shared_hits": self.shared_hits,
+                    "misses": self.misses,
+                },
+                "entries": entries,
+            }
+    
+    def restore(self, snapshot: Dict[str, Any], min_remaining_seconds: int = 60) -> int:
+        """
+        Load entries from a snapshot, discarding expired ones.
+        
+        Entries with less than min_remaining_seconds of life left are dropped
+        so a restored URL is never handed out just before it stops working.
+        Snapshots taken with a different signing window are ignored, since
+        their URLs would not match the ones other replicas produce.
+        
+        Args:
+            snapshot: Dictionary produced by snapshot()
+            min_remaining_seconds: Minimum remaining lifetime to keep an entry
+        
+        Returns:
+            int: Number of entries restored
+        """
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            logger.warning(f"Ignoring cache snapshot with unsupported version: {snapshot.get('version')}")
+            return 0
+        
+        if snapshot.get("window_seconds") != self.window_seconds:
+            logger.info(
+                f"Ignoring cache snapshot signed with window={snapshot.get('window_seconds')}s "
+                f"(current window={self.window_seconds}s)"
+            )
+            return 0
+        
+        with self.lock:
+            current_time = time.time()
+            restored = 0
+            
+            for entry in snapshot.get("entries", []):
+                expires_at = float(entry["expires_at"])
+                if expires_at - current_time < min_remaining_seconds:
+                    continue
+                if entry["gcs_path"] in self.cache:
+                    continue
+                self._store_local(entry["gcs_path"], entry["url"], expires_at)
+                restored += 1
+            
+            stats = snapshot.get("stats", {})
+            self.hits += int(stats.get("hits", 0))
+            self.shared_hits += int(stats.get("shared_hits", 0))
+            self.misses += int(stats.get("misses", 0))
+        
+        return restored
+    
+    def save_snapshot(self, location: str) -> bool:
+        """
+        Write a snapshot to a local path or gs:// URI.
+        
+        Signed URLs grant access to their objects, so local snapshots are
+        written with owner-only permissions. Failures are logged and never
+        raised, since this runs during shutdown.
+        
+        Args:
+            location: Local file path or gs://bucket/path/to/snapshot.json
+        
+        Returns:
+            bool: True if the snapshot was written
+        """
+        snapshot = self.snapshot()
+        data = json.dumps(snapshot)
+        
+        try:
+            if location.startswith("gs://"):
+                bucket_name, blob_name = parse_gcs_path(location)
+                blob = create_gcs_client(bucket_name=bucket_name).bucket.blob(blob_name)
+                blob.upload_from_string(data, content_type="application/json")
+            else:
+                directory = os.path.dirname(os.path.abspath(location))
+                os.makedirs(directory, exist_ok=True)
+                tmp_path = f"{location}.tmp"
+                fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(fd, "w") as f:
+                    f.write(data)
+                os.replace(tmp_path, location)
+        except Exception as e:
+            logger.error(f"Failed to save signed URL cache snapshot to {location}: {e}")
+            return False
+        
+        logger.info(f"Saved {len(snapshot['entries'])} signed URL cache entries to {location}")
+        return True
+    
+    def load_snapshot(self, location: str, min_remaining_seconds: int = 60) -> int:
+        """
+        Restore entries from a local path or gs:// URI.
+        
+        A missing or unreadable snapshot leaves the cache empty; failures
+        are logged and never raised, since this runs during startup.
+        
+        Args:
+            location: Local file path or gs://bucket/path/to/snapshot.json
+            min_remaining_seconds: Minimum remaining lifetime to keep an entry
+        
+        Returns:
+            int: Number of entries restored
+        """
+        try:
+            if location.startswith("gs://"):
+                bucket_name, blob_name = parse_gcs_path(location)
+                blob = create_gcs_client(bucket_name=bucket_name).bucket.blob(blob_name)
+                if not blob.exists():
+                    logger.info(f"No signed URL cache snapshot at {location}")
+                    return 0
+                data = blob.download_as_text()
+            else:
+                if not os.path.exists(location):
+                    logger.info(f"No signed URL cache snapshot at {location}")
+                    return 0
+                with open(location, "r") as f:
+                    data = f.read()
+            
+            restored = self.restore(json.loads(data), min_remaining_seconds=min_remaining_seconds)
+        except Exception as e:
+            logger.error(f"Failed to load signed URL cache snapshot from {location}: {e}")
+            return 0
+        
+        logger.info(f"Restored {restored} signed URL cache entries from {location}")
+        return restored
+    
     def get_stats(self) -> Dict[str, any]:
         """
         Get cache statistics.
@@ -181,10 +553,15 @@ class SignedURLCache:
             return {
                 "size": len(self.cache),
                 "hits": self.hits,
+                "shared_hits": self.shared_hits,
                 "misses": self.misses,
+                "evictions": self.evictions,
+                "max_entries": self.max_entries,
+                "shared_backend": type(self.shared_backend).__name__ if self.shared_backend else None,
                 "total_requests": total_requests,
                 "hit_rate_percent": round(hit_rate, 2),
-                "ttl_seconds": self.default_ttl
+                "ttl_seconds": self.default_ttl,
+                "window_seconds": self.window_seconds,
             }
 
 
@@ -196,12 +573,22 @@ def get_cache() -> SignedURLCache:
     """
     Get the global SignedURLCache instance.
     
-    Creates the cache on first access (lazy initialization).
+    Creates the cache on first access (lazy initialization), wiring in the
+    shared backend and LRU size from configuration.
     
     Returns:
         SignedURLCache: Global cache instance
     """
     global _global_cache
     if _global_cache is None:
-        _global_cache = SignedURLCache()
+        if HAS_APP_CONFIG:
+            _global_cache = SignedURLCache(
+                max_entries=app_config.signed_url_cache_max_entries,
+                shared_backend=create_shared_backend(
+                    app_config.signed_url_cache_backend,
+                    app_config.redis_url,
+                ),
+            )
+        else:
+            _global_cache = SignedURLCache()
     return _global_cache
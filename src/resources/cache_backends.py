@@ -0,0 +1,334 @@
+"""
+Shared cache backends for signed URL caching.
+
+Provides the second cache tier that sits behind each instance's local
+SignedURLCache, so that server replicas share signed URLs instead of
+warming separately.
+
+Backends:
+- RedisCacheBackend: Redis protocol (Memorystore, Redis, Valkey), with
+  pub/sub for cross-replica invalidation
+- InMemoryCacheBackend: in-process stand-in with the same semantics, for
+  tests and single-instance development
+"""
+
+import json
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import redis
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+
+logger = logging.getLogger(__name__)
+
+InvalidationCallback = Callable[[str], None]
+
+# Invalidation key meaning "drop every entry" (invalidations may have been missed)
+INVALIDATE_ALL = "*"
+
+
+class SharedCacheBackend(ABC):
+    """
+    Interface for a cache tier shared by all server replicas.
+
+    Entries are stored with an absolute expiration timestamp so every replica
+    agrees on when a signed URL stops being served. Invalidation is broadcast
+    to subscribers so local caches can drop their copy.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        """
+        Fetch an entry.
+
+        Args:
+            key: Cache key (GCS path)
+
+        Returns:
+            Tuple of (signed URL, expiry UNIX timestamp) or None if absent
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: str, expires_at: float) -> None:
+        """
+        Store an entry until the given UNIX timestamp.
+
+        Args:
+            key: Cache key (GCS path)
+            value: Signed URL
+            expires_at: Absolute expiry timestamp
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+
+    @abstractmethod
+    def publish_invalidation(self, key: str) -> None:
+        """Broadcast that a key was invalidated to every subscriber."""
+
+    @abstractmethod
+    def subscribe(self, callback: InvalidationCallback) -> None:
+        """Register a callback invoked with the key of each invalidation."""
+
+    def get_health(self) -> Dict[str, Any]:
+        """
+        Report whether invalidations from other replicas are being received.
+
+        Returns:
+            dict: At least {"healthy": bool}
+        """
+        return {"healthy": True}
+
+    def close(self) -> None:
+        """Release connections and background listeners."""
+
+
+class InMemoryCacheBackend(SharedCacheBackend):
+    """
+    In-process shared backend.
+
+    Several SignedURLCache instances pointed at one InMemoryCacheBackend
+    behave like replicas sharing a Redis instance, which makes it suitable
+    for tests and local development.
+    """
+
+    def __init__(self):
+        self._store: Dict[str, Tuple[str, float]] = {}
+        self._subscribers: List[InvalidationCallback] = []
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.time():
+                del self._store[key]
+                return None
+            return entry
+
+    def set(self, key: str, value: str, expires_at: float) -> None:
+        with self._lock:
+            self._store[key] = (value, expires_at)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._store.pop(key, None)
+
+    def publish_invalidation(self, key: str) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for callback in subscribers:
+            try:
+                callback(key)
+            except Exception as e:
+                logger.warning(f"Invalidation subscriber failed for {key}: {e}")
+
+    def subscribe(self, callback: InvalidationCallback) -> None:
+        with self._lock:
+            self._subscribers.append(callback)
+
+    def close(self) -> None:
+        with self._lock:
+            self._store.clear()
+            self._subscribers.clear()
+
+
+class RedisCacheBackend(SharedCacheBackend):
+    """
+    Shared backend speaking the Redis protocol.
+
+    Entries are stored as JSON with a matching key TTL, so Redis evicts them
+    on its own once the signed URL is no longer servable. Invalidations are
+    published on a pub/sub channel and delivered by a daemon listener thread.
+    When the listener loses its connection it keeps resubscribing; once it
+    is back, subscribers receive INVALIDATE_ALL because invalidations sent
+    in the meantime were lost.
+    """
+
+    # Pause between resubscribe attempts while Redis is unreachable
+    RESUBSCRIBE_DELAY_SECONDS = 1.0
+
+    def __init__(
+        self,
+        url: str,
+        key_prefix: str = "loist:signed-url:",
+        channel: str = "loist:signed-url:invalidate",
+        socket_timeout: float = 0.5,
+    ):
+        """
+        Initialize the Redis backend.
+
+        Args:
+            url: Redis URL (redis://host:port/db)
+            key_prefix: Prefix applied to every cache key
+            channel: Pub/sub channel for invalidation messages
+            socket_timeout: Socket timeout in seconds; kept short so a slow
+                shared tier degrades to signing instead of stalling requests
+
+        Raises:
+            ImportError: If the redis package is not installed
+        """
+        if not HAS_REDIS:
+            raise ImportError(
+                "redis package is required for RedisCacheBackend. "
+                "Install with: pip install redis"
+            )
+
+        self.key_prefix = key_prefix
+        self.channel = channel
+        self._client = redis.Redis.from_url(
+            url,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_timeout,
+            decode_responses=True,
+        )
+        self._pubsub = None
+        self._listener = None
+        self._handlers: Dict[str, Callable] = {}
+        self._callbacks: List[InvalidationCallback] = []
+        self._connected = False
+        self.listener_errors = 0
+        self.last_listener_error: Optional[str] = None
+
+        logger.info(f"Redis signed URL cache backend configured (prefix={key_prefix})")
+
+    def _key(self, key: str) -> str:
+        return f"{self.key_prefix}{key}"
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        raw = self._client.get(self._key(key))
+        if raw is None:
+            return None
+        entry = json.loads(raw)
+        return entry["url"], float(entry["expires_at"])
+
+    def set(self, key: str, value: str, expires_at: float) -> None:
+        ttl_ms = int((expires_at - time.time()) * 1000)
+        if ttl_ms <= 0:
+            return
+        payload = json.dumps({"url": value, "expires_at": expires_at})
+        self._client.set(self._key(key), payload, px=ttl_ms)
+
+    def delete(self, key: str) -> None:
+        self._client.delete(self._key(key))
+
+    def publish_invalidation(self, key: str) -> None:
+        self._client.publish(self.channel, key)
+
+    def subscribe(self, callback: InvalidationCallback) -> None:
+        def handler(message):
+            callback(message["data"])
+
+        self._callbacks.append(callback)
+        self._handlers[self.channel] = handler
+
+        if self._pubsub is None:
+            self._pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(**self._handlers)
+        self._connected = True
+
+        if self._listener is None:
+            self._listener = self._pubsub.run_in_thread(
+                sleep_time=1.0,
+                daemon=True,
+                exception_handler=self._on_listener_error,
+            )
+
+    def _on_listener_error(self, error: BaseException, pubsub, thread) -> None:
+        """
+        Keep the listener thread alive across connection errors.
+
+        Called by the listener thread for each exception it hits. Resubscribes
+        (which reconnects), and after an outage tells subscribers to drop
+        everything, since invalidations published meanwhile were lost.
+        """
+        if thread is not self._listener:
+            return  # Backend closed; let the thread wind down
+
+        self.listener_errors += 1
+        self.last_listener_error = str(error)
+        if self._connected:
+            self._connected = False
+            logger.error(
+                f"Signed URL invalidation listener lost Redis ({error}); "
+                f"cross-replica invalidation is paused until it resubscribes"
+            )
+
+        time.sleep(self.RESUBSCRIBE_DELAY_SECONDS)
+        try:
+            pubsub.subscribe(**self._handlers)
+        except Exception as e:
+            logger.debug(f"Resubscribing to {self.channel} failed: {e}")
+            return
+
+        self._connected = True
+        logger.info(f"Signed URL invalidation listener resubscribed to {self.channel}")
+        for callback in list(self._callbacks):
+            try:
+                callback(INVALIDATE_ALL)
+            except Exception as e:
+                logger.warning(f"Invalidation subscriber failed after resubscribe: {e}")
+
+    def get_health(self) -> Dict[str, Any]:
+        running = self._listener is not None and self._listener.is_alive()
+        return {
+            "healthy": running and self._connected,
+            "listener_running": running,
+            "listener_connected": self._connected,
+            "listener_errors": self.listener_errors,
+            "last_listener_error": self.last_listener_error,
+        }
+
+    def close(self) -> None:
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+        if self._pubsub is not None:
+            self._pubsub.close()
+            self._pubsub = None
+        self._connected = False
+        self._client.close()
+
+
+def create_shared_backend(
+    backend: str,
+    redis_url: Optional[str] = None,
+) -> Optional[SharedCacheBackend]:
+    """
+    Create a shared cache backend by name.
+
+    Args:
+        backend: "none", "memory", or "redis"
+        redis_url: Redis URL, required for the redis backend
+
+    Returns:
+        SharedCacheBackend instance, or None when sharing is disabled
+
+    Raises:
+        ValueError: If the backend name is unknown or redis_url is missing
+        ImportError: If the redis backend is requested without the redis package
+
+    Example:
+        >>> backend = create_shared_backend("redis", "redis://localhost:6379/0")
+        >>> cache = SignedURLCache(shared_backend=backend)
+    """
+    if not backend or backend == "none":
+        return None
+
+    if backend == "memory":
+        return InMemoryCacheBackend()
+
+    if backend == "redis":
+        if not redis_url:
+            raise ValueError("redis_url is required for the redis cache backend")
+        return RedisCacheBackend(redis_url)
+
+    raise ValueError(f"Unknown shared cache backend: {backend}")
@@ -10,7 +10,7 @@ from typing import Dict, Any
 import re
 import json
 
-from database import get_audio_metadata_by_id
+from database.async_operations import get_audio_metadata_by_id
 from src.exceptions import ResourceNotFoundError, ValidationError
 
 logger = logging.getLogger(__name__)
@@ -51,7 +51,7 @@ async def get_metadata_resource(uri: str) -> Dict[str, Any]:
         
         # Get metadata from database
         try:
-            metadata = get_audio_metadata_by_id(audio_id)
+            metadata = await get_audio_metadata_by_id(audio_id)
         except Exception as e:
             logger.error(f"Database error fetching metadata: {e}")
             raise
@@ -9,7 +9,7 @@ import logging
 from typing import Dict, Any
 import re
 
-from database import get_audio_metadata_by_id
+from database.async_operations import get_audio_metadata_by_id
 from src.exceptions import ResourceNotFoundError, ValidationError
 from .cache import get_cache
 
@@ -55,7 +55,7 @@ async def get_thumbnail_resource(uri: str) -> Dict[str, Any]:
         
         # Get metadata from database
         try:
-            metadata = get_audio_metadata_by_id(audio_id)
+            metadata = await get_audio_metadata_by_id(audio_id)
         except Exception as e:
             logger.error(f"Database error fetching metadata: {e}")
             raise
@@ -77,7 +77,7 @@ async def get_thumbnail_resource(uri: str) -> Dict[str, Any]:
         # Generate signed URL with caching
         cache = get_cache()
         try:
-            signed_url = cache.get(
+            signed_url = await cache.aget(
                 gcs_path=thumbnail_path,
                 url_expiration_minutes=15
             )
@@ -11,6 +11,7 @@ app_dir = Path(__file__).parent.parent
 if str(app_dir) not in sys.path:
     sys.path.insert(0, str(app_dir))
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from typing import Optional
@@ -116,10 +117,25 @@ async def lifespan(app):
     logger.info(f"🔐 Authentication: {'enabled' if config.auth_enabled else 'disabled'}")
     logger.info(f"✅ Health check enabled: {config.enable_healthcheck}")
     
+    # Warm the signed URL cache from the previous instance's snapshot
+    if config.signed_url_cache_snapshot_path:
+        from src.resources.cache import get_cache
+        await asyncio.to_thread(get_cache().load_snapshot, config.signed_url_cache_snapshot_path)
+    
     yield
     
     # Shutdown
     logger.info(f"🛑 Shutting down {config.server_name}")
+    
+    if config.signed_url_cache_snapshot_path:
+        from src.resources.cache import get_cache
+        await asyncio.to_thread(get_cache().save_snapshot, config.signed_url_cache_snapshot_path)
+    
+    from database import close_async_pool, close_metadata_cache
+    from src.storage import close_async_gcs_clients
+    await close_async_pool()
+    await close_async_gcs_clients()
+    close_metadata_cache()
 
 
 # Initialize authentication if enabled
@@ -235,6 +251,34 @@ def health_check() -> dict:
             "authentication": "enabled" if config.auth_enabled else "disabled"
         }
         
+        # Circuit breaker and retry budget state for GCS and the database
+        from src.circuit_breaker import get_resilience_status, STATE_CLOSED
+        dependencies = get_resilience_status()
+        response["dependencies"] = dependencies
+        if any(dep["circuit"]["state"] != STATE_CLOSED for dep in dependencies.values()):
+            response["status"] = "degraded"
+        
+        # Hit rates of the in-process read caches
+        from database import get_metadata_cache
+        from src.tools.query_tools import get_search_cache
+        response["caches"] = {
+            "track_metadata": get_metadata_cache().get_stats(),
+            "search_results": get_search_cache().get_stats(),
+        }
+        
+        # Without its invalidation listener the shared signed URL tier can serve stale URLs
+        from src.resources.cache import get_cache
+        shared_backend = get_cache().shared_backend
+        if shared_backend is not None:
+            shared_health = shared_backend.get_health()
+            response["caches"]["signed_url_shared_tier"] = shared_health
+            if not shared_health["healthy"]:
+                response["status"] = "degraded"
+        
+        # How well concurrent track lookups are being coalesced
+        from database.async_operations import get_metadata_loader
+        response["lookup_batching"] = get_metadata_loader().get_stats()
+        
         logger.info("Health check passed")
         return response
         
@@ -355,7 +399,10 @@ async def search_library(
     limit: int = 20,
     offset: int = 0,
     sortBy: str = "relevance",
-    sortOrder: str = "desc"
+    sortOrder: str = "desc",
+    includeTotal: bool = True,
+    cursor: str = None,
+    facets: list = None
 ) -> dict:
     """
     Search across all processed audio in the library.
@@ -371,6 +418,12 @@ async def search_library(
         offset: Number of results to skip (default: 0, max: 10000)
         sortBy: Field to sort by (relevance, title, artist, year, duration, created_at)
         sortOrder: Sort order (asc or desc, default: desc)
+        includeTotal: Count all matches for "total" (default: true); false
+            is faster on broad queries and returns total as null
+        cursor: nextCursor from the previous page; use instead of offset
+            for deep pages
+        facets: Facets to count over all matches, any of "genre",
+            "decade", "format", "duration" (counted in one pass)
         
     Returns:
         dict: Success response with search results, relevance scores, and pagination info,
@@ -396,7 +449,10 @@ async def search_library(
             "limit": limit,
             "offset": offset,
             "sortBy": sortBy,
-            "sortOrder": sortOrder
+            "sortOrder": sortOrder,
+            "includeTotal": includeTotal,
+            "cursor": cursor,
+            "facets": facets
         }
 
         # Call the async function
@@ -408,6 +464,102 @@ async def search_library(
         return error_response
 
 
+@mcp.tool()
+async def suggest(
+    prefix: str,
+    limit: int = 10,
+    fields: list = None
+) -> dict:
+    """
+    Autocomplete a typed prefix from artist, title and album values.
+
+    Fast enough to call on every keystroke; use search_library once the
+    user picks a suggestion.
+
+    Args:
+        prefix: Typed prefix, matched case-insensitively at the start of
+            the value (1-100 characters)
+        limit: Maximum suggestions to return (1-20, default: 10)
+        fields: Fields to complete, any of "artist", "title", "album"
+            (default: all three)
+
+    Returns:
+        dict: Success response with suggestions ({field, value}, shortest
+              first), or error response
+
+    Example:
+        >>> result = await suggest(prefix="beat", limit=5)
+        >>> print(result["suggestions"][0]["value"])
+        "Beat Happening"
+    """
+    from src.tools.query_tools import suggest as suggest_func
+    from src.error_utils import handle_tool_error
+
+    try:
+        return await suggest_func({"prefix": prefix, "limit": limit, "fields": fields})
+    except Exception as e:
+        # Log and return error response
+        error_response = handle_tool_error(e, "suggest")
+        logger.error(f"Suggest failed for prefix '{prefix}': {error_response}")
+        return error_response
+
+
+@mcp.tool()
+async def delete_audio(audioId: str) -> dict:
+    """
+    Delete a processed audio track and its stored audio and artwork files.
+
+    Args:
+        audioId: UUID of the audio track to delete
+
+    Returns:
+        dict: Success response with storage cleanup counts, or error response
+              if the track was not found
+
+    Example:
+        >>> result = await delete_audio(audioId="550e8400-e29b-41d4-a716-446655440000")
+        >>> print(result["storage"]["deletedFiles"])
+        2
+    """
+    from src.tools.delete_tools import delete_audio as delete_func
+    from src.error_utils import handle_tool_error
+
+    try:
+        return await delete_func({"audioId": audioId})
+    except Exception as e:
+        error_response = handle_tool_error(e, "delete_audio")
+        logger.error(f"Delete audio failed for {audioId}: {error_response}")
+        return error_response
+
+
+@mcp.tool()
+async def delete_audio_batch(audioIds: list[str]) -> dict:
+    """
+    Delete many audio tracks and their stored files in batched operations.
+
+    Args:
+        audioIds: UUIDs of the audio tracks to delete (max 10000)
+
+    Returns:
+        dict: Success response with deleted and not-found ids and storage
+              cleanup counts, or error response
+
+    Example:
+        >>> result = await delete_audio_batch(audioIds=["550e8400-...", "660e8400-..."])
+        >>> print(len(result["deleted"]))
+        2
+    """
+    from src.tools.delete_tools import delete_audio_batch as delete_batch_func
+    from src.error_utils import handle_tool_error
+
+    try:
+        return await delete_batch_func({"audioIds": audioIds})
+    except Exception as e:
+        error_response = handle_tool_error(e, "delete_audio_batch")
+        logger.error(f"Delete audio batch failed: {error_response}")
+        return error_response
+
+
 # ============================================================================
 # Task 9: MCP Resources
 # ============================================================================
@@ -516,7 +668,7 @@ async def embed_page(request):
         Returns: HTML page with embedded audio player
     """
     from starlette.requests import Request
-    from database import get_audio_metadata_by_id
+    from database.async_operations import get_audio_metadata_by_id
     from src.resources.cache import get_cache
     
     # Extract audioId from path parameters
@@ -525,7 +677,7 @@ async def embed_page(request):
     
     try:
         # Get metadata from database
-        metadata = get_audio_metadata_by_id(audioId)
+        metadata = await get_audio_metadata_by_id(audioId)
         
         if not metadata:
             logger.warning(f"Audio track not found: {audioId}")
@@ -545,11 +697,12 @@ async def embed_page(request):
                 status_code=500
             )
         
-        # Generate signed URLs using cache
+        # Generate signed URLs using cache (in a worker thread: signing a
+        # GET checks that the blob exists, a blocking GCS call)
         cache = get_cache()
         
         try:
-            stream_url = cache.get(audio_path, url_expiration_minutes=15)
+            stream_url = await cache.aget(audio_path, url_expiration_minutes=15)
         except Exception as e:
             logger.error(f"Failed to generate signed URL for audio: {e}")
             return HTMLResponse(
@@ -561,7 +714,7 @@ async def embed_page(request):
         thumbnail_url = None
         if thumbnail_path:
             try:
-                thumbnail_url = cache.get(thumbnail_path, url_expiration_minutes=15)
+                thumbnail_url = await cache.aget(thumbnail_path, url_expiration_minutes=15)
             except Exception as e:
                 logger.warning(f"Failed to generate signed URL for thumbnail: {e}")
                 # Continue without thumbnail
@@ -665,7 +818,7 @@ async def oembed_endpoint(request):
     """
     from starlette.responses import JSONResponse
     from starlette.requests import Request
-    from database import get_audio_metadata_by_id
+    from database.async_operations import get_audio_metadata_by_id
     from src.resources.cache import get_cache
     from urllib.parse import unquote
     
@@ -708,7 +861,7 @@ async def oembed_endpoint(request):
             )
         
         # Get metadata from database
-        metadata = get_audio_metadata_by_id(audio_id)
+        metadata = await get_audio_metadata_by_id(audio_id)
         
         if not metadata:
             logger.warning(f"Audio track not found for oEmbed: {audio_id}")
@@ -724,7 +877,7 @@ async def oembed_endpoint(request):
         if thumbnail_path:
             try:
                 cache = get_cache()
-                thumbnail_url = cache.get(thumbnail_path, url_expiration_minutes=15)
+                thumbnail_url = await cache.aget(thumbnail_path, url_expiration_minutes=15)
             except Exception as e:
                 logger.warning(f"Failed to generate thumbnail URL for oEmbed: {e}")
                 # Continue without thumbnail
@@ -780,6 +933,53 @@ async def oembed_endpoint(request):
         )
 
 
+@mcp.custom_route("/storage/{bucket}/{blob_path:path}", methods=["GET", "HEAD"])
+async def local_storage_object(request):
+    """
+    Serve an object from the local storage backend through a signed URL.
+    
+    Only active when storage_backend is "local"; URLs are produced by
+    LocalStorageBackend.generate_signed_url and carry an HMAC signature and
+    expiry. Range requests are supported, and the file is sent zero-copy
+    when the ASGI server implements the pathsend extension.
+    
+    Args:
+        request: Starlette Request with bucket/blob_path path parameters and
+            expires/signature query parameters
+    
+    Returns:
+        FileResponse with the object, or 403/404 on invalid requests
+    """
+    from starlette.responses import FileResponse, PlainTextResponse
+    from google.cloud.exceptions import NotFound
+    from src.storage.backend import create_storage_backend
+    from src.storage.local_backend import LocalStorageBackend
+    
+    backend = create_storage_backend()
+    if not isinstance(backend, LocalStorageBackend):
+        return PlainTextResponse("Not Found", status_code=404)
+    
+    blob_name = request.path_params["blob_path"]
+    if request.path_params["bucket"] != backend.bucket_name:
+        return PlainTextResponse("Not Found", status_code=404)
+    
+    if not backend.verify_signature(
+        blob_name,
+        request.query_params.get("expires"),
+        request.query_params.get("signature"),
+    ):
+        logger.warning(f"Rejected local storage request with invalid or expired signature: {blob_name}")
+        return PlainTextResponse("Forbidden", status_code=403)
+    
+    try:
+        metadata = backend.get_file_metadata(blob_name)
+        path = backend.object_path(blob_name)
+    except (NotFound, ValueError):
+        return PlainTextResponse("Not Found", status_code=404)
+    
+    return FileResponse(path, media_type=metadata.get("content_type") or "application/octet-stream")
+
+
 def create_http_app():
     """
     Create HTTP application with CORS middleware for iframe embedding
@@ -830,7 +1030,6 @@ if __name__ == "__main__":
     elif config.server_transport == "dual":
         # Run both HTTP web server and MCP stdio for Cursor
         logger.info(f"🔄 Starting dual mode: HTTP server + MCP stdio")
-        import asyncio
         import threading
 
         # Function to run MCP in stdio mode in a separate thread
@@ -3,6 +3,8 @@ Google Cloud Storage integration for Loist Music Library MCP Server.
 
 This module provides utilities for managing audio file storage in GCS,
 including signed URL generation, file uploads, and lifecycle management.
+A local filesystem backend implements the same StorageBackend interface
+for benchmarks and single-node deployments.
 """
 
 from .gcs_client import (
@@ -10,16 +12,39 @@ from .gcs_client import (
     generate_signed_url,
     upload_audio_file,
     delete_file,
+    delete_gcs_paths,
     list_audio_files,
+    iter_audio_file_pages,
     get_file_metadata,
 )
+from .backend import ListPage, StorageBackend, StoredObject, create_storage_backend
+from .local_backend import LocalStorageBackend
+from .async_gcs_client import (
+    AsyncGCSClient,
+    create_async_gcs_client,
+    get_async_gcs_client,
+    close_async_gcs_clients,
+    agenerate_signed_url,
+)
 
 __all__ = [
     "create_gcs_client",
     "generate_signed_url",
     "upload_audio_file",
     "delete_file",
+    "delete_gcs_paths",
     "list_audio_files",
+    "iter_audio_file_pages",
     "get_file_metadata",
+    "ListPage",
+    "AsyncGCSClient",
+    "create_async_gcs_client",
+    "get_async_gcs_client",
+    "close_async_gcs_clients",
+    "agenerate_signed_url",
+    "StorageBackend",
+    "StoredObject",
+    "LocalStorageBackend",
+    "create_storage_backend",
 ]
 
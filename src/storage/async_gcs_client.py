@@ -0,0 +1,845 @@
+"""
+Async-native Google Cloud Storage client.
+
+Talks to the GCS JSON API directly over a pooled httpx.AsyncClient, so
+async MCP handlers and the processing pipeline can reach storage without
+blocking the event loop or borrowing worker threads. Upload and download
+bodies are streamed chunk by chunk.
+
+The interface mirrors GCSClient (generate_signed_url, upload_file,
+get_file_metadata, delete_file, file_exists, listing), with coroutines in
+place of blocking methods. Errors are raised as the same
+google.api_core exceptions the synchronous client raises.
+
+Set STORAGE_EMULATOR_HOST (e.g. http://localhost:4443) to point the client
+at a local fake-GCS server; anonymous credentials are used in that case.
+"""
+
+import asyncio
+import base64
+import datetime
+import logging
+import mimetypes
+import os
+from pathlib import Path
+from typing import Optional, Dict, Any, List, AsyncIterator, Sequence
+from urllib.parse import quote
+
+import google_crc32c
+import httpx
+from google.api_core import exceptions as api_exceptions
+from google.auth.credentials import AnonymousCredentials, Credentials
+from google.cloud.exceptions import NotFound, GoogleCloudError
+
+from src.circuit_breaker import get_circuit_breaker
+from .backend import LISTING_FIELDS, ListPage, get_storage_backend_name, validate_listing_fields
+from .gcs_client import (
+    RESUMABLE_RETRY_STATUS_CODES,
+    UPLOAD_CHUNK_TIMEOUT_SECONDS,
+    _align_chunk_size,
+    _parse_committed_bytes,
+    generate_signed_url,
+    sign_url_v4,
+)
+from .retry import RetryConfig
+
+# Try to import config, but make it optional for backward compatibility
+try:
+    from src.config import config as app_config
+    HAS_APP_CONFIG = True
+except ImportError:
+    HAS_APP_CONFIG = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_API_ENDPOINT = "https://storage.googleapis.com"
+
+STORAGE_SCOPES = ("https://www.googleapis.com/auth/devstorage.read_write",)
+
+# Streaming download buffer size
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _to_isoformat(timestamp: Optional[str]) -> Optional[str]:
+    """Normalise an RFC 3339 timestamp to the isoformat() GCSClient returns."""
+    if not timestamp:
+        return None
+    return datetime.datetime.fromisoformat(timestamp.replace("Z", "+00:00")).isoformat()
+
+
+def _resource_to_listing_dict(resource: Dict[str, Any], fields: Sequence[str]) -> Dict[str, Any]:
+    """Convert a JSON API object resource into a listing dict holding only the requested fields."""
+    values = {
+        "name": lambda: resource.get("name"),
+        "size": lambda: int(resource["size"]) if "size" in resource else None,
+        "crc32c": lambda: resource.get("crc32c"),
+        "md5_hash": lambda: resource.get("md5Hash"),
+        "content_type": lambda: resource.get("contentType"),
+        "generation": lambda: int(resource["generation"]) if "generation" in resource else None,
+        "created": lambda: _to_isoformat(resource.get("timeCreated")),
+        "updated": lambda: _to_isoformat(resource.get("updated")),
+    }
+    return {name: values[name]() for name in fields}
+
+
+def _resource_to_metadata(resource: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a JSON API object resource into the dict GCSClient.get_file_metadata returns."""
+    metadata = _resource_to_listing_dict(
+        resource,
+        ("name", "size", "content_type", "created", "updated", "md5_hash", "crc32c", "generation"),
+    )
+    metadata["metageneration"] = int(resource["metageneration"]) if "metageneration" in resource else None
+    metadata["custom_metadata"] = resource.get("metadata") or {}
+    return metadata
+
+
+class AsyncGCSClient:
+    """Async client for Google Cloud Storage built on httpx."""
+
+    def __init__(
+        self,
+        bucket_name: Optional[str] = None,
+        credentials_path: Optional[str] = None,
+        credentials: Optional[Credentials] = None,
+        api_endpoint: Optional[str] = None,
+        max_connections: int = 20,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        Initialize async GCS client.
+
+        Args:
+            bucket_name: Name of the GCS bucket (defaults to config or env var GCS_BUCKET_NAME)
+            credentials_path: Path to service account key (defaults to config or env var GOOGLE_APPLICATION_CREDENTIALS)
+            credentials: Explicit credentials (takes precedence over credentials_path)
+            api_endpoint: Storage endpoint (defaults to STORAGE_EMULATOR_HOST or the public endpoint)
+            max_connections: Size of the HTTP connection pool
+            transport: Custom httpx transport (e.g. a mock transport in tests)
+        """
+        if HAS_APP_CONFIG:
+            self.bucket_name = bucket_name or app_config.gcs_bucket_name or os.getenv("GCS_BUCKET_NAME")
+            self.credentials_path = credentials_path or app_config.gcs_credentials_path
+        else:
+            self.bucket_name = bucket_name or os.getenv("GCS_BUCKET_NAME")
+            self.credentials_path = credentials_path or os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
+
+        if not self.bucket_name:
+            raise ValueError("Bucket name must be provided via parameter, config, or GCS_BUCKET_NAME env var")
+
+        emulator_host = os.getenv("STORAGE_EMULATOR_HOST")
+        self.api_endpoint = (api_endpoint or emulator_host or DEFAULT_API_ENDPOINT).rstrip("/")
+
+        if credentials is None and emulator_host and not api_endpoint:
+            credentials = AnonymousCredentials()
+
+        self._credentials: Optional[Credentials] = credentials
+        self._credentials_lock = asyncio.Lock()
+        self._max_connections = max_connections
+        self._transport = transport
+        self._http: Optional[httpx.AsyncClient] = None
+
+        logger.info(f"Initialized async GCS client for bucket: {self.bucket_name} ({self.api_endpoint})")
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Get or create the pooled HTTP client."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                base_url=self.api_endpoint,
+                transport=self._transport,
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_connections,
+                ),
+                timeout=httpx.Timeout(30.0, write=UPLOAD_CHUNK_TIMEOUT_SECONDS),
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the connection pool."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def __aenter__(self) -> "AsyncGCSClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    def _load_credentials(self) -> Credentials:
+        """Load credentials from the key file or application default credentials (blocking)."""
+        if self.credentials_path and os.path.exists(self.credentials_path):
+            from google.oauth2 import service_account
+
+            logger.info(f"Using credentials from: {self.credentials_path}")
+            return service_account.Credentials.from_service_account_file(
+                self.credentials_path, scopes=STORAGE_SCOPES
+            )
+
+        import google.auth
+
+        credentials, _ = google.auth.default(scopes=STORAGE_SCOPES)
+        return credentials
+
+    async def _get_credentials(self) -> Credentials:
+        """Get credentials, refreshing the access token off the event loop when it has expired."""
+        async with self._credentials_lock:
+            if self._credentials is None:
+                self._credentials = await asyncio.to_thread(self._load_credentials)
+
+            if not isinstance(self._credentials, AnonymousCredentials) and not self._credentials.valid:
+                from google.auth.transport.requests import Request
+
+                await asyncio.to_thread(self._credentials.refresh, Request())
+
+            return self._credentials
+
+    async def _auth_headers(self) -> Dict[str, str]:
+        """Build the Authorization header for a request."""
+        headers: Dict[str, str] = {}
+        credentials = await self._get_credentials()
+        credentials.apply(headers)
+        return headers
+
+    def _object_path(self, blob_name: str) -> str:
+        """JSON API path of an object."""
+        return f"/storage/v1/b/{quote(self.bucket_name, safe='')}/o/{quote(blob_name, safe='')}"
+
+    @staticmethod
+    def _raise_for_status(response: httpx.Response) -> None:
+        """Raise the google.api_core exception matching an error response."""
+        if response.is_success:
+            return
+
+        message = response.reason_phrase
+        try:
+            message = response.json()["error"]["message"]
+        except (ValueError, KeyError, TypeError):
+            pass
+
+        raise api_exceptions.from_http_status(
+            response.status_code,
+            f"{response.request.method} {response.request.url}: {message}",
+            response=response,
+        )
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        stream: bool = False,
+        **kwargs,
+    ) -> httpx.Response:
+        """
+        Send an authenticated request through the "gcs" circuit breaker.
+
+        Transport errors, 429 and 5xx responses count as dependency failures;
+        any other answer counts as a healthy dependency.
+
+        Args:
+            method: HTTP method
+            url: Path relative to the API endpoint, or an absolute URL
+            stream: Return an unread streaming response (caller must close it)
+            **kwargs: Passed to httpx.AsyncClient.build_request
+
+        Returns:
+            Response (any status)
+
+        Raises:
+            CircuitOpenError: If the GCS circuit is open
+            httpx.TransportError: On connection failures and timeouts
+        """
+        headers = kwargs.pop("headers", None) or {}
+        headers.update(await self._auth_headers())
+        request = self.http.build_request(method, url, headers=headers, **kwargs)
+
+        # Guard only the round trip: a credential refresh error is not a GCS outage
+        breaker = get_circuit_breaker("gcs")
+        probe = breaker.before_call()
+
+        try:
+            response = await self.http.send(request, stream=stream)
+        except httpx.TransportError:
+            breaker.record_failure()
+            raise
+        else:
+            if response.status_code in RESUMABLE_RETRY_STATUS_CODES:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+        finally:
+            # Cancelled or failed without an outcome
+            if probe:
+                breaker.release_probe()
+
+        return response
+
+    async def generate_signed_url(
+        self,
+        blob_name: str,
+        expiration_minutes: int = 15,
+        method: str = "GET",
+        content_type: Optional[str] = None,
+        response_disposition: Optional[str] = None,
+        window_seconds: Optional[int] = None,
+    ) -> str:
+        """
+        Generate a signed URL for temporary access to a blob.
+
+        Signing happens locally with the service account key; only the
+        existence check for GET URLs goes over the network.
+
+        Args:
+            blob_name: Name/path of the blob in GCS
+            expiration_minutes: URL expiration time in minutes (default: 15)
+            method: HTTP method (GET, PUT, POST, DELETE)
+            content_type: Content-Type header for PUT/POST requests
+            response_disposition: Content-Disposition header (e.g., "attachment; filename=audio.mp3")
+            window_seconds: Align expiry to fixed buckets of this many seconds
+                (defaults to config gcs_signed_url_window_seconds; 0 disables alignment)
+
+        Returns:
+            Signed URL string
+
+        Raises:
+            NotFound: If blob doesn't exist (for GET requests)
+            GoogleCloudError: If URL generation fails
+        """
+        if method == "GET" and not await self.file_exists(blob_name):
+            logger.error(f"Blob not found: {blob_name}")
+            raise NotFound(f"Blob not found: {blob_name}")
+
+        if window_seconds is None:
+            window_seconds = app_config.gcs_signed_url_window_seconds if HAS_APP_CONFIG else 0
+
+        credentials = await self._get_credentials()
+        url = sign_url_v4(
+            credentials,
+            api_endpoint=self.api_endpoint,
+            bucket_name=self.bucket_name,
+            blob_name=blob_name,
+            expiration_minutes=expiration_minutes,
+            window_seconds=window_seconds,
+            method=method,
+            content_type=content_type,
+            response_disposition=response_disposition,
+        )
+
+        logger.info(
+            f"Generated signed URL for blob: {blob_name}, "
+            f"expires in {expiration_minutes} minutes"
+        )
+        return url
+
+    async def upload_file(
+        self,
+        source_path: Path | str,
+        destination_blob_name: str,
+        content_type: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None,
+        chunk_size: Optional[int] = None,
+        crc32c: Optional[str] = None,
+        md5_hash: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Upload a file to GCS as a chunked resumable upload.
+
+        Only one chunk is held in memory at a time. After a transient
+        failure the session is probed for the bytes GCS has committed and the
+        upload continues from there. Parallel composite uploads remain a
+        GCSClient feature.
+
+        Args:
+            source_path: Local file path to upload
+            destination_blob_name: Destination path in GCS bucket
+            content_type: MIME type of the file (guessed from the file name if omitted)
+            metadata: Custom metadata key-value pairs
+            chunk_size: Chunk size in bytes, rounded up to 256 KiB
+                (defaults to config gcs_upload_chunk_size_mb)
+            crc32c: Base64 big-endian CRC32C of the file contents, validated by GCS
+            md5_hash: Base64 MD5 digest of the file contents, validated by GCS
+
+        Returns:
+            Metadata of the uploaded object (same keys as get_file_metadata)
+
+        Raises:
+            FileNotFoundError: If source file doesn't exist
+            GoogleCloudError: If the upload fails permanently or resume attempts run out
+        """
+        source_path = Path(source_path)
+
+        if not source_path.exists():
+            raise FileNotFoundError(f"Source file not found: {source_path}")
+
+        if chunk_size is None:
+            chunk_size = (app_config.gcs_upload_chunk_size_mb if HAS_APP_CONFIG else 8) * 1024 * 1024
+        chunk_size = _align_chunk_size(chunk_size)
+        length = source_path.stat().st_size
+        # Without a type GCS would store application/octet-stream
+        content_type = content_type or mimetypes.guess_type(source_path.name)[0]
+
+        resource: Dict[str, Any] = {"name": destination_blob_name}
+        if content_type:
+            resource["contentType"] = content_type
+        if metadata:
+            resource["metadata"] = metadata
+        if crc32c:
+            resource["crc32c"] = crc32c
+        if md5_hash:
+            resource["md5Hash"] = md5_hash
+
+        headers = {"X-Upload-Content-Length": str(length)}
+        if content_type:
+            headers["X-Upload-Content-Type"] = content_type
+
+        try:
+            response = await self._request(
+                "POST",
+                f"/upload/storage/v1/b/{quote(self.bucket_name, safe='')}/o",
+                params={"uploadType": "resumable"},
+                json=resource,
+                headers=headers,
+            )
+            self._raise_for_status(response)
+            session_url = response.headers["Location"]
+
+            result = await self._upload_chunks(session_url, source_path, length, chunk_size)
+        except GoogleCloudError as e:
+            logger.error(f"Failed to upload file {source_path}: {e}")
+            raise
+
+        logger.info(
+            f"Uploaded file: {source_path} -> gs://{self.bucket_name}/{destination_blob_name}"
+        )
+        return _resource_to_metadata(result)
+
+    async def _upload_chunks(
+        self,
+        session_url: str,
+        source_path: Path,
+        length: int,
+        chunk_size: int,
+    ) -> Dict[str, Any]:
+        """
+        Send a file to an open resumable session, resuming after transient failures.
+
+        Args:
+            session_url: Resumable session URI
+            source_path: Local file to read from
+            length: Total number of bytes to upload
+            chunk_size: Chunk size in bytes (multiple of 256 KiB)
+
+        Returns:
+            Object resource returned by GCS for the finished upload
+        """
+        max_resume_attempts = app_config.gcs_upload_max_resume_attempts if HAS_APP_CONFIG else 5
+        backoff = RetryConfig(max_attempts=max_resume_attempts + 1)
+
+        committed = 0
+        resume_attempts = 0
+        probe = False
+
+        with open(source_path, "rb") as f:
+            while True:
+                try:
+                    if probe:
+                        # Ask GCS how much of the session it has persisted
+                        content, content_range = b"", f"bytes */{length}"
+                    else:
+                        f.seek(committed)
+                        content = await asyncio.to_thread(f.read, min(chunk_size, length - committed))
+                        if content:
+                            content_range = f"bytes {committed}-{committed + len(content) - 1}/{length}"
+                        else:
+                            content_range = f"bytes */{length}"
+
+                    response = await self._request(
+                        "PUT",
+                        session_url,
+                        content=content,
+                        headers={"Content-Range": content_range},
+                    )
+
+                    if response.status_code in (200, 201):
+                        return response.json()
+
+                    if response.status_code == 308:
+                        new_committed = _parse_committed_bytes(response.headers.get("Range"))
+                        if new_committed > committed:
+                            resume_attempts = 0
+                        committed = new_committed
+                        probe = False
+                        continue
+
+                    try:
+                        self._raise_for_status(response)
+                    except GoogleCloudError as e:
+                        if response.status_code not in RESUMABLE_RETRY_STATUS_CODES:
+                            raise
+                        error = e
+
+                except httpx.TransportError as e:
+                    error = e
+
+                resume_attempts += 1
+                if resume_attempts > max_resume_attempts:
+                    logger.error(
+                        f"Resumable upload to {session_url} failed at byte {committed}/{length} "
+                        f"after {max_resume_attempts} resume attempts"
+                    )
+                    if isinstance(error, GoogleCloudError):
+                        raise error
+                    raise api_exceptions.ServiceUnavailable(f"Resumable upload interrupted: {error}")
+
+                delay = backoff.calculate_delay(resume_attempts - 1)
+                logger.warning(
+                    f"Resumable upload of {source_path} interrupted at byte {committed}/{length} "
+                    f"({error}); resuming in {delay:.2f}s "
+                    f"(attempt {resume_attempts}/{max_resume_attempts})"
+                )
+                await asyncio.sleep(delay)
+                probe = True
+
+    async def stream_file(
+        self,
+        blob_name: str,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream the contents of a blob.
+
+        Args:
+            blob_name: Name/path of the blob
+            chunk_size: Maximum size of each yielded chunk
+
+        Yields:
+            Chunks of the object body
+
+        Raises:
+            NotFound: If blob doesn't exist
+            GoogleCloudError: If the download fails
+        """
+        response = await self._request(
+            "GET",
+            f"/download{self._object_path(blob_name)}",
+            params={"alt": "media"},
+            stream=True,
+        )
+        try:
+            if not response.is_success:
+                await response.aread()
+                self._raise_for_status(response)
+
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+        finally:
+            await response.aclose()
+
+    async def download_file(
+        self,
+        blob_name: str,
+        destination_path: Path | str,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    ) -> Dict[str, Any]:
+        """
+        Download a blob to a local file, validating its CRC32C.
+
+        Args:
+            blob_name: Name/path of the blob
+            destination_path: Local file to write
+            chunk_size: Streaming buffer size in bytes
+
+        Returns:
+            Dictionary with "path", "size" and base64 "crc32c" of the written file
+
+        Raises:
+            NotFound: If blob doesn't exist
+            GoogleCloudError: If the download fails or the checksum does not match
+        """
+        destination_path = Path(destination_path)
+        expected = await self.get_file_metadata(blob_name)
+        checksum = google_crc32c.Checksum()
+        size = 0
+
+        try:
+            with open(destination_path, "wb") as f:
+                async for chunk in self.stream_file(blob_name, chunk_size):
+                    checksum.update(chunk)
+                    size += len(chunk)
+                    await asyncio.to_thread(f.write, chunk)
+
+            crc32c = base64.b64encode(checksum.digest()).decode("ascii")
+            if expected.get("crc32c") and crc32c != expected["crc32c"]:
+                raise api_exceptions.BadRequest(
+                    f"CRC32C mismatch downloading gs://{self.bucket_name}/{blob_name}: "
+                    f"expected {expected['crc32c']}, got {crc32c}"
+                )
+        except Exception:
+            destination_path.unlink(missing_ok=True)
+            raise
+
+        logger.info(f"Downloaded gs://{self.bucket_name}/{blob_name} -> {destination_path} ({size} bytes)")
+        return {"path": destination_path, "size": size, "crc32c": crc32c}
+
+    async def delete_file(self, blob_name: str) -> bool:
+        """
+        Delete a file from GCS.
+
+        Args:
+            blob_name: Name/path of the blob to delete
+
+        Returns:
+            True if deleted, False if blob didn't exist
+
+        Raises:
+            GoogleCloudError: If deletion fails
+        """
+        response = await self._request("DELETE", self._object_path(blob_name))
+
+        if response.status_code == 404:
+            logger.warning(f"Blob not found for deletion: {blob_name}")
+            return False
+
+        try:
+            self._raise_for_status(response)
+        except GoogleCloudError as e:
+            logger.error(f"Failed to delete blob {blob_name}: {e}")
+            raise
+
+        logger.info(f"Deleted blob: {blob_name}")
+        return True
+
+    async def get_file_metadata(self, blob_name: str) -> Dict[str, Any]:
+        """
+        Get metadata for a file in GCS.
+
+        Args:
+            blob_name: Name/path of the blob
+
+        Returns:
+            Dictionary containing blob metadata (same keys as GCSClient.get_file_metadata)
+
+        Raises:
+            NotFound: If blob doesn't exist
+            GoogleCloudError: If metadata retrieval fails
+        """
+        response = await self._request("GET", self._object_path(blob_name))
+
+        try:
+            self._raise_for_status(response)
+        except NotFound:
+            logger.error(f"Blob not found: {blob_name}")
+            raise
+        except GoogleCloudError as e:
+            logger.error(f"Failed to get metadata for {blob_name}: {e}")
+            raise
+
+        logger.debug(f"Retrieved metadata for blob: {blob_name}")
+        return _resource_to_metadata(response.json())
+
+    async def file_exists(self, blob_name: str) -> bool:
+        """
+        Check if a file exists in GCS.
+
+        Args:
+            blob_name: Name/path of the blob
+
+        Returns:
+            True if file exists, False otherwise
+        """
+        response = await self._request("GET", self._object_path(blob_name), params={"fields": "name"})
+        if response.status_code == 404:
+            return False
+        self._raise_for_status(response)
+        return True
+
+    async def aiter_file_pages(
+        self,
+        prefix: Optional[str] = None,
+        delimiter: Optional[str] = None,
+        page_size: int = 1000,
+        page_token: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        max_results: Optional[int] = None,
+    ) -> AsyncIterator[ListPage]:
+        """
+        List files page by page.
+
+        Args:
+            prefix: Filter to files with this prefix (e.g., "audio/")
+            delimiter: Directory delimiter (e.g., "/" for directory-like listing)
+            page_size: Objects requested per API call
+            page_token: Resume a listing from a previous page's next_page_token
+            fields: Metadata fields to return (keys of LISTING_FIELDS;
+                defaults to DEFAULT_LISTING_FIELDS)
+            max_results: Stop after this many objects in total
+
+        Yields:
+            ListPage for each page fetched
+
+        Raises:
+            ValueError: If an unknown field is requested
+        """
+        fields = validate_listing_fields(fields)
+
+        projection = ",".join(LISTING_FIELDS[name] for name in fields)
+        remaining = max_results
+
+        while True:
+            params: Dict[str, Any] = {
+                "maxResults": page_size if remaining is None else min(page_size, remaining),
+                "fields": f"items({projection}),prefixes,nextPageToken",
+            }
+            if prefix:
+                params["prefix"] = prefix
+            if delimiter:
+                params["delimiter"] = delimiter
+            if page_token:
+                params["pageToken"] = page_token
+
+            response = await self._request(
+                "GET", f"/storage/v1/b/{quote(self.bucket_name, safe='')}/o", params=params
+            )
+            self._raise_for_status(response)
+            body = response.json()
+
+            items = [_resource_to_listing_dict(item, fields) for item in body.get("items", [])]
+            page_token = body.get("nextPageToken")
+            if remaining is not None:
+                remaining -= len(items)
+                if remaining <= 0:
+                    page_token = None
+
+            yield ListPage(items=items, next_page_token=page_token, prefixes=body.get("prefixes", []))
+
+            if not page_token:
+                return
+
+    async def list_files(
+        self,
+        prefix: Optional[str] = None,
+        delimiter: Optional[str] = None,
+        max_results: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        List files in the bucket.
+
+        Args:
+            prefix: Filter to files with this prefix (e.g., "audio/")
+            delimiter: Directory delimiter (e.g., "/" for directory-like listing)
+            max_results: Maximum number of results to return
+
+        Returns:
+            List of blob metadata dictionaries
+        """
+        results: List[Dict[str, Any]] = []
+        async for page in self.aiter_file_pages(prefix=prefix, delimiter=delimiter, max_results=max_results):
+            results.extend(page.items)
+
+        logger.info(f"Listed {len(results)} files with prefix: {prefix or 'None'}")
+        return results
+
+
+def create_async_gcs_client(
+    bucket_name: Optional[str] = None,
+    credentials_path: Optional[str] = None,
+) -> AsyncGCSClient:
+    """
+    Create an async GCS client instance.
+
+    Args:
+        bucket_name: GCS bucket name
+        credentials_path: Path to service account key file
+
+    Returns:
+        AsyncGCSClient instance (close it with aclose() or use "async with")
+    """
+    return AsyncGCSClient(bucket_name=bucket_name, credentials_path=credentials_path)
+
+
+# Shared clients by bucket; their HTTP pools belong to the loop that created them
+_async_clients: Dict[Optional[str], AsyncGCSClient] = {}
+_async_clients_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_async_gcs_client(bucket_name: Optional[str] = None) -> AsyncGCSClient:
+    """
+    Get the shared async GCS client for a bucket.
+
+    Clients are created on first use and reused, so requests share one
+    connection pool and one set of credentials. They are bound to the
+    running event loop and recreated when called from a different loop.
+
+    Args:
+        bucket_name: GCS bucket name (defaults to config)
+
+    Returns:
+        Shared AsyncGCSClient instance (closed by close_async_gcs_clients)
+    """
+    global _async_clients_loop
+    loop = asyncio.get_running_loop()
+    if loop is not _async_clients_loop:
+        _async_clients.clear()
+        _async_clients_loop = loop
+
+    client = _async_clients.get(bucket_name)
+    if client is None:
+        client = AsyncGCSClient(bucket_name=bucket_name)
+        _async_clients[bucket_name] = client
+    return client
+
+
+async def close_async_gcs_clients() -> None:
+    """Close the shared async GCS clients (call on shutdown)."""
+    clients = list(_async_clients.values())
+    _async_clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
+async def agenerate_signed_url(
+    blob_name: str,
+    bucket_name: Optional[str] = None,
+    expiration_minutes: int = 15,
+    method: str = "GET",
+    window_seconds: Optional[int] = None,
+) -> str:
+    """
+    Async variant of generate_signed_url.
+
+    With the GCS backend the existence check of a GET URL goes through the
+    shared async client instead of a worker thread. The local backend only
+    touches the filesystem and is signed in a worker thread.
+
+    Args:
+        blob_name: Name/path of the blob
+        bucket_name: GCS bucket name (defaults to config)
+        expiration_minutes: URL expiration in minutes
+        method: HTTP method
+        window_seconds: Expiry alignment bucket in seconds (defaults to config, 0 disables)
+
+    Returns:
+        Signed URL string
+
+    Raises:
+        NotFound: If blob doesn't exist (for GET requests)
+    """
+    if get_storage_backend_name() == "local":
+        return await asyncio.to_thread(
+            generate_signed_url,
+            blob_name=blob_name,
+            bucket_name=bucket_name,
+            expiration_minutes=expiration_minutes,
+            method=method,
+            window_seconds=window_seconds,
+        )
+
+    client = get_async_gcs_client(bucket_name)
+    return await client.generate_signed_url(
+        blob_name,
+        expiration_minutes=expiration_minutes,
+        method=method,
+        window_seconds=window_seconds,
+    )
@@ -0,0 +1,324 @@
+"""
+Storage backend interface.
+
+AudioStorageManager, the module-level storage helpers and SignedURLCache
+talk to object storage through StorageBackend, so the same ingest and
+streaming code runs against Google Cloud Storage (GCSClient) or local disk
+(LocalStorageBackend). The backend is chosen by config storage_backend.
+
+Objects are always addressed as "gs://{bucket}/{name}" paths; the local
+backend maps the bucket to a directory under its root.
+"""
+
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from collections import namedtuple
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Iterator, AsyncIterator, Sequence
+
+from google.cloud.exceptions import NotFound
+
+# Try to import config, but make it optional for backward compatibility
+try:
+    from src.config import config as app_config
+    HAS_APP_CONFIG = True
+except ImportError:
+    HAS_APP_CONFIG = False
+
+logger = logging.getLogger(__name__)
+
+# Listing fields (dict key -> JSON API field) available for projection
+LISTING_FIELDS = {
+    "name": "name",
+    "size": "size",
+    "crc32c": "crc32c",
+    "md5_hash": "md5Hash",
+    "content_type": "contentType",
+    "generation": "generation",
+    "created": "timeCreated",
+    "updated": "updated",
+}
+
+# Fields returned by list_files when no projection is requested
+DEFAULT_LISTING_FIELDS = ("name", "size", "content_type", "created", "updated")
+
+
+@dataclass
+class ListPage:
+    """
+    One page of a bucket listing.
+
+    Attributes:
+        items: Blob metadata dictionaries restricted to the requested fields
+        next_page_token: Token to resume the listing after this page (None on the last page)
+        prefixes: "Directory" prefixes on this page when listing with a delimiter
+    """
+    items: List[Dict[str, Any]]
+    next_page_token: Optional[str] = None
+    prefixes: List[str] = field(default_factory=list)
+
+
+BucketRef = namedtuple("BucketRef", ["name"])
+
+
+@dataclass
+class StoredObject:
+    """
+    Result of an upload to a non-GCS backend.
+
+    Exposes the storage.Blob attributes callers read after an upload
+    (name, bucket.name, size, content_type, md5_hash, crc32c, generation).
+    """
+    name: str
+    bucket_name: str
+    size: int
+    content_type: Optional[str] = None
+    md5_hash: Optional[str] = None
+    crc32c: Optional[str] = None
+    generation: Optional[int] = None
+    metadata: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def bucket(self) -> BucketRef:
+        """Bucket reference, mirroring storage.Blob.bucket."""
+        return BucketRef(self.bucket_name)
+
+
+def validate_listing_fields(fields: Optional[Sequence[str]]) -> tuple:
+    """
+    Resolve a listing field projection.
+
+    Args:
+        fields: Requested keys (see LISTING_FIELDS), or None for the defaults
+
+    Returns:
+        Tuple of field names
+
+    Raises:
+        ValueError: If an unknown field is requested
+    """
+    fields = tuple(fields) if fields else DEFAULT_LISTING_FIELDS
+    unknown = [name for name in fields if name not in LISTING_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown listing fields: {unknown}. Valid fields: {list(LISTING_FIELDS)}")
+    return fields
+
+
+class StorageBackend(ABC):
+    """
+    Object storage used for audio and artwork files.
+
+    Implementations provide put (upload_file), get-range (read_range), sign
+    (generate_signed_url), delete (delete_file), list (iter_file_pages) and
+    get_file_metadata; listing helpers are derived from iter_file_pages.
+    """
+
+    bucket_name: str
+
+    @abstractmethod
+    def upload_file(
+        self,
+        source_path: Path | str,
+        destination_blob_name: str,
+        content_type: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None,
+        crc32c: Optional[str] = None,
+        md5_hash: Optional[str] = None,
+        **kwargs,
+    ) -> Any:
+        """Store a local file under destination_blob_name and return the stored object."""
+
+    @abstractmethod
+    def read_range(self, blob_name: str, start: int = 0, length: Optional[int] = None) -> bytes:
+        """Read length bytes of an object starting at start (to the end when length is None)."""
+
+    @abstractmethod
+    def generate_signed_url(
+        self,
+        blob_name: str,
+        expiration_minutes: int = 15,
+        method: str = "GET",
+        content_type: Optional[str] = None,
+        response_disposition: Optional[str] = None,
+        window_seconds: Optional[int] = None,
+    ) -> str:
+        """Generate a time-limited URL granting access to an object."""
+
+    @abstractmethod
+    def delete_file(self, blob_name: str) -> bool:
+        """Delete an object; return False if it did not exist."""
+
+    @abstractmethod
+    def get_file_metadata(self, blob_name: str) -> Dict[str, Any]:
+        """Return object metadata; raise NotFound if it does not exist."""
+
+    @abstractmethod
+    def iter_file_pages(
+        self,
+        prefix: Optional[str] = None,
+        delimiter: Optional[str] = None,
+        page_size: int = 1000,
+        page_token: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        max_results: Optional[int] = None,
+    ) -> Iterator[ListPage]:
+        """Lazily list objects one page at a time."""
+
+    def delete_files(self, blob_names: Sequence[str]) -> List[str]:
+        """
+        Delete several objects.
+
+        Missing objects count as deleted.
+
+        Args:
+            blob_names: Names/paths of the blobs to delete
+
+        Returns:
+            Names that could not be deleted
+        """
+        failed = []
+        for blob_name in blob_names:
+            try:
+                self.delete_file(blob_name)
+            except Exception as e:
+                logger.error(f"Failed to delete blob {blob_name}: {e}")
+                failed.append(blob_name)
+        return failed
+
+    def file_exists(self, blob_name: str) -> bool:
+        """
+        Check if a file exists.
+
+        Args:
+            blob_name: Name/path of the blob
+
+        Returns:
+            True if exists, False otherwise
+        """
+        try:
+            self.get_file_metadata(blob_name)
+            return True
+        except NotFound:
+            return False
+
+    def iter_files(
+        self,
+        prefix: Optional[str] = None,
+        delimiter: Optional[str] = None,
+        page_size: int = 1000,
+        page_token: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        max_results: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily list the bucket one blob at a time.
+
+        Same arguments as iter_file_pages; pages are fetched on demand.
+
+        Yields:
+            Blob metadata dictionaries
+        """
+        for page in self.iter_file_pages(
+            prefix=prefix,
+            delimiter=delimiter,
+            page_size=page_size,
+            page_token=page_token,
+            fields=fields,
+            max_results=max_results,
+        ):
+            yield from page.items
+
+    def list_files(
+        self,
+        prefix: Optional[str] = None,
+        delimiter: Optional[str] = None,
+        max_results: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        List files in the bucket.
+
+        Args:
+            prefix: Filter to files with this prefix (e.g., "audio/")
+            delimiter: Directory delimiter (e.g., "/" for directory-like listing)
+            max_results: Maximum number of results to return
+
+        Returns:
+            List of blob metadata dictionaries
+
+        Note:
+            Loads the entire listing into memory. Use iter_files or
+            iter_file_pages for bucket-scale listings.
+        """
+        results = list(self.iter_files(prefix=prefix, delimiter=delimiter, max_results=max_results))
+
+        logger.info(f"Listed {len(results)} files with prefix: {prefix or 'None'}")
+        return results
+
+    async def aiter_file_pages(
+        self,
+        prefix: Optional[str] = None,
+        delimiter: Optional[str] = None,
+        page_size: int = 1000,
+        page_token: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        max_results: Optional[int] = None,
+    ) -> AsyncIterator[ListPage]:
+        """
+        Async variant of iter_file_pages.
+
+        Each page request runs in a worker thread, so the event loop is never
+        blocked by the listing.
+
+        Yields:
+            ListPage objects in listing order
+        """
+        pages = self.iter_file_pages(
+            prefix=prefix,
+            delimiter=delimiter,
+            page_size=page_size,
+            page_token=page_token,
+            fields=fields,
+            max_results=max_results,
+        )
+        sentinel = object()
+
+        while True:
+            page = await asyncio.to_thread(next, pages, sentinel)
+            if page is sentinel:
+                return
+            yield page
+
+
+def get_storage_backend_name() -> str:
+    """Configured backend name ("gcs" or "local")."""
+    return app_config.storage_backend if HAS_APP_CONFIG else "gcs"
+
+
+def create_storage_backend(
+    bucket_name: Optional[str] = None,
+    project_id: Optional[str] = None,
+    credentials_path: Optional[str] = None,
+) -> StorageBackend:
+    """
+    Create the configured storage backend.
+
+    Args:
+        bucket_name: Bucket name (defaults to config)
+        project_id: GCP project ID (GCS only)
+        credentials_path: Path to service account key file (GCS only)
+
+    Returns:
+        GCSClient or LocalStorageBackend, depending on config storage_backend
+    """
+    if get_storage_backend_name() == "local":
+        from .local_backend import LocalStorageBackend
+        return LocalStorageBackend(bucket_name=bucket_name)
+
+    from .gcs_client import GCSClient
+    return GCSClient(
+        bucket_name=bucket_name,
+        project_id=project_id,
+        credentials_path=credentials_path,
+    )
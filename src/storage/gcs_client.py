@@ -3,19 +3,37 @@ Google Cloud Storage client implementation for audio file management.
 
 Provides functionality for:
 - Signed URL generation for secure streaming
-- File upload/download operations
+- File upload/download operations (chunked resumable and parallel composite uploads)
 - Metadata management
 - Lifecycle policy enforcement
 """
 
 import datetime
 import logging
+import math
+import mimetypes
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Iterator, Sequence
+from urllib.parse import quote
+import requests
+from google.api_core import exceptions as api_exceptions
 from google.cloud import storage
+from google.cloud.storage import _signing
 from google.cloud.exceptions import NotFound, GoogleCloudError
 import os
 
+from .backend import (
+    LISTING_FIELDS,
+    ListPage,
+    StorageBackend,
+    create_storage_backend,
+    validate_listing_fields,
+)
+from .retry import RetryConfig
+
 # Try to import config, but make it optional for backward compatibility
 try:
     from src.config import config as app_config
@@ -25,9 +43,165 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# V4 signed URLs cannot be valid for longer than 7 days
+MAX_SIGNED_URL_SECONDS = 7 * 24 * 60 * 60
+
+# Resumable upload chunks (except the last) must be multiples of 256 KiB
+RESUMABLE_CHUNK_ALIGNMENT = 256 * 1024
+
+# A single compose request accepts at most 32 source objects
+MAX_COMPOSE_SOURCES = 32
+
+# Per-chunk request timeout for resumable uploads
+UPLOAD_CHUNK_TIMEOUT_SECONDS = 120
+
+# Calls per JSON API batch request (GCS recommends at most 100)
+MAX_BATCH_CALLS = 100
+
+# Responses after which a resumable session is probed and resumed
+RESUMABLE_RETRY_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+def _blob_to_listing_dict(blob: storage.Blob, fields: Sequence[str]) -> Dict[str, Any]:
+    """Convert a listed blob into a metadata dict holding only the requested fields."""
+    values = {
+        "name": lambda: blob.name,
+        "size": lambda: blob.size,
+        "crc32c": lambda: blob.crc32c,
+        "md5_hash": lambda: blob.md5_hash,
+        "content_type": lambda: blob.content_type,
+        "generation": lambda: blob.generation,
+        "created": lambda: blob.time_created.isoformat() if blob.time_created else None,
+        "updated": lambda: blob.updated.isoformat() if blob.updated else None,
+    }
+    return {name: values[name]() for name in fields}
+
+
+def _align_chunk_size(chunk_size: int) -> int:
+    """Round a chunk size up to the 256 KiB multiple required by resumable uploads."""
+    chunks = max(1, math.ceil(chunk_size / RESUMABLE_CHUNK_ALIGNMENT))
+    return chunks * RESUMABLE_CHUNK_ALIGNMENT
+
+
+def _parse_committed_bytes(range_header: Optional[str]) -> int:
+    """
+    Parse the number of bytes GCS has persisted from a 308 Range header.
+    
+    Args:
+        range_header: Value like "bytes=0-1048575", or None if nothing is stored
+    
+    Returns:
+        Number of committed bytes
+    """
+    if not range_header:
+        return 0
+    _, _, end = range_header.partition("-")
+    return int(end) + 1
+
 
-class GCSClient:
-    """Client for interacting with Google Cloud Storage."""
+def compute_signing_window(
+    expiration_minutes: int,
+    window_seconds: int,
+    now: Optional[float] = None,
+) -> Tuple[datetime.datetime, int]:
+    """
+    Align a signed URL's validity period to a fixed time bucket.
+    
+    Every signer inside the same bucket gets the same request timestamp and
+    lifetime, so V4 URLs for the same blob are byte-identical across requests
+    and server replicas, which lets browsers and CDNs reuse cached bytes.
+    
+    Args:
+        expiration_minutes: Minimum remaining lifetime the URL must have
+        window_seconds: Size of the time bucket in seconds
+        now: Current UNIX timestamp (defaults to time.time())
+    
+    Returns:
+        Tuple of (bucket start as naive UTC datetime, URL lifetime in seconds
+        counted from the bucket start)
+    
+    Example:
+        >>> start, lifetime = compute_signing_window(15, 900, now=1000.0)
+        >>> start, lifetime
+        (datetime.datetime(1970, 1, 1, 0, 15), 1800)
+    """
+    if window_seconds <= 0:
+        raise ValueError(f"window_seconds must be positive, got: {window_seconds}")
+    
+    if now is None:
+        now = time.time()
+    
+    window_start = int(now // window_seconds) * window_seconds
+    
+    # Round the requested lifetime up to whole buckets and add one more, so a
+    # URL signed at the very end of a bucket still lives expiration_minutes.
+    windows_needed = math.ceil(expiration_minutes * 60 / window_seconds) + 1
+    lifetime = min(windows_needed * window_seconds, MAX_SIGNED_URL_SECONDS)
+    
+    start = datetime.datetime.fromtimestamp(window_start, tz=datetime.timezone.utc)
+    return start.replace(tzinfo=None), lifetime
+
+
+def sign_url_v4(
+    credentials,
+    api_endpoint: str,
+    bucket_name: str,
+    blob_name: str,
+    expiration_minutes: int = 15,
+    window_seconds: int = 0,
+    method: str = "GET",
+    content_type: Optional[str] = None,
+    response_disposition: Optional[str] = None,
+) -> str:
+    """
+    Sign a V4 URL for a blob without any network calls.
+    
+    With a positive window_seconds the request timestamp and lifetime are
+    aligned to that bucket (see compute_signing_window); otherwise the URL
+    is stamped with the current time.
+    
+    Args:
+        credentials: Credentials able to sign bytes (e.g. a service account)
+        api_endpoint: Storage endpoint the URL points at
+        bucket_name: Bucket holding the blob
+        blob_name: Name/path of the blob
+        expiration_minutes: Minimum URL lifetime in minutes
+        window_seconds: Expiry alignment bucket in seconds (0 disables)
+        method: HTTP method
+        content_type: Content-Type header for PUT/POST requests
+        response_disposition: Content-Disposition header
+    
+    Returns:
+        Signed URL string
+    """
+    resource = f"/{bucket_name}/{quote(blob_name, safe='/~')}"
+    
+    if window_seconds > 0:
+        window_start, lifetime = compute_signing_window(expiration_minutes, window_seconds)
+        return _signing.generate_signed_url_v4(
+            credentials,
+            resource=resource,
+            expiration=lifetime,
+            api_access_endpoint=api_endpoint,
+            method=method.upper(),
+            content_type=content_type,
+            response_disposition=response_disposition,
+            _request_timestamp=window_start.strftime("%Y%m%dT%H%M%SZ"),
+        )
+    
+    return _signing.generate_signed_url_v4(
+        credentials,
+        resource=resource,
+        expiration=datetime.timedelta(minutes=expiration_minutes),
+        api_access_endpoint=api_endpoint,
+        method=method.upper(),
+        content_type=content_type,
+        response_disposition=response_disposition,
+    )
+
+
+class GCSClient(StorageBackend):
+    """Client for interacting with Google Cloud Storage (the GCS StorageBackend)."""
     
     def __init__(
         self,
@@ -89,6 +263,7 @@ class GCSClient:
         method: str = "GET",
         content_type: Optional[str] = None,
         response_disposition: Optional[str] = None,
+        window_seconds: Optional[int] = None,
     ) -> str:
         """
         Generate a signed URL for temporary access to a blob.
@@ -99,6 +274,9 @@ class GCSClient:
             method: HTTP method (GET, PUT, POST, DELETE)
             content_type: Content-Type header for PUT/POST requests
             response_disposition: Content-Disposition header (e.g., "attachment; filename=audio.mp3")
+            window_seconds: Align expiry to fixed buckets of this many seconds so the
+                same blob yields the same URL within a bucket (defaults to config
+                gcs_signed_url_window_seconds; 0 disables alignment)
         
         Returns:
             Signed URL string
@@ -127,7 +305,20 @@ class GCSClient:
             if response_disposition:
                 url_params["response_disposition"] = response_disposition
             
-            url = blob.generate_signed_url(**url_params)
+            if window_seconds is None:
+                window_seconds = app_config.gcs_signed_url_window_seconds if HAS_APP_CONFIG else 0
+            
+            if window_seconds > 0:
+                url = self._generate_windowed_signed_url(
+                    blob,
+                    expiration_minutes=expiration_minutes,
+                    window_seconds=window_seconds,
+                    method=method,
+                    content_type=content_type,
+                    response_disposition=response_disposition,
+                )
+            else:
+                url = blob.generate_signed_url(**url_params)
             
             logger.info(
                 f"Generated signed URL for blob: {blob_name}, "
@@ -143,46 +334,134 @@ class GCSClient:
             logger.error(f"Failed to generate signed URL for {blob_name}: {e}")
             raise
     
+    def _generate_windowed_signed_url(
+        self,
+        blob: storage.Blob,
+        expiration_minutes: int,
+        window_seconds: int,
+        method: str = "GET",
+        content_type: Optional[str] = None,
+        response_disposition: Optional[str] = None,
+    ) -> str:
+        """
+        Sign a V4 URL whose request timestamp and lifetime are bucket-aligned.
+        
+        Blob.generate_signed_url always stamps the current time into
+        X-Goog-Date, so the V4 signer is called directly with the bucket
+        start as the request timestamp.
+        
+        Args:
+            blob: Blob to sign
+            expiration_minutes: Minimum remaining lifetime of the URL
+            window_seconds: Size of the alignment bucket in seconds
+            method: HTTP method
+            content_type: Content-Type header for PUT/POST requests
+            response_disposition: Content-Disposition header
+        
+        Returns:
+            Signed URL string
+        """
+        return sign_url_v4(
+            self.client._credentials,
+            api_endpoint=self.client.api_endpoint,
+            bucket_name=self.bucket_name,
+            blob_name=blob.name,
+            expiration_minutes=expiration_minutes,
+            window_seconds=window_seconds,
+            method=method,
+            content_type=content_type,
+            response_disposition=response_disposition,
+        )
+    
     def upload_file(
         self,
         source_path: Path | str,
         destination_blob_name: str,
         content_type: Optional[str] = None,
         metadata: Optional[Dict[str, str]] = None,
+        chunk_size: Optional[int] = None,
+        composite_threshold: Optional[int] = None,
+        crc32c: Optional[str] = None,
+        md5_hash: Optional[str] = None,
     ) -> storage.Blob:
         """
         Upload a file to GCS.
         
+        Checksums computed elsewhere (e.g. while downloading) are sent with the
+        upload so GCS validates the object server-side, without this process
+        re-reading the file to hash it.
+        
+        Files are sent as chunked resumable uploads. If a chunk fails with a
+        transient error, the session is probed for the bytes GCS has already
+        committed and the upload continues from there rather than restarting.
+        Files at or above the composite threshold are split into parts that
+        are uploaded concurrently and then composed into the destination.
+        
         Args:
             source_path: Local file path to upload
             destination_blob_name: Destination path in GCS bucket
-            content_type: MIME type of the file
+            content_type: MIME type of the file (guessed from the file name if omitted)
             metadata: Custom metadata key-value pairs
+            chunk_size: Resumable chunk size in bytes, rounded up to 256 KiB
+                (defaults to config gcs_upload_chunk_size_mb)
+            composite_threshold: Minimum size in bytes for a parallel composite
+                upload (defaults to config gcs_composite_upload_threshold_mb;
+                0 disables)
+            crc32c: Base64 big-endian CRC32C of the file contents
+            md5_hash: Base64 MD5 digest of the file contents (not checked for
+                composite uploads, since composite objects have no MD5)
         
         Returns:
             Uploaded blob object
         
         Raises:
             FileNotFoundError: If source file doesn't exist
-            GoogleCloudError: If upload fails
+            GoogleCloudError: If upload fails or the stored object fails checksum validation
         """
         source_path = Path(source_path)
         
         if not source_path.exists():
             raise FileNotFoundError(f"Source file not found: {source_path}")
         
+        if chunk_size is None:
+            chunk_size = (app_config.gcs_upload_chunk_size_mb if HAS_APP_CONFIG else 8) * 1024 * 1024
+        if composite_threshold is None:
+            composite_threshold = (
+                app_config.gcs_composite_upload_threshold_mb if HAS_APP_CONFIG else 0
+            ) * 1024 * 1024
+        chunk_size = _align_chunk_size(chunk_size)
+        
+        file_size = source_path.stat().st_size
+        # Without a type GCS would store application/octet-stream
+        content_type = content_type or mimetypes.guess_type(source_path.name)[0]
+        
         try:
             blob = self.bucket.blob(destination_blob_name)
             
             # Set metadata if provided
             if metadata:
                 blob.metadata = metadata
+            if content_type:
+                blob.content_type = content_type
             
-            # Upload file
-            blob.upload_from_filename(
-                str(source_path),
-                content_type=content_type,
-            )
+            if composite_threshold > 0 and file_size >= composite_threshold:
+                self._upload_composite(blob, source_path, file_size, chunk_size)
+                
+                # Compose does not validate a supplied hash; compare the result instead
+                if crc32c and blob.crc32c != crc32c:
+                    blob.delete()
+                    raise api_exceptions.BadRequest(
+                        f"CRC32C mismatch for gs://{self.bucket_name}/{destination_blob_name}: "
+                        f"expected {crc32c}, got {blob.crc32c}"
+                    )
+            else:
+                # Hashes in the session metadata are validated by GCS on finalize
+                if crc32c:
+                    blob.crc32c = crc32c
+                if md5_hash:
+                    blob.md5_hash = md5_hash
+                resource = self._upload_resumable(blob, source_path, 0, file_size, chunk_size)
+                blob._set_properties(resource)
             
             logger.info(
                 f"Uploaded file: {source_path} -> gs://{self.bucket_name}/{destination_blob_name}"
@@ -194,6 +473,191 @@ class GCSClient:
             logger.error(f"Failed to upload file {source_path}: {e}")
             raise
     
+    def _upload_resumable(
+        self,
+        blob: storage.Blob,
+        source_path: Path,
+        offset: int,
+        length: int,
+        chunk_size: int,
+    ) -> Dict[str, Any]:
+        """
+        Upload a byte range of a file to a blob through a resumable session.
+        
+        Args:
+            blob: Destination blob (content type and metadata already set)
+            source_path: Local file to read from
+            offset: Start offset of the range within the file
+            length: Number of bytes to upload
+            chunk_size: Chunk size in bytes (multiple of 256 KiB)
+        
+        Returns:
+            Object resource returned by GCS for the finished upload
+        
+        Raises:
+            GoogleCloudError: If the upload fails permanently or resume attempts run out
+        """
+        max_resume_attempts = app_config.gcs_upload_max_resume_attempts if HAS_APP_CONFIG else 5
+        backoff = RetryConfig(max_attempts=max_resume_attempts + 1)
+        
+        session_url = blob.create_resumable_upload_session(
+            content_type=blob.content_type,
+            size=length,
+            client=self.client,
+        )
+        transport = self.client._http
+        
+        committed = 0
+        resume_attempts = 0
+        probe = False
+        
+        with open(source_path, "rb") as f:
+            while True:
+                try:
+                    if probe:
+                        # Ask GCS how much of the session it has persisted
+                        response = transport.put(
+                            session_url,
+                            data=b"",
+                            headers={"Content-Range": f"bytes */{length}"},
+                            timeout=UPLOAD_CHUNK_TIMEOUT_SECONDS,
+                        )
+                    else:
+                        f.seek(offset + committed)
+                        chunk = f.read(min(chunk_size, length - committed))
+                        if chunk:
+                            content_range = f"bytes {committed}-{committed + len(chunk) - 1}/{length}"
+                        else:
+                            content_range = f"bytes */{length}"
+                        response = transport.put(
+                            session_url,
+                            data=chunk,
+                            headers={"Content-Range": content_range},
+                            timeout=UPLOAD_CHUNK_TIMEOUT_SECONDS,
+                        )
+                    
+                    if response.status_code in (200, 201):
+                        return response.json()
+                    
+                    if response.status_code == 308:
+                        new_committed = _parse_committed_bytes(response.headers.get("Range"))
+                        if new_committed > committed:
+                            resume_attempts = 0
+                        committed = new_committed
+                        probe = False
+                        continue
+                    
+                    error = api_exceptions.from_http_response(response)
+                    if response.status_code not in RESUMABLE_RETRY_STATUS_CODES:
+                        raise error
+                    
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    error = e
+                
+                resume_attempts += 1
+                if resume_attempts > max_resume_attempts:
+                    logger.error(
+                        f"Resumable upload of {blob.name} failed at byte {committed}/{length} "
+                        f"after {max_resume_attempts} resume attempts"
+                    )
+                    if isinstance(error, GoogleCloudError):
+                        raise error
+                    raise api_exceptions.ServiceUnavailable(f"Resumable upload interrupted: {error}")
+                
+                delay = backoff.calculate_delay(resume_attempts - 1)
+                logger.warning(
+                    f"Resumable upload of {blob.name} interrupted at byte {committed}/{length} "
+                    f"({error}); resuming in {delay:.2f}s "
+                    f"(attempt {resume_attempts}/{max_resume_attempts})"
+                )
+                time.sleep(delay)
+                probe = True
+    
+    def _upload_composite(
+        self,
+        blob: storage.Blob,
+        source_path: Path,
+        file_size: int,
+        chunk_size: int,
+    ) -> None:
+        """
+        Upload a large file as concurrent parts, then compose them into the blob.
+        
+        Parts are written under a temporary prefix next to the destination and
+        deleted after composing. Composite objects carry a CRC32C but no MD5.
+        
+        Args:
+            blob: Destination blob (content type and metadata already set)
+            source_path: Local file to upload
+            file_size: Size of the file in bytes
+            chunk_size: Resumable chunk size for each part
+        
+        Raises:
+            GoogleCloudError: If any part upload or the compose fails
+        """
+        max_parts = app_config.gcs_composite_upload_parts if HAS_APP_CONFIG else 8
+        part_count = max(1, min(max_parts, MAX_COMPOSE_SOURCES, math.ceil(file_size / chunk_size)))
+        part_size = math.ceil(file_size / part_count)
+        
+        part_prefix = f"{blob.name}.parts/{uuid.uuid4().hex}"
+        ranges = [
+            (index, index * part_size, min(part_size, file_size - index * part_size))
+            for index in range(part_count)
+            if index * part_size < file_size
+        ]
+        parts = []
+        for index, _, _ in ranges:
+            part = self.bucket.blob(f"{part_prefix}/part-{index:03d}")
+            part.content_type = blob.content_type
+            parts.append(part)
+        
+        logger.info(
+            f"Parallel composite upload of {source_path} ({file_size} bytes) "
+            f"in {len(parts)} parts of up to {part_size} bytes"
+        )
+        
+        try:
+            with ThreadPoolExecutor(max_workers=len(parts)) as executor:
+                futures = [
+                    executor.submit(self._upload_resumable, part, source_path, offset, length, chunk_size)
+                    for part, (_, offset, length) in zip(parts, ranges)
+                ]
+                for future in futures:
+                    future.result()
+            
+            blob.compose(parts)
+        finally:
+            for part in parts:
+                try:
+                    part.delete()
+                except NotFound:
+                    pass
+                except GoogleCloudError as e:
+                    logger.warning(f"Failed to delete composite part {part.name}: {e}")
+    
+    def read_range(self, blob_name: str, start: int = 0, length: Optional[int] = None) -> bytes:
+        """
+        Read a byte range of a file in GCS.
+        
+        Args:
+            blob_name: Name/path of the blob
+            start: Offset of the first byte
+            length: Number of bytes to read (to the end of the object when None)
+        
+        Returns:
+            The requested bytes
+        
+        Raises:
+            NotFound: If blob doesn't exist
+            GoogleCloudError: If the download fails
+        """
+        if length == 0:
+            return b""
+        
+        blob = self.bucket.blob(blob_name)
+        end = start + length - 1 if length is not None else None
+        return blob.download_as_bytes(start=start, end=end)
+    
     def delete_file(self, blob_name: str) -> bool:
         """
         Delete a file from GCS.
@@ -221,6 +685,41 @@ class GCSClient:
             logger.error(f"Failed to delete blob {blob_name}: {e}")
             raise
     
+    def delete_files(self, blob_names: Sequence[str]) -> List[str]:
+        """
+        Delete several files using JSON API batch requests.
+        
+        Up to MAX_BATCH_CALLS deletes are sent in one HTTP request. Blobs that
+        are already gone count as deleted.
+        
+        Args:
+            blob_names: Names/paths of the blobs to delete
+        
+        Returns:
+            Names that could not be deleted
+        """
+        blob_names = list(blob_names)
+        failed: List[str] = []
+        
+        for start in range(0, len(blob_names), MAX_BATCH_CALLS):
+            chunk = blob_names[start:start + MAX_BATCH_CALLS]
+            try:
+                with self.client.batch(raise_exception=False) as batch:
+                    for blob_name in chunk:
+                        self.bucket.delete_blob(blob_name)
+            except GoogleCloudError as e:
+                logger.error(f"Batch delete of {len(chunk)} blobs failed: {e}")
+                failed.extend(chunk)
+                continue
+            
+            for blob_name, response in zip(chunk, batch._responses):
+                if response.status_code >= 300 and response.status_code != 404:
+                    logger.error(f"Failed to delete blob {blob_name}: HTTP {response.status_code}")
+                    failed.append(blob_name)
+        
+        logger.info(f"Batch deleted {len(blob_names) - len(failed)}/{len(blob_names)} blobs")
+        return failed
+    
     def get_file_metadata(self, blob_name: str) -> Dict[str, Any]:
         """
         Get metadata for a file in GCS.
@@ -262,43 +761,63 @@ class GCSClient:
             logger.error(f"Failed to get metadata for {blob_name}: {e}")
             raise
     
-    def list_files(
+    def iter_file_pages(
         self,
         prefix: Optional[str] = None,
         delimiter: Optional[str] = None,
+        page_size: int = 1000,
+        page_token: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
         max_results: Optional[int] = None,
-    ) -> List[Dict[str, Any]]:
+    ) -> Iterator[ListPage]:
         """
-        List files in the bucket.
+        Lazily list the bucket one page at a time.
+        
+        Only the current page is held in memory, and each page carries the
+        token needed to resume from the following page, so long-running jobs
+        can checkpoint and restart where they stopped.
         
         Args:
             prefix: Filter to files with this prefix (e.g., "audio/")
             delimiter: Directory delimiter (e.g., "/" for directory-like listing)
-            max_results: Maximum number of results to return
+            page_size: Number of blobs requested per API call (max 1000)
+            page_token: Resume token from a previous ListPage.next_page_token
+            fields: Keys to return for each blob (see LISTING_FIELDS); the API
+                response is projected to these fields as well
+            max_results: Stop after this many blobs in total
         
-        Returns:
-            List of blob metadata dictionaries
+        Yields:
+            ListPage objects in listing order
+        
+        Raises:
+            ValueError: If an unknown field is requested
+            GoogleCloudError: If a page request fails
+        
+        Example:
+            >>> for page in client.iter_file_pages("audio/", fields=["name", "size", "crc32c"]):
+            ...     process(page.items)
+            ...     save_checkpoint(page.next_page_token)
         """
+        fields = validate_listing_fields(fields)
+        api_fields = ",".join(LISTING_FIELDS[name] for name in fields)
+        
         try:
-            blobs = self.client.list_blobs(
+            iterator = self.client.list_blobs(
                 self.bucket_name,
                 prefix=prefix,
                 delimiter=delimiter,
                 max_results=max_results,
+                page_size=page_size,
+                page_token=page_token,
+                fields=f"items({api_fields}),prefixes,nextPageToken",
             )
             
-            results = []
-            for blob in blobs:
-                results.append({
-                    "name": blob.name,
-                    "size": blob.size,
-                    "content_type": blob.content_type,
-                    "created": blob.time_created.isoformat() if blob.time_created else None,
-                    "updated": blob.updated.isoformat() if blob.updated else None,
-                })
-            
-            logger.info(f"Listed {len(results)} files with prefix: {prefix or 'None'}")
-            return results
+            for page in iterator.pages:
+                yield ListPage(
+                    items=[_blob_to_listing_dict(blob, fields) for blob in page],
+                    next_page_token=iterator.next_page_token,
+                    prefixes=sorted(page.prefixes),
+                )
             
         except GoogleCloudError as e:
             logger.error(f"Failed to list files: {e}")
@@ -352,6 +871,7 @@ def generate_signed_url(
     bucket_name: Optional[str] = None,
     expiration_minutes: int = 15,
     method: str = "GET",
+    window_seconds: Optional[int] = None,
 ) -> str:
     """
     Generate a signed URL for a blob.
@@ -361,15 +881,17 @@ def generate_signed_url(
         bucket_name: GCS bucket name (defaults to env var)
         expiration_minutes: URL expiration in minutes
         method: HTTP method
+        window_seconds: Expiry alignment bucket in seconds (defaults to config, 0 disables)
     
     Returns:
         Signed URL string
     """
-    client = create_gcs_client(bucket_name=bucket_name)
+    client = create_storage_backend(bucket_name=bucket_name)
     return client.generate_signed_url(
         blob_name=blob_name,
         expiration_minutes=expiration_minutes,
         method=method,
+        window_seconds=window_seconds,
     )
 
 
@@ -378,6 +900,8 @@ def upload_audio_file(
     destination_blob_name: str,
     bucket_name: Optional[str] = None,
     metadata: Optional[Dict[str, str]] = None,
+    crc32c: Optional[str] = None,
+    md5_hash: Optional[str] = None,
 ) -> storage.Blob:
     """
     Upload an audio file to GCS.
@@ -387,11 +911,13 @@ def upload_audio_file(
         destination_blob_name: Destination path in GCS
         bucket_name: GCS bucket name
         metadata: Custom metadata
+        crc32c: Base64 CRC32C of the file, validated by GCS
+        md5_hash: Base64 MD5 of the file, validated by GCS
     
     Returns:
-        Uploaded blob object
+        Uploaded blob object (a StoredObject on the local backend)
     """
-    client = create_gcs_client(bucket_name=bucket_name)
+    client = create_storage_backend(bucket_name=bucket_name)
     
     # Determine content type for audio files
     content_type = "audio/mpeg"  # Default
@@ -414,6 +940,8 @@ def upload_audio_file(
         destination_blob_name=destination_blob_name,
         content_type=content_type,
         metadata=metadata,
+        crc32c=crc32c,
+        md5_hash=md5_hash,
     )
 
 
@@ -428,10 +956,41 @@ def delete_file(blob_name: str, bucket_name: Optional[str] = None) -> bool:
     Returns:
         True if deleted, False if not found
     """
-    client = create_gcs_client(bucket_name=bucket_name)
+    client = create_storage_backend(bucket_name=bucket_name)
     return client.delete_file(blob_name)
 
 
+def delete_gcs_paths(gcs_paths: Sequence[str]) -> List[str]:
+    """
+    Delete files addressed by gs://bucket/name paths.
+    
+    Paths are grouped by bucket and removed with the backend's batched
+    delete_files (up to MAX_BATCH_CALLS deletes per request on GCS).
+    
+    Args:
+        gcs_paths: Full gs:// paths of the files to delete
+    
+    Returns:
+        Paths that could not be deleted (malformed paths included)
+    """
+    by_bucket: Dict[str, List[str]] = {}
+    failed: List[str] = []
+    
+    for gcs_path in dict.fromkeys(gcs_paths):
+        bucket_name, sep, blob_name = gcs_path.removeprefix("gs://").partition("/")
+        if not gcs_path.startswith("gs://") or not sep or not blob_name:
+            logger.error(f"Cannot delete malformed GCS path: {gcs_path}")
+            failed.append(gcs_path)
+            continue
+        by_bucket.setdefault(bucket_name, []).append(blob_name)
+    
+    for bucket_name, blob_names in by_bucket.items():
+        client = create_storage_backend(bucket_name=bucket_name)
+        failed.extend(f"gs://{bucket_name}/{name}" for name in client.delete_files(blob_names))
+    
+    return failed
+
+
 def list_audio_files(
     prefix: str = "audio/",
     bucket_name: Optional[str] = None,
@@ -448,10 +1007,39 @@ def list_audio_files(
     Returns:
         List of file metadata
     """
-    client = create_gcs_client(bucket_name=bucket_name)
+    client = create_storage_backend(bucket_name=bucket_name)
     return client.list_files(prefix=prefix, max_results=max_results)
 
 
+def iter_audio_file_pages(
+    prefix: str = "audio/",
+    bucket_name: Optional[str] = None,
+    page_size: int = 1000,
+    page_token: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> Iterator[ListPage]:
+    """
+    Lazily list audio files in GCS one page at a time.
+    
+    Args:
+        prefix: Path prefix (default: "audio/")
+        bucket_name: GCS bucket name
+        page_size: Blobs per page
+        page_token: Resume token from a previous page
+        fields: Keys to return per blob (e.g. ["name", "size", "crc32c"])
+    
+    Returns:
+        Iterator of ListPage objects
+    """
+    client = create_storage_backend(bucket_name=bucket_name)
+    return client.iter_file_pages(
+        prefix=prefix,
+        page_size=page_size,
+        page_token=page_token,
+        fields=fields,
+    )
+
+
 def get_file_metadata(
     blob_name: str,
     bucket_name: Optional[str] = None,
@@ -466,6 +1054,6 @@ def get_file_metadata(
     Returns:
         Metadata dictionary
     """
-    client = create_gcs_client(bucket_name=bucket_name)
+    client = create_storage_backend(bucket_name=bucket_name)
     return client.get_file_metadata(blob_name)
 
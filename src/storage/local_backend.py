@@ -0,0 +1,512 @@
+"""
+Local filesystem storage backend.
+
+Stores objects under {storage_path}/{bucket}/{name} with a JSON sidecar per
+object under {storage_path}/.metadata/, so the ingest path can be
+benchmarked without GCS and a single-node deployment can run without a
+bucket. Range reads use mmap (read_range), and signed URLs are HMAC-signed
+links to the server's /storage route, which serves the file with a
+FileResponse (zero-copy where the ASGI server supports it).
+"""
+
+import base64
+import calendar
+import hashlib
+import hmac
+import json
+import logging
+import mmap
+import os
+import secrets
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterator, Sequence
+from urllib.parse import quote, urlencode
+
+import google_crc32c
+from google.api_core import exceptions as api_exceptions
+from google.cloud.exceptions import NotFound
+
+from .backend import ListPage, StorageBackend, StoredObject, validate_listing_fields
+from .gcs_client import MAX_SIGNED_URL_SECONDS, compute_signing_window
+
+# Try to import config, but make it optional for backward compatibility
+try:
+    from src.config import config as app_config
+    HAS_APP_CONFIG = True
+except ImportError:
+    HAS_APP_CONFIG = False
+
+logger = logging.getLogger(__name__)
+
+# Directory (under the storage root) holding per-object metadata sidecars
+METADATA_DIR = ".metadata"
+
+# Buffer size for hashing copies
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# Signing key shared by all local backends in this process when none is configured
+_process_signing_key: Optional[bytes] = None
+
+
+def _default_signing_key() -> bytes:
+    """Signing key from config, or a random key generated once per process."""
+    global _process_signing_key
+
+    if HAS_APP_CONFIG and app_config.local_storage_signing_key:
+        return app_config.local_storage_signing_key.encode("utf-8")
+
+    if _process_signing_key is None:
+        logger.warning(
+            "LOCAL_STORAGE_SIGNING_KEY is not set; local signed URLs will not survive a restart"
+        )
+        _process_signing_key = secrets.token_bytes(32)
+    return _process_signing_key
+
+
+class LocalStorageBackend(StorageBackend):
+    """Storage backend that keeps objects on local disk."""
+
+    def __init__(
+        self,
+        root: Optional[Path | str] = None,
+        bucket_name: Optional[str] = None,
+        signing_key: Optional[bytes | str] = None,
+        base_url: Optional[str] = None,
+    ):
+        """
+        Initialize the local storage backend.
+
+        Args:
+            root: Storage root directory (defaults to config storage_path)
+            bucket_name: Logical bucket name used in gs:// paths (defaults to
+                config gcs_bucket_name, then "local")
+            signing_key: HMAC key for signed URLs (defaults to config
+                local_storage_signing_key, then a random per-process key)
+            base_url: Public base URL of the server (defaults to config
+                local_storage_base_url, then http://localhost:{server_port})
+        """
+        if HAS_APP_CONFIG:
+            self.root = Path(root or app_config.storage_path)
+            self.bucket_name = bucket_name or app_config.gcs_bucket_name or "local"
+            self.base_url = (
+                base_url
+                or app_config.local_storage_base_url
+                or f"http://localhost:{app_config.server_port}"
+            )
+        else:
+            self.root = Path(root or "./storage")
+            self.bucket_name = bucket_name or os.getenv("GCS_BUCKET_NAME") or "local"
+            self.base_url = base_url or "http://localhost:8080"
+        self.base_url = self.base_url.rstrip("/")
+
+        if isinstance(signing_key, str):
+            signing_key = signing_key.encode("utf-8")
+        self._signing_key = signing_key or _default_signing_key()
+
+        self.bucket_root = (self.root / self.bucket_name).resolve()
+        self.metadata_root = (self.root / METADATA_DIR / self.bucket_name).resolve()
+        self.bucket_root.mkdir(parents=True, exist_ok=True)
+        self.metadata_root.mkdir(parents=True, exist_ok=True)
+
+        logger.info(f"Initialized local storage backend at {self.bucket_root}")
+
+    def object_path(self, blob_name: str) -> Path:
+        """
+        Resolve the file holding an object.
+
+        Args:
+            blob_name: Name/path of the blob
+
+        Returns:
+            Absolute path inside the bucket directory
+
+        Raises:
+            ValueError: If the name escapes the bucket directory
+        """
+        path = (self.bucket_root / blob_name).resolve()
+        if not blob_name or not path.is_relative_to(self.bucket_root):
+            raise ValueError(f"Invalid object name: {blob_name!r}")
+        return path
+
+    def _metadata_path(self, blob_name: str) -> Path:
+        """Path of an object's metadata sidecar."""
+        return self.metadata_root / f"{blob_name}.json"
+
+    def _load_resource(self, blob_name: str) -> Dict[str, Any]:
+        """Load an object's sidecar, raising NotFound if the object is missing."""
+        path = self.object_path(blob_name)
+        if not path.is_file():
+            raise NotFound(f"Blob not found: {blob_name}")
+
+        try:
+            resource = json.loads(self._metadata_path(blob_name).read_text())
+        except (FileNotFoundError, ValueError):
+            # Files dropped into the directory by hand have no sidecar
+            stat = path.stat()
+            resource = {"generation": stat.st_mtime_ns // 1000, "created": stat.st_mtime}
+
+        stat = path.stat()
+        resource["size"] = stat.st_size
+        resource["updated"] = stat.st_mtime
+        return resource
+
+    def upload_file(
+        self,
+        source_path: Path | str,
+        destination_blob_name: str,
+        content_type: Optional[str] = None,
+        metadata: Optional[Dict[str, str]] = None,
+        crc32c: Optional[str] = None,
+        md5_hash: Optional[str] = None,
+        **kwargs,
+    ) -> StoredObject:
+        """
+        Copy a file into the store.
+
+        The file is hashed while it is copied to a temporary file next to the
+        destination, validated against the supplied checksums, and then
+        renamed into place, so readers never see a partial object.
+
+        Args:
+            source_path: Local file path to upload
+            destination_blob_name: Destination object name
+            content_type: MIME type of the file
+            metadata: Custom metadata key-value pairs
+            crc32c: Base64 big-endian CRC32C of the file contents
+            md5_hash: Base64 MD5 digest of the file contents
+            **kwargs: GCS-only upload options (chunk_size, composite_threshold), ignored
+
+        Returns:
+            StoredObject describing the stored file
+
+        Raises:
+            FileNotFoundError: If source file doesn't exist
+            BadRequest: If the contents do not match a supplied checksum
+        """
+        source_path = Path(source_path)
+        if not source_path.exists():
+            raise FileNotFoundError(f"Source file not found: {source_path}")
+
+        destination = self.object_path(destination_blob_name)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+
+        crc = google_crc32c.Checksum()
+        md5 = hashlib.md5()
+        fd, tmp_name = tempfile.mkstemp(dir=destination.parent, prefix=".upload-")
+        try:
+            with open(source_path, "rb") as src, os.fdopen(fd, "wb") as dst:
+                while chunk := src.read(COPY_CHUNK_SIZE):
+                    crc.update(chunk)
+                    md5.update(chunk)
+                    dst.write(chunk)
+
+            actual_crc32c = base64.b64encode(crc.digest()).decode("ascii")
+            actual_md5 = base64.b64encode(md5.digest()).decode("ascii")
+            if crc32c and crc32c != actual_crc32c:
+                raise api_exceptions.BadRequest(
+                    f"CRC32C mismatch for {destination_blob_name}: expected {crc32c}, got {actual_crc32c}"
+                )
+            if md5_hash and md5_hash != actual_md5:
+                raise api_exceptions.BadRequest(
+                    f"MD5 mismatch for {destination_blob_name}: expected {md5_hash}, got {actual_md5}"
+                )
+
+            os.replace(tmp_name, destination)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        now = time.time()
+        stored = StoredObject(
+            name=destination_blob_name,
+            bucket_name=self.bucket_name,
+            size=destination.stat().st_size,
+            content_type=content_type,
+            md5_hash=actual_md5,
+            crc32c=actual_crc32c,
+            generation=time.time_ns() // 1000,
+            metadata=dict(metadata or {}),
+        )
+
+        sidecar = self._metadata_path(destination_blob_name)
+        sidecar.parent.mkdir(parents=True, exist_ok=True)
+        sidecar.write_text(json.dumps({
+            "content_type": stored.content_type,
+            "md5_hash": stored.md5_hash,
+            "crc32c": stored.crc32c,
+            "generation": stored.generation,
+            "metadata": stored.metadata,
+            "created": now,
+        }))
+
+        logger.info(f"Stored file: {source_path} -> {destination}")
+        return stored
+
+    def read_range(self, blob_name: str, start: int = 0, length: Optional[int] = None) -> bytes:
+        """
+        Read a byte range of an object through a memory map.
+
+        Args:
+            blob_name: Name/path of the blob
+            start: Offset of the first byte
+            length: Number of bytes to read (to the end of the object when None)
+
+        Returns:
+            The requested bytes
+
+        Raises:
+            NotFound: If the object doesn't exist
+        """
+        path = self.object_path(blob_name)
+        if not path.is_file():
+            raise NotFound(f"Blob not found: {blob_name}")
+
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            end = size if length is None else min(size, start + length)
+            if start >= end:
+                return b""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return mapped[start:end]
+
+    def _signature(self, method: str, blob_name: str, expires: int) -> str:
+        """HMAC-SHA256 signature over the method, object and expiry."""
+        message = f"{method.upper()}\n{self.bucket_name}\n{blob_name}\n{expires}".encode("utf-8")
+        return hmac.new(self._signing_key, message, hashlib.sha256).hexdigest()
+
+    def generate_signed_url(
+        self,
+        blob_name: str,
+        expiration_minutes: int = 15,
+        method: str = "GET",
+        content_type: Optional[str] = None,
+        response_disposition: Optional[str] = None,
+        window_seconds: Optional[int] = None,
+    ) -> str:
+        """
+        Generate an HMAC-signed URL for the server's /storage route.
+
+        Expiry is aligned to windows exactly like GCS V4 URLs, so the
+        SignedURLCache behaves the same against either backend.
+
+        Args:
+            blob_name: Name/path of the blob
+            expiration_minutes: URL expiration time in minutes (default: 15)
+            method: HTTP method the URL is valid for
+            content_type: Unused (kept for interface compatibility)
+            response_disposition: Unused (kept for interface compatibility)
+            window_seconds: Expiry alignment bucket in seconds (defaults to
+                config gcs_signed_url_window_seconds; 0 disables alignment)
+
+        Returns:
+            Signed URL string
+
+        Raises:
+            NotFound: If the object doesn't exist (for GET requests)
+        """
+        if method == "GET" and not self.object_path(blob_name).is_file():
+            logger.error(f"Blob not found: {blob_name}")
+            raise NotFound(f"Blob not found: {blob_name}")
+
+        if window_seconds is None:
+            window_seconds = app_config.gcs_signed_url_window_seconds if HAS_APP_CONFIG else 0
+
+        if window_seconds > 0:
+            window_start, lifetime = compute_signing_window(expiration_minutes, window_seconds)
+            expires = calendar.timegm(window_start.timetuple()) + lifetime
+        else:
+            expires = int(time.time()) + min(expiration_minutes * 60, MAX_SIGNED_URL_SECONDS)
+
+        query = {"expires": expires, "signature": self._signature(method, blob_name, expires)}
+        if method.upper() != "GET":
+            query["method"] = method.upper()
+
+        return f"{self.base_url}/storage/{quote(self.bucket_name)}/{quote(blob_name)}?{urlencode(query)}"
+
+    def verify_signature(
+        self,
+        blob_name: str,
+        expires: int | str,
+        signature: str,
+        method: str = "GET",
+    ) -> bool:
+        """
+        Check a signed URL's signature and expiry.
+
+        Args:
+            blob_name: Name/path of the blob from the URL
+            expires: "expires" query parameter
+            signature: "signature" query parameter
+            method: HTTP method the URL was signed for
+
+        Returns:
+            True if the signature is valid and has not expired
+        """
+        try:
+            expires = int(expires)
+        except (TypeError, ValueError):
+            return False
+
+        if expires < time.time():
+            return False
+
+        expected = self._signature(method, blob_name, expires)
+        return hmac.compare_digest(expected, signature or "")
+
+    def delete_file(self, blob_name: str) -> bool:
+        """
+        Delete an object and its metadata.
+
+        Args:
+            blob_name: Name/path of the blob to delete
+
+        Returns:
+            True if deleted, False if the object didn't exist
+        """
+        path = self.object_path(blob_name)
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            logger.warning(f"Blob not found for deletion: {blob_name}")
+            return False
+
+        self._metadata_path(blob_name).unlink(missing_ok=True)
+
+        # Drop now-empty directories up to the bucket root
+        for parent in path.parents:
+            if parent == self.bucket_root:
+                break
+            try:
+                parent.rmdir()
+            except OSError:
+                break
+
+        logger.info(f"Deleted blob: {blob_name}")
+        return True
+
+    def get_file_metadata(self, blob_name: str) -> Dict[str, Any]:
+        """
+        Get metadata for an object.
+
+        Args:
+            blob_name: Name/path of the blob
+
+        Returns:
+            Dictionary with the same keys as GCSClient.get_file_metadata
+
+        Raises:
+            NotFound: If the object doesn't exist
+        """
+        resource = self._load_resource(blob_name)
+        return {
+            "name": blob_name,
+            "size": resource["size"],
+            "content_type": resource.get("content_type"),
+            "created": _isoformat(resource.get("created")),
+            "updated": _isoformat(resource.get("updated")),
+            "md5_hash": resource.get("md5_hash"),
+            "crc32c": resource.get("crc32c"),
+            "generation": resource.get("generation"),
+            "metageneration": 1,
+            "custom_metadata": resource.get("metadata") or {},
+        }
+
+    def _list_names(self, prefix: str) -> list:
+        """Object names under a prefix in lexicographic order."""
+        names = []
+        for dirpath, _, filenames in os.walk(self.bucket_root):
+            for filename in filenames:
+                if filename.startswith(".upload-"):
+                    continue
+                name = Path(dirpath, filename).relative_to(self.bucket_root).as_posix()
+                if name.startswith(prefix):
+                    names.append(name)
+        return sorted(names)
+
+    def iter_file_pages(
+        self,
+        prefix: Optional[str] = None,
+        delimiter: Optional[str] = None,
+        page_size: int = 1000,
+        page_token: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        max_results: Optional[int] = None,
+    ) -> Iterator[ListPage]:
+        """
+        List objects one page at a time.
+
+        Page tokens are the last name on the previous page, so a listing can
+        be resumed after objects have been added or removed. Metadata is
+        only read for the page being yielded.
+
+        Args:
+            prefix: Filter to files with this prefix (e.g., "audio/")
+            delimiter: Directory delimiter (e.g., "/" for directory-like listing);
+                prefixes are reported on the first page
+            page_size: Number of objects per page
+            page_token: Resume token from a previous ListPage.next_page_token
+            fields: Keys to return for each object (see LISTING_FIELDS)
+            max_results: Stop after this many objects in total
+
+        Yields:
+            ListPage objects in listing order
+
+        Raises:
+            ValueError: If an unknown field is requested
+        """
+        fields = validate_listing_fields(fields)
+        prefix = prefix or ""
+
+        names = [name for name in self._list_names(prefix) if page_token is None or name > page_token]
+
+        prefixes = set()
+        if delimiter:
+            objects = []
+            for name in names:
+                cut = name.find(delimiter, len(prefix))
+                if cut == -1:
+                    objects.append(name)
+                else:
+                    prefixes.add(name[:cut + len(delimiter)])
+            names = objects
+
+        if max_results is not None:
+            names = names[:max_results]
+
+        chunks = [names[i:i + page_size] for i in range(0, len(names), page_size)] or [[]]
+        for index, chunk in enumerate(chunks):
+            is_last = index == len(chunks) - 1
+            items = []
+            for name in chunk:
+                metadata = self.get_file_metadata(name)
+                items.append({key: metadata[key] for key in fields})
+            yield ListPage(
+                items=items,
+                next_page_token=None if is_last else chunk[-1],
+                prefixes=sorted(prefixes) if index == 0 else [],
+            )
+
+    def file_exists(self, blob_name: str) -> bool:
+        """
+        Check if an object exists.
+
+        Args:
+            blob_name: Name/path of the blob
+
+        Returns:
+            True if exists, False otherwise
+        """
+        try:
+            return self.object_path(blob_name).is_file()
+        except ValueError:
+            return False
+
+
+def _isoformat(timestamp: Optional[float]) -> Optional[str]:
+    """Format a UNIX timestamp the way GCSClient formats blob times."""
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
@@ -16,6 +16,9 @@ from pathlib import Path
 from typing import Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 
+from src.storage.backend import StorageBackend, get_storage_backend_name
+from src.storage.gcs_client import GCSClient
+from src.storage.local_backend import LocalStorageBackend
 from src.storage.retry import with_retry, RetryConfig, CONSERVATIVE_CONFIG
 
 logger = logging.getLogger(__name__)
@@ -266,6 +269,7 @@ class AudioStorageManager:
         project_id: Optional[str] = None,
         credentials_path: Optional[str] = None,
         retry_config: Optional[RetryConfig] = None,
+        backend: Optional[StorageBackend] = None,
     ):
         """
         Initialize the audio storage manager.
@@ -275,15 +279,19 @@ class AudioStorageManager:
             project_id: GCP project ID
             credentials_path: Path to service account credentials
             retry_config: Custom retry configuration (uses CONSERVATIVE_CONFIG if not provided)
+            backend: Storage backend to upload to (defaults to the backend
+                selected by config storage_backend)
         """
-        # Import here to avoid circular dependency
-        from src.storage.gcs_client import GCSClient
-        
-        self.gcs_client = GCSClient(
-            bucket_name=bucket_name,
-            project_id=project_id,
-            credentials_path=credentials_path,
-        )
+        if backend is not None:
+            self.gcs_client = backend
+        elif get_storage_backend_name() == "local":
+            self.gcs_client = LocalStorageBackend(bucket_name=bucket_name)
+        else:
+            self.gcs_client = GCSClient(
+                bucket_name=bucket_name,
+                project_id=project_id,
+                credentials_path=credentials_path,
+            )
         
         self.filename_generator = FilenameGenerator()
         self.file_organizer = FileOrganizer()
@@ -294,6 +302,11 @@ class AudioStorageManager:
             f"with retry config (max_attempts={self.retry_config.max_attempts})"
         )
     
+    @property
+    def backend(self) -> StorageBackend:
+        """Storage backend files are uploaded to (also available as gcs_client)."""
+        return self.gcs_client
+    
     def _upload_file_with_retry(
         self,
         source_path: Path,
@@ -316,7 +329,7 @@ class AudioStorageManager:
             Uploaded blob object
         """
         # Create a wrapped upload function with retry logic
-        @with_retry(config=self.retry_config, operation_name=operation_name)
+        @with_retry(config=self.retry_config, operation_name=operation_name, dependency="gcs")
         def _do_upload():
             return self.gcs_client.upload_file(
                 source_path=source_path,
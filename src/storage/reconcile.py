@@ -0,0 +1,248 @@
+"""
+Orphan blob reconciliation.
+
+process_audio_complete uploads audio and artwork under audio/{id}/ before
+it writes the audio_tracks row, so a failure in the database stage leaves
+blobs that no track references. OrphanReconciler streams the bucket
+listing, diffs the audio ids it finds against audio_tracks one bounded
+batch at a time, and deletes the orphans in rate-limited batch requests.
+
+Run it with:
+    python -m database.cli reconcile-storage            # dry run
+    python -m database.cli reconcile-storage --apply    # delete orphans
+"""
+
+import logging
+import time
+import uuid
+from dataclasses import dataclass, field, asdict
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List, Callable, Set
+
+from .backend import StorageBackend, create_storage_backend
+
+logger = logging.getLogger(__name__)
+
+# Prefix under which process_audio_complete stores track files
+AUDIO_PREFIX = "audio/"
+
+# Orphan blob names kept in the report for inspection
+MAX_REPORTED_ORPHANS = 100
+
+
+def extract_audio_id(blob_name: str, prefix: str = AUDIO_PREFIX) -> Optional[str]:
+    """
+    Extract the track id from a blob name of the form {prefix}{id}/{file}.
+
+    Args:
+        blob_name: Name/path of the blob
+        prefix: Listing prefix the id follows
+
+    Returns:
+        Canonical UUID string, or None if the name doesn't follow the layout
+    """
+    if not blob_name.startswith(prefix):
+        return None
+
+    audio_id, sep, _ = blob_name[len(prefix):].partition("/")
+    if not sep:
+        return None
+
+    try:
+        return str(uuid.UUID(audio_id))
+    except ValueError:
+        return None
+
+
+@dataclass
+class ReconcileReport:
+    """Outcome of a reconciliation run."""
+    dry_run: bool
+    scanned_blobs: int = 0
+    checked_ids: int = 0
+    orphan_ids: int = 0
+    orphan_blobs: int = 0
+    deleted_blobs: int = 0
+    failed_blobs: int = 0
+    skipped_recent_ids: int = 0
+    unrecognized_blobs: int = 0
+    duration_seconds: float = 0.0
+    sample_orphans: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the report to a dictionary."""
+        return asdict(self)
+
+
+class OrphanReconciler:
+    """
+    Find and delete blobs whose track id has no row in audio_tracks.
+
+    Memory stays bounded: the listing is consumed lazily, and only the blob
+    names of the current batch of ids are held. Ids are contiguous in the
+    lexicographic listing, so every blob of an id lands in the same batch.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[StorageBackend] = None,
+        id_lookup: Optional[Callable[[List[str]], Set[str]]] = None,
+        batch_size: int = 500,
+        delete_batch_size: int = 100,
+        max_deletes_per_second: float = 50.0,
+        min_age_seconds: float = 3600.0,
+        page_size: int = 1000,
+        dry_run: bool = True,
+    ):
+        """
+        Initialize the reconciler.
+
+        Args:
+            backend: Storage backend to scan (defaults to the configured backend)
+            id_lookup: Callable returning which of a list of ids exist
+                (defaults to database.get_existing_track_ids)
+            batch_size: Distinct track ids diffed against the database per query
+            delete_batch_size: Blobs per delete batch request
+            max_deletes_per_second: Upper bound on the delete rate (0 disables)
+            min_age_seconds: Leave ids alone if any blob is younger than this,
+                so uploads still waiting for their database row are not removed
+            page_size: Blobs per listing page
+            dry_run: Report orphans without deleting them
+        """
+        if id_lookup is None:
+            from database import get_existing_track_ids
+            id_lookup = get_existing_track_ids
+
+        self.backend = backend or create_storage_backend()
+        self.id_lookup = id_lookup
+        self.batch_size = batch_size
+        self.delete_batch_size = delete_batch_size
+        self.max_deletes_per_second = max_deletes_per_second
+        self.min_age_seconds = min_age_seconds
+        self.page_size = page_size
+        self.dry_run = dry_run
+
+        self._next_delete_at = 0.0
+
+    def run(self, prefix: str = AUDIO_PREFIX) -> ReconcileReport:
+        """
+        Scan the bucket and reconcile it against the database.
+
+        Args:
+            prefix: Listing prefix holding per-track directories
+
+        Returns:
+            ReconcileReport with counts and a sample of orphan blob names
+        """
+        started = time.monotonic()
+        report = ReconcileReport(dry_run=self.dry_run)
+        cutoff = datetime.now(timezone.utc).timestamp() - self.min_age_seconds
+
+        pending: Dict[str, List[str]] = {}
+        recent: Set[str] = set()
+
+        logger.info(
+            f"Reconciling gs://{self.backend.bucket_name}/{prefix} against audio_tracks "
+            f"({'dry run' if self.dry_run else 'deleting orphans'})"
+        )
+
+        for item in self.backend.iter_files(
+            prefix=prefix, page_size=self.page_size, fields=("name", "created")
+        ):
+            report.scanned_blobs += 1
+            audio_id = extract_audio_id(item["name"], prefix)
+            if audio_id is None:
+                report.unrecognized_blobs += 1
+                continue
+
+            if audio_id not in pending and len(pending) >= self.batch_size:
+                self._reconcile_batch(pending, recent, report)
+                pending, recent = {}, set()
+
+            pending.setdefault(audio_id, []).append(item["name"])
+            if _is_recent(item.get("created"), cutoff):
+                recent.add(audio_id)
+
+        if pending:
+            self._reconcile_batch(pending, recent, report)
+
+        report.duration_seconds = round(time.monotonic() - started, 3)
+        logger.info(
+            f"Reconciliation finished: scanned {report.scanned_blobs} blobs, "
+            f"{report.orphan_ids} orphan ids ({report.orphan_blobs} blobs), "
+            f"deleted {report.deleted_blobs}, failed {report.failed_blobs}"
+        )
+        return report
+
+    def _reconcile_batch(
+        self,
+        pending: Dict[str, List[str]],
+        recent: Set[str],
+        report: ReconcileReport,
+    ) -> None:
+        """Diff one batch of ids against the database and delete the orphans."""
+        ids = list(pending)
+        existing = self.id_lookup(ids)
+        report.checked_ids += len(ids)
+
+        orphans = [audio_id for audio_id in ids if audio_id not in existing]
+        skipped = [audio_id for audio_id in orphans if audio_id in recent]
+        report.skipped_recent_ids += len(skipped)
+
+        orphan_blobs = [name for audio_id in orphans if audio_id not in recent for name in pending[audio_id]]
+        report.orphan_ids += len(orphans) - len(skipped)
+        report.orphan_blobs += len(orphan_blobs)
+
+        room = MAX_REPORTED_ORPHANS - len(report.sample_orphans)
+        if room > 0:
+            report.sample_orphans.extend(orphan_blobs[:room])
+
+        if self.dry_run or not orphan_blobs:
+            return
+
+        for start in range(0, len(orphan_blobs), self.delete_batch_size):
+            chunk = orphan_blobs[start:start + self.delete_batch_size]
+            self._throttle(len(chunk))
+            failed = self.backend.delete_files(chunk)
+            report.deleted_blobs += len(chunk) - len(failed)
+            report.failed_blobs += len(failed)
+
+    def _throttle(self, count: int) -> None:
+        """Sleep as needed to keep deletes under max_deletes_per_second."""
+        if self.max_deletes_per_second <= 0:
+            return
+
+        now = time.monotonic()
+        if self._next_delete_at > now:
+            time.sleep(self._next_delete_at - now)
+            now = self._next_delete_at
+        self._next_delete_at = now + count / self.max_deletes_per_second
+
+
+def _is_recent(created: Optional[str], cutoff: float) -> bool:
+    """Whether an isoformat creation time is after the cutoff timestamp."""
+    if not created:
+        return False
+    try:
+        return datetime.fromisoformat(created).timestamp() > cutoff
+    except ValueError:
+        return False
+
+
+def reconcile_storage(
+    dry_run: bool = True,
+    prefix: str = AUDIO_PREFIX,
+    **kwargs,
+) -> ReconcileReport:
+    """
+    Reconcile the configured bucket against audio_tracks.
+
+    Args:
+        dry_run: Report orphans without deleting them
+        prefix: Listing prefix holding per-track directories
+        **kwargs: Further OrphanReconciler options
+
+    Returns:
+        ReconcileReport
+    """
+    return OrphanReconciler(dry_run=dry_run, **kwargs).run(prefix=prefix)
@@ -2,7 +2,10 @@
 Retry utilities for reliable cloud storage operations.
 
 Implements exponential backoff with jitter for handling transient failures
-in cloud services like Google Cloud Storage.
+in cloud services like Google Cloud Storage. When a dependency name is
+given, retries draw from that dependency's shared retry budget and calls
+go through its circuit breaker (see src.circuit_breaker), so callers fail
+fast while the dependency is down.
 """
 
 import time
@@ -12,6 +15,8 @@ from typing import Callable, TypeVar, Any, Optional, Type, Tuple
 from functools import wraps
 from google.cloud.exceptions import GoogleCloudError, TooManyRequests, ServiceUnavailable
 
+from src.circuit_breaker import get_circuit_breaker, get_retry_budget
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
@@ -89,6 +94,7 @@ class RetryConfig:
 def with_retry(
     config: Optional[RetryConfig] = None,
     operation_name: Optional[str] = None,
+    dependency: Optional[str] = None,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """
     Decorator to add retry logic with exponential backoff to a function.
@@ -96,68 +102,27 @@ def with_retry(
     Args:
         config: RetryConfig object (uses defaults if not provided)
         operation_name: Name of operation for logging (uses function name if not provided)
+        dependency: Dependency name (e.g. "gcs") whose retry budget and circuit
+            breaker guard the calls; None retries without shared guards
     
     Returns:
         Decorated function with retry logic
         
     Example:
-        >>> @with_retry(RetryConfig(max_attempts=5))
+        >>> @with_retry(RetryConfig(max_attempts=5), dependency="gcs")
         ... def upload_file(path):
         ...     # Upload logic here
         ...     pass
     """
-    if config is None:
-        config = RetryConfig()
-    
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
-            op_name = operation_name or func.__name__
-            last_exception: Optional[Exception] = None
-            
-            for attempt in range(config.max_attempts):
-                try:
-                    # Attempt the operation
-                    result = func(*args, **kwargs)
-                    
-                    # Log success if this wasn't the first attempt
-                    if attempt > 0:
-                        logger.info(
-                            f"{op_name} succeeded on attempt {attempt + 1}/{config.max_attempts}"
-                        )
-                    
-                    return result
-                    
-                except config.retryable_exceptions as e:
-                    last_exception = e
-                    is_last_attempt = (attempt == config.max_attempts - 1)
-                    
-                    if is_last_attempt:
-                        logger.error(
-                            f"{op_name} failed after {config.max_attempts} attempts: {e}"
-                        )
-                        raise
-                    
-                    # Calculate delay for next retry
-                    delay = config.calculate_delay(attempt)
-                    
-                    logger.warning(
-                        f"{op_name} failed (attempt {attempt + 1}/{config.max_attempts}): {e}. "
-                        f"Retrying in {delay:.2f}s..."
-                    )
-                    
-                    # Sleep before retry
-                    time.sleep(delay)
-                    
-                except Exception as e:
-                    # Non-retryable exception, fail immediately
-                    logger.error(f"{op_name} failed with non-retryable error: {e}")
-                    raise
-            
-            # This should never be reached, but satisfy type checker
-            if last_exception:
-                raise last_exception
-            raise RuntimeError(f"{op_name} failed without exception")
+            return retry_operation(
+                lambda: func(*args, **kwargs),
+                config=config,
+                operation_name=operation_name or func.__name__,
+                dependency=dependency,
+            )
         
         return wrapper
     return decorator
@@ -167,6 +132,7 @@ def retry_operation(
     operation: Callable[[], T],
     config: Optional[RetryConfig] = None,
     operation_name: str = "operation",
+    dependency: Optional[str] = None,
 ) -> T:
     """
     Execute an operation with retry logic (functional approach).
@@ -174,33 +140,49 @@ def retry_operation(
     This is an alternative to the decorator for cases where you can't
     decorate the function directly.
     
+    With a dependency name, each attempt first checks the dependency's
+    circuit breaker (raising CircuitOpenError while it is open), retryable
+    failures are recorded against the breaker, and each retry must take a
+    token from the dependency's shared retry budget. An exhausted budget
+    surfaces the failure immediately instead of sleeping.
+    
     Args:
         operation: Callable to execute (takes no arguments)
         config: RetryConfig object (uses defaults if not provided)
         operation_name: Name of operation for logging
+        dependency: Dependency name guarding the calls (None = no shared guards)
     
     Returns:
         Result from successful operation
         
     Raises:
-        Last exception if all retries failed
+        CircuitOpenError: If the dependency's circuit is open
+        Last exception if all retries failed or the retry budget ran out
         
     Example:
         >>> result = retry_operation(
         ...     lambda: upload_to_gcs(file_path),
         ...     RetryConfig(max_attempts=5),
-        ...     "file_upload"
+        ...     "file_upload",
+        ...     dependency="gcs",
         ... )
     """
     if config is None:
         config = RetryConfig()
     
+    breaker = get_circuit_breaker(dependency) if dependency else None
+    budget = get_retry_budget(dependency) if dependency else None
     last_exception: Optional[Exception] = None
     
     for attempt in range(config.max_attempts):
+        probe = breaker.before_call() if breaker else False
+        
         try:
             result = operation()
             
+            if breaker:
+                breaker.record_success()
+            
             if attempt > 0:
                 logger.info(
                     f"{operation_name} succeeded on attempt {attempt + 1}/{config.max_attempts}"
@@ -212,12 +194,22 @@ def retry_operation(
             last_exception = e
             is_last_attempt = (attempt == config.max_attempts - 1)
             
+            if breaker:
+                breaker.record_failure()
+            
             if is_last_attempt:
                 logger.error(
                     f"{operation_name} failed after {config.max_attempts} attempts: {e}"
                 )
                 raise
             
+            if budget and not budget.try_acquire():
+                logger.error(
+                    f"{operation_name} failed (attempt {attempt + 1}/{config.max_attempts}): {e}. "
+                    f"Retry budget for {dependency} exhausted; not retrying"
+                )
+                raise
+            
             delay = config.calculate_delay(attempt)
             
             logger.warning(
@@ -228,8 +220,16 @@ def retry_operation(
             time.sleep(delay)
             
         except Exception as e:
+            # The dependency answered; the failure is not a sign of an outage
+            if breaker:
+                breaker.record_success()
             logger.error(f"{operation_name} failed with non-retryable error: {e}")
             raise
+            
+        finally:
+            # Interrupted (KeyboardInterrupt, cancellation) without an outcome
+            if probe:
+                breaker.release_probe()
     
     if last_exception:
         raise last_exception
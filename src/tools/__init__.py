@@ -8,9 +8,12 @@ This module provides MCP tool implementations for audio processing and query wor
 from .process_audio import process_audio_complete, ProcessAudioError
 
 # Task 8: Query/retrieval tools
-from .query_tools import get_audio_metadata, search_library
+from .query_tools import get_audio_metadata, search_library, suggest
 from .query_schemas import QueryException
 
+# Delete tools
+from .delete_tools import delete_audio, delete_audio_batch
+
 __all__ = [
     # Task 7
     "process_audio_complete",
@@ -18,5 +21,9 @@ __all__ = [
     # Task 8
     "get_audio_metadata",
     "search_library",
+    "suggest",
     "QueryException",
+    # Delete tools
+    "delete_audio",
+    "delete_audio_batch",
 ]
@@ -0,0 +1,104 @@
+"""
+Pydantic schemas for the delete_audio and delete_audio_batch MCP tools.
+
+Errors are reported with the query tools' QueryError/QueryException so all
+library tools share one error contract.
+"""
+
+from typing import List, Literal
+from pydantic import BaseModel, Field, field_validator
+import uuid
+
+
+# Maximum track ids accepted by a single delete_audio_batch call
+MAX_BATCH_DELETE = 10000
+
+
+# ============================================================================
+# Input Schemas
+# ============================================================================
+
+class DeleteAudioInput(BaseModel):
+    """
+    Input schema for delete_audio tool.
+
+    Example:
+        {
+            "audioId": "550e8400-e29b-41d4-a716-446655440000"
+        }
+    """
+    audioId: str = Field(
+        ...,
+        description="UUID of the audio track to delete",
+        min_length=36,
+        max_length=36
+    )
+
+    @field_validator('audioId')
+    @classmethod
+    def validate_uuid_format(cls, v):
+        """Ensure audioId is a valid UUID and normalize it"""
+        try:
+            return str(uuid.UUID(v))
+        except ValueError:
+            raise ValueError("audioId must be a valid UUID format")
+
+
+class DeleteAudioBatchInput(BaseModel):
+    """
+    Input schema for delete_audio_batch tool.
+
+    Example:
+        {
+            "audioIds": [
+                "550e8400-e29b-41d4-a716-446655440000",
+                "660e8400-e29b-41d4-a716-446655440001"
+            ]
+        }
+    """
+    audioIds: List[str] = Field(
+        ...,
+        description=f"UUIDs of the audio tracks to delete (max: {MAX_BATCH_DELETE})",
+        min_length=1,
+        max_length=MAX_BATCH_DELETE
+    )
+
+    @field_validator('audioIds')
+    @classmethod
+    def validate_uuid_formats(cls, v):
+        """Ensure every id is a valid UUID; normalize and drop duplicates"""
+        normalized = []
+        for audio_id in v:
+            try:
+                normalized.append(str(uuid.UUID(audio_id)))
+            except ValueError:
+                raise ValueError(f"audioIds contains an invalid UUID: {audio_id}")
+        return list(dict.fromkeys(normalized))
+
+
+# ============================================================================
+# Output Schemas
+# ============================================================================
+
+class StorageCleanup(BaseModel):
+    """Outcome of deleting the stored files of deleted tracks"""
+    deletedFiles: int = Field(ge=0, description="Files removed from storage")
+    failedFiles: List[str] = Field(
+        default_factory=list,
+        description="gs:// paths that could not be removed (left for reconcile-storage)"
+    )
+
+
+class DeleteAudioOutput(BaseModel):
+    """Success output for delete_audio tool."""
+    success: Literal[True] = Field(description="Operation success indicator")
+    audioId: str = Field(description="UUID of the deleted audio track")
+    storage: StorageCleanup = Field(description="Storage cleanup outcome")
+
+
+class DeleteAudioBatchOutput(BaseModel):
+    """Success output for delete_audio_batch tool."""
+    success: Literal[True] = Field(description="Operation success indicator")
+    deleted: List[str] = Field(description="UUIDs of the deleted audio tracks")
+    notFound: List[str] = Field(description="Requested UUIDs with no matching track")
+    storage: StorageCleanup = Field(description="Storage cleanup outcome")
@@ -0,0 +1,188 @@
+"""
+Delete tools for Loist Music Library MCP Server.
+
+Implements delete_audio and delete_audio_batch MCP tools. Deletion is
+database-first: rows are removed with batched DELETE ... RETURNING
+statements, then the audio and artwork files they referenced are removed
+with batched storage deletes and their signed URLs are dropped from the
+cache. Files that cannot be removed are reported and left for the
+reconcile-storage job, which removes blobs no track references.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Any, List, Tuple
+
+from .delete_schemas import (
+    DeleteAudioInput,
+    DeleteAudioOutput,
+    DeleteAudioBatchInput,
+    DeleteAudioBatchOutput,
+    StorageCleanup,
+)
+from .query_schemas import QueryException, QueryErrorCode
+
+from database import delete_audio_tracks
+from src.storage import delete_gcs_paths
+from src.resources.cache import get_cache
+from src.exceptions import DatabaseOperationError
+
+logger = logging.getLogger(__name__)
+
+
+# ============================================================================
+# Helper Functions
+# ============================================================================
+
+async def delete_tracks(audio_ids: List[str]) -> Tuple[List[str], StorageCleanup]:
+    """
+    Delete tracks and clean up their stored files and cached signed URLs.
+
+    Args:
+        audio_ids: Normalized track UUIDs
+
+    Returns:
+        Tuple of (deleted track ids, storage cleanup outcome)
+
+    Raises:
+        QueryException: If the database delete fails
+    """
+    try:
+        rows = await asyncio.to_thread(delete_audio_tracks, audio_ids)
+    except DatabaseOperationError as e:
+        logger.error(f"Database error deleting tracks: {e}")
+        raise QueryException(
+            error_code=QueryErrorCode.DATABASE_ERROR,
+            message=f"Failed to delete tracks: {str(e)}",
+            details={"requested": len(audio_ids)}
+        )
+
+    gcs_paths = [
+        path
+        for row in rows
+        for path in (row.get("audio_gcs_path"), row.get("thumbnail_gcs_path"))
+        if path
+    ]
+
+    # Drop cached URLs first so no new links are handed out for the files
+    get_cache().invalidate_many(gcs_paths)
+
+    try:
+        failed = await asyncio.to_thread(delete_gcs_paths, gcs_paths)
+    except Exception as e:
+        # Rows are already gone; leftover files are cleaned up by reconcile-storage
+        logger.error(f"Storage cleanup failed for {len(gcs_paths)} files: {e}")
+        failed = gcs_paths
+
+    cleanup = StorageCleanup(deletedFiles=len(gcs_paths) - len(failed), failedFiles=failed)
+    return [row["id"] for row in rows], cleanup
+
+
+def _error_response(e: Exception) -> Dict[str, Any]:
+    """Convert an exception to a QueryError response dictionary."""
+    if not isinstance(e, QueryException):
+        logger.exception(f"Unexpected error deleting audio: {e}")
+        e = QueryException(
+            error_code=QueryErrorCode.DATABASE_ERROR,
+            message=f"Unexpected error: {str(e)}",
+            details={"exception_type": type(e).__name__}
+        )
+    else:
+        logger.error(f"Delete error: {e.message}")
+    return e.to_error_response().model_dump()
+
+
+# ============================================================================
+# Main Tool Functions
+# ============================================================================
+
+async def delete_audio(input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Delete a processed audio track and its stored files.
+
+    Args:
+        input_data: Dictionary containing audioId
+
+    Returns:
+        Dictionary with success status and storage cleanup, or error response
+
+    Example:
+        >>> result = await delete_audio({"audioId": "550e8400-..."})
+        >>> print(result["storage"]["deletedFiles"])
+        2
+    """
+    try:
+        try:
+            validated_input = DeleteAudioInput(**input_data)
+        except Exception as e:
+            raise QueryException(
+                error_code=QueryErrorCode.INVALID_QUERY,
+                message=f"Invalid input: {str(e)}",
+                details={"validation_errors": str(e)}
+            )
+
+        audio_id = validated_input.audioId
+        deleted, cleanup = await delete_tracks([audio_id])
+
+        if not deleted:
+            raise QueryException(
+                error_code=QueryErrorCode.RESOURCE_NOT_FOUND,
+                message=f"Audio track with ID '{audio_id}' was not found",
+                details={"audioId": audio_id}
+            )
+
+        logger.info(f"Deleted audio track {audio_id} ({cleanup.deletedFiles} files)")
+        return DeleteAudioOutput(success=True, audioId=audio_id, storage=cleanup).model_dump()
+
+    except Exception as e:
+        return _error_response(e)
+
+
+async def delete_audio_batch(input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Delete many audio tracks and their stored files.
+
+    Rows are deleted in batches of database.operations.DELETE_BATCH_SIZE and
+    files in storage batch requests, so bulk cleanups of thousands of tracks
+    take a handful of round trips.
+
+    Args:
+        input_data: Dictionary containing audioIds
+
+    Returns:
+        Dictionary with deleted and not-found ids and storage cleanup, or error response
+
+    Example:
+        >>> result = await delete_audio_batch({"audioIds": ["550e8400-...", "660e8400-..."]})
+        >>> print(result["deleted"], result["notFound"])
+    """
+    start_time = time.time()
+
+    try:
+        try:
+            validated_input = DeleteAudioBatchInput(**input_data)
+        except Exception as e:
+            raise QueryException(
+                error_code=QueryErrorCode.INVALID_QUERY,
+                message=f"Invalid input: {str(e)}",
+                details={"validation_errors": str(e)}
+            )
+
+        audio_ids = validated_input.audioIds
+        deleted, cleanup = await delete_tracks(audio_ids)
+        deleted_set = set(deleted)
+
+        logger.info(
+            f"Deleted {len(deleted)}/{len(audio_ids)} audio tracks and "
+            f"{cleanup.deletedFiles} files in {time.time() - start_time:.3f}s"
+        )
+        return DeleteAudioBatchOutput(
+            success=True,
+            deleted=deleted,
+            notFound=[audio_id for audio_id in audio_ids if audio_id not in deleted_set],
+            storage=cleanup,
+        ).model_dump()
+
+    except Exception as e:
+        return _error_response(e)
@@ -116,6 +116,7 @@ class ProcessingPipeline:
         self.audio_id: Optional[str] = None
         self.temp_audio_path: Optional[str] = None
         self.temp_artwork_path: Optional[str] = None
+        self.audio_checksums: Dict[str, str] = {}  # Computed while downloading
         self.gcs_audio_path: Optional[str] = None
         self.gcs_artwork_path: Optional[str] = None
         self.db_committed: bool = False
@@ -236,7 +237,8 @@ async def process_audio_complete(input_data: Dict[str, Any]) -> Dict[str, Any]:
                 url=str(source.url),
                 headers=source.headers,
                 max_size_mb=options.maxSizeMB,
-                timeout_seconds=options.timeout
+                timeout_seconds=options.timeout,
+                checksums=pipeline.audio_checksums,
             )
             
             logger.info(f"Downloaded audio to: {pipeline.temp_audio_path}")
@@ -346,10 +348,12 @@ async def process_audio_complete(input_data: Dict[str, Any]) -> Dict[str, Any]:
             # Determine filename
             filename = source.filename or f"{pipeline.audio_id}.{metadata_dict.get('format', 'mp3').lower()}"
             
-            # Upload audio file
+            # Upload audio file; download checksums let GCS verify it end to end
             audio_blob = upload_audio_file(
                 source_path=pipeline.temp_audio_path,
-                destination_blob_name=f"audio/{pipeline.audio_id}/{filename}"
+                destination_blob_name=f"audio/{pipeline.audio_id}/{filename}",
+                crc32c=pipeline.audio_checksums.get("crc32c"),
+                md5_hash=pipeline.audio_checksums.get("md5_hash"),
             )
             # Construct full GCS path (gs://bucket/path) for database storage
             pipeline.gcs_audio_path = f"gs://{audio_blob.bucket.name}/{audio_blob.name}"
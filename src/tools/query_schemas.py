@@ -41,6 +41,21 @@ class SortOrder(str, Enum):
     DESC = "desc"
 
 
+class SuggestField(str, Enum):
+    """Fields the suggest tool can complete"""
+    ARTIST = "artist"
+    TITLE = "title"
+    ALBUM = "album"
+
+
+class FacetField(str, Enum):
+    """Facets that can be counted over search matches"""
+    GENRE = "genre"
+    DECADE = "decade"
+    FORMAT = "format"
+    DURATION = "duration"
+
+
 # ============================================================================
 # Input Schemas - get_audio_metadata
 # ============================================================================
@@ -203,6 +218,19 @@ class SearchLibraryInput(BaseModel):
         default=SortOrder.DESC,
         description="Sort order (asc or desc)"
     )
+    includeTotal: bool = Field(
+        default=True,
+        description="Whether to count all matches (false skips counting; hasMore is still returned)"
+    )
+    cursor: Optional[str] = Field(
+        default=None,
+        max_length=1000,
+        description="nextCursor from the previous page; pages in constant time (use instead of offset)"
+    )
+    facets: Optional[List[FacetField]] = Field(
+        default=None,
+        description="Facets to count over all matches (genre, decade, format, duration)"
+    )
 
     @field_validator('query')
     @classmethod
@@ -231,6 +259,13 @@ class SearchLibraryInput(BaseModel):
             raise ValueError("offset cannot exceed 10000 (use cursor-based pagination for deep results)")
         return v
 
+    @model_validator(mode='after')
+    def validate_cursor_or_offset(self):
+        """A cursor already encodes the position; it cannot be combined with offset"""
+        if self.cursor and self.offset:
+            raise ValueError("Use either cursor or offset, not both")
+        return self
+
     model_config = {
         "json_schema_extra": {
             "examples": [
@@ -256,6 +291,50 @@ class SearchLibraryInput(BaseModel):
     }
 
 
+# ============================================================================
+# Input Schemas - suggest
+# ============================================================================
+
+class SuggestInput(BaseModel):
+    """
+    Input schema for suggest tool.
+    
+    Completes a typed prefix from artist, title and album values.
+    
+    Example:
+        {
+            "prefix": "beat",
+            "limit": 5,
+            "fields": ["artist"]
+        }
+    """
+    prefix: str = Field(
+        ...,
+        description="Typed prefix (case-insensitive, matched at the start of the value)",
+        min_length=1,
+        max_length=100
+    )
+    limit: int = Field(
+        default=10,
+        ge=1,
+        le=20,
+        description="Maximum number of suggestions (max: 20)"
+    )
+    fields: Optional[List[SuggestField]] = Field(
+        default=None,
+        description="Fields to complete (default: artist, title and album)"
+    )
+
+    @field_validator('prefix')
+    @classmethod
+    def sanitize_prefix(cls, v):
+        """Remove control characters; the prefix must not be blank"""
+        v = ''.join(char for char in v if ord(char) >= 32).strip()
+        if not v:
+            raise ValueError("Prefix cannot be empty after sanitization")
+        return v
+
+
 # ============================================================================
 # Output Schemas - Shared Components
 # ============================================================================
@@ -320,6 +399,20 @@ class SearchResult(BaseModel):
     )
 
 
+class FacetCount(BaseModel):
+    """Number of matching tracks with one facet value"""
+    value: str = Field(description="Facet value, e.g. \"Rock\", \"1970s\", \"FLAC\" or \"120-240s\"")
+    count: int = Field(ge=0, description="Number of matching tracks with this value")
+    min: Optional[int] = Field(
+        default=None,
+        description="Lower bound of a decade (year) or duration (seconds) bucket"
+    )
+    max: Optional[int] = Field(
+        default=None,
+        description="Upper bound of a decade (year) or duration (seconds) bucket; null if open-ended"
+    )
+
+
 class SearchLibraryOutput(BaseModel):
     """
     Success output for search_library tool.
@@ -330,15 +423,28 @@ class SearchLibraryOutput(BaseModel):
     results: List[SearchResult] = Field(
         description="List of matching audio tracks with relevance scores"
     )
-    total: int = Field(
+    total: Optional[int] = Field(
+        default=None,
         ge=0,
-        description="Total number of matching results (may be more than returned)"
+        description="Total number of matching results (may be more than returned); null when includeTotal is false"
     )
     limit: int = Field(description="Number of results requested")
     offset: int = Field(description="Number of results skipped")
     hasMore: bool = Field(
         description="Whether more results are available"
     )
+    nextCursor: Optional[str] = Field(
+        default=None,
+        description="Cursor for the next page (pass as cursor); null on the last page"
+    )
+    fuzzy: bool = Field(
+        default=False,
+        description="True when full-text search found nothing and results come from typo-tolerant matching"
+    )
+    facets: Optional[Dict[str, List[FacetCount]]] = Field(
+        default=None,
+        description="Counts per requested facet over all matches, most frequent first"
+    )
 
     model_config = {
         "json_schema_extra": {
@@ -379,6 +485,23 @@ class SearchLibraryOutput(BaseModel):
     }
 
 
+class Suggestion(BaseModel):
+    """One completion of the typed prefix"""
+    field: SuggestField = Field(description="Field the value comes from")
+    value: str = Field(description="Completed value, e.g. an artist name")
+
+
+class SuggestOutput(BaseModel):
+    """
+    Success output for suggest tool.
+    
+    Returns completions ordered shortest (closest to the prefix) first.
+    """
+    success: Literal[True] = Field(description="Operation success indicator")
+    prefix: str = Field(description="Prefix that was completed")
+    suggestions: List[Suggestion] = Field(description="Completions, shortest first")
+
+
 # ============================================================================
 # Error Schemas
 # ============================================================================
@@ -1,8 +1,8 @@
 """
 Query/retrieval tools for Loist Music Library MCP Server.
 
-Implements get_audio_metadata and search_library MCP tools for
-retrieving and searching processed audio tracks.
+Implements get_audio_metadata, search_library and suggest MCP tools for
+retrieving, searching and autocompleting processed audio tracks.
 
 Follows best practices from research:
 - Input validation with Pydantic
@@ -11,8 +11,12 @@ Follows best practices from research:
 - Response caching ready (implement at infrastructure level)
 """
 
+import copy
+import json
 import logging
-from typing import Dict, Any, List
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 import time
 
 from .query_schemas import (
@@ -21,6 +25,8 @@ from .query_schemas import (
     SearchLibraryInput,
     SearchLibraryOutput,
     SearchResult,
+    SuggestInput,
+    SuggestOutput,
     QueryException,
     QueryErrorCode,
 )
@@ -31,16 +37,25 @@ from .schemas import (
     AudioResources,
 )
 
-# Import database operations
-from database import (
+# Import database operations (async: queries never block the event loop)
+from database.async_operations import (
     get_audio_metadata_by_id,
     search_audio_tracks_advanced,
+    fuzzy_search_audio_tracks,
+    suggest_completions,
 )
 from src.exceptions import (
     DatabaseOperationError,
     ResourceNotFoundError,
     ValidationError,
 )
+from database.metadata_cache import get_library_generation, library_changes_tracked
+
+try:
+    from src.config import config as app_config
+    HAS_APP_CONFIG = True
+except ImportError:
+    HAS_APP_CONFIG = False
 
 logger = logging.getLogger(__name__)
 
@@ -111,6 +126,162 @@ def format_resources(audio_id: str, has_thumbnail: bool = False) -> AudioResourc
     )
 
 
+# ============================================================================
+# Search Result Cache
+# ============================================================================
+
+class SearchResultCache:
+    """
+    Bounded LRU + TTL cache of search_library responses.
+    
+    Keyed by the canonical form of SearchLibraryInput (see search_cache_key).
+    Each entry stores the library generation read before its search ran
+    and is only served while the generation is unchanged, so any insert,
+    update or delete of a track (locally or, via NOTIFY, on another
+    replica) expires every cached search at once. Entries are neither
+    served nor stored while changes are not being tracked
+    (database.metadata_cache.library_changes_tracked).
+    
+    Attributes:
+        max_entries: Maximum cached responses before LRU eviction
+        ttl_seconds: Maximum age of a cached response
+    """
+    
+    def __init__(self, max_entries: int = 1000, ttl_seconds: float = 60.0):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: LRU capacity (0 disables caching)
+            ttl_seconds: Seconds a response may be served
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[int, float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: str, generation: int) -> Optional[Dict[str, Any]]:
+        """
+        Return a copy of the cached response, or None on a miss.
+        
+        Args:
+            key: Key from search_cache_key()
+            generation: Current library generation
+        
+        Returns:
+            search_library response dictionary, or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != generation or entry[1] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(entry[2])
+    
+    def put(self, key: str, generation: int, response: Dict[str, Any]) -> None:
+        """
+        Store a response computed under the given library generation.
+        
+        Args:
+            key: Key from search_cache_key()
+            generation: Library generation read before the search ran
+            response: search_library response dictionary
+        """
+        if self.max_entries <= 0:
+            return
+        
+        with self._lock:
+            self._entries[key] = (generation, time.monotonic() + self.ttl_seconds, copy.deepcopy(response))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary with size and hit/miss counts
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "evictions": self.evictions,
+            }
+
+
+def search_cache_key(validated_input: SearchLibraryInput) -> str:
+    """
+    Canonical cache key of a search_library request.
+    
+    Requests that run the same SQL map to the same key: whitespace in
+    the query is collapsed and filter lists are sorted (genres
+    case-folded), mirroring the normalization the search itself applies,
+    so a cached nextCursor is valid for every request sharing the key.
+    
+    Args:
+        validated_input: Validated search_library input
+    
+    Returns:
+        Cache key string
+    """
+    data = validated_input.model_dump(mode="json")
+    data["query"] = " ".join(data["query"].split())
+    
+    filters = data.get("filters") or {}
+    if filters.get("genre"):
+        filters["genre"] = sorted({genre.strip().lower() for genre in filters["genre"]})
+    if filters.get("format"):
+        filters["format"] = sorted(set(filters["format"]))
+    if data.get("facets"):
+        data["facets"] = sorted(set(data["facets"]))
+    
+    return json.dumps(data, sort_keys=True, separators=(",", ":"))
+
+
+# Global cache instance
+_search_cache: Optional[SearchResultCache] = None
+
+
+def get_search_cache() -> SearchResultCache:
+    """
+    Get the global SearchResultCache instance.
+    
+    Returns:
+        SearchResultCache: Global cache instance (sized from configuration)
+    """
+    global _search_cache
+    if _search_cache is None:
+        if HAS_APP_CONFIG:
+            _search_cache = SearchResultCache(
+                max_entries=app_config.search_cache_max_entries if app_config.search_cache_enabled else 0,
+                ttl_seconds=app_config.search_cache_ttl_seconds,
+            )
+        else:
+            _search_cache = SearchResultCache()
+    return _search_cache
+
+
 # ============================================================================
 # Main Tool Functions
 # ============================================================================
@@ -154,7 +325,7 @@ async def get_audio_metadata(input_data: Dict[str, Any]) -> Dict[str, Any]:
         
         # Fetch from database
         try:
-            db_metadata = get_audio_metadata_by_id(audio_id)
+            db_metadata = await get_audio_metadata_by_id(audio_id)
         except ResourceNotFoundError as e:
             logger.warning(f"Audio track not found: {audio_id}")
             raise QueryException(
@@ -215,6 +386,47 @@ async def get_audio_metadata(input_data: Dict[str, Any]) -> Dict[str, Any]:
         return error_response.model_dump()
 
 
+async def _fuzzy_search_fallback(
+    query: str,
+    limit: int,
+    filter_params: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """
+    Run the trigram fallback for a search that found no full-text matches.
+    
+    Fallback failures are logged and treated as "no results": the
+    full-text search itself succeeded, so the caller still gets a valid
+    (empty) response.
+    
+    Args:
+        query: Original search query
+        limit: Maximum results
+        filter_params: Filter arguments used for the full-text search
+    
+    Returns:
+        List of track dictionaries (empty if disabled or nothing matched)
+    """
+    if HAS_APP_CONFIG and not app_config.search_fuzzy_fallback:
+        return []
+    
+    threshold = app_config.search_fuzzy_threshold if HAS_APP_CONFIG else 0.3
+    
+    try:
+        tracks = await fuzzy_search_audio_tracks(
+            query=query,
+            limit=limit,
+            similarity_threshold=threshold,
+            **filter_params
+        )
+    except Exception as e:
+        logger.warning(f"Fuzzy search fallback failed for '{query}': {e}")
+        return []
+    
+    if tracks:
+        logger.info(f"No full-text matches for '{query}'; fuzzy fallback found {len(tracks)}")
+    return tracks
+
+
 async def search_library(input_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Search across all processed audio in the library.
@@ -261,57 +473,72 @@ async def search_library(input_data: Dict[str, Any]) -> Dict[str, Any]:
         offset = validated_input.offset
         sort_by = validated_input.sortBy
         sort_order = validated_input.sortOrder
+        include_total = validated_input.includeTotal
+        cursor = validated_input.cursor
+        facets = [f.value for f in validated_input.facets] if validated_input.facets else None
+        
+        # Serve repeated searches from the cache while the library is unchanged
+        cache = get_search_cache()
+        cache_key = search_cache_key(validated_input)
+        generation = get_library_generation()
+        use_cache = cache.max_entries > 0 and library_changes_tracked()
+        if use_cache:
+            cached = cache.get(cache_key, generation)
+            if cached is not None:
+                logger.debug(f"Search cache hit for '{query}'")
+                return cached
         
         logger.debug(f"Searching for: '{query}' with limit={limit}, offset={offset}")
         
-        # Build filter parameters for database query
-        # Note: search_audio_tracks_advanced currently only supports:
-        # - status_filter, year_min/year_max, format_filter
-        filter_params = {}
+        # Build filter parameters for database query (only completed tracks
+        # are searchable; each filter becomes an indexed SQL predicate)
+        filter_params = {"status_filter": "COMPLETED"}
 
         if filters:
-            # Status filter (only show completed tracks)
-            filter_params["status_filter"] = "COMPLETED"
+            if filters.genre:
+                filter_params["genres"] = filters.genre
 
-            # Year range filter
             if filters.year:
                 if filters.year.min is not None:
                     filter_params["year_min"] = filters.year.min
                 if filters.year.max is not None:
                     filter_params["year_max"] = filters.year.max
 
-            # Format filter (take first format if multiple specified)
-            if filters.format and len(filters.format) > 0:
-                filter_params["format_filter"] = filters.format[0].value
+            if filters.duration:
+                if filters.duration.min is not None:
+                    filter_params["duration_min"] = filters.duration.min
+                if filters.duration.max is not None:
+                    filter_params["duration_max"] = filters.duration.max
 
-            # TODO: Add support for other filters in search_audio_tracks_advanced:
-            # - genre, duration, artist, album filters are not yet implemented
-        else:
-            # Default: only show completed tracks
-            filter_params["status_filter"] = "COMPLETED"
-        
-        # Determine sort field mapping
-        sort_field_map = {
-            "relevance": "score",  # Default from search
-            "title": "title",
-            "artist": "artist",
-            "year": "year",
-            "duration": "duration",
-            "created_at": "created_at"
-        }
-        
-        db_sort_field = sort_field_map.get(sort_by.value, "score")
-        db_sort_order = sort_order.value  # "asc" or "desc"
+            if filters.format:
+                filter_params["formats"] = [f.value for f in filters.format]
+
+            if filters.artist:
+                filter_params["artist_filter"] = filters.artist
+
+            if filters.album:
+                filter_params["album_filter"] = filters.album
         
         # Execute search query
         try:
-            search_results = search_audio_tracks_advanced(
+            search_results = await search_audio_tracks_advanced(
                 query=query,
-                limit=limit + 1,  # Fetch one extra to check if more results exist
+                limit=limit,  # has_more is computed by the search itself
                 offset=offset,
                 min_rank=0.01,  # Minimum relevance threshold
+                include_total=include_total,
+                cursor=cursor,
+                sort_by=sort_by.value,  # SortField values match the database sort fields
+                sort_order=sort_order.value,
+                facets=facets,
                 **filter_params
             )
+        except ValidationError as e:
+            raise QueryException(
+                error_code=QueryErrorCode.INVALID_QUERY,
+                message=str(e),
+                details={"query": query}
+            )
         except DatabaseOperationError as e:
             logger.error(f"Database error during search: {e}")
             raise QueryException(
@@ -329,8 +556,22 @@ async def search_library(input_data: Dict[str, Any]) -> Dict[str, Any]:
         
         # Extract tracks from search result
         tracks = search_results.get('tracks', [])
-        total_matches = search_results.get('total_matches', 0)
+        total_matches = search_results.get('total_matches')
         has_more = search_results.get('has_more', False)
+        next_cursor = search_results.get('next_cursor')
+        facet_counts = search_results.get('facets')
+        fuzzy = False
+
+        # No full-text hits on the first page: retry with trigram matching so
+        # misspelled artists and titles still find something
+        if not tracks and offset == 0 and not cursor:
+            tracks = await _fuzzy_search_fallback(query, limit, filter_params)
+            if tracks:
+                fuzzy = True
+                total_matches = len(tracks) if include_total else None
+                has_more = False
+                next_cursor = None
+                facet_counts = None  # Counted over the (empty) full-text matches
 
         logger.info(f"Found {len(tracks)} results for '{query}' (total matches: {total_matches})")
 
@@ -380,13 +621,19 @@ async def search_library(input_data: Dict[str, Any]) -> Dict[str, Any]:
             total=total_matches,
             limit=limit,
             offset=offset,
-            hasMore=has_more
+            hasMore=has_more,
+            nextCursor=next_cursor,
+            fuzzy=fuzzy,
+            facets=facet_counts
         )
         
         search_time = time.time() - start_time
         logger.info(f"Search completed in {search_time:.3f}s: {len(formatted_results)} results")
         
-        return response.model_dump()
+        result = response.model_dump()
+        if use_cache:
+            cache.put(cache_key, generation, result)
+        return result
         
     except QueryException as e:
         # Known query error
@@ -405,6 +652,86 @@ async def search_library(input_data: Dict[str, Any]) -> Dict[str, Any]:
         return error_response.model_dump()
 
 
+async def suggest(input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Complete a typed prefix from artist, title and album values.
+    
+    Backs typeahead in clients: each call is a few short prefix index
+    scans instead of a ranked full-text search. Only completed tracks
+    are suggested.
+    
+    Args:
+        input_data: Dictionary containing prefix and optional limit and fields
+        
+    Returns:
+        Dictionary with success status and suggestions, or error response
+        
+    Example:
+        >>> result = await suggest({"prefix": "beat", "limit": 5})
+        >>> print(result["suggestions"][0])
+        {'field': 'artist', 'value': 'Beat Happening'}
+    """
+    try:
+        # Validate input
+        try:
+            validated_input = SuggestInput(**input_data)
+        except Exception as e:
+            logger.error(f"Input validation failed: {e}")
+            raise QueryException(
+                error_code=QueryErrorCode.INVALID_QUERY,
+                message=f"Invalid input: {str(e)}",
+                details={"validation_errors": str(e)}
+            )
+        
+        prefix = validated_input.prefix
+        fields = [f.value for f in validated_input.fields] if validated_input.fields else None
+        
+        try:
+            suggestions = await suggest_completions(
+                prefix=prefix,
+                limit=validated_input.limit,
+                fields=fields,
+                status_filter="COMPLETED"
+            )
+        except ValidationError as e:
+            raise QueryException(
+                error_code=QueryErrorCode.INVALID_QUERY,
+                message=str(e),
+                details={"prefix": prefix}
+            )
+        except DatabaseOperationError as e:
+            logger.error(f"Database error during suggest: {e}")
+            raise QueryException(
+                error_code=QueryErrorCode.DATABASE_ERROR,
+                message=f"Suggest failed: {str(e)}",
+                details={"prefix": prefix}
+            )
+        
+        response = SuggestOutput(
+            success=True,
+            prefix=prefix,
+            suggestions=suggestions
+        )
+        
+        return response.model_dump()
+        
+    except QueryException as e:
+        # Known query error
+        logger.error(f"Query error: {e.message}")
+        error_response = e.to_error_response()
+        return error_response.model_dump()
+        
+    except Exception as e:
+        # Unexpected error
+        logger.exception(f"Unexpected error during suggest: {e}")
+        error_response = QueryException(
+            error_code=QueryErrorCode.DATABASE_ERROR,
+            message=f"Unexpected error: {str(e)}",
+            details={"exception_type": type(e).__name__}
+        ).to_error_response()
+        return error_response.model_dump()
+
+
 # ============================================================================
 # Synchronous Wrappers (if needed)
 # ============================================================================
@@ -0,0 +1,281 @@
+"""
+Tests for the async PostgreSQL access path.
+
+These tests verify:
+- AsyncDatabasePool bounds concurrent checkouts and reuses connections
+- Broken or mid-transaction connections are not handed out again
+- Connection failures count against the database circuit breaker
+- Async operations run the shared SQL and return psycopg2-compatible results
+- Without the async pool, operations fall back to worker threads
+"""
+
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import psycopg
+import pytest
+
+from database import async_operations
+from database.async_pool import AsyncDatabasePool
+from database.operations import GET_METADATA_BY_ID_QUERY, GET_METADATA_BY_IDS_QUERY
+from src.circuit_breaker import reset_resilience_state, get_circuit_breaker
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    async def fetchall(self):
+        return self.rows
+
+
+class FakeConnection:
+    """Minimal psycopg AsyncConnection stand-in."""
+
+    def __init__(self, rows=None):
+        self.closed = False
+        self.info = MagicMock(transaction_status=psycopg.pq.TransactionStatus.IDLE)
+        self.adapters = MagicMock()
+        self.rows = rows if rows is not None else [{"ok": 1}]
+        self.executed = []
+        self.rollback = AsyncMock()
+
+    async def execute(self, query, params=None):
+        self.executed.append((query, params))
+        return FakeCursor(self.rows)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def reset_breakers():
+    reset_resilience_state()
+    yield
+    reset_resilience_state()
+
+
+@pytest.fixture
+def connect():
+    """Patch psycopg connect to hand out FakeConnections."""
+    connections = []
+
+    async def fake_connect(*args, **kwargs):
+        conn = FakeConnection()
+        connections.append(conn)
+        return conn
+
+    with patch("database.async_pool.psycopg.AsyncConnection.connect", side_effect=fake_connect) as mock_connect:
+        mock_connect.connections = connections
+        yield mock_connect
+
+
+@pytest.fixture
+def pool():
+    return AsyncDatabasePool(max_connections=2, database_url="postgresql://u:p@localhost/db")
+
+
+class TestAsyncDatabasePool:
+    """Test checkout, checkin and limits."""
+
+    @pytest.mark.asyncio
+    async def test_connections_are_reused(self, pool, connect):
+        for _ in range(3):
+            async with pool.get_connection() as conn:
+                await conn.execute("SELECT 1")
+
+        assert connect.call_count == 1
+        assert connect.call_args.kwargs["autocommit"] is True
+        assert pool.get_stats()["idle_connections"] == 1
+
+    @pytest.mark.asyncio
+    async def test_checkouts_wait_at_max_connections(self, pool, connect):
+        active = 0
+        peak = 0
+
+        async def hold():
+            nonlocal active, peak
+            async with pool.get_connection():
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(hold() for _ in range(6)))
+
+        stats = pool.get_stats()
+        assert peak == 2
+        assert stats["open_connections"] == 2
+        assert stats["waits"] > 0
+
+    @pytest.mark.asyncio
+    async def test_closed_connection_is_replaced(self, pool, connect):
+        async with pool.get_connection() as conn:
+            first = conn
+        first.closed = True
+
+        async with pool.get_connection() as conn:
+            assert conn is not first
+
+        assert pool.get_stats()["connections_closed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_open_transaction_rolled_back_on_checkin(self, pool, connect):
+        async with pool.get_connection() as conn:
+            conn.info.transaction_status = psycopg.pq.TransactionStatus.INERROR
+
+        conn.rollback.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_connect_failure_trips_breaker(self, pool):
+        failing = AsyncMock(side_effect=psycopg.OperationalError("down"))
+
+        with patch("database.async_pool.psycopg.AsyncConnection.connect", failing):
+            with pytest.raises(psycopg.OperationalError):
+                await pool.initialize()
+
+        assert get_circuit_breaker("database").get_state()["consecutive_failures"] == 1
+
+    @pytest.fixture
+    def half_open(self):
+        """Open the database circuit and let its recovery timeout pass."""
+        now = {"t": 1000.0}
+        with patch("src.circuit_breaker.time.monotonic", side_effect=lambda: now["t"]):
+            breaker = get_circuit_breaker("database")
+            for _ in range(breaker.failure_threshold):
+                breaker.record_failure()
+            now["t"] += breaker.recovery_timeout
+            yield breaker
+
+    @pytest.mark.asyncio
+    async def test_half_open_probe_pings_idle_connection(self, pool, connect, half_open):
+        idle = FakeConnection()
+        pool._semaphore = asyncio.Semaphore(pool.max_connections)
+        pool._idle.append(idle)
+
+        async with pool.get_connection() as conn:
+            assert conn is idle
+            assert conn.executed == [("SELECT 1", None)]
+            assert half_open.state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_released(self, pool, half_open):
+        async def hang(*args, **kwargs):
+            await asyncio.Event().wait()
+
+        pool._semaphore = asyncio.Semaphore(pool.max_connections)
+        with patch("database.async_pool.psycopg.AsyncConnection.connect", side_effect=hang):
+            task = asyncio.create_task(pool.get_connection().__aenter__())
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert half_open.state == "half_open"
+        assert half_open.before_call() is True  # Probe slot was given back
+
+    @pytest.mark.asyncio
+    async def test_uuid_loaded_as_text(self, pool, connect):
+        async with pool.get_connection() as conn:
+            loader_type = conn.adapters.register_loader.call_args.args[0]
+
+        assert loader_type == "uuid"
+
+
+def _fake_async_connection(conn):
+    @asynccontextmanager
+    async def get_async_connection():
+        yield conn
+    return get_async_connection
+
+
+class TestAsyncOperations:
+    """Test the async counterparts of the read operations."""
+
+    @pytest.fixture(autouse=True)
+    def enabled(self):
+        with patch("database.async_operations.is_async_pool_enabled", return_value=True):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_get_by_id(self):
+        track_id = str(uuid.uuid4())
+        conn = FakeConnection(rows=[{"id": track_id, "title": "Hey Jude"}])
+
+        with patch("database.async_operations.get_async_connection", _fake_async_connection(conn)):
+            result = await async_operations.get_audio_metadata_by_id(track_id)
+
+        assert result == {"id": track_id, "title": "Hey Jude"}
+        assert conn.executed == [(GET_METADATA_BY_ID_QUERY, (track_id,))]
+
+    @pytest.mark.asyncio
+    async def test_get_by_id_invalid(self):
+        from src.exceptions import ValidationError
+
+        with pytest.raises(ValidationError):
+            await async_operations.get_audio_metadata_by_id("nope")
+
+    @pytest.mark.asyncio
+    async def test_get_by_ids(self):
+        ids = [str(uuid.uuid4()) for _ in range(3)]
+        conn = FakeConnection(rows=[{"id": ids[0]}])
+
+        with patch("database.async_operations.get_async_connection", _fake_async_connection(conn)):
+            result = await async_operations.get_audio_metadata_by_ids(ids)
+
+        assert result == [{"id": ids[0]}]
+        assert conn.executed == [(GET_METADATA_BY_IDS_QUERY, (ids,))]
+
+    @pytest.mark.asyncio
+    async def test_search(self):
+        # limit + 1 rows: the extra row tells the search another page exists
+        conn = FakeConnection(rows=[
+            {"total": 3, "id": "a", "rank": 0.5, "created_at": "2024-05-01T12:00:00+00:00"},
+            {"total": 3, "id": "b", "rank": 0.4, "created_at": "2024-05-01T12:00:00+00:00"},
+        ])
+
+        with patch("database.async_operations.get_async_connection", _fake_async_connection(conn)):
+            result = await async_operations.search_audio_tracks_advanced(
+                "hey jude", limit=1, status_filter="COMPLETED"
+            )
+
+        assert result["total_matches"] == 3
+        assert result["has_more"] is True
+        assert result["next_cursor"]
+        assert result["filters"]["status"] == "COMPLETED"
+        count_query, count_params = conn.executed[0]
+        assert "COUNT(*)" in count_query
+        assert count_params[0] == "hey & jude"
+
+    @pytest.mark.asyncio
+    async def test_database_error_wrapped(self):
+        from src.exceptions import DatabaseOperationError
+
+        conn = FakeConnection()
+        conn.execute = AsyncMock(side_effect=psycopg.errors.UndefinedTable("missing"))
+
+        with patch("database.async_operations.get_async_connection", _fake_async_connection(conn)):
+            with pytest.raises(DatabaseOperationError):
+                await async_operations.get_audio_metadata_by_id(str(uuid.uuid4()))
+
+
+class TestThreadFallback:
+    """Test the psycopg2 fallback when the async pool is disabled."""
+
+    @pytest.mark.asyncio
+    async def test_runs_sync_operation_in_thread(self):
+        track_id = str(uuid.uuid4())
+
+        with patch("database.async_operations.is_async_pool_enabled", return_value=False), \
+             patch("database.async_operations.operations.get_audio_metadata_by_id", return_value={"id": track_id}) as sync_op, \
+             patch("database.async_operations.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            result = await async_operations.get_audio_metadata_by_id(track_id)
+
+        assert result == {"id": track_id}
+        sync_op.assert_called_once_with(track_id)
+        to_thread.assert_called_once()
@@ -0,0 +1,366 @@
+"""
+Tests for the async-native GCS client.
+
+The client runs against FakeGCS, an in-process stand-in for the GCS JSON
+API served through httpx.MockTransport. These tests verify:
+- Metadata, existence checks and deletes map onto the JSON API
+- Resumable uploads stream in chunks and resume after transient errors
+- Downloads stream to disk and validate CRC32C
+- Listings page through nextPageToken with field projection
+- Error responses surface as google.api_core exceptions
+- Shared clients are reused per bucket and signing falls back for the local backend
+"""
+
+import asyncio
+import base64
+import json
+import mimetypes
+import re
+from unittest.mock import patch
+from urllib.parse import unquote
+
+import google_crc32c
+import httpx
+import pytest
+from google.api_core import exceptions as api_exceptions
+from google.auth.credentials import AnonymousCredentials
+
+from src.circuit_breaker import get_circuit_breaker, reset_resilience_state
+from src.storage import async_gcs_client
+from src.storage.async_gcs_client import AsyncGCSClient, agenerate_signed_url, get_async_gcs_client
+from src.storage.backend import ListPage
+
+
+def crc32c_of(data: bytes) -> str:
+    return base64.b64encode(google_crc32c.Checksum(data).digest()).decode("ascii")
+
+
+class FakeGCS:
+    """Minimal GCS JSON API: objects get/delete/list/media and resumable uploads."""
+
+    def __init__(self):
+        self.objects = {}
+        self.sessions = {}
+        self.requests = []
+        self.fail_puts = 0
+
+    def add(self, name, data, **extra):
+        self.objects[name] = {
+            "resource": {
+                "name": name,
+                "size": str(len(data)),
+                "crc32c": crc32c_of(data),
+                "contentType": "audio/mpeg",
+                "generation": "1",
+                "metageneration": "1",
+                "timeCreated": "2025-01-01T00:00:00.000Z",
+                "updated": "2025-01-02T00:00:00.000Z",
+                **extra,
+            },
+            "data": data,
+        }
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        path = request.url.raw_path.decode().split("?")[0]
+        params = request.url.params
+
+        if match := re.fullmatch(r"/upload/storage/v1/b/([^/]+)/o", path):
+            session_id = str(len(self.sessions))
+            self.sessions[session_id] = {"resource": json.loads(request.content), "data": b""}
+            return httpx.Response(200, headers={"Location": f"http://fake-gcs/session/{session_id}"})
+
+        if match := re.fullmatch(r"/session/(\d+)", path):
+            return self._put_chunk(self.sessions[match.group(1)], request)
+
+        if match := re.fullmatch(r"/(?:download/)?storage/v1/b/([^/]+)/o/(.+)", path):
+            name = unquote(match.group(2))
+            obj = self.objects.get(name)
+            if obj is None:
+                return httpx.Response(404, json={"error": {"code": 404, "message": "No such object"}})
+            if request.method == "DELETE":
+                del self.objects[name]
+                return httpx.Response(204)
+            if params.get("alt") == "media":
+                return httpx.Response(200, content=obj["data"])
+            return httpx.Response(200, json=obj["resource"])
+
+        if re.fullmatch(r"/storage/v1/b/([^/]+)/o", path):
+            names = sorted(n for n in self.objects if n.startswith(params.get("prefix", "")))
+            start = int(params.get("pageToken", 0))
+            size = int(params["maxResults"])
+            body = {"items": [self.objects[n]["resource"] for n in names[start:start + size]]}
+            if start + size < len(names):
+                body["nextPageToken"] = str(start + size)
+            return httpx.Response(200, json=body)
+
+        return httpx.Response(400, json={"error": {"message": f"unexpected {path}"}})
+
+    def _put_chunk(self, session, request):
+        content_range = request.headers["Content-Range"]
+        total = int(content_range.rsplit("/", 1)[1])
+
+        if not content_range.startswith("bytes */"):
+            if self.fail_puts:
+                # Persist the chunk, then report an error as if the response was lost
+                self.fail_puts -= 1
+                session["data"] += request.content
+                return httpx.Response(503, json={"error": {"message": "backend error"}})
+            session["data"] += request.content
+
+        if len(session["data"]) < total:
+            headers = {"Range": f"bytes=0-{len(session['data']) - 1}"} if session["data"] else {}
+            return httpx.Response(308, headers=headers)
+
+        resource = dict(session["resource"])
+        name = resource.pop("name")
+        if "crc32c" in resource and resource["crc32c"] != crc32c_of(session["data"]):
+            return httpx.Response(400, json={"error": {"message": "crc32c mismatch"}})
+        self.add(name, session["data"], **resource)
+        return httpx.Response(200, json=self.objects[name]["resource"])
+
+
+@pytest.fixture(autouse=True)
+def fresh_breakers():
+    reset_resilience_state()
+    yield
+    reset_resilience_state()
+
+
+@pytest.fixture
+def fake_gcs():
+    return FakeGCS()
+
+
+@pytest.fixture
+def client(fake_gcs):
+    return AsyncGCSClient(
+        bucket_name="test-bucket",
+        credentials=AnonymousCredentials(),
+        api_endpoint="http://fake-gcs",
+        transport=httpx.MockTransport(fake_gcs),
+    )
+
+
+class TestObjects:
+    """Test metadata, existence and delete."""
+
+    @pytest.mark.asyncio
+    async def test_get_file_metadata(self, client, fake_gcs):
+        fake_gcs.add("audio/a b.mp3", b"abc", metadata={"track": "1"})
+
+        metadata = await client.get_file_metadata("audio/a b.mp3")
+
+        assert metadata["name"] == "audio/a b.mp3"
+        assert metadata["size"] == 3
+        assert metadata["generation"] == 1
+        assert metadata["created"] == "2025-01-01T00:00:00+00:00"
+        assert metadata["custom_metadata"] == {"track": "1"}
+        assert "/o/audio%2Fa%20b.mp3" in str(fake_gcs.requests[0].url)
+
+    @pytest.mark.asyncio
+    async def test_missing_object_raises_not_found(self, client):
+        with pytest.raises(api_exceptions.NotFound):
+            await client.get_file_metadata("missing.mp3")
+
+        assert await client.file_exists("missing.mp3") is False
+
+    @pytest.mark.asyncio
+    async def test_delete_file(self, client, fake_gcs):
+        fake_gcs.add("audio/a.mp3", b"abc")
+
+        assert await client.delete_file("audio/a.mp3") is True
+        assert await client.delete_file("audio/a.mp3") is False
+
+    @pytest.mark.asyncio
+    async def test_signed_url_requires_existing_blob(self, client):
+        with pytest.raises(api_exceptions.NotFound):
+            await client.generate_signed_url("missing.mp3")
+
+    @pytest.mark.asyncio
+    async def test_credential_error_does_not_hold_probe(self, client, fake_gcs):
+        fake_gcs.add("audio/a.mp3", b"abc")
+        now = {"t": 1000.0}
+        breaker = get_circuit_breaker("gcs")
+
+        with patch("src.circuit_breaker.time.monotonic", side_effect=lambda: now["t"]):
+            for _ in range(breaker.failure_threshold):
+                breaker.record_failure()
+            now["t"] += breaker.recovery_timeout
+
+            with patch.object(client, "_auth_headers", side_effect=RuntimeError("refresh failed")):
+                with pytest.raises(RuntimeError):
+                    await client.file_exists("audio/a.mp3")
+
+            assert await client.file_exists("audio/a.mp3") is True
+            assert breaker.state == "closed"
+
+
+class TestUploads:
+    """Test resumable uploads."""
+
+    @pytest.mark.asyncio
+    async def test_upload_in_chunks(self, client, fake_gcs, tmp_path):
+        data = bytes(range(256)) * 4096  # 1 MiB
+        source = tmp_path / "track.mp3"
+        source.write_bytes(data)
+
+        result = await client.upload_file(
+            source, "audio/track.mp3", content_type="audio/mpeg",
+            chunk_size=256 * 1024, crc32c=crc32c_of(data),
+        )
+
+        assert result["size"] == len(data)
+        assert fake_gcs.objects["audio/track.mp3"]["data"] == data
+        puts = [r for r in fake_gcs.requests if r.method == "PUT"]
+        assert len(puts) == 4
+        assert all(len(r.content) == 256 * 1024 for r in puts)
+
+    @pytest.mark.asyncio
+    async def test_upload_resumes_after_transient_error(self, client, fake_gcs, tmp_path, monkeypatch):
+        monkeypatch.setattr("src.storage.async_gcs_client.asyncio.sleep", _no_sleep)
+        data = b"x" * (512 * 1024)
+        source = tmp_path / "track.mp3"
+        source.write_bytes(data)
+        fake_gcs.fail_puts = 1
+
+        await client.upload_file(source, "audio/track.mp3", chunk_size=256 * 1024)
+
+        assert fake_gcs.objects["audio/track.mp3"]["data"] == data
+        probes = [r for r in fake_gcs.requests if r.headers.get("Content-Range", "").startswith("bytes */")]
+        assert len(probes) == 1
+
+    @pytest.mark.asyncio
+    async def test_content_type_guessed_from_file_name(self, client, fake_gcs, tmp_path):
+        source = tmp_path / "track.wav"
+        source.write_bytes(b"abc")
+
+        await client.upload_file(source, "audio/track.wav")
+
+        assert fake_gcs.objects["audio/track.wav"]["resource"]["contentType"] == mimetypes.guess_type("track.wav")[0]
+
+    @pytest.mark.asyncio
+    async def test_checksum_mismatch_rejected(self, client, tmp_path):
+        source = tmp_path / "track.mp3"
+        source.write_bytes(b"abc")
+
+        with pytest.raises(api_exceptions.BadRequest):
+            await client.upload_file(source, "audio/track.mp3", crc32c=crc32c_of(b"other"))
+
+    @pytest.mark.asyncio
+    async def test_missing_source(self, client, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            await client.upload_file(tmp_path / "nope.mp3", "audio/nope.mp3")
+
+
+class TestDownloads:
+    """Test streaming downloads."""
+
+    @pytest.mark.asyncio
+    async def test_download_file(self, client, fake_gcs, tmp_path):
+        data = b"audio" * 1000
+        fake_gcs.add("audio/a.mp3", data)
+
+        result = await client.download_file("audio/a.mp3", tmp_path / "a.mp3", chunk_size=1024)
+
+        assert (tmp_path / "a.mp3").read_bytes() == data
+        assert result["crc32c"] == crc32c_of(data)
+
+    @pytest.mark.asyncio
+    async def test_corrupt_download_removed(self, client, fake_gcs, tmp_path):
+        fake_gcs.add("audio/a.mp3", b"audio", crc32c=crc32c_of(b"other"))
+
+        with pytest.raises(api_exceptions.BadRequest):
+            await client.download_file("audio/a.mp3", tmp_path / "a.mp3")
+
+        assert not (tmp_path / "a.mp3").exists()
+
+
+class TestListing:
+    """Test paginated listing."""
+
+    @pytest.mark.asyncio
+    async def test_pages_and_projection(self, client, fake_gcs):
+        for i in range(5):
+            fake_gcs.add(f"audio/{i}.mp3", b"x" * i)
+        fake_gcs.add("other/x.mp3", b"x")
+
+        pages = [
+            page async for page in client.aiter_file_pages(
+                prefix="audio/", page_size=2, fields=["name", "size"]
+            )
+        ]
+
+        assert all(isinstance(page, ListPage) for page in pages)
+        assert [len(page.items) for page in pages] == [2, 2, 1]
+        assert pages[0].items[1] == {"name": "audio/1.mp3", "size": 1}
+        assert fake_gcs.requests[0].url.params["fields"] == "items(name,size),prefixes,nextPageToken"
+
+    @pytest.mark.asyncio
+    async def test_list_files_max_results(self, client, fake_gcs):
+        for i in range(5):
+            fake_gcs.add(f"audio/{i}.mp3", b"x")
+
+        files = await client.list_files(prefix="audio/", max_results=3)
+
+        assert [f["name"] for f in files] == ["audio/0.mp3", "audio/1.mp3", "audio/2.mp3"]
+    @pytest.mark.asyncio
+    async def test_unknown_field_rejected(self, client):
+        with pytest.raises(ValueError, match="Unknown listing fields"):
+            async for _ in client.aiter_file_pages(fields=["name", "bogus"]):
+                pass
+
+
+class TestSharedClients:
+    """Test the per-bucket shared clients and async signing."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_clients(self, monkeypatch):
+        monkeypatch.setattr(async_gcs_client, "_async_clients", {})
+        monkeypatch.setattr(async_gcs_client, "_async_clients_loop", None)
+
+    @pytest.mark.asyncio
+    async def test_client_reused_per_bucket(self):
+        first = get_async_gcs_client("bucket-a")
+
+        assert get_async_gcs_client("bucket-a") is first
+        assert get_async_gcs_client("bucket-b") is not first
+
+        await async_gcs_client.close_async_gcs_clients()
+        assert async_gcs_client._async_clients == {}
+
+    def test_client_recreated_for_new_loop(self):
+        async def get():
+            return get_async_gcs_client("bucket-a")
+
+        assert asyncio.run(get()) is not asyncio.run(get())
+
+    @pytest.mark.asyncio
+    async def test_signing_checks_existence_through_shared_client(self, client, fake_gcs):
+        fake_gcs.add("audio/a.mp3", b"abc")
+
+        with patch("src.storage.async_gcs_client.get_storage_backend_name", return_value="gcs"), \
+             patch("src.storage.async_gcs_client.get_async_gcs_client", return_value=client), \
+             patch("src.storage.async_gcs_client.sign_url_v4", return_value="https://signed") as sign:
+            url = await agenerate_signed_url("audio/a.mp3", bucket_name="test-bucket", window_seconds=0)
+
+            with pytest.raises(api_exceptions.NotFound):
+                await agenerate_signed_url("missing.mp3", bucket_name="test-bucket")
+
+        assert url == "https://signed"
+        assert sign.call_count == 1
+        assert "/o/audio%2Fa.mp3" in str(fake_gcs.requests[0].url)
+
+    @pytest.mark.asyncio
+    async def test_local_backend_signs_in_thread(self):
+        with patch("src.storage.async_gcs_client.get_storage_backend_name", return_value="local"), \
+             patch("src.storage.async_gcs_client.generate_signed_url", return_value="http://local") as sign:
+            url = await agenerate_signed_url("audio/a.mp3", bucket_name="test-bucket")
+
+        assert url == "http://local"
+        assert sign.call_args.kwargs["blob_name"] == "audio/a.mp3"
+        assert async_gcs_client._async_clients == {}
+
+
+async def _no_sleep(_delay):
+    return None
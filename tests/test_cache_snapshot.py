@@ -0,0 +1,117 @@
+"""
+Tests for signed URL cache snapshots.
+
+These tests verify:
+- Snapshots round-trip through local disk
+- Expired and nearly-expired entries are discarded on restore
+- Hit statistics carry over
+- Snapshots from a different signing window are ignored
+- Missing or corrupt snapshots leave the cache empty
+- gs:// locations go through the GCS client
+"""
+
+import json
+import os
+import time
+import pytest
+from unittest.mock import patch, MagicMock
+
+from src.resources.cache import SignedURLCache, SNAPSHOT_VERSION
+
+
+@pytest.fixture
+def warm_cache():
+    """Cache with one long-lived entry, one nearly-expired entry and some stats."""
+    cache = SignedURLCache(window_seconds=0)
+    now = time.time()
+    cache._store_local("gs://b/fresh.mp3", "https://signed/fresh", now + 600)
+    cache._store_local("gs://b/stale.mp3", "https://signed/stale", now + 10)
+    cache.hits = 7
+    cache.misses = 3
+    return cache
+
+
+class TestSnapshotRoundTrip:
+    """Test saving and loading snapshots on local disk."""
+
+    def test_round_trip(self, warm_cache, tmp_path):
+        location = str(tmp_path / "cache" / "snapshot.json")
+        assert warm_cache.save_snapshot(location) is True
+
+        fresh = SignedURLCache(window_seconds=0)
+        restored = fresh.load_snapshot(location)
+
+        assert restored == 1
+        assert fresh.cache["gs://b/fresh.mp3"] == "https://signed/fresh"
+        assert "gs://b/stale.mp3" not in fresh.cache
+        assert fresh.hits == 7
+        assert fresh.misses == 3
+
+    def test_snapshot_file_is_private(self, warm_cache, tmp_path):
+        location = str(tmp_path / "snapshot.json")
+        warm_cache.save_snapshot(location)
+
+        assert os.stat(location).st_mode & 0o777 == 0o600
+
+    def test_expired_entries_not_saved(self, tmp_path):
+        cache = SignedURLCache(window_seconds=0)
+        cache._store_local("gs://b/old.mp3", "https://signed/old", time.time() - 1)
+
+        assert cache.snapshot()["entries"] == []
+
+
+class TestRestoreRules:
+    """Test which snapshots and entries are accepted."""
+
+    def test_window_mismatch_ignored(self, warm_cache):
+        snapshot = warm_cache.snapshot()
+        other = SignedURLCache(window_seconds=900)
+
+        assert other.restore(snapshot) == 0
+        assert other.hits == 0
+
+    def test_unknown_version_ignored(self, warm_cache):
+        snapshot = warm_cache.snapshot()
+        snapshot["version"] = SNAPSHOT_VERSION + 1
+
+        assert SignedURLCache(window_seconds=0).restore(snapshot) == 0
+
+    def test_missing_file(self, tmp_path):
+        cache = SignedURLCache(window_seconds=0)
+        assert cache.load_snapshot(str(tmp_path / "missing.json")) == 0
+
+    def test_corrupt_file(self, tmp_path):
+        location = tmp_path / "snapshot.json"
+        location.write_text("{not json")
+
+        cache = SignedURLCache(window_seconds=0)
+        assert cache.load_snapshot(str(location)) == 0
+        assert len(cache.cache) == 0
+
+
+class TestGCSLocation:
+    """Test gs:// snapshot locations."""
+
+    def test_save_to_gcs(self, warm_cache):
+        mock_client = MagicMock()
+        with patch("src.resources.cache.create_gcs_client", return_value=mock_client) as mock_create:
+            assert warm_cache.save_snapshot("gs://snap-bucket/cache/snapshot.json") is True
+
+        mock_create.assert_called_once_with(bucket_name="snap-bucket")
+        mock_client.bucket.blob.assert_called_once_with("cache/snapshot.json")
+        payload = mock_client.bucket.blob.return_value.upload_from_string.call_args.args[0]
+        assert json.loads(payload)["version"] == SNAPSHOT_VERSION
+
+    def test_load_from_gcs(self, warm_cache):
+        mock_client = MagicMock()
+        blob = mock_client.bucket.blob.return_value
+        blob.exists.return_value = True
+        blob.download_as_text.return_value = json.dumps(warm_cache.snapshot())
+
+        cache = SignedURLCache(window_seconds=0)
+        with patch("src.resources.cache.create_gcs_client", return_value=mock_client):
+            assert cache.load_snapshot("gs://snap-bucket/cache/snapshot.json") == 1
+
+    def test_save_failure_is_not_raised(self, warm_cache):
+        with patch("src.resources.cache.create_gcs_client", side_effect=RuntimeError("no creds")):
+            assert warm_cache.save_snapshot("gs://snap-bucket/snapshot.json") is False
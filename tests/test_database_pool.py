@@ -12,6 +12,7 @@ Tests verify:
 
 import pytest
 import os
+import time
 from uuid import uuid4
 from unittest.mock import patch, MagicMock
 
@@ -336,6 +337,258 @@ class TestDatabaseUtils:
         assert result[0]["num"] == 1
 
 
+
+class FakeConnection:
+    """psycopg2 connection stand-in that counts SELECT 1 pings."""
+    
+    def __init__(self):
+        self.closed = 0
+        self.pings = 0
+        self.alive = True
+    
+    def cursor(self, *args, **kwargs):
+        conn = self
+        cursor = MagicMock()
+        cursor.__enter__.return_value = cursor
+        
+        def execute(query, params=None):
+            from psycopg2 import OperationalError
+            if not conn.alive:
+                raise OperationalError("server closed the connection")
+            if query == "SELECT 1":
+                conn.pings += 1
+        
+        cursor.execute.side_effect = execute
+        cursor.fetchone.return_value = (1,)
+        return cursor
+    
+    def rollback(self):
+        pass
+
+
+class FakeThreadedPool:
+    """Minimal ThreadedConnectionPool: LIFO idle list, new connections on demand."""
+    
+    def __init__(self, minconn, maxconn, dsn=None, **kwargs):
+        self._pool = [FakeConnection() for _ in range(minconn)]
+        self.maxconn = maxconn
+        self.closed_connections = []
+    
+    def getconn(self):
+        return self._pool.pop() if self._pool else FakeConnection()
+    
+    def putconn(self, conn, close=False):
+        if close:
+            conn.closed = 1
+            self.closed_connections.append(conn)
+        else:
+            self._pool.append(conn)
+    
+    def closeall(self):
+        pass
+
+
+class TestIdleValidation:
+    """Test idle-based checkout validation, eviction and keepalive (no database needed)."""
+    
+    @pytest.fixture
+    def fake_pool(self):
+        from database.pool import DatabasePool
+        
+        with patch("database.pool.pool.ThreadedConnectionPool", FakeThreadedPool):
+            db = DatabasePool(
+                min_connections=1,
+                max_connections=5,
+                database_url="postgresql://u:p@localhost/db",
+                validation_idle_seconds=30,
+                keepalive_interval_seconds=0,
+            )
+            db.initialize()
+            yield db
+            db.close()
+    
+    def test_recent_connection_not_pinged(self, fake_pool):
+        with fake_pool.get_connection() as conn:
+            pings = conn.pings
+        
+        with fake_pool.get_connection() as conn:
+            assert conn.pings == pings
+        
+        stats = fake_pool.get_stats()
+        assert stats["validation_skipped"] >= 1
+        assert stats["validation_pings"] == 1  # first checkout of the unseen connection
+    
+    def test_idle_connection_pinged(self, fake_pool):
+        with fake_pool.get_connection() as conn:
+            pass
+        pings = conn.pings
+        
+        with patch("database.pool.time.monotonic", return_value=time.monotonic() + 60):
+            with fake_pool.get_connection() as conn:
+                assert conn.pings == pings + 1
+    
+    def test_closed_connection_rejected_without_ping(self, fake_pool):
+        with fake_pool.get_connection() as conn:
+            pass
+        conn.closed = 1
+        
+        with fake_pool.get_connection() as replacement:
+            assert replacement is not conn
+        
+        assert fake_pool.get_stats()["validation_failures"] == 1
+    
+    def test_connection_error_evicts(self, fake_pool):
+        from psycopg2 import OperationalError
+        
+        with pytest.raises(OperationalError):
+            with fake_pool.get_connection() as conn:
+                raise OperationalError("server closed the connection")
+        
+        assert conn in fake_pool._pool.closed_connections
+        assert fake_pool.get_stats()["connections_evicted"] == 1
+    
+    def test_keepalive_pings_stale_connections(self, fake_pool):
+        with fake_pool.get_connection() as conn:
+            pass
+        pings = conn.pings
+        
+        assert fake_pool.keepalive() == 0
+        
+        with patch("database.pool.time.monotonic", return_value=time.monotonic() + 60):
+            assert fake_pool.keepalive() == 1
+        assert conn.pings == pings + 1
+    
+    def test_keepalive_drops_dead_connections(self, fake_pool):
+        with fake_pool.get_connection() as conn:
+            pass
+        conn.alive = False
+        
+        with patch("database.pool.time.monotonic", return_value=time.monotonic() + 60):
+            fake_pool.keepalive()
+        
+        assert conn in fake_pool._pool.closed_connections
+
+
+
+class TestCheckoutQueue:
+    """Test FIFO waiting, timeouts and reservations when the pool is exhausted."""
+    
+    def test_waiters_served_in_order(self):
+        import threading
+        from database.pool import CheckoutQueue
+        
+        queue = CheckoutQueue(capacity=1)
+        queue.acquire()
+        order = []
+        
+        def waiter(n):
+            queue.acquire(timeout=5)
+            order.append(n)
+            queue.release()
+        
+        threads = []
+        for n in range(3):
+            t = threading.Thread(target=waiter, args=(n,))
+            t.start()
+            threads.append(t)
+            while queue.get_stats()["queue_depth"] < n + 1:
+                time.sleep(0.001)
+        
+        queue.release()
+        for t in threads:
+            t.join(timeout=5)
+        
+        assert order == [0, 1, 2]
+        assert queue.get_stats()["max_queue_depth"] == 3
+    
+    def test_timeout(self):
+        from database.pool import CheckoutQueue, PoolTimeoutError
+        
+        queue = CheckoutQueue(capacity=1)
+        queue.acquire()
+        
+        with pytest.raises(PoolTimeoutError):
+            queue.acquire(timeout=0.01)
+        
+        stats = queue.get_stats()
+        assert stats["checkout_timeouts"] == 1
+        assert stats["queue_depth"] == 0
+    
+    def test_queue_full_rejected(self):
+        import threading
+        from database.pool import CheckoutQueue, PoolQueueFullError
+        
+        queue = CheckoutQueue(capacity=1, max_waiters=1)
+        queue.acquire()
+        t = threading.Thread(target=lambda: queue.acquire(timeout=5))
+        t.start()
+        while queue.get_stats()["queue_depth"] < 1:
+            time.sleep(0.001)
+        
+        with pytest.raises(PoolQueueFullError):
+            queue.acquire(timeout=1)
+        queue.release()
+        t.join()
+        
+        assert queue.get_stats()["checkouts_rejected"] == 1
+    
+    def test_reserved_slots_for_high_priority(self):
+        from database.pool import CheckoutQueue, PoolTimeoutError, PRIORITY_HIGH
+        
+        queue = CheckoutQueue(capacity=2, reserved=1)
+        queue.acquire()
+        
+        with pytest.raises(PoolTimeoutError):
+            queue.acquire(timeout=0.01)
+        assert queue.acquire(PRIORITY_HIGH, timeout=0.01) == 0.0
+    
+    def test_wait_histogram(self):
+        from database.pool import CheckoutQueue
+        
+        queue = CheckoutQueue(capacity=2)
+        queue.acquire()
+        queue.acquire()
+        
+        histogram = queue.get_stats()["wait_histogram"]
+        assert histogram["<=1ms"] == 2
+        assert sum(histogram.values()) == 2
+    
+    def test_pool_waits_instead_of_failing(self):
+        import threading
+        from database.pool import DatabasePool
+        
+        with patch("database.pool.pool.ThreadedConnectionPool", FakeThreadedPool):
+            db = DatabasePool(
+                min_connections=1,
+                max_connections=1,
+                database_url="postgresql://u:p@localhost/db",
+                keepalive_interval_seconds=0,
+                reserved_connections=0,
+                checkout_timeout=5,
+            )
+            db.initialize()
+            released = threading.Event()
+            
+            def holder():
+                with db.get_connection():
+                    released.wait(5)
+            
+            t = threading.Thread(target=holder)
+            t.start()
+            while db.get_stats()["in_use"] < 1:
+                time.sleep(0.001)
+            
+            threading.Timer(0.05, released.set).start()
+            with db.get_connection() as conn:
+                assert conn is not None
+            t.join()
+            
+            stats = db.get_stats()
+            assert stats["in_use"] == 0
+            assert stats["total_wait_seconds"] > 0
+            db.close()
+
+
 if __name__ == "__main__":
     # Allow running tests directly
     pytest.main([__file__, "-v"])
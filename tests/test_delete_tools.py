@@ -0,0 +1,182 @@
+"""
+Tests for delete_audio and delete_audio_batch tools.
+
+These tests verify:
+- Rows are deleted with batched DELETE ... RETURNING statements
+- Stored audio and artwork files are removed after the rows
+- Cached signed URLs for deleted files are invalidated
+- Not-found ids, invalid input and storage failures are reported
+"""
+
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.config import config
+from src.exceptions import DatabaseOperationError
+from src.resources.cache import SignedURLCache
+from src.storage.backend import create_storage_backend
+from src.storage.gcs_client import delete_gcs_paths
+from src.tools.delete_tools import delete_audio, delete_audio_batch
+from src.tools.query_schemas import QueryErrorCode
+
+
+@pytest.fixture
+def local_storage(tmp_path, monkeypatch):
+    """Route storage calls to a local backend under tmp_path."""
+    monkeypatch.setattr(config, "storage_backend", "local")
+    monkeypatch.setattr(config, "storage_path", str(tmp_path / "store"))
+    monkeypatch.setattr(config, "local_storage_signing_key", "secret")
+    monkeypatch.setattr(config, "gcs_bucket_name", "test-bucket")
+    return create_storage_backend()
+
+
+@pytest.fixture
+def tracks(local_storage, tmp_path):
+    """Store audio and artwork for 3 tracks; return their database rows."""
+    source = tmp_path / "file.bin"
+    source.write_bytes(b"data")
+    rows = []
+    for _ in range(3):
+        audio_id = str(uuid.uuid4())
+        local_storage.upload_file(source, f"audio/{audio_id}/audio.mp3")
+        local_storage.upload_file(source, f"audio/{audio_id}/artwork.jpg")
+        rows.append({
+            "id": audio_id,
+            "audio_gcs_path": f"gs://test-bucket/audio/{audio_id}/audio.mp3",
+            "thumbnail_gcs_path": f"gs://test-bucket/audio/{audio_id}/artwork.jpg",
+        })
+    return rows
+
+
+@pytest.fixture
+def cache():
+    cache = SignedURLCache(window_seconds=0)
+    with patch("src.tools.delete_tools.get_cache", return_value=cache):
+        yield cache
+
+
+def _delete_rows(rows):
+    """Fake delete_audio_tracks returning the rows whose id was requested."""
+    return lambda ids: [row for row in rows if row["id"] in ids]
+
+
+class TestDeleteAudio:
+    """Test the single-track tool."""
+
+    @pytest.mark.asyncio
+    async def test_deletes_row_files_and_cache(self, local_storage, tracks, cache):
+        track = tracks[0]
+        cache._store_local(track["audio_gcs_path"], "https://signed", 2**40)
+
+        with patch("src.tools.delete_tools.delete_audio_tracks", side_effect=_delete_rows(tracks)) as mock_delete:
+            result = await delete_audio({"audioId": track["id"].upper()})
+
+        assert result["success"] is True
+        assert result["storage"] == {"deletedFiles": 2, "failedFiles": []}
+        mock_delete.assert_called_once_with([track["id"]])
+        assert track["audio_gcs_path"] not in cache.cache
+        assert not local_storage.file_exists(f"audio/{track['id']}/audio.mp3")
+        assert local_storage.file_exists(f"audio/{tracks[1]['id']}/audio.mp3")
+
+    @pytest.mark.asyncio
+    async def test_not_found(self, local_storage, cache):
+        with patch("src.tools.delete_tools.delete_audio_tracks", return_value=[]):
+            result = await delete_audio({"audioId": str(uuid.uuid4())})
+
+        assert result["success"] is False
+        assert result["error"] == QueryErrorCode.RESOURCE_NOT_FOUND
+
+    @pytest.mark.asyncio
+    async def test_invalid_id(self):
+        result = await delete_audio({"audioId": "not-a-uuid"})
+
+        assert result["success"] is False
+        assert result["error"] == QueryErrorCode.INVALID_QUERY
+
+    @pytest.mark.asyncio
+    async def test_database_error(self, cache):
+        with patch("src.tools.delete_tools.delete_audio_tracks", side_effect=DatabaseOperationError("down")):
+            result = await delete_audio({"audioId": str(uuid.uuid4())})
+
+        assert result["error"] == QueryErrorCode.DATABASE_ERROR
+
+
+class TestDeleteAudioBatch:
+    """Test the batch tool."""
+
+    @pytest.mark.asyncio
+    async def test_batch_reports_deleted_and_not_found(self, local_storage, tracks, cache):
+        missing = str(uuid.uuid4())
+        ids = [row["id"] for row in tracks[:2]] + [missing, tracks[0]["id"]]
+
+        with patch("src.tools.delete_tools.delete_audio_tracks", side_effect=_delete_rows(tracks)) as mock_delete:
+            result = await delete_audio_batch({"audioIds": ids})
+
+        assert result["success"] is True
+        assert mock_delete.call_count == 1
+        assert result["deleted"] == [tracks[0]["id"], tracks[1]["id"]]
+        assert result["notFound"] == [missing]
+        assert result["storage"]["deletedFiles"] == 4
+        remaining = {f["name"] for f in local_storage.list_files(prefix="audio/")}
+        assert remaining == {f"audio/{tracks[2]['id']}/audio.mp3", f"audio/{tracks[2]['id']}/artwork.jpg"}
+
+    @pytest.mark.asyncio
+    async def test_storage_failures_are_reported(self, tracks, cache):
+        failed = [tracks[0]["thumbnail_gcs_path"]]
+
+        with patch("src.tools.delete_tools.delete_audio_tracks", side_effect=_delete_rows(tracks)), \
+             patch("src.tools.delete_tools.delete_gcs_paths", return_value=failed):
+            result = await delete_audio_batch({"audioIds": [tracks[0]["id"]]})
+
+        assert result["success"] is True
+        assert result["storage"] == {"deletedFiles": 1, "failedFiles": failed}
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_rejected(self):
+        result = await delete_audio_batch({"audioIds": []})
+
+        assert result["error"] == QueryErrorCode.INVALID_QUERY
+
+
+class TestDeleteGCSPaths:
+    """Test grouping of gs:// paths into batched backend deletes."""
+
+    def test_groups_by_bucket(self):
+        backends = {}
+
+        def make_backend(bucket_name):
+            backends[bucket_name] = MagicMock(delete_files=MagicMock(return_value=["b"]))
+            return backends[bucket_name]
+
+        with patch("src.storage.gcs_client.create_storage_backend", side_effect=make_backend):
+            failed = delete_gcs_paths(["gs://one/a", "gs://two/b", "gs://one/c", "bad-path"])
+
+        backends["one"].delete_files.assert_called_once_with(["a", "c"])
+        backends["two"].delete_files.assert_called_once_with(["b"])
+        assert failed == ["bad-path", "gs://one/b", "gs://two/b"]
+
+
+class TestDeleteAudioTracks:
+    """Test the database delete operation."""
+
+    def test_single_statement_per_batch(self):
+        from database import operations
+
+        ids = [str(uuid.uuid4()) for _ in range(5)]
+        conn = MagicMock()
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.fetchall.side_effect = lambda: [{"id": i, "audio_gcs_path": None, "thumbnail_gcs_path": None} for i in ids[:2]]
+        conn_ctx = MagicMock()
+        conn_ctx.__enter__.return_value = conn
+
+        with patch.object(operations, "get_connection", return_value=conn_ctx), \
+             patch.object(operations, "DELETE_BATCH_SIZE", 3):
+            deleted = operations.delete_audio_tracks(ids + ["bad"])
+
+        assert cursor.execute.call_count == 2
+        assert "RETURNING" in cursor.execute.call_args_list[0].args[0]
+        assert cursor.execute.call_args_list[0].args[1] == (ids[:3],)
+        assert len(deleted) == 4
+        conn.commit.assert_called_once()
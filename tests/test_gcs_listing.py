@@ -0,0 +1,122 @@
+"""
+Tests for streaming, paginated GCS listing.
+
+These tests verify:
+- Pages are fetched lazily, one API call per page
+- Page tokens resume a listing where it stopped
+- Field projection is applied to the request and the results
+- list_files still returns the full listing
+- The async iterator yields the same pages
+"""
+
+import pytest
+from unittest.mock import patch
+
+from google.auth.credentials import AnonymousCredentials
+from google.cloud import storage
+
+from src.storage.gcs_client import GCSClient, ListPage
+
+
+BLOBS = [
+    {"name": f"audio/{i:04d}/track.mp3", "size": str(1000 + i), "crc32c": f"crc{i}==",
+     "contentType": "audio/mpeg", "timeCreated": "2025-01-01T00:00:00Z",
+     "updated": "2025-01-02T00:00:00Z"}
+    for i in range(7)
+]
+
+
+class FakeListingAPI:
+    """Serve objects.list responses in pages, recording each request."""
+
+    def __init__(self, blobs):
+        self.blobs = blobs
+        self.requests = []
+
+    def __call__(self, method, path, query_params=None, **kwargs):
+        params = dict(query_params or {})
+        self.requests.append(params)
+        page_size = int(params.get("maxResults", 1000))
+        start = int(params.get("pageToken", 0))
+        prefix = params.get("prefix", "")
+
+        matching = [b for b in self.blobs if b["name"].startswith(prefix)]
+        page = matching[start:start + page_size]
+        response = {"items": page}
+        if start + page_size < len(matching):
+            response["nextPageToken"] = str(start + page_size)
+        return response
+
+
+@pytest.fixture
+def listing():
+    return FakeListingAPI(BLOBS)
+
+
+@pytest.fixture
+def gcs_client(listing):
+    client = GCSClient(bucket_name="test-bucket", project_id="test-project")
+    client._client = storage.Client(project="test-project", credentials=AnonymousCredentials())
+    with patch.object(client._client._connection, "api_request", side_effect=listing):
+        yield client
+
+
+class TestIterFilePages:
+    """Test page-by-page listing."""
+
+    def test_pages_are_lazy(self, gcs_client, listing):
+        pages = gcs_client.iter_file_pages(prefix="audio/", page_size=3)
+
+        first = next(pages)
+
+        assert isinstance(first, ListPage)
+        assert len(first.items) == 3
+        assert first.next_page_token == "3"
+        assert len(listing.requests) == 1
+
+    def test_all_pages(self, gcs_client):
+        pages = list(gcs_client.iter_file_pages(prefix="audio/", page_size=3))
+
+        assert [len(p.items) for p in pages] == [3, 3, 1]
+        assert pages[-1].next_page_token is None
+
+    def test_resume_from_page_token(self, gcs_client):
+        first = next(gcs_client.iter_file_pages(prefix="audio/", page_size=3))
+
+        resumed = list(gcs_client.iter_files(prefix="audio/", page_size=3,
+                                             page_token=first.next_page_token))
+
+        assert [item["name"] for item in resumed] == [b["name"] for b in BLOBS[3:]]
+
+    def test_field_projection(self, gcs_client, listing):
+        page = next(gcs_client.iter_file_pages(prefix="audio/", fields=["name", "size", "crc32c"]))
+
+        assert page.items[0] == {"name": "audio/0000/track.mp3", "size": 1000, "crc32c": "crc0=="}
+        assert listing.requests[0]["fields"] == "items(name,size,crc32c),prefixes,nextPageToken"
+
+    def test_unknown_field_rejected(self, gcs_client):
+        with pytest.raises(ValueError):
+            next(gcs_client.iter_file_pages(fields=["name", "owner"]))
+
+
+class TestListFiles:
+    """Test that list_files is built on the streaming listing."""
+
+    def test_list_files_returns_everything(self, gcs_client):
+        files = gcs_client.list_files(prefix="audio/")
+
+        assert len(files) == len(BLOBS)
+        assert set(files[0]) == {"name", "size", "content_type", "created", "updated"}
+
+    def test_list_files_max_results(self, gcs_client):
+        assert len(gcs_client.list_files(prefix="audio/", max_results=2)) == 2
+
+
+class TestAsyncIteration:
+    """Test the async page iterator."""
+
+    @pytest.mark.asyncio
+    async def test_aiter_file_pages(self, gcs_client):
+        pages = [page async for page in gcs_client.aiter_file_pages(prefix="audio/", page_size=4)]
+
+        assert [len(p.items) for p in pages] == [4, 3]
@@ -327,11 +327,53 @@ class TestDownloadFunction:
             
             # Progress callback should have been called
             assert len(progress_calls) > 0
-            
+
         finally:
             if result and result.exists():
                 result.unlink()
-    
+
+    @patch('requests.Session.head')
+    @patch('requests.Session.get')
+    def test_download_computes_checksums(self, mock_get, mock_head):
+        """Test CRC32C/MD5 are computed across chunks while downloading."""
+        import base64
+        import hashlib
+        import google_crc32c
+        from src.downloader import HTTPDownloader
+
+        mock_head_response = Mock()
+        mock_head_response.headers = {"Content-Length": "2000"}
+        mock_head_response.raise_for_status = Mock()
+        mock_head.return_value = mock_head_response
+
+        mock_get_response = Mock()
+        mock_get_response.headers = {"Content-Length": "2000"}
+        mock_get_response.raise_for_status = Mock()
+        mock_get_response.iter_content = Mock(return_value=[b"a" * 1000, b"", b"b" * 1000])
+        mock_get_response.__enter__ = Mock(return_value=mock_get_response)
+        mock_get_response.__exit__ = Mock(return_value=False)
+        mock_get.return_value = mock_get_response
+
+        payload = b"a" * 1000 + b"b" * 1000
+        expected = {
+            "crc32c": base64.b64encode(google_crc32c.value(payload).to_bytes(4, "big")).decode(),
+            "md5_hash": base64.b64encode(hashlib.md5(payload).digest()).decode(),
+        }
+
+        downloader = HTTPDownloader()
+        checksums = {}
+        result = None
+
+        try:
+            result = downloader.download("https://example.com/audio.mp3", checksums=checksums)
+
+            assert checksums == expected
+            assert downloader.last_checksums == expected
+
+        finally:
+            if result and result.exists():
+                result.unlink()
+
     @patch('requests.Session.head')
     @patch('requests.Session.get')
     def test_download_timeout(self, mock_get, mock_head):
@@ -0,0 +1,215 @@
+"""
+Tests for the pluggable storage backend and the local filesystem implementation.
+
+These tests verify:
+- Uploads are atomic, checksummed and carry metadata
+- Range reads (mmap) return the requested bytes
+- HMAC-signed URLs verify, and tampered or expired URLs do not
+- Listing pages, page tokens and delimiters
+- AudioStorageManager and SignedURLCache work unchanged on the local backend
+"""
+
+import base64
+import hashlib
+import time
+from unittest.mock import patch
+from urllib.parse import urlparse, parse_qs, unquote
+
+import google_crc32c
+import pytest
+from google.api_core import exceptions as api_exceptions
+from google.cloud.exceptions import NotFound
+
+from src.config import config
+from src.storage.backend import StorageBackend, create_storage_backend
+from src.storage.gcs_client import GCSClient
+from src.storage.local_backend import LocalStorageBackend
+
+
+@pytest.fixture
+def backend(tmp_path):
+    return LocalStorageBackend(
+        root=tmp_path / "store",
+        bucket_name="test-bucket",
+        signing_key=b"secret",
+        base_url="http://localhost:8080",
+    )
+
+
+@pytest.fixture
+def audio_file(tmp_path):
+    path = tmp_path / "song.mp3"
+    path.write_bytes(b"0123456789" * 100)
+    return path
+
+
+class TestInterface:
+    """Test that both implementations share the interface."""
+
+    def test_backends_are_storage_backends(self, backend):
+        assert isinstance(backend, StorageBackend)
+        assert issubclass(GCSClient, StorageBackend)
+
+    def test_factory_selects_local(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(config, "storage_backend", "local")
+        monkeypatch.setattr(config, "storage_path", str(tmp_path))
+
+        assert isinstance(create_storage_backend(bucket_name="b"), LocalStorageBackend)
+
+
+class TestUploadAndRead:
+    """Test put and get-range."""
+
+    def test_upload_and_metadata(self, backend, audio_file):
+        data = audio_file.read_bytes()
+
+        stored = backend.upload_file(
+            audio_file, "audio/1/song.mp3", content_type="audio/mpeg", metadata={"audio_id": "1"}
+        )
+
+        assert stored.bucket.name == "test-bucket"
+        assert stored.size == len(data)
+        assert stored.md5_hash == base64.b64encode(hashlib.md5(data).digest()).decode()
+
+        metadata = backend.get_file_metadata("audio/1/song.mp3")
+        assert metadata["content_type"] == "audio/mpeg"
+        assert metadata["custom_metadata"] == {"audio_id": "1"}
+        assert metadata["crc32c"] == base64.b64encode(google_crc32c.Checksum(data).digest()).decode()
+
+    def test_checksum_mismatch_leaves_nothing(self, backend, audio_file):
+        with pytest.raises(api_exceptions.BadRequest):
+            backend.upload_file(audio_file, "audio/1/song.mp3", md5_hash="bm9wZQ==")
+
+        assert not backend.file_exists("audio/1/song.mp3")
+        assert list(backend.bucket_root.rglob(".upload-*")) == []
+
+    def test_read_range(self, backend, audio_file):
+        backend.upload_file(audio_file, "audio/1/song.mp3")
+
+        assert backend.read_range("audio/1/song.mp3", 5, 10) == b"5678901234"
+        assert backend.read_range("audio/1/song.mp3", 995) == b"56789"
+        assert backend.read_range("audio/1/song.mp3", 5000) == b""
+
+    def test_missing_object(self, backend):
+        with pytest.raises(NotFound):
+            backend.read_range("audio/missing.mp3")
+        with pytest.raises(NotFound):
+            backend.get_file_metadata("audio/missing.mp3")
+
+    def test_path_traversal_rejected(self, backend, audio_file):
+        with pytest.raises(ValueError):
+            backend.upload_file(audio_file, "../escape.mp3")
+
+    def test_delete(self, backend, audio_file):
+        backend.upload_file(audio_file, "audio/1/song.mp3")
+
+        assert backend.delete_file("audio/1/song.mp3") is True
+        assert backend.delete_file("audio/1/song.mp3") is False
+        assert not (backend.bucket_root / "audio").exists()
+
+
+class TestSignedURLs:
+    """Test HMAC-signed local URLs."""
+
+    def _parts(self, url):
+        parsed = urlparse(url)
+        query = parse_qs(parsed.query)
+        blob = unquote(parsed.path.split("/", 3)[3])
+        return blob, query["expires"][0], query["signature"][0]
+
+    def test_signed_url_verifies(self, backend, audio_file):
+        backend.upload_file(audio_file, "audio/1/my song.mp3")
+
+        url = backend.generate_signed_url("audio/1/my song.mp3", window_seconds=0)
+
+        assert url.startswith("http://localhost:8080/storage/test-bucket/audio/1/my%20song.mp3?")
+        assert backend.verify_signature(*self._parts(url))
+
+    def test_tampered_or_expired_rejected(self, backend, audio_file):
+        backend.upload_file(audio_file, "audio/1/song.mp3")
+        blob, expires, signature = self._parts(
+            backend.generate_signed_url("audio/1/song.mp3", expiration_minutes=1, window_seconds=0)
+        )
+
+        assert not backend.verify_signature("audio/1/other.mp3", expires, signature)
+        assert not backend.verify_signature(blob, int(expires) + 60, signature)
+        with patch("src.storage.local_backend.time.time", return_value=time.time() + 120):
+            assert not backend.verify_signature(blob, expires, signature)
+
+    def test_windowed_urls_are_stable(self, backend, audio_file):
+        backend.upload_file(audio_file, "audio/1/song.mp3")
+
+        with patch("src.storage.gcs_client.time.time", return_value=1_700_000_100):
+            first = backend.generate_signed_url("audio/1/song.mp3", window_seconds=900)
+        with patch("src.storage.gcs_client.time.time", return_value=1_700_000_500):
+            second = backend.generate_signed_url("audio/1/song.mp3", window_seconds=900)
+
+        assert first == second
+
+    def test_missing_blob_not_signed(self, backend):
+        with pytest.raises(NotFound):
+            backend.generate_signed_url("audio/missing.mp3")
+
+
+class TestListing:
+    """Test paginated listing."""
+
+    def test_pages_and_tokens(self, backend, audio_file):
+        for i in range(5):
+            backend.upload_file(audio_file, f"audio/{i}/song.mp3")
+
+        pages = list(backend.iter_file_pages(prefix="audio/", page_size=2, fields=["name", "size"]))
+
+        assert [len(p.items) for p in pages] == [2, 2, 1]
+        assert pages[0].items[0] == {"name": "audio/0/song.mp3", "size": 1000}
+        resumed = list(backend.iter_files(prefix="audio/", page_token=pages[0].next_page_token))
+        assert [item["name"] for item in resumed] == [f"audio/{i}/song.mp3" for i in range(2, 5)]
+
+    def test_delimiter(self, backend, audio_file):
+        backend.upload_file(audio_file, "audio/1/song.mp3")
+        backend.upload_file(audio_file, "audio/2/song.mp3")
+        backend.upload_file(audio_file, "audio/index.json")
+
+        page = next(backend.iter_file_pages(prefix="audio/", delimiter="/"))
+
+        assert [item["name"] for item in page.items] == ["audio/index.json"]
+        assert page.prefixes == ["audio/1/", "audio/2/"]
+
+    def test_list_files_max_results(self, backend, audio_file):
+        for i in range(3):
+            backend.upload_file(audio_file, f"audio/{i}/song.mp3")
+
+        assert len(backend.list_files(prefix="audio/", max_results=2)) == 2
+
+
+class TestUnchangedCallers:
+    """Test that callers work unchanged against the local backend."""
+
+    @pytest.fixture
+    def local_config(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(config, "storage_backend", "local")
+        monkeypatch.setattr(config, "storage_path", str(tmp_path / "store"))
+        monkeypatch.setattr(config, "local_storage_signing_key", "secret")
+        monkeypatch.setattr(config, "gcs_bucket_name", "test-bucket")
+
+    def test_audio_storage_manager(self, local_config, audio_file):
+        from src.storage.manager import AudioStorageManager
+
+        manager = AudioStorageManager()
+        result = manager.upload_audio_file(audio_file)
+
+        assert isinstance(manager.backend, LocalStorageBackend)
+        assert result.audio_gcs_path == f"gs://test-bucket/audio/{result.audio_id}/audio.mp3"
+        assert result.metadata["size"] == 1000
+
+    def test_signed_url_cache(self, local_config, audio_file):
+        from src.resources.cache import SignedURLCache
+
+        create_storage_backend().upload_file(audio_file, "audio/1/song.mp3")
+        cache = SignedURLCache()
+
+        url = cache.get("gs://test-bucket/audio/1/song.mp3")
+
+        assert url.startswith("http://localhost:")
+        assert cache.get("gs://test-bucket/audio/1/song.mp3") == url
+        assert cache.hits == 1
@@ -0,0 +1,156 @@
+"""
+Tests for coalescing concurrent track lookups (database.batching).
+
+These tests verify:
+- Concurrent loads are resolved by one batch call, duplicates sharing a result
+- Keys missing from the batch result resolve to None
+- A failing batch raises to every waiter
+- Batches are split at max_batch_size
+- Concurrent get_audio_metadata_by_id calls run one WHERE id = ANY query
+"""
+
+import asyncio
+import uuid
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from database import async_operations
+from database.batching import AsyncBatchLoader
+from database.operations import GET_METADATA_BY_ID_QUERY, GET_METADATA_BY_IDS_QUERY
+
+
+def _batch_fn(found=None):
+    """Batch function returning {key: found[key]} for the keys it knows."""
+    found = found or {}
+
+    async def batch(keys):
+        return {key: found[key] for key in keys if key in found}
+
+    return AsyncMock(side_effect=batch)
+
+
+class TestAsyncBatchLoader:
+    """Test the loader itself."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_batched(self):
+        batch_fn = _batch_fn({"a": 1, "b": 2, "c": 3})
+        loader = AsyncBatchLoader(batch_fn, window_seconds=0)
+
+        results = await asyncio.gather(*(loader.load(key) for key in ("a", "b", "c", "a")))
+
+        assert results == [1, 2, 3, 1]
+        batch_fn.assert_awaited_once_with(["a", "b", "c"])
+        stats = loader.get_stats()
+        assert (stats["loads"], stats["batches"], stats["coalesced"]) == (4, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_missing_key_resolves_none(self):
+        loader = AsyncBatchLoader(_batch_fn({"a": 1}), window_seconds=0)
+
+        assert await asyncio.gather(loader.load("a"), loader.load("x")) == [1, None]
+
+    @pytest.mark.asyncio
+    async def test_error_raised_to_every_waiter(self):
+        loader = AsyncBatchLoader(AsyncMock(side_effect=RuntimeError("down")), window_seconds=0)
+
+        results = await asyncio.gather(loader.load("a"), loader.load("b"), return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_split_at_max_batch_size(self):
+        batch_fn = _batch_fn({key: key for key in "abcde"})
+        loader = AsyncBatchLoader(batch_fn, window_seconds=0.05, max_batch_size=2)
+
+        results = await asyncio.gather(*(loader.load(key) for key in "abcde"))
+
+        assert results == list("abcde")
+        assert [call.args[0] for call in batch_fn.await_args_list] == [["a", "b"], ["c", "d"], ["e"]]
+
+    @pytest.mark.asyncio
+    async def test_sequential_loads_not_merged(self):
+        batch_fn = _batch_fn({"a": 1})
+        loader = AsyncBatchLoader(batch_fn, window_seconds=0)
+
+        await loader.load("a")
+        await loader.load("a")
+
+        assert batch_fn.await_count == 2
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    async def fetchall(self):
+        return self.rows
+
+
+class FakeConnection:
+    """Async connection stand-in returning the rows asked for."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.executed = []
+
+    async def execute(self, query, params=None):
+        self.executed.append((query, params))
+        wanted = params[0] if isinstance(params[0], list) else [params[0]]
+        return FakeCursor([row for row in self.rows if row["id"] in wanted])
+
+
+class TestBatchedMetadataLookup:
+    """Test get_audio_metadata_by_id through the loader."""
+
+    @pytest.fixture
+    def conn(self):
+        tracks = [{"id": str(uuid.uuid4()), "title": f"Track {i}"} for i in range(3)]
+        conn = FakeConnection(tracks)
+
+        @asynccontextmanager
+        async def get_async_connection():
+            yield conn
+
+        loader = AsyncBatchLoader(async_operations._load_metadata_batch, window_seconds=0)
+        with patch("database.async_operations.is_async_pool_enabled", return_value=True), \
+             patch("database.async_operations.get_async_connection", get_async_connection), \
+             patch.object(async_operations, "_metadata_loader", loader):
+            yield conn
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_one_query(self, conn):
+        ids = [row["id"] for row in conn.rows] + [str(uuid.uuid4())]
+
+        results = await asyncio.gather(*(async_operations.get_audio_metadata_by_id(i) for i in ids))
+
+        assert results == conn.rows + [None]
+        assert len(conn.executed) == 1
+        query, params = conn.executed[0]
+        assert query == GET_METADATA_BY_IDS_QUERY
+        assert sorted(params[0]) == sorted(ids)
+
+    @pytest.mark.asyncio
+    async def test_callers_get_independent_rows(self, conn):
+        track_id = conn.rows[0]["id"]
+
+        first, second = await asyncio.gather(
+            async_operations.get_audio_metadata_by_id(track_id),
+            async_operations.get_audio_metadata_by_id(track_id.upper()),
+        )
+        first["title"] = "changed"
+
+        assert second["title"] == "Track 0"
+        assert conn.executed == [(GET_METADATA_BY_ID_QUERY, (track_id,))]
+
+    @pytest.mark.asyncio
+    async def test_batching_disabled(self, conn):
+        with patch("database.async_operations._lookup_batching_enabled", return_value=False):
+            await asyncio.gather(*(async_operations.get_audio_metadata_by_id(row["id"]) for row in conn.rows))
+
+        assert [query for query, _ in conn.executed] == [GET_METADATA_BY_ID_QUERY] * 3
@@ -0,0 +1,251 @@
+"""
+Tests for the track metadata read-through cache (database.metadata_cache).
+
+These tests verify:
+- LRU eviction and TTL expiry
+- A read that races an invalidation is not cached
+- The cache is bypassed while no change listener is connected
+- NOTIFY payloads from the listener invalidate entries
+- The listener starts when either the metadata or the search cache is enabled
+- get_audio_metadata_by_id(s) read through the cache and writes invalidate it
+"""
+
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from database import operations
+from database import metadata_cache
+from database.metadata_cache import (
+    MetadataCache,
+    MetadataChangeListener,
+    INVALIDATE_ALL,
+    bypass_metadata_cache,
+)
+
+
+def _track(track_id=None, title="Hey Jude"):
+    return {"id": track_id or str(uuid.uuid4()), "title": title}
+
+
+def _fake_connection(fetchone=None, fetchall=None):
+    """get_connection() stand-in whose cursor returns the given rows."""
+    cursor = MagicMock()
+    cursor.fetchone.return_value = fetchone
+    cursor.fetchall.return_value = fetchall or []
+    conn = MagicMock()
+    conn.cursor.return_value.__enter__.return_value = cursor
+    conn_ctx = MagicMock()
+    conn_ctx.__enter__.return_value = conn
+    return conn_ctx
+
+
+class TestMetadataCache:
+    """Test the LRU/TTL cache itself."""
+
+    def test_hit_returns_copy(self):
+        cache = MetadataCache(require_listener=False)
+        track = _track()
+        cache.put(track, cache.generation)
+
+        cached = cache.get(track["id"].upper())
+        cached["title"] = "changed"
+
+        assert cache.get(track["id"])["title"] == "Hey Jude"
+        assert cache.hits == 2
+
+    def test_lru_eviction(self):
+        cache = MetadataCache(max_entries=2, require_listener=False)
+        first, second, third = _track(), _track(), _track()
+        for track in (first, second):
+            cache.put(track, cache.generation)
+        cache.get(first["id"])
+        cache.put(third, cache.generation)
+
+        assert cache.get(second["id"]) is None
+        assert cache.get(first["id"]) is not None
+        assert cache.evictions == 1
+
+    def test_ttl_expiry(self):
+        cache = MetadataCache(ttl_seconds=10, require_listener=False)
+        track = _track()
+
+        with patch("database.metadata_cache.time.monotonic", return_value=100.0):
+            cache.put(track, cache.generation)
+        with patch("database.metadata_cache.time.monotonic", return_value=111.0):
+            assert cache.get(track["id"]) is None
+
+    def test_put_after_invalidation_skipped(self):
+        cache = MetadataCache(require_listener=False)
+        track = _track()
+
+        generation = cache.generation
+        cache.invalidate(track["id"])  # e.g. a NOTIFY arriving while the query ran
+
+        assert cache.put(track, generation) is False
+        assert cache.get(track["id"]) is None
+
+    def test_invalidate_all(self):
+        cache = MetadataCache(require_listener=False)
+        track = _track()
+        cache.put(track, cache.generation)
+
+        cache.invalidate(INVALIDATE_ALL)
+
+        assert cache.get(track["id"]) is None
+
+    def test_bypassed_without_listener(self):
+        cache = MetadataCache(require_listener=True)
+        track = _track()
+
+        assert cache.put(track, cache.generation) is False
+
+        cache.set_listening(True)
+        cache.put(track, cache.generation)
+        assert cache.get(track["id"]) is not None
+
+        # Notifications may be missed while disconnected
+        cache.set_listening(False)
+        cache.set_listening(True)
+        assert cache.get(track["id"]) is None
+
+    def test_disabled_with_zero_entries(self):
+        cache = MetadataCache(max_entries=0, require_listener=False)
+
+        assert cache.active is False
+
+    def test_bypass_swaps_in_disabled_cache(self):
+        cache = MetadataCache(require_listener=False)
+        track = _track()
+        cache.put(track, cache.generation)
+
+        with patch.object(metadata_cache, "_metadata_cache", cache):
+            with bypass_metadata_cache():
+                assert metadata_cache.get_metadata_cache().get(track["id"]) is None
+                assert metadata_cache.library_changes_tracked() is False
+            assert metadata_cache.get_metadata_cache() is cache
+
+
+class TestGlobalCache:
+    """Test when get_metadata_cache starts the change listener."""
+
+    def _create(self, metadata_enabled, search_enabled, database_url="postgresql://db"):
+        config = MagicMock(
+            db_metadata_cache_enabled=metadata_enabled,
+            db_metadata_cache_max_entries=100,
+            db_metadata_cache_ttl_seconds=60.0,
+            db_metadata_cache_listen=True,
+            search_cache_enabled=search_enabled,
+        )
+        with patch.object(metadata_cache, "HAS_APP_CONFIG", True), \
+             patch.object(metadata_cache, "app_config", config, create=True), \
+             patch.object(metadata_cache, "_metadata_cache", None), \
+             patch.object(metadata_cache, "_listener", None), \
+             patch.object(metadata_cache, "_resolve_database_url", return_value=database_url), \
+             patch.object(metadata_cache, "MetadataChangeListener") as listener_cls:
+            cache = metadata_cache.get_metadata_cache()
+        return cache, listener_cls
+
+    def test_listener_started_for_search_cache_only(self):
+        cache, listener_cls = self._create(metadata_enabled=False, search_enabled=True)
+
+        assert cache.max_entries == 0
+        listener_cls.assert_called_once_with(cache, "postgresql://db")
+        listener_cls.return_value.start.assert_called_once()
+
+    def test_no_listener_when_both_disabled(self):
+        _, listener_cls = self._create(metadata_enabled=False, search_enabled=False)
+
+        listener_cls.assert_not_called()
+
+    def test_missing_database_url_logged(self, caplog):
+        _, listener_cls = self._create(metadata_enabled=True, search_enabled=True, database_url=None)
+
+        listener_cls.assert_not_called()
+        assert "No database URL for the metadata change listener" in caplog.text
+
+
+class TestMetadataChangeListener:
+    """Test NOTIFY handling."""
+
+    def test_notification_invalidates(self):
+        cache = MetadataCache(require_listener=False)
+        track = _track()
+        cache.put(track, cache.generation)
+
+        MetadataChangeListener(cache, "postgresql://").handle_notification(track["id"])
+
+        assert cache.get(track["id"]) is None
+
+    def test_listen_loop_dispatches_notifies(self):
+        cache = MetadataCache()
+        track = _track()
+        conn = MagicMock()
+        conn.notifies = []
+        listener = MetadataChangeListener(cache, "postgresql://", connect=lambda url: conn)
+
+        waits = []
+
+        def fake_select(readable, writable, errors, timeout):
+            waits.append(timeout)
+            if len(waits) == 1:
+                # LISTEN is up: a track gets cached, then changed elsewhere
+                cache.put(track, cache.generation)
+                conn.notifies.append(MagicMock(payload=track["id"]))
+                return [conn], [], []
+            assert cache.get(track["id"]) is None
+            listener._stop.set()
+            return [], [], []
+
+        with patch("database.metadata_cache.select.select", side_effect=fake_select):
+            listener._listen_once()
+
+        conn.cursor.return_value.__enter__.return_value.execute.assert_any_call("LISTEN audio_tracks_changed")
+        assert listener.notifications == 1
+        assert cache.active is False  # Disconnected again after the loop ended
+        assert cache.get_stats()["size"] == 0
+        conn.close.assert_called_once()
+
+
+class TestReadThrough:
+    """Test the cache in front of the metadata lookups."""
+
+    @pytest.fixture
+    def cache(self):
+        cache = MetadataCache(require_listener=False)
+        with patch.object(operations, "get_metadata_cache", return_value=cache):
+            yield cache
+
+    def test_by_id_cached(self, cache):
+        track = _track()
+
+        with patch.object(operations, "get_connection", return_value=_fake_connection(fetchone=track)) as get_conn, \
+             patch.object(operations, "execute_prepared"):
+            first = operations.get_audio_metadata_by_id(track["id"])
+            second = operations.get_audio_metadata_by_id(track["id"])
+
+        assert first == second == track
+        assert get_conn.call_count == 1
+
+    def test_by_ids_queries_only_missing(self, cache):
+        cached, fresh = _track(), _track()
+        cache.put(cached, cache.generation)
+
+        with patch.object(operations, "get_connection", return_value=_fake_connection(fetchall=[fresh])), \
+             patch.object(operations, "execute_prepared") as execute:
+            result = operations.get_audio_metadata_by_ids([cached["id"], fresh["id"]])
+
+        assert execute.call_args.args[2] == ([fresh["id"]],)
+        assert {row["id"] for row in result} == {cached["id"], fresh["id"]}
+        assert cache.get(fresh["id"]) is not None
+
+    def test_delete_invalidates(self, cache):
+        track = _track()
+        cache.put(track, cache.generation)
+        deleted = [{"id": track["id"], "audio_gcs_path": None, "thumbnail_gcs_path": None}]
+
+        with patch.object(operations, "get_connection", return_value=_fake_connection(fetchall=deleted)):
+            operations.delete_audio_tracks([track["id"]])
+
+        assert cache.get(track["id"]) is None
@@ -0,0 +1,225 @@
+"""
+Tests for server-side prepared statements (database.prepared).
+
+These tests verify:
+- psycopg2 placeholders are rewritten as $n parameters
+- Queries are prepared once per connection and then executed by name
+- Replacement connections prepare their own statements
+- Statements lost on the server are prepared again and the query retried
+- The per-connection LRU limit deallocates old statements
+"""
+
+import gc
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+from psycopg2 import errors, extensions
+
+from database import operations
+from database.operations import GET_METADATA_BY_ID_QUERY, GET_METADATA_BY_IDS_QUERY
+from database.prepared import (
+    PreparedStatementRegistry,
+    statement_name,
+    to_server_placeholders,
+)
+
+
+class FakeConnection:
+    """Connection whose session remembers PREPAREd statement names."""
+
+    def __init__(self, transaction_status=extensions.TRANSACTION_STATUS_IDLE):
+        self.session = set()
+        self.rollback = MagicMock()
+        self.transaction_status = transaction_status
+        self.side_cursor = FakeCursor(self)
+
+    def get_transaction_status(self):
+        return self.transaction_status
+
+    def cursor(self):
+        return self.side_cursor
+
+
+class FakeCursor:
+    """Cursor that interprets PREPARE / EXECUTE / DEALLOCATE like the server."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.executed = []
+
+    def execute(self, query, params=None):
+        self.executed.append((query, params))
+        keyword, _, rest = query.partition(" ")
+        name = rest.split(" ", 1)[0]
+        session = self.connection.session
+
+        if keyword == "PREPARE":
+            if name in session:
+                raise errors.DuplicatePreparedStatement(f'prepared statement "{name}" already exists')
+            session.add(name)
+        elif keyword == "EXECUTE":
+            if name not in session:
+                raise errors.InvalidSqlStatementName(f'prepared statement "{name}" does not exist')
+        elif keyword == "DEALLOCATE":
+            session.discard(name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def keywords(self):
+        return [query.split(" ", 1)[0] for query, _ in self.executed]
+
+
+@pytest.fixture
+def registry():
+    return PreparedStatementRegistry(max_statements=2)
+
+
+class TestPlaceholders:
+    """Test placeholder rewriting."""
+
+    def test_positional_and_literal_percent(self):
+        query = "SELECT * FROM t WHERE a = %s AND b LIKE 'x%%' AND c = %s"
+
+        assert to_server_placeholders(query) == (
+            "SELECT * FROM t WHERE a = $1 AND b LIKE 'x%' AND c = $2",
+            2,
+        )
+
+    def test_named_placeholders_rejected(self):
+        with pytest.raises(ValueError):
+            to_server_placeholders("SELECT * FROM t WHERE a = %(a)s")
+
+
+class TestPreparedStatementRegistry:
+    """Test prepare-once / execute-by-name behaviour."""
+
+    def test_prepared_once_per_connection(self, registry):
+        cur = FakeCursor(FakeConnection())
+        track_id = str(uuid.uuid4())
+
+        for _ in range(3):
+            registry.execute(cur, GET_METADATA_BY_ID_QUERY, (track_id,))
+
+        name = statement_name(GET_METADATA_BY_ID_QUERY)
+        assert cur.keywords() == ["PREPARE", "EXECUTE", "EXECUTE", "EXECUTE"]
+        assert "$1" in cur.executed[0][0]
+        assert cur.executed[1] == (f"EXECUTE {name} (%s)", [track_id])
+        assert registry.get_stats()["prepares"] == 1
+        assert registry.get_stats()["executes"] == 3
+
+    def test_list_parameters_sent_as_array_literal(self, registry):
+        cur = FakeCursor(FakeConnection())
+        ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+
+        registry.execute(cur, GET_METADATA_BY_IDS_QUERY, (ids,))
+
+        assert cur.executed[1][1] == ['{"%s","%s"}' % tuple(ids)]
+
+    def test_new_connection_prepares_again(self, registry):
+        first = FakeCursor(FakeConnection())
+        registry.execute(first, GET_METADATA_BY_ID_QUERY, ("a",))
+
+        replacement = FakeCursor(FakeConnection())
+        registry.execute(replacement, GET_METADATA_BY_ID_QUERY, ("a",))
+
+        assert replacement.keywords() == ["PREPARE", "EXECUTE"]
+
+    def test_closed_connections_are_dropped(self, registry):
+        conn = FakeConnection()
+        registry.execute(FakeCursor(conn), GET_METADATA_BY_ID_QUERY, ("a",))
+        assert registry.get_stats()["connections"] == 1
+
+        del conn
+        gc.collect()
+
+        assert registry.get_stats()["connections"] == 0
+
+    def test_lost_statement_is_reprepared(self, registry):
+        conn = FakeConnection()
+        cur = FakeCursor(conn)
+        registry.execute(cur, GET_METADATA_BY_ID_QUERY, ("a",))
+
+        conn.session.clear()  # e.g. DISCARD ALL by a connection proxy
+        registry.execute(cur, GET_METADATA_BY_ID_QUERY, ("a",))
+
+        assert cur.keywords() == ["PREPARE", "EXECUTE", "EXECUTE", "PREPARE", "EXECUTE"]
+        conn.rollback.assert_called_once()
+        assert registry.get_stats()["reprepares"] == 1
+
+    def test_resync_keeps_open_transaction(self, registry):
+        conn = FakeConnection(transaction_status=extensions.TRANSACTION_STATUS_INTRANS)
+        cur = FakeCursor(conn)
+        registry.execute(cur, GET_METADATA_BY_ID_QUERY, ("a",))
+
+        conn.session.clear()
+        registry.execute(cur, GET_METADATA_BY_ID_QUERY, ("a",))
+
+        # Only the failed EXECUTE is undone; earlier statements survive
+        assert cur.keywords()[3:] == ["SAVEPOINT", "EXECUTE", "ROLLBACK", "PREPARE", "EXECUTE"]
+        conn.rollback.assert_not_called()
+        # Released on another cursor once the query succeeded, leaving cur's results intact
+        assert conn.side_cursor.keywords() == ["RELEASE", "RELEASE"]
+
+    def test_no_savepoint_outside_transaction(self, registry):
+        conn = FakeConnection()
+        cur = FakeCursor(conn)
+
+        registry.execute(cur, GET_METADATA_BY_ID_QUERY, ("a",))
+
+        assert cur.keywords() == ["PREPARE", "EXECUTE"]
+        assert conn.side_cursor.keywords() == []
+
+    def test_statement_prepared_outside_registry(self, registry):
+        conn = FakeConnection()
+        conn.session.add(statement_name(GET_METADATA_BY_ID_QUERY))
+        cur = FakeCursor(conn)
+
+        registry.execute(cur, GET_METADATA_BY_ID_QUERY, ("a",))
+
+        assert cur.keywords() == ["PREPARE", "DEALLOCATE", "PREPARE", "EXECUTE"]
+
+    def test_least_recently_used_statement_deallocated(self, registry):
+        cur = FakeCursor(FakeConnection())
+        queries = [f"SELECT {i} WHERE %s IS NOT NULL" for i in range(3)]
+
+        registry.execute(cur, queries[0], ("a",))
+        registry.execute(cur, queries[1], ("a",))
+        registry.execute(cur, queries[0], ("a",))
+        registry.execute(cur, queries[2], ("a",))
+
+        assert f"DEALLOCATE {statement_name(queries[1])}" in [q for q, _ in cur.executed]
+        assert registry.is_prepared(cur.connection, queries[0])
+        assert not registry.is_prepared(cur.connection, queries[1])
+
+    def test_disabled_runs_plain_query(self):
+        registry = PreparedStatementRegistry(enabled=False)
+        cur = FakeCursor(FakeConnection())
+
+        registry.execute(cur, GET_METADATA_BY_ID_QUERY, ("a",))
+
+        assert cur.executed == [(GET_METADATA_BY_ID_QUERY, ["a"])]
+
+
+class TestOperationsUsePreparedStatements:
+    """Test that the hot read operations go through the registry."""
+
+    def test_get_by_id(self, registry):
+        conn = FakeConnection()
+        cur = FakeCursor(conn)
+        cur.fetchone = MagicMock(return_value=None)
+        conn.cursor = MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cur
+        conn_ctx = MagicMock()
+        conn_ctx.__enter__.return_value = conn
+
+        with patch.object(operations, "get_connection", return_value=conn_ctx), \
+             patch("database.prepared.get_statement_registry", return_value=registry):
+            operations.get_audio_metadata_by_id(str(uuid.uuid4()))
+            operations.get_audio_metadata_by_id(str(uuid.uuid4()))
+
+        assert cur.keywords() == ["PREPARE", "EXECUTE", "EXECUTE"]
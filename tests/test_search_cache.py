@@ -0,0 +1,115 @@
+"""
+Tests for the search_library result cache (src.tools.query_tools).
+
+These tests verify:
+- Repeated searches are served from the cache and counted as hits
+- Equivalent inputs (whitespace, filter order) share one entry
+- A library generation bump (any track write) expires every entry
+- Entries expire after the TTL and are bounded by LRU eviction
+- Nothing is cached while library changes are not being tracked
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from database import operations
+from database.metadata_cache import get_library_generation
+from src.exceptions import DatabaseOperationError
+from src.tools import query_tools
+from src.tools.query_schemas import SearchLibraryInput
+from src.tools.query_tools import SearchResultCache, search_cache_key, search_library
+
+
+SEARCH_RESULT = {"tracks": [], "total_matches": 0, "has_more": False}
+
+
+@pytest.fixture
+def search_cache():
+    """Fresh cache, with library changes treated as tracked."""
+    cache = SearchResultCache(max_entries=10, ttl_seconds=60)
+    with patch.object(query_tools, "get_search_cache", return_value=cache), \
+         patch.object(query_tools, "library_changes_tracked", return_value=True), \
+         patch.object(query_tools, "fuzzy_search_audio_tracks", return_value=[]):
+        yield cache
+
+
+def _key(**input_data):
+    return search_cache_key(SearchLibraryInput(**input_data))
+
+
+class TestSearchCacheKey:
+    """Test request canonicalization."""
+
+    def test_equivalent_inputs_share_key(self):
+        first = _key(query="hey  jude", filters={"genre": ["Rock", "blues"], "format": ["MP3", "FLAC"]})
+        second = _key(query=" hey jude ", filters={"genre": ["Blues", "rock"], "format": ["FLAC", "MP3"]})
+
+        assert first == second
+
+    def test_different_inputs_differ(self):
+        assert _key(query="rock") != _key(query="rock", limit=50)
+        assert _key(query="rock") != _key(query="rock", sortBy="title")
+
+
+class TestSearchResultCache:
+    """Test search_library with the cache in front of it."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_search_hits_cache(self, search_cache):
+        with patch.object(query_tools, "search_audio_tracks_advanced", return_value=SEARCH_RESULT) as mock_search:
+            first = await search_library({"query": "rock", "filters": {"genre": ["Rock", "Jazz"]}})
+            second = await search_library({"query": "rock", "filters": {"genre": ["jazz", "rock"]}})
+
+        assert first == second
+        assert mock_search.call_count == 1
+        stats = search_cache.get_stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_library_write_expires_entries(self, search_cache):
+        with patch.object(query_tools, "search_audio_tracks_advanced", return_value=SEARCH_RESULT) as mock_search:
+            await search_library({"query": "rock"})
+            with patch.object(operations, "get_metadata_cache"):
+                operations._tracks_changed(["550e8400-e29b-41d4-a716-446655440000"])
+            await search_library({"query": "rock"})
+
+        assert mock_search.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_not_cached_when_changes_untracked(self, search_cache):
+        with patch.object(query_tools, "library_changes_tracked", return_value=False), \
+             patch.object(query_tools, "search_audio_tracks_advanced", return_value=SEARCH_RESULT) as mock_search:
+            await search_library({"query": "rock"})
+            await search_library({"query": "rock"})
+
+        assert mock_search.call_count == 2
+        assert search_cache.get_stats()["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_not_cached(self, search_cache):
+        with patch.object(query_tools, "search_audio_tracks_advanced",
+                          side_effect=DatabaseOperationError("down")):
+            result = await search_library({"query": "rock"})
+
+        assert result["success"] is False
+        assert search_cache.get_stats()["size"] == 0
+
+    def test_ttl_expiry(self):
+        cache = SearchResultCache(ttl_seconds=30)
+        generation = get_library_generation()
+
+        with patch("src.tools.query_tools.time.monotonic", return_value=100.0):
+            cache.put("key", generation, {"success": True})
+        with patch("src.tools.query_tools.time.monotonic", return_value=131.0):
+            assert cache.get("key", generation) is None
+
+    def test_lru_eviction(self):
+        cache = SearchResultCache(max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.put(key, 0, {"key": key})
+
+        assert cache.get("a", 0) is None
+        assert cache.get("c", 0) == {"key": "c"}
+        assert cache.evictions == 1
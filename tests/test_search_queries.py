@@ -0,0 +1,611 @@
+"""
+Tests for the advanced search SQL (database.operations).
+
+These tests verify:
+- The page query parses the tsquery and ranks each row once
+- The total comes from a window count instead of a separate COUNT query
+- includeTotal=false skips counting and still reports hasMore
+- The count query only runs for pages past the end of the results
+- Cursor pages seek past the previous page's last row
+- sortBy/sortOrder order by the column with an index-compatible keyset
+- Every search_library filter becomes an SQL predicate, and (against a
+  configured database) the planner answers it with the matching index
+- Zero-hit searches fall back to indexed trigram (fuzzy) matching
+- Facet counts come from one GROUPING SETS query over all matches
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from database import operations
+from database.operations import (
+    build_advanced_search_queries,
+    advanced_search_response,
+    build_fuzzy_search_query,
+    facet_counts,
+)
+from src.exceptions import ValidationError
+
+
+def is_db_configured() -> bool:
+    """Check if database configuration is available."""
+    return bool(
+        (os.getenv("DB_HOST") or os.getenv("DB_CONNECTION_NAME")) and
+        os.getenv("DB_NAME") and
+        os.getenv("DB_USER") and
+        os.getenv("DB_PASSWORD")
+    )
+
+
+def _rows(count, total=None):
+    created_at = datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc)
+    rows = [{"id": f"id{i}", "title": f"Song {i}", "rank": 0.5, "created_at": created_at} for i in range(count)]
+    if total is not None:
+        for row in rows:
+            row["total"] = total
+    return rows
+
+
+def _fake_connection(fetchall, fetchone=None):
+    """get_connection() stand-in whose cursor returns the given rows."""
+    cursor = MagicMock()
+    cursor.fetchall.return_value = fetchall
+    cursor.fetchone.return_value = fetchone
+    conn = MagicMock()
+    conn.cursor.return_value.__enter__.return_value = cursor
+    conn_ctx = MagicMock()
+    conn_ctx.__enter__.return_value = conn
+    return conn_ctx
+
+
+class TestSearchQueryBuilder:
+    """Test the generated SQL."""
+
+    def test_single_pass_query(self):
+        search = build_advanced_search_queries("hey jude", limit=10, status_filter="COMPLETED")
+
+        sql = search.search_query
+        assert sql.count("to_tsquery") == 1
+        assert sql.count("ts_rank") == 1
+        assert "COUNT(*) OVER ()" in sql
+        assert search.search_params == ["hey & jude", "COMPLETED", 0.0, 11, 0]
+
+    def test_without_total_fetches_one_extra_row(self):
+        search = build_advanced_search_queries("rock", limit=10, include_total=False)
+
+        assert "OVER ()" not in search.search_query
+        assert search.search_params[-2:] == [11, 0]
+
+
+class TestSearchFilters:
+    """Test the filter predicates."""
+
+    def test_all_filters_pushed_down(self):
+        search = build_advanced_search_queries(
+            "rock",
+            status_filter="COMPLETED",
+            genres=["Rock", " Jazz "],
+            formats=["mp3", "FLAC"],
+            duration_min=120,
+            duration_max=300.5,
+            artist_filter="beatles",
+            album_filter="50%_off",
+        )
+
+        sql = search.search_query
+        assert "UPPER(t.format) = ANY(%s::text[])" in sql
+        assert "LOWER(t.genre) = ANY(%s::text[])" in sql
+        assert "t.duration_seconds >= %s" in sql
+        assert "t.artist ILIKE %s" in sql
+        assert search.count_params == [
+            "rock", "COMPLETED", ["FLAC", "MP3"], ["jazz", "rock"], 120, 300.5,
+            "%beatles%", "%50\\%\\_off%", 0.0,
+        ]
+
+    def test_format_filter_merged_into_formats(self):
+        search = build_advanced_search_queries("rock", format_filter="wav", formats=["MP3"])
+
+        assert search.filters["formats"] == ["MP3", "WAV"]
+
+    def test_invalid_duration_range(self):
+        with pytest.raises(ValidationError):
+            build_advanced_search_queries("rock", duration_min=300, duration_max=100)
+
+
+class TestSearchResponse:
+    """Test totals and hasMore in the result dictionary."""
+
+    def test_total_from_window_column(self):
+        search = build_advanced_search_queries("rock", limit=2)
+
+        result = advanced_search_response(search, _rows(3, total=5))
+
+        assert result["total_matches"] == 5
+        assert result["has_more"] is True
+        assert len(result["tracks"]) == 2
+        assert "total" not in result["tracks"][0]
+
+    def test_without_total(self):
+        search = build_advanced_search_queries("rock", limit=2, include_total=False)
+
+        result = advanced_search_response(search, _rows(3))
+
+        assert result["total_matches"] is None
+        assert len(result["tracks"]) == 2
+        assert result["has_more"] is True
+
+    def test_empty_first_page(self):
+        search = build_advanced_search_queries("rock")
+
+        assert not search.needs_count([])
+        assert advanced_search_response(search, [])["total_matches"] == 0
+
+
+class TestSearchCursor:
+    """Test keyset pagination of search results."""
+
+    def test_next_cursor_seeks_past_last_row(self):
+        first = build_advanced_search_queries("rock", limit=2)
+        page = advanced_search_response(first, _rows(3, total=10))
+
+        assert page["next_cursor"]
+
+        second = build_advanced_search_queries("rock", limit=2, cursor=page["next_cursor"])
+
+        assert "(rank, created_at, id) <" in second.search_query
+        assert second.search_params[-5:] == [0.5, "2024-05-01T12:00:00+00:00", "id1", 3, 0]
+
+    def test_no_cursor_on_last_page(self):
+        search = build_advanced_search_queries("rock", limit=2)
+
+        assert advanced_search_response(search, _rows(2, total=2))["next_cursor"] is None
+
+    def test_cursor_from_other_query_rejected(self):
+        search = build_advanced_search_queries("rock", limit=2)
+        cursor = advanced_search_response(search, _rows(3, total=10))["next_cursor"]
+
+        with pytest.raises(ValidationError):
+            build_advanced_search_queries("jazz", limit=2, cursor=cursor)
+
+    def test_malformed_cursor_rejected(self):
+        with pytest.raises(ValidationError):
+            build_advanced_search_queries("rock", cursor="not-a-cursor")
+
+    def test_cursor_and_offset_rejected(self):
+        search = build_advanced_search_queries("rock", limit=2)
+        cursor = advanced_search_response(search, _rows(3, total=10))["next_cursor"]
+
+        with pytest.raises(ValidationError):
+            build_advanced_search_queries("rock", offset=2, cursor=cursor)
+
+
+class TestSearchSort:
+    """Test column ordering of search results."""
+
+    def test_relevance_is_default(self):
+        search = build_advanced_search_queries("rock")
+
+        assert "ORDER BY rank DESC, created_at DESC, id DESC" in search.search_query
+        assert search.total_in_page
+
+    def test_column_sort_without_window_total(self):
+        search = build_advanced_search_queries("rock", sort_by="year", sort_order="asc")
+
+        assert "ORDER BY year ASC, id ASC" in search.search_query
+        assert "OVER ()" not in search.search_query
+        assert search.needs_count(_rows(1))
+
+    def test_total_from_count_query(self):
+        search = build_advanced_search_queries("rock", limit=2, sort_by="title")
+
+        result = advanced_search_response(search, _rows(3), total_matches=9)
+
+        assert result["total_matches"] == 9
+        assert result["has_more"] is True
+
+    def test_column_cursor(self):
+        search = build_advanced_search_queries("rock", limit=2, sort_by="title", sort_order="asc")
+        cursor = advanced_search_response(search, _rows(3), total_matches=9)["next_cursor"]
+
+        second = build_advanced_search_queries(
+            "rock", limit=2, sort_by="title", sort_order="asc", cursor=cursor
+        )
+
+        assert "(title, id) > (%s::text, %s::uuid)" in second.search_query
+        assert second.search_params[-4:] == ["Song 1", "id1", 3, 0]
+
+    def test_nullable_column_seek(self):
+        rows = [{"id": "a", "artist": "Abba"}, {"id": "b", "artist": None}, {"id": "c", "artist": None}]
+
+        for sort_order, null_last in (("asc", True), ("desc", False)):
+            search = build_advanced_search_queries("rock", limit=1, sort_by="artist", sort_order=sort_order)
+            cursor = advanced_search_response(search, rows[:2], total_matches=3)["next_cursor"]
+            second = build_advanced_search_queries(
+                "rock", limit=1, sort_by="artist", sort_order=sort_order, cursor=cursor
+            )
+
+            # Values compared after "Abba" must still include NULL artists ascending
+            assert ("artist IS NULL)" in second.search_query) is null_last
+
+    def test_cursor_bound_to_sort(self):
+        search = build_advanced_search_queries("rock", limit=2, sort_by="title")
+        cursor = advanced_search_response(search, _rows(3), total_matches=9)["next_cursor"]
+
+        with pytest.raises(ValidationError):
+            build_advanced_search_queries("rock", limit=2, sort_by="title", sort_order="asc", cursor=cursor)
+
+    def test_invalid_sort(self):
+        with pytest.raises(ValidationError):
+            build_advanced_search_queries("rock", sort_by="bitrate")
+
+
+class TestListingCursor:
+    """Test keyset pagination of get_all_audio_metadata."""
+
+    def _list(self, rows, **kwargs):
+        conn_ctx = _fake_connection(rows, fetchone={"count": 10})
+        cursor = conn_ctx.__enter__.return_value.cursor.return_value.__enter__.return_value
+        with patch.object(operations, "get_connection", return_value=conn_ctx):
+            result = operations.get_all_audio_metadata(**kwargs)
+        return result, cursor
+
+    def test_seek_on_created_at_and_id(self):
+        first, _ = self._list(_rows(3), limit=2)
+
+        second, cur = self._list(_rows(1), limit=2, cursor=first["next_cursor"])
+
+        query, params = cur.execute.call_args.args
+        assert "(created_at, id) < (%s::timestamptz, %s::uuid)" in repr(query)
+        assert params == ["2024-05-01T12:00:00+00:00", "id1", 3, 0]
+        assert second["has_more"] is False
+        assert second["next_cursor"] is None
+
+    def test_count_skipped_on_cursor_pages(self):
+        first, cur = self._list(_rows(3), limit=2)
+        assert first["total_count"] == 10
+        assert cur.execute.call_count == 2
+
+        second, cur = self._list(_rows(1), limit=2, cursor=first["next_cursor"])
+        assert second["total_count"] is None
+        assert cur.execute.call_count == 1
+
+        third, cur = self._list(_rows(1), limit=2, cursor=first["next_cursor"], include_total=True)
+        assert third["total_count"] == 10
+        assert cur.execute.call_count == 2
+
+    def test_count_can_be_skipped_on_first_page(self):
+        result, cur = self._list(_rows(1), limit=2, include_total=False)
+
+        assert result["total_count"] is None
+        assert cur.execute.call_count == 1
+
+    def test_cursor_unsupported_for_nullable_order(self):
+        with pytest.raises(ValidationError):
+            operations.get_all_audio_metadata(order_by="artist", cursor="abc")
+
+    def test_malformed_cursor_is_validation_error(self):
+        with patch.object(operations, "get_connection") as get_conn:
+            with pytest.raises(ValidationError):
+                operations.get_all_audio_metadata(cursor="not-a-cursor")
+
+        get_conn.assert_not_called()
+
+    def test_cursor_from_other_listing_rejected(self):
+        first, _ = self._list(_rows(3), limit=2)
+
+        with pytest.raises(ValidationError):
+            self._list(_rows(1), limit=2, status_filter="COMPLETED", cursor=first["next_cursor"])
+
+
+class TestSearchExecution:
+    """Test the statements run by search_audio_tracks_advanced."""
+
+    def test_one_statement_per_search(self):
+        with patch.object(operations, "get_connection", return_value=_fake_connection(_rows(2, total=2))), \
+             patch.object(operations, "execute_prepared") as execute:
+            result = operations.search_audio_tracks_advanced("rock", limit=5)
+
+        assert execute.call_count == 1
+        assert result["total_matches"] == 2
+        assert result["has_more"] is False
+
+    def test_count_fallback_past_last_page(self):
+        conn_ctx = _fake_connection([], fetchone={"total": 7})
+
+        with patch.object(operations, "get_connection", return_value=conn_ctx), \
+             patch.object(operations, "execute_prepared") as execute:
+            result = operations.search_audio_tracks_advanced("rock", limit=5, offset=20)
+
+        assert execute.call_count == 2
+        assert execute.call_args.args[1].startswith("SELECT COUNT(*) AS total")
+        assert result["total_matches"] == 7
+        assert result["has_more"] is False
+
+
+class TestSearchLibraryFilters:
+    """Test that search_library passes every filter to the database."""
+
+    @pytest.mark.asyncio
+    async def test_filters_passed_through(self):
+        from src.tools.query_tools import search_library
+
+        search_result = {"tracks": [], "total_matches": 0, "has_more": False}
+
+        with patch("src.tools.query_tools.search_audio_tracks_advanced", return_value=search_result) as mock_search:
+            await search_library({
+                "query": "rock",
+                "filters": {
+                    "genre": ["Rock", "Blues"],
+                    "year": {"min": 1960, "max": 1980},
+                    "duration": {"min": 180, "max": 600},
+                    "format": ["MP3", "FLAC"],
+                    "artist": "Beatles",
+                    "album": "Abbey",
+                },
+            })
+
+        kwargs = mock_search.call_args.kwargs
+        assert kwargs["status_filter"] == "COMPLETED"
+        assert kwargs["genres"] == ["Rock", "Blues"]
+        assert (kwargs["year_min"], kwargs["year_max"]) == (1960, 1980)
+        assert (kwargs["duration_min"], kwargs["duration_max"]) == (180, 600)
+        assert kwargs["formats"] == ["MP3", "FLAC"]
+        assert kwargs["artist_filter"] == "Beatles"
+        assert kwargs["album_filter"] == "Abbey"
+
+    @pytest.mark.asyncio
+    async def test_sort_passed_through(self):
+        from src.tools.query_tools import search_library
+
+        search_result = {"tracks": [], "total_matches": 0, "has_more": False}
+
+        with patch("src.tools.query_tools.search_audio_tracks_advanced", return_value=search_result) as mock_search:
+            await search_library({"query": "rock", "sortBy": "duration", "sortOrder": "asc"})
+
+        kwargs = mock_search.call_args.kwargs
+        assert (kwargs["sort_by"], kwargs["sort_order"]) == ("duration", "asc")
+
+
+class TestSearchLibraryIncludeTotal:
+    """Test the includeTotal option of the search_library tool."""
+
+    @pytest.mark.asyncio
+    async def test_include_total_false(self):
+        from src.tools.query_tools import search_library
+
+        search_result = {"tracks": [], "total_matches": None, "has_more": True}
+
+        with patch("src.tools.query_tools.search_audio_tracks_advanced", return_value=search_result) as mock_search:
+            result = await search_library({"query": "rock", "limit": 100, "includeTotal": False})
+
+        assert result["success"] is True
+        assert result["total"] is None
+        assert result["hasMore"] is True
+        assert mock_search.call_args.kwargs["include_total"] is False
+        assert mock_search.call_args.kwargs["limit"] == 100
+
+
+class TestSearchFacets:
+    """Test facet counting."""
+
+    def test_one_grouped_query(self):
+        search = build_advanced_search_queries("rock", genres=["Rock"], facets=["genre", "decade", "format"])
+
+        assert search.facet_query.count("GROUPING SETS") == 1
+        assert "GROUPING SETS ((facet_genre), (facet_decade), (facet_format))" in search.facet_query
+        # Facets count the whole match set, with the search's filters
+        assert search.facet_params == search.count_params
+
+    def test_no_facets_by_default(self):
+        search = build_advanced_search_queries("rock")
+
+        assert search.facets == ()
+        assert advanced_search_response(search, [])["facets"] is None
+
+    def test_invalid_facet(self):
+        with pytest.raises(ValidationError):
+            build_advanced_search_queries("rock", facets=["mood"])
+
+    def test_bucket_counts(self):
+        rows = [
+            {"facet": "genre", "value": "Rock", "count": 5},
+            {"facet": "genre", "value": None, "count": 2},
+            {"facet": "decade", "value": "1970", "count": 4},
+            {"facet": "duration", "value": "120", "count": 3},
+            {"facet": "duration", "value": "600", "count": 1},
+        ]
+
+        counts = facet_counts(("genre", "decade", "duration", "format"), rows)
+
+        assert counts["genre"] == [{"value": "Rock", "count": 5}]
+        assert counts["decade"] == [{"value": "1970s", "count": 4, "min": 1970, "max": 1979}]
+        assert counts["duration"] == [
+            {"value": "120-240s", "count": 3, "min": 120, "max": 240},
+            {"value": "600s+", "count": 1, "min": 600, "max": None},
+        ]
+        assert counts["format"] == []
+
+    def test_facet_query_executed(self):
+        conn_ctx = _fake_connection(None)
+        cursor = conn_ctx.__enter__.return_value.cursor.return_value.__enter__.return_value
+        cursor.fetchall.side_effect = [_rows(1, total=1), [{"facet": "format", "value": "MP3", "count": 1}]]
+
+        with patch.object(operations, "get_connection", return_value=conn_ctx), \
+             patch.object(operations, "execute_prepared") as execute:
+            result = operations.search_audio_tracks_advanced("rock", facets=["format"])
+
+        assert execute.call_count == 2
+        assert "GROUPING SETS" in execute.call_args.args[1]
+        assert result["facets"] == {"format": [{"value": "MP3", "count": 1}]}
+
+    @pytest.mark.asyncio
+    async def test_facets_passed_through(self):
+        from src.tools.query_tools import search_library
+
+        search_result = {
+            "tracks": _rows(1, total=1), "total_matches": 1, "has_more": False,
+            "facets": {"format": [{"value": "FLAC", "count": 1}]},
+        }
+
+        with patch("src.tools.query_tools.search_audio_tracks_advanced", return_value=search_result) as mock_search:
+            result = await search_library({"query": "rock", "facets": ["format", "decade"]})
+
+        assert mock_search.call_args.kwargs["facets"] == ["format", "decade"]
+        assert result["facets"]["format"][0] == {"value": "FLAC", "count": 1, "min": None, "max": None}
+
+
+class TestFuzzySearch:
+    """Test the trigram fallback query."""
+
+    def test_uses_trigram_operator(self):
+        sql, params = build_fuzzy_search_query("beatels", limit=10)
+
+        assert "t.fuzzy_text %% %s" in sql
+        assert "similarity(t.fuzzy_text, %s) AS rank" in sql
+        assert "similarity(t.fuzzy_text, %s) >= %s" in sql
+        assert params == ["beatels", "beatels", "beatels", 0.3, 10]
+
+    def test_filters_applied(self):
+        sql, params = build_fuzzy_search_query("beatels", status_filter="COMPLETED", genres=["Rock"])
+
+        assert "t.status = %s" in sql
+        assert "LOWER(t.genre) = ANY(%s::text[])" in sql
+        assert params[4:6] == ["COMPLETED", ["rock"]]
+
+    def test_invalid_threshold(self):
+        with pytest.raises(ValidationError):
+            build_fuzzy_search_query("beatels", similarity_threshold=1.5)
+
+    def test_threshold_set_before_query(self):
+        conn_ctx = _fake_connection(_rows(1))
+        cursor = conn_ctx.__enter__.return_value.cursor.return_value.__enter__.return_value
+
+        with patch.object(operations, "get_connection", return_value=conn_ctx), \
+             patch.object(operations, "execute_prepared") as execute:
+            result = operations.fuzzy_search_audio_tracks("beatels", similarity_threshold=0.4)
+
+        cursor.execute.assert_called_once_with(operations.SET_SIMILARITY_THRESHOLD_QUERY, ("0.4",))
+        assert "fuzzy_text" in execute.call_args.args[1]
+        assert len(result) == 1
+
+
+class TestSearchLibraryFuzzyFallback:
+    """Test that search_library retries zero-hit searches with fuzzy matching."""
+
+    @pytest.mark.asyncio
+    async def test_fallback_on_no_results(self):
+        from src.tools.query_tools import search_library
+
+        empty = {"tracks": [], "total_matches": 0, "has_more": False}
+        fuzzy_tracks = [{"id": "550e8400-e29b-41d4-a716-446655440000", "title": "Hey Jude",
+                         "artist": "The Beatles", "format": "MP3", "rank": 0.45}]
+
+        with patch("src.tools.query_tools.search_audio_tracks_advanced", return_value=empty), \
+             patch("src.tools.query_tools.fuzzy_search_audio_tracks", return_value=fuzzy_tracks) as mock_fuzzy:
+            result = await search_library({"query": "beatels", "filters": {"genre": ["Rock"]}})
+
+        assert result["success"] is True
+        assert result["fuzzy"] is True
+        assert result["total"] == 1
+        assert result["hasMore"] is False
+        assert mock_fuzzy.call_args.kwargs["genres"] == ["Rock"]
+        assert mock_fuzzy.call_args.kwargs["status_filter"] == "COMPLETED"
+
+    @pytest.mark.asyncio
+    async def test_no_fallback_when_fts_matches(self):
+        from src.tools.query_tools import search_library
+
+        found = {"tracks": _rows(1, total=1), "total_matches": 1, "has_more": False}
+
+        with patch("src.tools.query_tools.search_audio_tracks_advanced", return_value=found), \
+             patch("src.tools.query_tools.fuzzy_search_audio_tracks") as mock_fuzzy:
+            result = await search_library({"query": "rock"})
+
+        assert result["fuzzy"] is False
+        mock_fuzzy.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_no_fallback_past_first_page(self):
+        from src.tools.query_tools import search_library
+
+        empty = {"tracks": [], "total_matches": 3, "has_more": False}
+
+        with patch("src.tools.query_tools.search_audio_tracks_advanced", return_value=empty), \
+             patch("src.tools.query_tools.fuzzy_search_audio_tracks") as mock_fuzzy:
+            await search_library({"query": "rock", "offset": 20})
+
+        mock_fuzzy.assert_not_called()
+
+
+SEED_ROWS = 50000
+
+SEED_SQL = """
+    INSERT INTO audio_tracks (
+        status, title, artist, album, genre, year,
+        duration_seconds, format, audio_gcs_path
+    )
+    SELECT
+        'COMPLETED',
+        'Indexcheck Track ' || g,
+        'Indexcheck Artist ' || g,
+        'Indexcheck Album ' || (g %% 1000),
+        'Genre ' || (g %% 500),
+        1900 + g %% 200,
+        g / 10.0,
+        CASE WHEN g %% 1000 = 0 THEN 'FLAC' ELSE 'MP3' END,
+        'gs://indexcheck/' || g || '.mp3'
+    FROM generate_series(1, %s) AS g
+"""
+
+
+@pytest.mark.skipif(not is_db_configured(), reason="Database not configured")
+class TestSearchFilterIndexUsage:
+    """EXPLAIN filtered searches on a seeded table (rolled back afterwards)."""
+
+    @pytest.fixture
+    def cur(self):
+        from database import get_connection
+
+        with get_connection() as conn:
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(SEED_SQL, (SEED_ROWS,))
+                    cur.execute("ANALYZE audio_tracks")
+                    yield cur
+            finally:
+                conn.rollback()
+
+    def _plan(self, cur, **filters):
+        # "indexcheck" matches every seeded row, so only the filter is selective
+        search = build_advanced_search_queries("indexcheck", status_filter="COMPLETED", **filters)
+        cur.execute("EXPLAIN (FORMAT JSON) " + search.search_query, search.search_params)
+        return json.dumps(cur.fetchone()[0])
+
+    def test_genre_uses_index(self, cur):
+        assert "idx_audio_tracks_genre_lower" in self._plan(cur, genres=["genre 7"])
+
+    def test_format_uses_index(self, cur):
+        assert "idx_audio_tracks_status_format" in self._plan(cur, formats=["FLAC"])
+
+    def test_duration_uses_index(self, cur):
+        assert "idx_audio_tracks_status_duration" in self._plan(cur, duration_min=100, duration_max=101)
+
+    def test_title_sort_walks_index(self, cur):
+        plan = self._plan(cur, sort_by="title", include_total=False)
+
+        assert "idx_audio_tracks_title_id" in plan
+        assert '"Node Type": "Sort"' not in plan
+
+    def test_artist_uses_trigram_index(self, cur):
+        assert '"idx_audio_tracks_artist"' in self._plan(cur, artist_filter="artist 4242")
+
+    def test_fuzzy_uses_trigram_index(self, cur):
+        sql, params = build_fuzzy_search_query("indexchek artst 4242", status_filter="COMPLETED")
+        cur.execute(operations.SET_SIMILARITY_THRESHOLD_QUERY, ("0.3",))
+        cur.execute("EXPLAIN (FORMAT JSON) " + sql, params)
+
+        assert "idx_audio_tracks_fuzzy_text" in json.dumps(cur.fetchone()[0])
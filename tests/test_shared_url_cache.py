@@ -0,0 +1,244 @@
+"""
+Tests for the shared signed URL cache tier.
+
+These tests verify:
+- Replicas sharing a backend reuse each other's signed URLs
+- Invalidation propagates to every replica's local cache
+- The local LRU evicts least recently used entries
+- Shared backend failures degrade to signing
+- The async lookup signs misses through the async signing path
+- The Redis invalidation listener survives connection errors and reports its health
+- Backend factory selection
+"""
+
+import time
+import pytest
+from unittest.mock import AsyncMock, patch, MagicMock
+
+from src.resources.cache import SignedURLCache
+from src.resources.cache_backends import (
+    InMemoryCacheBackend,
+    RedisCacheBackend,
+    create_shared_backend,
+    HAS_REDIS,
+)
+
+
+GCS_PATH = "gs://test-bucket/audio/track.mp3"
+
+
+@pytest.fixture
+def mock_sign():
+    """Patch signing so each call returns a distinct URL."""
+    counter = {"n": 0}
+
+    def sign(**kwargs):
+        counter["n"] += 1
+        return f"https://signed/{kwargs['blob_name']}?v={counter['n']}"
+
+    with patch("src.resources.cache.generate_signed_url", side_effect=sign) as mock:
+        yield mock
+
+
+class TestSharedTier:
+    """Test cross-replica sharing through a common backend."""
+
+    def test_second_replica_reuses_url(self, mock_sign):
+        backend = InMemoryCacheBackend()
+        replica_a = SignedURLCache(window_seconds=0, shared_backend=backend)
+        replica_b = SignedURLCache(window_seconds=0, shared_backend=backend)
+
+        url_a = replica_a.get(GCS_PATH)
+        url_b = replica_b.get(GCS_PATH)
+
+        assert url_a == url_b
+        assert mock_sign.call_count == 1
+        assert replica_b.get_stats()["shared_hits"] == 1
+        assert replica_b.expiry[GCS_PATH] == replica_a.expiry[GCS_PATH]
+
+    def test_expired_shared_entry_is_resigned(self, mock_sign):
+        backend = InMemoryCacheBackend()
+        backend.set(GCS_PATH, "https://stale", time.time() - 1)
+        cache = SignedURLCache(window_seconds=0, shared_backend=backend)
+
+        url = cache.get(GCS_PATH)
+
+        assert url != "https://stale"
+        assert mock_sign.call_count == 1
+
+    def test_invalidation_propagates(self, mock_sign):
+        backend = InMemoryCacheBackend()
+        replica_a = SignedURLCache(window_seconds=0, shared_backend=backend)
+        replica_b = SignedURLCache(window_seconds=0, shared_backend=backend)
+        replica_a.get(GCS_PATH)
+        replica_b.get(GCS_PATH)
+
+        assert replica_a.invalidate(GCS_PATH) is True
+
+        assert GCS_PATH not in replica_a.cache
+        assert GCS_PATH not in replica_b.cache
+        assert backend.get(GCS_PATH) is None
+
+    def test_backend_errors_fall_back_to_signing(self, mock_sign):
+        backend = MagicMock()
+        backend.get.side_effect = ConnectionError("redis down")
+        backend.set.side_effect = ConnectionError("redis down")
+        cache = SignedURLCache(window_seconds=0, shared_backend=backend)
+
+        url = cache.get(GCS_PATH)
+
+        assert url.startswith("https://signed/")
+        assert mock_sign.call_count == 1
+
+    def test_shared_round_trips_run_without_lock(self, mock_sign):
+        backend = MagicMock()
+        cache = SignedURLCache(window_seconds=0, shared_backend=backend)
+        lock_held = []
+        backend.get.side_effect = lambda key: lock_held.append(cache.lock.locked())
+        backend.set.side_effect = lambda *args: lock_held.append(cache.lock.locked())
+
+        cache.get(GCS_PATH)
+
+        assert lock_held == [False, False]
+        assert cache.get_stats()["misses"] == 1
+
+
+class TestAsyncLookup:
+    """Test SignedURLCache.aget."""
+
+    @pytest.mark.asyncio
+    async def test_miss_signed_async_then_cached(self, mock_sign):
+        backend = InMemoryCacheBackend()
+        cache = SignedURLCache(window_seconds=0, shared_backend=backend)
+
+        with patch("src.resources.cache.agenerate_signed_url", AsyncMock(return_value="https://async")) as asign:
+            first = await cache.aget(GCS_PATH)
+            second = await cache.aget(GCS_PATH)
+
+        assert first == second == "https://async"
+        asign.assert_awaited_once()
+        assert asign.await_args.kwargs["blob_name"] == "audio/track.mp3"
+        assert mock_sign.call_count == 0
+        assert backend.get(GCS_PATH)[0] == "https://async"
+        assert cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_shared_hit_skips_signing(self, mock_sign):
+        backend = InMemoryCacheBackend()
+        SignedURLCache(window_seconds=0, shared_backend=backend).get(GCS_PATH)
+        replica = SignedURLCache(window_seconds=0, shared_backend=backend)
+
+        with patch("src.resources.cache.agenerate_signed_url", AsyncMock()) as asign:
+            url = await replica.aget(GCS_PATH)
+
+        assert url == backend.get(GCS_PATH)[0]
+        asign.assert_not_awaited()
+        assert replica.get_stats()["shared_hits"] == 1
+
+
+class TestRedisListener:
+    """Test the Redis pub/sub listener's error handling."""
+
+    @pytest.fixture
+    def backend(self):
+        client = MagicMock()
+        with patch("src.resources.cache_backends.HAS_REDIS", True), \
+             patch("src.resources.cache_backends.redis", create=True) as redis_module, \
+             patch.object(RedisCacheBackend, "RESUBSCRIBE_DELAY_SECONDS", 0):
+            redis_module.Redis.from_url.return_value = client
+            yield RedisCacheBackend("redis://localhost:6379/0")
+
+    def _listener(self, backend):
+        pubsub = backend._client.pubsub.return_value
+        handler = pubsub.run_in_thread.call_args.kwargs["exception_handler"]
+        return pubsub, pubsub.run_in_thread.return_value, handler
+
+    def test_listener_started_with_exception_handler(self, backend):
+        backend.subscribe(lambda key: None)
+        _, thread, handler = self._listener(backend)
+        thread.is_alive.return_value = True
+
+        assert handler is not None
+        assert backend.get_health()["healthy"] is True
+
+    def test_connection_error_resubscribes_and_flushes(self, backend, mock_sign):
+        cache = SignedURLCache(window_seconds=0, shared_backend=backend)
+        pubsub, thread, handler = self._listener(backend)
+        thread.is_alive.return_value = True
+        cache.get(GCS_PATH)
+
+        pubsub.subscribe.side_effect = ConnectionError("redis down")
+        handler(ConnectionError("reset"), pubsub, thread)
+
+        health = backend.get_health()
+        assert health["healthy"] is False
+        assert health["listener_errors"] == 1
+
+        pubsub.subscribe.side_effect = None
+        handler(ConnectionError("reset"), pubsub, thread)
+
+        assert backend.get_health()["healthy"] is True
+        # Invalidations published during the outage were lost
+        assert GCS_PATH not in cache.cache
+
+    def test_dead_listener_unhealthy(self, backend):
+        backend.subscribe(lambda key: None)
+        _, thread, _ = self._listener(backend)
+        thread.is_alive.return_value = False
+
+        assert backend.get_health()["healthy"] is False
+
+    def test_errors_after_close_ignored(self, backend):
+        backend.subscribe(lambda key: None)
+        pubsub, thread, handler = self._listener(backend)
+        backend.close()
+        pubsub.subscribe.reset_mock()
+
+        handler(ConnectionError("closed"), pubsub, thread)
+
+        pubsub.subscribe.assert_not_called()
+
+
+class TestLocalLRU:
+    """Test bounded local cache behaviour."""
+
+    def test_evicts_least_recently_used(self, mock_sign):
+        cache = SignedURLCache(window_seconds=0, max_entries=2)
+        cache.get("gs://b/one.mp3")
+        cache.get("gs://b/two.mp3")
+        cache.get("gs://b/one.mp3")  # Touch so two.mp3 becomes oldest
+        cache.get("gs://b/three.mp3")
+
+        assert list(cache.cache) == ["gs://b/one.mp3", "gs://b/three.mp3"]
+        assert "gs://b/two.mp3" not in cache.expiry
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_unbounded_by_default(self, mock_sign):
+        cache = SignedURLCache(window_seconds=0)
+        for i in range(20):
+            cache.get(f"gs://b/{i}.mp3")
+
+        assert len(cache.cache) == 20
+
+
+class TestBackendFactory:
+    """Test create_shared_backend selection."""
+
+    def test_none_disables_sharing(self):
+        assert create_shared_backend("none") is None
+
+    def test_memory_backend(self):
+        assert isinstance(create_shared_backend("memory"), InMemoryCacheBackend)
+
+    def test_redis_requires_url(self):
+        with pytest.raises((ValueError, ImportError)):
+            create_shared_backend("redis")
+
+    @pytest.mark.skipif(HAS_REDIS, reason="redis package installed")
+    def test_redis_requires_package(self):
+        with pytest.raises(ImportError):
+            create_shared_backend("redis", "redis://localhost:6379/0")
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            create_shared_backend("memcached")
@@ -0,0 +1,137 @@
+"""
+Tests for window-aligned signed URL generation.
+
+These tests verify:
+- Window arithmetic keeps the requested minimum lifetime
+- URLs for the same blob are byte-identical within a window
+- URLs change once the window rolls over
+- Window alignment can be disabled
+- The signed URL cache rolls entries over at window boundaries
+"""
+
+import datetime
+import pytest
+from unittest.mock import patch
+from urllib.parse import urlparse, parse_qs
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from google.cloud import storage
+from google.oauth2 import service_account
+
+from src.storage.gcs_client import GCSClient, compute_signing_window
+from src.resources.cache import SignedURLCache
+
+
+WINDOW_START = 1_700_000_100  # Aligned to a 900s window boundary
+
+
+@pytest.fixture(scope="module")
+def credentials():
+    """Service account credentials backed by a throwaway RSA key."""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode()
+    return service_account.Credentials.from_service_account_info({
+        "type": "service_account",
+        "project_id": "test-project",
+        "private_key_id": "test-key",
+        "private_key": pem,
+        "client_email": "signer@test-project.iam.gserviceaccount.com",
+        "token_uri": "https://oauth2.googleapis.com/token",
+    })
+
+
+@pytest.fixture
+def gcs_client(credentials):
+    """GCSClient wired to an offline storage client."""
+    client = GCSClient(bucket_name="test-bucket", project_id="test-project")
+    client._client = storage.Client(project="test-project", credentials=credentials)
+    with patch.object(storage.Blob, "exists", return_value=True):
+        yield client
+
+
+def _query(url: str) -> dict:
+    return {k: v[0] for k, v in parse_qs(urlparse(url).query).items()}
+
+
+class TestComputeSigningWindow:
+    """Test window arithmetic."""
+
+    def test_window_start_is_aligned(self):
+        start, _ = compute_signing_window(15, 900, now=WINDOW_START + 437)
+        assert start == datetime.datetime(2023, 11, 14, 22, 15)
+
+    @pytest.mark.parametrize("offset", [0, 1, 450, 899])
+    def test_lifetime_covers_requested_expiration(self, offset):
+        now = WINDOW_START + offset
+        _, lifetime = compute_signing_window(15, 900, now=now)
+        assert WINDOW_START + lifetime - now >= 15 * 60
+
+    def test_lifetime_capped_at_seven_days(self):
+        _, lifetime = compute_signing_window(7 * 24 * 60, 900, now=WINDOW_START)
+        assert lifetime == 7 * 24 * 60 * 60
+
+    def test_invalid_window(self):
+        with pytest.raises(ValueError):
+            compute_signing_window(15, 0)
+
+
+class TestWindowedSignedURLs:
+    """Test byte-identical URLs within a window."""
+
+    def test_same_url_within_window(self, gcs_client):
+        with patch("src.storage.gcs_client.time.time", return_value=WINDOW_START + 10):
+            first = gcs_client.generate_signed_url("audio/track.mp3", window_seconds=900)
+        with patch("src.storage.gcs_client.time.time", return_value=WINDOW_START + 800):
+            second = gcs_client.generate_signed_url("audio/track.mp3", window_seconds=900)
+
+        assert first == second
+        assert _query(first)["X-Goog-Expires"] == "1800"
+
+    def test_url_changes_in_next_window(self, gcs_client):
+        with patch("src.storage.gcs_client.time.time", return_value=WINDOW_START + 10):
+            first = gcs_client.generate_signed_url("audio/track.mp3", window_seconds=900)
+        with patch("src.storage.gcs_client.time.time", return_value=WINDOW_START + 910):
+            second = gcs_client.generate_signed_url("audio/track.mp3", window_seconds=900)
+
+        assert first != second
+
+    def test_blob_name_is_quoted(self, gcs_client):
+        with patch("src.storage.gcs_client.time.time", return_value=WINDOW_START):
+            url = gcs_client.generate_signed_url("audio/my track.mp3", window_seconds=900)
+
+        assert urlparse(url).path == "/test-bucket/audio/my%20track.mp3"
+
+    def test_disabled_window_uses_blob_signing(self, gcs_client):
+        with patch.object(storage.Blob, "generate_signed_url", return_value="https://signed") as mock_sign:
+            url = gcs_client.generate_signed_url("audio/track.mp3", window_seconds=0)
+
+        assert url == "https://signed"
+        mock_sign.assert_called_once()
+
+
+class TestCacheWindowRollover:
+    """Test that cached URLs expire at window boundaries."""
+
+    def test_entry_expires_at_window_end(self):
+        cache = SignedURLCache(window_seconds=900)
+
+        with patch("src.resources.cache.generate_signed_url", return_value="https://signed") as mock_sign, \
+             patch("src.resources.cache.time.time", return_value=WINDOW_START + 600):
+            cache.get("gs://test-bucket/audio/track.mp3")
+
+        assert cache.expiry["gs://test-bucket/audio/track.mp3"] == WINDOW_START + 900
+        assert mock_sign.call_args.kwargs["window_seconds"] == 900
+
+    def test_disabled_window_keeps_ttl(self):
+        cache = SignedURLCache(window_seconds=0)
+
+        with patch("src.resources.cache.generate_signed_url", return_value="https://signed"), \
+             patch("src.resources.cache.time.time", return_value=WINDOW_START + 600):
+            cache.get("gs://test-bucket/audio/track.mp3", url_expiration_minutes=15)
+
+        assert cache.expiry["gs://test-bucket/audio/track.mp3"] == WINDOW_START + 600 + 810
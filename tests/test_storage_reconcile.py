@@ -0,0 +1,150 @@
+"""
+Tests for orphan blob reconciliation.
+
+These tests verify:
+- Track ids are parsed from audio/{id}/ blob names
+- Orphans are found with a batched set diff against the database
+- Dry runs delete nothing; --apply deletes in batches
+- Recently uploaded tracks are left alone
+- GCS deletes are sent as batch requests
+"""
+
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.storage.gcs_client import GCSClient, MAX_BATCH_CALLS
+from src.storage.local_backend import LocalStorageBackend
+from src.storage.reconcile import OrphanReconciler, extract_audio_id
+
+
+@pytest.fixture
+def backend(tmp_path):
+    return LocalStorageBackend(root=tmp_path / "store", bucket_name="test-bucket", signing_key=b"k")
+
+
+@pytest.fixture
+def tracks(backend, tmp_path):
+    """Create 6 tracks with audio and artwork; ids[::2] exist in the database."""
+    source = tmp_path / "file.bin"
+    source.write_bytes(b"data")
+    ids = sorted(str(uuid.uuid4()) for _ in range(6))
+    for audio_id in ids:
+        backend.upload_file(source, f"audio/{audio_id}/song.mp3")
+        backend.upload_file(source, f"audio/{audio_id}/artwork.jpg")
+    return ids
+
+
+class FakeLookup:
+    """Record id lookups and answer from a fixed set."""
+
+    def __init__(self, existing):
+        self.existing = set(existing)
+        self.calls = []
+
+    def __call__(self, ids):
+        self.calls.append(list(ids))
+        return {i for i in ids if i in self.existing}
+
+
+class TestExtractAudioId:
+    """Test blob name parsing."""
+
+    def test_valid(self):
+        audio_id = str(uuid.uuid4())
+        assert extract_audio_id(f"audio/{audio_id}/song.mp3") == audio_id
+
+    @pytest.mark.parametrize("name", ["audio/song.mp3", "audio/not-a-uuid/song.mp3", "other/x/y.mp3"])
+    def test_unrecognized(self, name):
+        assert extract_audio_id(name) is None
+
+
+class TestOrphanReconciler:
+    """Test the reconciliation job."""
+
+    def test_dry_run_reports_without_deleting(self, backend, tracks):
+        lookup = FakeLookup(tracks[::2])
+
+        report = OrphanReconciler(backend, lookup, min_age_seconds=0).run()
+
+        assert report.dry_run
+        assert report.scanned_blobs == 12
+        assert report.orphan_ids == 3
+        assert report.orphan_blobs == 6
+        assert report.deleted_blobs == 0
+        assert len(backend.list_files(prefix="audio/")) == 12
+
+    def test_apply_deletes_orphans_only(self, backend, tracks):
+        lookup = FakeLookup(tracks[::2])
+
+        report = OrphanReconciler(
+            backend, lookup, min_age_seconds=0, dry_run=False, max_deletes_per_second=0
+        ).run()
+
+        assert report.deleted_blobs == 6
+        remaining = {extract_audio_id(f["name"]) for f in backend.list_files(prefix="audio/")}
+        assert remaining == set(tracks[::2])
+
+    def test_lookups_are_batched(self, backend, tracks):
+        lookup = FakeLookup(tracks)
+
+        report = OrphanReconciler(backend, lookup, batch_size=4, min_age_seconds=0, page_size=3).run()
+
+        assert [len(call) for call in lookup.calls] == [4, 2]
+        assert report.checked_ids == 6
+        assert report.orphan_ids == 0
+
+    def test_recent_uploads_skipped(self, backend, tracks):
+        report = OrphanReconciler(backend, FakeLookup([]), min_age_seconds=3600, dry_run=False).run()
+
+        assert report.skipped_recent_ids == 6
+        assert report.deleted_blobs == 0
+
+    def test_deletes_are_rate_limited(self, backend, tracks):
+        reconciler = OrphanReconciler(
+            backend, FakeLookup([]), min_age_seconds=0, dry_run=False,
+            delete_batch_size=4, max_deletes_per_second=2,
+        )
+
+        clock = {"t": 100.0}
+
+        def sleep(seconds):
+            clock["t"] += seconds
+
+        with patch("src.storage.reconcile.time.monotonic", side_effect=lambda: clock["t"]), \
+             patch("src.storage.reconcile.time.sleep", side_effect=sleep) as mock_sleep:
+            report = reconciler.run()
+
+        # 12 deletes in batches of 4 at 2/s: the 2nd and 3rd batches each wait 2s
+        assert report.deleted_blobs == 12
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [2.0, 2.0]
+
+
+class TestGCSBatchDelete:
+    """Test that GCSClient deletes through batch requests."""
+
+    def test_delete_files_batches(self):
+        client = GCSClient(bucket_name="test-bucket", project_id="test-project")
+        client._client = MagicMock()
+        batches = []
+
+        def make_batch(raise_exception):
+            batch = MagicMock()
+            batch.__enter__.return_value = batch
+            size = min(MAX_BATCH_CALLS, 150 - MAX_BATCH_CALLS * len(batches))
+            batch._responses = [MagicMock(status_code=204) for _ in range(size)]
+            if not batches:
+                batch._responses[0].status_code = 404
+                batch._responses[1].status_code = 500
+            batches.append(batch)
+            return batch
+
+        client._client.batch.side_effect = make_batch
+        names = [f"audio/{i}/song.mp3" for i in range(150)]
+
+        failed = client.delete_files(names)
+
+        assert len(batches) == 2
+        assert failed == ["audio/1/song.mp3"]
+        assert client._client.bucket.return_value.delete_blob.call_count == 150
@@ -0,0 +1,145 @@
+"""
+Tests for the suggest (autocomplete) tool and its prefix query.
+
+These tests verify:
+- Each field is completed with an index-ordered, LIMITed prefix scan
+- LIKE wildcards in the prefix are matched literally
+- The tool validates input and returns {field, value} suggestions
+- (Against a configured database) the lookup uses the prefix indexes
+"""
+
+import json
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from database import operations
+from database.operations import build_suggest_query
+from src.exceptions import ValidationError, DatabaseOperationError
+
+
+def is_db_configured() -> bool:
+    """Check if database configuration is available."""
+    return bool(
+        (os.getenv("DB_HOST") or os.getenv("DB_CONNECTION_NAME")) and
+        os.getenv("DB_NAME") and
+        os.getenv("DB_USER") and
+        os.getenv("DB_PASSWORD")
+    )
+
+
+class TestSuggestQuery:
+    """Test the generated SQL."""
+
+    def test_one_prefix_scan_per_field(self):
+        sql, params = build_suggest_query("Beat", limit=5)
+
+        for field in ("artist", "title", "album"):
+            assert f'WHERE status = %s AND LOWER({field}) COLLATE "C" LIKE %s' in sql
+            assert f'ORDER BY LOWER({field}) COLLATE "C"' in sql
+        assert params == ["COMPLETED", "beat%", 5] * 3 + [5]
+
+    def test_selected_fields(self):
+        sql, params = build_suggest_query("beat", fields=["artist"], status_filter=None)
+
+        assert "title" not in sql
+        assert "status" not in sql
+        assert params == ["beat%", 10, 10]
+
+    def test_wildcards_escaped(self):
+        _, params = build_suggest_query("100%_pure", fields=["title"])
+
+        assert params[1] == "100\\%\\_pure%"
+
+    @pytest.mark.parametrize("kwargs", [
+        {"prefix": "   "},
+        {"prefix": "beat", "limit": 0},
+        {"prefix": "beat", "limit": 21},
+        {"prefix": "beat", "fields": ["genre"]},
+    ])
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValidationError):
+            build_suggest_query(**kwargs)
+
+    def test_executes_prepared(self):
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [{"field": "artist", "value": "The Beatles"}]
+        conn = MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cursor
+        conn_ctx = MagicMock()
+        conn_ctx.__enter__.return_value = conn
+
+        with patch.object(operations, "get_connection", return_value=conn_ctx), \
+             patch.object(operations, "execute_prepared") as execute:
+            result = operations.suggest_completions("the beat")
+
+        assert execute.call_args.args[2][1] == "the beat%"
+        assert result == [{"field": "artist", "value": "The Beatles"}]
+
+
+class TestSuggestTool:
+    """Test the suggest tool."""
+
+    @pytest.mark.asyncio
+    async def test_returns_suggestions(self):
+        from src.tools.query_tools import suggest
+
+        rows = [{"field": "artist", "value": "Beck"}, {"field": "title", "value": "Beat It"}]
+
+        with patch("src.tools.query_tools.suggest_completions", return_value=rows) as mock_suggest:
+            result = await suggest({"prefix": "be", "limit": 5, "fields": ["artist", "title"]})
+
+        assert result["success"] is True
+        assert [s["value"] for s in result["suggestions"]] == ["Beck", "Beat It"]
+        kwargs = mock_suggest.call_args.kwargs
+        assert kwargs["fields"] == ["artist", "title"]
+        assert kwargs["limit"] == 5
+        assert kwargs["status_filter"] == "COMPLETED"
+
+    @pytest.mark.asyncio
+    async def test_invalid_input(self):
+        from src.tools.query_tools import suggest
+
+        result = await suggest({"prefix": "", "limit": 5})
+
+        assert result["success"] is False
+        assert result["error"] == "INVALID_QUERY"
+
+    @pytest.mark.asyncio
+    async def test_database_error(self):
+        from src.tools.query_tools import suggest
+
+        with patch("src.tools.query_tools.suggest_completions",
+                   side_effect=DatabaseOperationError("connection lost")):
+            result = await suggest({"prefix": "beat"})
+
+        assert result["success"] is False
+        assert result["error"] == "DATABASE_ERROR"
+
+
+@pytest.mark.skipif(not is_db_configured(), reason="Database not configured")
+class TestSuggestIndexUsage:
+    """EXPLAIN suggestions on a seeded table (rolled back afterwards)."""
+
+    def test_prefix_uses_index(self):
+        from database import get_connection
+
+        with get_connection() as conn:
+            try:
+                with conn.cursor() as cur:
+                    cur.execute("""
+                        INSERT INTO audio_tracks (status, title, artist, audio_gcs_path)
+                        SELECT 'COMPLETED', 'Suggestcheck Track ' || g, 'Suggestcheck Artist ' || g,
+                               'gs://suggestcheck/' || g || '.mp3'
+                        FROM generate_series(1, 50000) AS g
+                    """)
+                    cur.execute("ANALYZE audio_tracks")
+
+                    sql, params = build_suggest_query("suggestcheck artist 42", fields=["artist"])
+                    cur.execute("EXPLAIN (FORMAT JSON) " + sql, params)
+                    plan = json.dumps(cur.fetchone()[0])
+            finally:
+                conn.rollback()
+
+        assert "idx_audio_tracks_suggest_artist" in plan